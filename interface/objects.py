@@ -0,0 +1,3885 @@
+#!/usr/bin/env python
+
+#
+# This file is auto generated
+#
+
+from pyon.core.object import IonObjectBase
+#
+# Enums
+
+class IonEnum(object):
+    pass
+
+class ResourceVisibilityEnum(IonEnum):
+    PUBLIC = 1
+    REGISTERED = 2
+    FACILITY = 3
+    OWNER = 4
+    _value_map = {'PUBLIC': 1, 'REGISTERED': 2, 'FACILITY': 3, 'OWNER': 4}
+    _str_map = {1: 'PUBLIC', 2: 'REGISTERED', 3: 'FACILITY', 4: 'OWNER'}
+
+class AttachmentType(IonEnum):
+    ASCII = 1
+    BLOB = 2
+    OBJECT = 3
+    REFERENCE = 4
+    _value_map = {'ASCII': 1, 'BLOB': 2, 'OBJECT': 3, 'REFERENCE': 4}
+    _str_map = {1: 'ASCII', 2: 'BLOB', 3: 'OBJECT', 4: 'REFERENCE'}
+
+class ComputedValueAvailability(IonEnum):
+    PROVIDED = 1
+    NOTAVAILABLE = 2
+    _value_map = {'PROVIDED': 1, 'NOTAVAILABLE': 2}
+    _str_map = {1: 'PROVIDED', 2: 'NOTAVAILABLE'}
+
+class CapabilityType(IonEnum):
+    AGT_CMD = 1
+    AGT_PAR = 2
+    RES_CMD = 3
+    RES_PAR = 4
+    RES_IFACE = 5
+    CONV_TYPE = 6
+    AGT_STATES = 7
+    RES_STATES = 8
+    ALERT_DEFS = 9
+    AGT_CMD_ARGS = 10
+    AGT_STREAMS = 11
+    _value_map = {'AGT_CMD': 1, 'AGT_PAR': 2, 'RES_CMD': 3, 'RES_PAR': 4, 'RES_IFACE': 5, 'CONV_TYPE': 6, 'AGT_STATES': 7, 'RES_STATES': 8, 'ALERT_DEFS': 9, 'AGT_CMD_ARGS': 10, 'AGT_STREAMS': 11}
+    _str_map = {1: 'AGT_CMD', 2: 'AGT_PAR', 3: 'RES_CMD', 4: 'RES_PAR', 5: 'RES_IFACE', 6: 'CONV_TYPE', 7: 'AGT_STATES', 8: 'RES_STATES', 9: 'ALERT_DEFS', 10: 'AGT_CMD_ARGS', 11: 'AGT_STREAMS'}
+
+class DeploymentTypeEnum(IonEnum):
+    PROCESS = 1
+    SERVICE = 2
+    CLIENT = 3
+    _value_map = {'PROCESS': 1, 'SERVICE': 2, 'CLIENT': 3}
+    _str_map = {1: 'PROCESS', 2: 'SERVICE', 3: 'CLIENT'}
+
+class ProcessStateEnum(IonEnum):
+    REQUESTED = 1
+    WAITING = 2
+    PENDING = 3
+    RUNNING = 4
+    TERMINATING = 5
+    TERMINATED = 6
+    FAILED = 7
+    REJECTED = 8
+    EXITED = 9
+    _value_map = {'REQUESTED': 1, 'WAITING': 2, 'PENDING': 3, 'RUNNING': 4, 'TERMINATING': 5, 'TERMINATED': 6, 'FAILED': 7, 'REJECTED': 8, 'EXITED': 9}
+    _str_map = {1: 'REQUESTED', 2: 'WAITING', 3: 'PENDING', 4: 'RUNNING', 5: 'TERMINATING', 6: 'TERMINATED', 7: 'FAILED', 8: 'REJECTED', 9: 'EXITED'}
+
+class ServiceStateEnum(IonEnum):
+    PENDING = 1
+    READY = 2
+    STEADY = 3
+    FAILED = 4
+    _value_map = {'PENDING': 1, 'READY': 2, 'STEADY': 3, 'FAILED': 4}
+    _str_map = {1: 'PENDING', 2: 'READY', 3: 'STEADY', 4: 'FAILED'}
+
+class ProcessScheduleMode(IonEnum):
+    IMMEDIATE = 1
+    SCHEDULE = 2
+    _value_map = {'IMMEDIATE': 1, 'SCHEDULE': 2}
+    _str_map = {1: 'IMMEDIATE', 2: 'SCHEDULE'}
+
+class ProcessRestartMode(IonEnum):
+    NEVER = 1
+    ALWAYS = 2
+    ABNORMAL = 3
+    _value_map = {'NEVER': 1, 'ALWAYS': 2, 'ABNORMAL': 3}
+    _str_map = {1: 'NEVER', 2: 'ALWAYS', 3: 'ABNORMAL'}
+
+class ProcessQueueingMode(IonEnum):
+    NEVER = 1
+    ALWAYS = 2
+    START_ONLY = 3
+    RESTART_ONLY = 4
+    _value_map = {'NEVER': 1, 'ALWAYS': 2, 'START_ONLY': 3, 'RESTART_ONLY': 4}
+    _str_map = {1: 'NEVER', 2: 'ALWAYS', 3: 'START_ONLY', 4: 'RESTART_ONLY'}
+
+class TokenTypeEnum(IonEnum):
+    ACTOR_SECRET = 1
+    ACTOR_AUTH = 2
+    ACTOR_RESET_PASSWD = 3
+    OAUTH_GRANT = 4
+    OAUTH_ACCESS = 5
+    OAUTH_REFRESH = 6
+    _value_map = {'ACTOR_SECRET': 1, 'ACTOR_AUTH': 2, 'ACTOR_RESET_PASSWD': 3, 'OAUTH_GRANT': 4, 'OAUTH_ACCESS': 5, 'OAUTH_REFRESH': 6}
+    _str_map = {1: 'ACTOR_SECRET', 2: 'ACTOR_AUTH', 3: 'ACTOR_RESET_PASSWD', 4: 'OAUTH_GRANT', 5: 'OAUTH_ACCESS', 6: 'OAUTH_REFRESH'}
+
+class AuthStatusEnum(IonEnum):
+    ENABLED = 1
+    LOCKED = 2
+    DISABLED = 3
+    _value_map = {'ENABLED': 1, 'LOCKED': 2, 'DISABLED': 3}
+    _str_map = {1: 'ENABLED', 2: 'LOCKED', 3: 'DISABLED'}
+
+class ProposalOriginatorEnum(IonEnum):
+    CONSUMER = 1
+    PROVIDER = 2
+    BROKER = 3
+    _value_map = {'CONSUMER': 1, 'PROVIDER': 2, 'BROKER': 3}
+    _str_map = {1: 'CONSUMER', 2: 'PROVIDER', 3: 'BROKER'}
+
+class ProposalStatusEnum(IonEnum):
+    INITIAL = 1
+    COUNTER = 2
+    ACCEPTED = 3
+    REJECTED = 4
+    GRANTED = 5
+    _value_map = {'INITIAL': 1, 'COUNTER': 2, 'ACCEPTED': 3, 'REJECTED': 4, 'GRANTED': 5}
+    _str_map = {1: 'INITIAL', 2: 'COUNTER', 3: 'ACCEPTED', 4: 'REJECTED', 5: 'GRANTED'}
+
+class NegotiationTypeEnum(IonEnum):
+    REQUEST = 1
+    INVITATION = 2
+    BROKERED = 3
+    _value_map = {'REQUEST': 1, 'INVITATION': 2, 'BROKERED': 3}
+    _str_map = {1: 'REQUEST', 2: 'INVITATION', 3: 'BROKERED'}
+
+class NegotiationStatusEnum(IonEnum):
+    OPEN = 1
+    ACCEPTED = 2
+    REJECTED = 3
+    _value_map = {'OPEN': 1, 'ACCEPTED': 2, 'REJECTED': 3}
+    _str_map = {1: 'OPEN', 2: 'ACCEPTED', 3: 'REJECTED'}
+
+class PolicyTypeEnum(IonEnum):
+    COMMON_SERVICE_ACCESS = 1
+    SERVICE_ACCESS = 2
+    RESOURCE_ACCESS = 3
+    SERVICE_OP_PRECOND = 4
+    PROC_OP_PRECOND = 5
+    _value_map = {'COMMON_SERVICE_ACCESS': 1, 'SERVICE_ACCESS': 2, 'RESOURCE_ACCESS': 3, 'SERVICE_OP_PRECOND': 4, 'PROC_OP_PRECOND': 5}
+    _str_map = {1: 'COMMON_SERVICE_ACCESS', 2: 'SERVICE_ACCESS', 3: 'RESOURCE_ACCESS', 4: 'SERVICE_OP_PRECOND', 5: 'PROC_OP_PRECOND'}
+
+class ResourceModificationType(IonEnum):
+    CREATE = 1
+    UPDATE = 2
+    RETIRE = 3
+    DELETE = 4
+    _value_map = {'CREATE': 1, 'UPDATE': 2, 'RETIRE': 3, 'DELETE': 4}
+    _str_map = {1: 'CREATE', 2: 'UPDATE', 3: 'RETIRE', 4: 'DELETE'}
+
+class DirectoryModificationType(IonEnum):
+    CREATE = 1
+    UPDATE = 2
+    DELETE = 3
+    _value_map = {'CREATE': 1, 'UPDATE': 2, 'DELETE': 3}
+    _str_map = {1: 'CREATE', 2: 'UPDATE', 3: 'DELETE'}
+
+class ResourceAgentExecutionStatus(IonEnum):
+    OK = 1
+    FAILED = 2
+    _value_map = {'OK': 1, 'FAILED': 2}
+    _str_map = {1: 'OK', 2: 'FAILED'}
+
+class InformationStatus(IonEnum):
+    NORMAL = 1
+    ERROR = 2
+    OFFLINE = 3
+    _value_map = {'NORMAL': 1, 'ERROR': 2, 'OFFLINE': 3}
+    _str_map = {1: 'NORMAL', 2: 'ERROR', 3: 'OFFLINE'}
+
+class InformationContentAccessEnum(IonEnum):
+    VIEW = 1
+    REALTIME_VIEW = 2
+    DOWNLOAD = 3
+    SUBSCRIBE = 4
+    MODIFY = 5
+    OPERATOR_ACTION = 6
+    OTHER = 7
+    _value_map = {'VIEW': 1, 'REALTIME_VIEW': 2, 'DOWNLOAD': 3, 'SUBSCRIBE': 4, 'MODIFY': 5, 'OPERATOR_ACTION': 6, 'OTHER': 7}
+    _str_map = {1: 'VIEW', 2: 'REALTIME_VIEW', 3: 'DOWNLOAD', 4: 'SUBSCRIBE', 5: 'MODIFY', 6: 'OPERATOR_ACTION', 7: 'OTHER'}
+
+class ContainerStateEnum(IonEnum):
+    START = 1
+    STOP = 2
+    TERMINATE = 3
+    ERROR = 4
+    _value_map = {'START': 1, 'STOP': 2, 'TERMINATE': 3, 'ERROR': 4}
+    _str_map = {1: 'START', 2: 'STOP', 3: 'TERMINATE', 4: 'ERROR'}
+
+class SampleEnum(IonEnum):
+    SUNDAY = 1
+    MONDAY = 2
+    TUESDAY = 3
+    WEDNESDAY = 4
+    THURSDAY = 5
+    FRIDAY = 6
+    SATURDAY = 7
+    _value_map = {'SUNDAY': 1, 'MONDAY': 2, 'TUESDAY': 3, 'WEDNESDAY': 4, 'THURSDAY': 5, 'FRIDAY': 6, 'SATURDAY': 7}
+    _str_map = {1: 'SUNDAY', 2: 'MONDAY', 3: 'TUESDAY', 4: 'WEDNESDAY', 5: 'THURSDAY', 6: 'FRIDAY', 7: 'SATURDAY'}
+
+class AnEnum(IonEnum):
+    VALUE1 = 1
+    VALUE2 = 2
+    _value_map = {'VALUE1': 1, 'VALUE2': 2}
+    _str_map = {1: 'VALUE1', 2: 'VALUE2'}
+
+
+# Data Objects
+
+class Response(IonObjectBase):
+    '''
+    Generic response object
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Generic\ response\ object'}
+
+    def __init__(self, code=200, body=None):
+        self.type_ = 'Response'
+        self.code = code
+        self.body = body
+
+    _schema = {
+                'code': {'type': 'int', 'default': 200, 'decorators': {}, 'description': ''},
+                'body': {'type': 'NoneType', 'default': None, 'decorators': {}, 'description': ''},
+              }
+
+class MediaResponse(Response):
+    '''
+    Container object for a media object to be returned to called in its original form, e.g. a XML document, PNG image, PDF file
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Container\ object\ for\ a\ media\ object\ to\ be\ returned\ to\ called\ in\ its\ original\ form\,\ e\.g\.\ a\ XML\ document\,\ PNG\ image\,\ PDF\ file'}
+
+    def __init__(self, code=200, body=None, media_mimetype='', media_encoding='raw', internal_encoding='', response_headers=None, response_code=0, attributes=None):
+        Response.__init__(self, code, body)
+        self.type_ = 'MediaResponse'
+        # The mime type of the content, to be returned to the caller
+        self.media_mimetype = media_mimetype
+        # The encoding of content returning to the user
+        self.media_encoding = media_encoding
+        # The encoding of content within this object (can be base64, utf8). Default utf8
+        self.internal_encoding = internal_encoding
+        # Additional headers to set in the response
+        self.response_headers = response_headers or {}
+        # A status code:
+        self.response_code = response_code
+        # Additional attributes
+        self.attributes = attributes or {}
+
+    _schema = dict(Response._schema.items() + {
+                'media_mimetype': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ The\ mime\ type\ of\ the\ content\,\ to\ be\ returned\ to\ the\ caller'},
+                'media_encoding': {'type': 'str', 'default': 'raw', 'decorators': {}, 'description': '\ The\ encoding\ of\ content\ returning\ to\ the\ user'},
+                'internal_encoding': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ The\ encoding\ of\ content\ within\ this\ object\ \(can\ be\ base64\,\ utf8\)\.\ Default\ utf8'},
+                'response_headers': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': '\ Additional\ headers\ to\ set\ in\ the\ response'},
+                'response_code': {'type': 'int', 'default': 0, 'decorators': {}, 'description': '\ A\ status\ code\:'},
+                'attributes': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': '\ Additional\ attributes'},
+              }.items())
+
+class Association(IonObjectBase):
+    '''
+    A first class object creating a typed cross-reference between 2 resources. It references the subject resource by id and type and the object resource by id and type and a predicate.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'A\ first\ class\ object\ creating\ a\ typed\ cross\-reference\ between\ 2\ resources\.\ It\ references\ the\ subject\ resource\ by\ id\ and\ type\ and\ the\ object\ resource\ by\ id\ and\ type\ and\ a\ predicate\.'}
+
+    def __init__(self, s='', st='', p='', o='', ot='', ts='', order='', attributes=None, retired=False):
+        self.type_ = 'Association'
+        self.s = s
+        self.st = st
+        self.p = p
+        self.o = o
+        self.ot = ot
+        self.ts = ts
+        self.order = order
+        self.attributes = attributes or {}
+        self.retired = retired
+
+    _schema = {
+                's': {'type': 'str', 'default': '', 'decorators': {}, 'description': 'Subject\ ID'},
+                'st': {'type': 'str', 'default': '', 'decorators': {}, 'description': 'Subject\ type'},
+                'p': {'type': 'str', 'default': '', 'decorators': {}, 'description': 'Predicate'},
+                'o': {'type': 'str', 'default': '', 'decorators': {}, 'description': 'Object\ ID'},
+                'ot': {'type': 'str', 'default': '', 'decorators': {}, 'description': 'Object\ type'},
+                'ts': {'type': 'str', 'default': '', 'decorators': {}, 'description': 'Timestamp'},
+                'order': {'type': 'str', 'default': '', 'decorators': {}, 'description': 'A\ value\ that\ can\ be\ ordered\ lexicographically\ if\ needed\ to\ provide\ association\ precendence'},
+                'attributes': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': 'Arbitrary\ set\ of\ key\-value\ arguments\ providing\ details\ to\ the\ association'},
+                'retired': {'type': 'bool', 'default': False, 'decorators': {}, 'description': 'Flag\ identifying\ retired\ associations'},
+              }
+
+class Resource(IonObjectBase):
+    '''
+    Enumerates the possible visibility levels of a resource. Represents an entity known to the system that provides capability and has an identity and a life cycle. Resources can be associated with other resources. Abstract base type and type root. The following are internal attributes common to all objects: _id: A unique identifier that comes with every persisted object; _rev: A revision identifier that comes with every persisted object; type_: The object type
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Enumerates\ the\ possible\ visibility\ levels\ of\ a\ resource\.\ Represents\ an\ entity\ known\ to\ the\ system\ that\ provides\ capability\ and\ has\ an\ identity\ and\ a\ life\ cycle\.\ Resources\ can\ be\ associated\ with\ other\ resources\.\ Abstract\ base\ type\ and\ type\ root\.\ The\ following\ are\ internal\ attributes\ common\ to\ all\ objects\:\ \_id\:\ A\ unique\ identifier\ that\ comes\ with\ every\ persisted\ object\;\ \_rev\:\ A\ revision\ identifier\ that\ comes\ with\ every\ persisted\ object\;\ type\_\:\ The\ object\ type'}
+
+    def __init__(self, name='', description='', lcstate='DRAFT', availability='PRIVATE', visibility=ResourceVisibilityEnum.PUBLIC, ts_created='', ts_updated='', alt_ids=None, addl=None):
+        self.type_ = 'Resource'
+        # Human readable long name of the resource, e.g. for display in resource lists
+        self.name = name
+        # A more verbose description of the resource
+        self.description = description
+        # Resource life cycle state. Codeset: DRAFT, PLANNED, DEVELOPED, INTEGRATED, DEPLOYED, RETIRED, DELETED
+        self.lcstate = lcstate
+        # Resource availability state. Codeset: PRIVATE, DISCOVERABLE, AVAILABLE
+        self.availability = availability
+        # Resource visibility level
+        self.visibility = visibility
+        # Timestamp when resource object was created (str in millis in UNIX epoch)
+        self.ts_created = ts_created
+        # Timestamp when resource object was last updated (str in millis in UNIX epoch)
+        self.ts_updated = ts_updated
+        # Holds a list of alternate IDs to this resource, e.g. for preload in the form prefix:id
+        self.alt_ids = alt_ids or []
+        # Additional attributes, e.g. from preload import
+        self.addl = addl or {}
+
+    _schema = {
+                'name': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Human\ readable\ long\ name\ of\ the\ resource\,\ e\.g\.\ for\ display\ in\ resource\ lists'},
+                'description': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ A\ more\ verbose\ description\ of\ the\ resource'},
+                'lcstate': {'type': 'str', 'default': 'DRAFT', 'decorators': {}, 'description': '\ Resource\ life\ cycle\ state\.\ Codeset\:\ DRAFT\,\ PLANNED\,\ DEVELOPED\,\ INTEGRATED\,\ DEPLOYED\,\ RETIRED\,\ DELETED'},
+                'availability': {'type': 'str', 'default': 'PRIVATE', 'decorators': {}, 'description': '\ Resource\ availability\ state\.\ Codeset\:\ PRIVATE\,\ DISCOVERABLE\,\ AVAILABLE'},
+                'visibility': {'type': 'int', 'default': ResourceVisibilityEnum.PUBLIC, 'enum_type': 'ResourceVisibilityEnum', 'decorators': {}, 'description': '\ Resource\ visibility\ level'},
+                'ts_created': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Timestamp\ when\ resource\ object\ was\ created\ \(str\ in\ millis\ in\ UNIX\ epoch\)'},
+                'ts_updated': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Timestamp\ when\ resource\ object\ was\ last\ updated\ \(str\ in\ millis\ in\ UNIX\ epoch\)'},
+                'alt_ids': {'type': 'list', 'default': [], 'decorators': {}, 'description': '\ Holds\ a\ list\ of\ alternate\ IDs\ to\ this\ resource\,\ e\.g\.\ for\ preload\ in\ the\ form\ prefix\:id'},
+                'addl': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': '\ Additional\ attributes\,\ e\.g\.\ from\ preload\ import'},
+              }
+
+class SystemResource(Resource):
+    '''
+    Describes a resource that represents a system internal component or function. Abstract base type.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Describes\ a\ resource\ that\ represents\ a\ system\ internal\ component\ or\ function\.\ Abstract\ base\ type\.'}
+
+    def __init__(self, name='', description='', lcstate='DRAFT', availability='PRIVATE', visibility=ResourceVisibilityEnum.PUBLIC, ts_created='', ts_updated='', alt_ids=None, addl=None):
+        Resource.__init__(self, name, description, lcstate, availability, visibility, ts_created, ts_updated, alt_ids, addl)
+        self.type_ = 'SystemResource'
+
+    _schema = dict(Resource._schema.items() + {
+              }.items())
+
+class AppResource(Resource):
+    '''
+    Describes a resource that is described by itself, without having a physical and data representation. Abstract base type.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Describes\ a\ resource\ that\ is\ described\ by\ itself\,\ without\ having\ a\ physical\ and\ data\ representation\.\ Abstract\ base\ type\.'}
+
+    def __init__(self, name='', description='', lcstate='DRAFT', availability='PRIVATE', visibility=ResourceVisibilityEnum.PUBLIC, ts_created='', ts_updated='', alt_ids=None, addl=None):
+        Resource.__init__(self, name, description, lcstate, availability, visibility, ts_created, ts_updated, alt_ids, addl)
+        self.type_ = 'AppResource'
+
+    _schema = dict(Resource._schema.items() + {
+              }.items())
+
+class InformationResource(Resource):
+    '''
+    Describes a resource that exists as an electronic artifact, such as science data, attachments, actor identities. Abstract base type.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Describes\ a\ resource\ that\ exists\ as\ an\ electronic\ artifact\,\ such\ as\ science\ data\,\ attachments\,\ actor\ identities\.\ Abstract\ base\ type\.'}
+
+    def __init__(self, name='', description='', lcstate='DRAFT', availability='PRIVATE', visibility=ResourceVisibilityEnum.PUBLIC, ts_created='', ts_updated='', alt_ids=None, addl=None):
+        Resource.__init__(self, name, description, lcstate, availability, visibility, ts_created, ts_updated, alt_ids, addl)
+        self.type_ = 'InformationResource'
+
+    _schema = dict(Resource._schema.items() + {
+              }.items())
+
+class TaskableResource(Resource):
+    '''
+    Describes a resource that can be controlled and monitored, such as a physical device or a computational process. Abstract base type.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Describes\ a\ resource\ that\ can\ be\ controlled\ and\ monitored\,\ such\ as\ a\ physical\ device\ or\ a\ computational\ process\.\ Abstract\ base\ type\.'}
+
+    def __init__(self, name='', description='', lcstate='DRAFT', availability='PRIVATE', visibility=ResourceVisibilityEnum.PUBLIC, ts_created='', ts_updated='', alt_ids=None, addl=None):
+        Resource.__init__(self, name, description, lcstate, availability, visibility, ts_created, ts_updated, alt_ids, addl)
+        self.type_ = 'TaskableResource'
+
+    _schema = dict(Resource._schema.items() + {
+              }.items())
+
+class ExecutableResource(InformationResource):
+    '''
+    Describes an electronically described computational entity that can be instantiated into a taskable resource. Abstract base type.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Describes\ an\ electronically\ described\ computational\ entity\ that\ can\ be\ instantiated\ into\ a\ taskable\ resource\.\ Abstract\ base\ type\.'}
+
+    def __init__(self, name='', description='', lcstate='DRAFT', availability='PRIVATE', visibility=ResourceVisibilityEnum.PUBLIC, ts_created='', ts_updated='', alt_ids=None, addl=None):
+        InformationResource.__init__(self, name, description, lcstate, availability, visibility, ts_created, ts_updated, alt_ids, addl)
+        self.type_ = 'ExecutableResource'
+
+    _schema = dict(InformationResource._schema.items() + {
+              }.items())
+
+class AbstractAttachmentContext(IonObjectBase):
+    '''
+    Enumerates the representation type for an attachment. Possible values are: ASCII: the content is ASCII, e.g. JSON or BASE64 encoded by the application; BLOB: the content is a binary; OBJECT: the content is an arbitrary object, such as a dict, list; REFERENCE: the content is a reference document and requires a parser to be ingested Abstract base type for objects holding additional information about attachments, specific by type.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Enumerates\ the\ representation\ type\ for\ an\ attachment\.\ Possible\ values\ are\:\ ASCII\:\ the\ content\ is\ ASCII\,\ e\.g\.\ JSON\ or\ BASE64\ encoded\ by\ the\ application\;\ BLOB\:\ the\ content\ is\ a\ binary\;\ OBJECT\:\ the\ content\ is\ an\ arbitrary\ object\,\ such\ as\ a\ dict\,\ list\;\ REFERENCE\:\ the\ content\ is\ a\ reference\ document\ and\ requires\ a\ parser\ to\ be\ ingested\ Abstract\ base\ type\ for\ objects\ holding\ additional\ information\ about\ attachments\,\ specific\ by\ type\.'}
+
+    def __init__(self):
+        self.type_ = 'AbstractAttachmentContext'
+
+    _schema = {
+              }
+
+class Attachment(InformationResource):
+    '''
+    Represents separate information attached to a resource, such as a PDF or image file.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Represents\ separate\ information\ attached\ to\ a\ resource\,\ such\ as\ a\ PDF\ or\ image\ file\.'}
+
+    def __init__(self, name='', description='', lcstate='DRAFT', availability='PRIVATE', visibility=ResourceVisibilityEnum.PUBLIC, ts_created='', ts_updated='', alt_ids=None, addl=None, attachment_type=AttachmentType.ASCII, content_type='', content='', object_id='', created_by='', modified_by='', keywords=None, attachment_size=0, context=None):
+        InformationResource.__init__(self, name, description, lcstate, availability, visibility, ts_created, ts_updated, alt_ids, addl)
+        self.type_ = 'Attachment'
+        # System representation type of attachment
+        self.attachment_type = attachment_type
+        # Content type of attachment (PDF document, PNG image, etc); expressed as standard MIME types
+        self.content_type = content_type
+        # Unused for holding the actual data
+        self.content = content
+        # (SYS) Associated object (resource) ID, for easier indexing
+        self.object_id = object_id
+        # The identity of the creator of the document. For documents imported from external sources,
+        # this is not the same as the creator of this resource.
+        self.created_by = created_by
+        # The identity of someone who has modified of the document. For documents imported from external sources,
+        # this modification may have happened outside of the system
+        self.modified_by = modified_by
+        # Keywords indicating the type of attachment (e.g. user manual, log)
+        self.keywords = keywords or []
+        # Size of the attachment content, in bytes
+        self.attachment_size = attachment_size
+        # Provides additional attributes depending on the type of attachment.
+        self.context = context or AbstractAttachmentContext()
+
+    _schema = dict(InformationResource._schema.items() + {
+                'attachment_type': {'type': 'int', 'default': AttachmentType.ASCII, 'enum_type': 'AttachmentType', 'decorators': {}, 'description': '\ System\ representation\ type\ of\ attachment'},
+                'content_type': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Content\ type\ of\ attachment\ \(PDF\ document\,\ PNG\ image\,\ etc\)\;\ expressed\ as\ standard\ MIME\ types'},
+                'content': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Unused\ for\ holding\ the\ actual\ data'},
+                'object_id': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ \(SYS\)\ Associated\ object\ \(resource\)\ ID\,\ for\ easier\ indexing'},
+                'created_by': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ The\ identity\ of\ the\ creator\ of\ the\ document\.\ For\ documents\ imported\ from\ external\ sources\,\ \ this\ is\ not\ the\ same\ as\ the\ creator\ of\ this\ resource\.'},
+                'modified_by': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ The\ identity\ of\ someone\ who\ has\ modified\ of\ the\ document\.\ For\ documents\ imported\ from\ external\ sources\,\ \ this\ modification\ may\ have\ happened\ outside\ of\ the\ system'},
+                'keywords': {'type': 'list', 'default': [], 'decorators': {"ContentType": "str"}, 'description': '\ Keywords\ indicating\ the\ type\ of\ attachment\ \(e\.g\.\ user\ manual\,\ log\)'},
+                'attachment_size': {'type': 'int', 'default': 0, 'decorators': {}, 'description': '\ Size\ of\ the\ attachment\ content\,\ in\ bytes'},
+                'context': {'type': 'AbstractAttachmentContext', 'default': AbstractAttachmentContext(), 'decorators': {}, 'description': '\ Provides\ additional\ attributes\ depending\ on\ the\ type\ of\ attachment\.'},
+              }.items())
+
+class CustomAttribute(IonObjectBase):
+    '''
+    Holds information about the definition of a custom attribute
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Holds\ information\ about\ the\ definition\ of\ a\ custom\ attribute'}
+
+    def __init__(self, name='', type='', description='', default='', units=''):
+        self.type_ = 'CustomAttribute'
+        # Name of the attribute
+        self.name = name
+        # Type of the attribute. Codelist: str, int, float, bool, list, dict
+        self.type = type
+        # Description for the attribute
+        self.description = description
+        # Default value for the attribute
+        self.default = default
+        # Units applied to the attribute value (if applicable)
+        self.units = units
+
+    _schema = {
+                'name': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Name\ of\ the\ attribute'},
+                'type': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Type\ of\ the\ attribute\.\ Codelist\:\ str\,\ int\,\ float\,\ bool\,\ list\,\ dict'},
+                'description': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Description\ for\ the\ attribute'},
+                'default': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Default\ value\ for\ the\ attribute'},
+                'units': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Units\ applied\ to\ the\ attribute\ value\ \(if\ applicable\)'},
+              }
+
+class Collection(InformationResource):
+    '''
+    Represents a named set of resources. These may or may not be of the same type, and may or may not be ordered.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Represents\ a\ named\ set\ of\ resources\.\ These\ may\ or\ may\ not\ be\ of\ the\ same\ type\,\ and\ may\ or\ may\ not\ be\ ordered\.'}
+
+    def __init__(self, name='', description='', lcstate='DRAFT', availability='PRIVATE', visibility=ResourceVisibilityEnum.PUBLIC, ts_created='', ts_updated='', alt_ids=None, addl=None, resources=None, options=None):
+        InformationResource.__init__(self, name, description, lcstate, availability, visibility, ts_created, ts_updated, alt_ids, addl)
+        self.type_ = 'Collection'
+        # The resources in this collection
+        self.resources = resources or []
+        # Additional search filter or options
+        self.options = options or {}
+
+    _schema = dict(InformationResource._schema.items() + {
+                'resources': {'type': 'list', 'default': [], 'decorators': {}, 'description': '\ The\ resources\ in\ this\ collection'},
+                'options': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': '\ Additional\ search\ filter\ or\ options'},
+              }.items())
+
+class ComputedValue(IonObjectBase):
+    '''
+    Enumerates the availability of a computed attribute's value. Holds a computed value and status about its availability. Abstract base type.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Enumerates\ the\ availability\ of\ a\ computed\ attribute\'s\ value\.\ Holds\ a\ computed\ value\ and\ status\ about\ its\ availability\.\ Abstract\ base\ type\.'}
+
+    def __init__(self, status=ComputedValueAvailability.NOTAVAILABLE, reason=''):
+        self.type_ = 'ComputedValue'
+        # Availability of this computed attribute value
+        self.status = status
+        # Additional details regarding attribute (un)availability
+        self.reason = reason
+
+    _schema = {
+                'status': {'type': 'int', 'default': ComputedValueAvailability.NOTAVAILABLE, 'enum_type': 'ComputedValueAvailability', 'decorators': {}, 'description': '\ Availability\ of\ this\ computed\ attribute\ value'},
+                'reason': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Additional\ details\ regarding\ attribute\ \(un\)availability'},
+              }
+
+class ComputedIntValue(ComputedValue):
+    '''
+    Holds an integer type computed value and status about its availability.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Holds\ an\ integer\ type\ computed\ value\ and\ status\ about\ its\ availability\.'}
+
+    def __init__(self, status=ComputedValueAvailability.NOTAVAILABLE, reason='', value=0):
+        ComputedValue.__init__(self, status, reason)
+        self.type_ = 'ComputedIntValue'
+        # Holds the value
+        self.value = value
+
+    _schema = dict(ComputedValue._schema.items() + {
+                'value': {'type': 'int', 'default': 0, 'decorators': {}, 'description': '\ Holds\ the\ value'},
+              }.items())
+
+class ComputedStringValue(ComputedValue):
+    '''
+    Holds a string type computed value and status about its availability.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Holds\ a\ string\ type\ computed\ value\ and\ status\ about\ its\ availability\.'}
+
+    def __init__(self, status=ComputedValueAvailability.NOTAVAILABLE, reason='', value=''):
+        ComputedValue.__init__(self, status, reason)
+        self.type_ = 'ComputedStringValue'
+        # Holds the value
+        self.value = value
+
+    _schema = dict(ComputedValue._schema.items() + {
+                'value': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Holds\ the\ value'},
+              }.items())
+
+class ComputedFloatValue(ComputedValue):
+    '''
+    Holds a float (decimal number) type computed value and status about its availability.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Holds\ a\ float\ \(decimal\ number\)\ type\ computed\ value\ and\ status\ about\ its\ availability\.'}
+
+    def __init__(self, status=ComputedValueAvailability.NOTAVAILABLE, reason='', value=0.0):
+        ComputedValue.__init__(self, status, reason)
+        self.type_ = 'ComputedFloatValue'
+        # Holds the value
+        self.value = value
+
+    _schema = dict(ComputedValue._schema.items() + {
+                'value': {'type': 'float', 'default': 0.0, 'decorators': {}, 'description': '\ Holds\ the\ value'},
+              }.items())
+
+class ComputedListValue(ComputedValue):
+    '''
+    Holds a list type computed value and status about its availability.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Holds\ a\ list\ type\ computed\ value\ and\ status\ about\ its\ availability\.'}
+
+    def __init__(self, status=ComputedValueAvailability.NOTAVAILABLE, reason='', value=None):
+        ComputedValue.__init__(self, status, reason)
+        self.type_ = 'ComputedListValue'
+        # Holds the value
+        self.value = value or []
+
+    _schema = dict(ComputedValue._schema.items() + {
+                'value': {'type': 'list', 'default': [], 'decorators': {}, 'description': '\ Holds\ the\ value'},
+              }.items())
+
+class ComputedDictValue(ComputedValue):
+    '''
+    Holds a dict (mapping) type computed value and status about its availability.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Holds\ a\ dict\ \(mapping\)\ type\ computed\ value\ and\ status\ about\ its\ availability\.'}
+
+    def __init__(self, status=ComputedValueAvailability.NOTAVAILABLE, reason='', value=None):
+        ComputedValue.__init__(self, status, reason)
+        self.type_ = 'ComputedDictValue'
+        # Holds the value
+        self.value = value or {}
+
+    _schema = dict(ComputedValue._schema.items() + {
+                'value': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': '\ Holds\ the\ value'},
+              }.items())
+
+class BaseComputedAttributes(IonObjectBase):
+    '''
+    Base container for attributes computed via the extended resource framework. Abstract base type.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Base\ container\ for\ attributes\ computed\ via\ the\ extended\ resource\ framework\.\ Abstract\ base\ type\.'}
+
+    def __init__(self):
+        self.type_ = 'BaseComputedAttributes'
+
+    _schema = {
+              }
+
+class ComputedAttributes(BaseComputedAttributes):
+    '''
+    The base type for computed attribute objects. IMPORTANT!!! NOTHING IN HERE SHOULD REFERENCE LOCAL FUNCTIONS SINCE THIS IS USED ACROSS SERVICES
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'The\ base\ type\ for\ computed\ attribute\ objects\.\ IMPORTANT\!\!\!\ NOTHING\ IN\ HERE\ SHOULD\ REFERENCE\ LOCAL\ FUNCTIONS\ SINCE\ THIS\ IS\ USED\ ACROSS\ SERVICES'}
+
+    def __init__(self):
+        BaseComputedAttributes.__init__(self)
+        self.type_ = 'ComputedAttributes'
+
+    _schema = dict(BaseComputedAttributes._schema.items() + {
+              }.items())
+
+class ResourceContainer(IonObjectBase):
+    '''
+    A non-persistable container for a resource and its related data used by the extended resource framework
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'A\ non\-persistable\ container\ for\ a\ resource\ and\ its\ related\ data\ used\ by\ the\ extended\ resource\ framework'}
+
+    def __init__(self, _id='', ts_created='', lcstate_transitions=None, availability_transitions=None, resource=None, ext_associations=None):
+        self.type_ = 'ResourceContainer'
+        #  Unique identifier (matches the id of the internal persistable resource object)
+        self._id = _id
+        # Timestamp str in millis in UNIX epoch
+        self.ts_created = ts_created
+        # Available lcstate transitions (key event, value target state)
+        self.lcstate_transitions = lcstate_transitions or {}
+        # Available availability transitions (key event, value target state)
+        self.availability_transitions = availability_transitions or {}
+        # Contains the actual resource object as retrieved from the resource registry
+        self.resource = resource or Resource()
+        # An optional dict of names and associated objects to get other associations on the fly
+        self.ext_associations = ext_associations or {}
+
+    _schema = {
+                '_id': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ \ Unique\ identifier\ \(matches\ the\ id\ of\ the\ internal\ persistable\ resource\ object\)'},
+                'ts_created': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Timestamp\ str\ in\ millis\ in\ UNIX\ epoch'},
+                'lcstate_transitions': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': '\ Available\ lcstate\ transitions\ \(key\ event\,\ value\ target\ state\)'},
+                'availability_transitions': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': '\ Available\ availability\ transitions\ \(key\ event\,\ value\ target\ state\)'},
+                'resource': {'type': 'Resource', 'default': Resource(), 'decorators': {}, 'description': '\ Contains\ the\ actual\ resource\ object\ as\ retrieved\ from\ the\ resource\ registry'},
+                'ext_associations': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': '\ An\ optional\ dict\ of\ names\ and\ associated\ objects\ to\ get\ other\ associations\ on\ the\ fly'},
+              }
+
+class ExtendedResource(ResourceContainer):
+    '''
+    A derived object containing common fields for all extended resource objects
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'A\ derived\ object\ containing\ common\ fields\ for\ all\ extended\ resource\ objects'}
+
+    def __init__(self, _id='', ts_created='', lcstate_transitions=None, availability_transitions=None, resource=None, ext_associations=None, computed=None, policies=None, owners=None, orgs=None, attachments=None):
+        ResourceContainer.__init__(self, _id, ts_created, lcstate_transitions, availability_transitions, resource, ext_associations)
+        self.type_ = 'ExtendedResource'
+        self.computed = computed or BaseComputedAttributes()
+        # A list of any associated policies
+        self.policies = policies or []
+        # A list of owner information of this resource
+        self.owners = owners or []
+        # A list of orgs to which this resource belongs - NOTE this does not apply to Users!
+        self.orgs = orgs or []
+        # list of sensors attached to this device
+        self.attachments = attachments or []
+
+    _schema = dict(ResourceContainer._schema.items() + {
+                'computed': {'type': 'BaseComputedAttributes', 'default': BaseComputedAttributes(), 'decorators': {}, 'description': ''},
+                'policies': {'type': 'list', 'default': [], 'decorators': {"hasPolicy": "Policy"}, 'description': '\ A\ list\ of\ any\ associated\ policies'},
+                'owners': {'type': 'list', 'default': [], 'decorators': {"hasOwnerInfo": ""}, 'description': '\ A\ list\ of\ owner\ information\ of\ this\ resource'},
+                'orgs': {'type': 'list', 'default': [], 'decorators': {"hasResource": "Org"}, 'description': '\ A\ list\ of\ orgs\ to\ which\ this\ resource\ belongs\ \-\ NOTE\ this\ does\ not\ apply\ to\ Users\!'},
+                'attachments': {'type': 'list', 'default': [], 'decorators': {"hasAttachment": "Attachment"}, 'description': '\ list\ of\ sensors\ attached\ to\ this\ device'},
+              }.items())
+
+class AssociatedResources(IonObjectBase):
+    '''
+    A base object for associations between resources
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'A\ base\ object\ for\ associations\ between\ resources'}
+
+    def __init__(self, key='', resource_type='', multiple_associations=False):
+        self.type_ = 'AssociatedResources'
+        # key to be used for prepare associations in case of multiple assocs with same resource type
+        # set via @Key decorator, by default will use resource_type value
+        self.key = key
+        self.resource_type = resource_type
+        self.multiple_associations = multiple_associations
+
+    _schema = {
+                'key': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ key\ to\ be\ used\ for\ prepare\ associations\ in\ case\ of\ multiple\ assocs\ with\ same\ resource\ type\ \ set\ via\ \@Key\ decorator\,\ by\ default\ will\ use\ resource\_type\ value'},
+                'resource_type': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'multiple_associations': {'type': 'bool', 'default': False, 'decorators': {}, 'description': ''},
+              }
+
+class ResourcePrepareSupport(IonObjectBase):
+    '''
+    A base object containing common fields for all prepare update objects
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'A\ base\ object\ containing\ common\ fields\ for\ all\ prepare\ update\ objects'}
+
+    def __init__(self, _id='', resource=None, resource_schema=None):
+        self.type_ = 'ResourcePrepareSupport'
+        self._id = _id
+        self.resource = resource or Resource()
+        self.resource_schema = resource_schema or {}
+
+    _schema = {
+                '_id': {'type': 'str', 'default': '', 'decorators': {}, 'description': 'Unique\ identifier\ \(matches\ the\ id\ of\ the\ internal\ persistable\ resource\ object\)'},
+                'resource': {'type': 'Resource', 'default': Resource(), 'decorators': {}, 'description': ''},
+                'resource_schema': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': ''},
+              }
+
+class TestExtendedResource(ExtendedResource):
+    '''
+    An object used for testing of the framework @OriginResourceType=InstrumentDevice
+    '''
+
+    _class_info = {'name': '', 'decorators': {'OriginResourceType': 'InstrumentDevice'}, 'docstring': 'An\ object\ used\ for\ testing\ of\ the\ framework\ \@OriginResourceType\=InstrumentDevice'}
+
+    def __init__(self, _id='', ts_created='', lcstate_transitions=None, availability_transitions=None, resource=None, ext_associations=None, computed=None, policies=None, owners=None, orgs=None, attachments=None, policy_count=0, resource_object=None, remote_resource_object=None, single_owner=None, owner_count=0):
+        ExtendedResource.__init__(self, _id, ts_created, lcstate_transitions, availability_transitions, resource, ext_associations, computed, policies, owners, orgs, attachments)
+        self.type_ = 'TestExtendedResource'
+        self.policy_count = policy_count
+        self.resource_object = resource_object or Resource()
+        self.remote_resource_object = remote_resource_object or Resource()
+        self.single_owner = single_owner or Resource()
+        self.owner_count = owner_count
+
+    _schema = dict(ExtendedResource._schema.items() + {
+                'policy_count': {'type': 'int', 'default': 0, 'decorators': {"hasPolicy": ""}, 'description': ''},
+                'resource_object': {'type': 'Resource', 'default': Resource(), 'decorators': {"Method": ""}, 'description': ''},
+                'remote_resource_object': {'type': 'Resource', 'default': Resource(), 'decorators': {"Method": "resource_registry.read"}, 'description': ''},
+                'single_owner': {'type': 'Resource', 'default': Resource(), 'decorators': {"hasOwnerInfo": ""}, 'description': 'single\ owner'},
+                'owner_count': {'type': 'int', 'default': 0, 'decorators': {"hasOwnerInfo": ""}, 'description': 'count\ of\ owners'},
+              }.items())
+
+class TestPrepareUpdateResource(ResourcePrepareSupport):
+    '''
+    An object used for testing of the framework @OriginResourceType=InstrumentDevice
+    '''
+
+    _class_info = {'name': '', 'decorators': {'OriginResourceType': 'InstrumentDevice'}, 'docstring': 'An\ object\ used\ for\ testing\ of\ the\ framework\ \@OriginResourceType\=InstrumentDevice'}
+
+    def __init__(self, _id='', resource=None, resource_schema=None):
+        ResourcePrepareSupport.__init__(self, _id, resource, resource_schema)
+        self.type_ = 'TestPrepareUpdateResource'
+
+    _schema = dict(ResourcePrepareSupport._schema.items() + {
+              }.items())
+
+class TestExtendedResourceDevice(ExtendedResource):
+    '''
+    An object used for testing of the framework @OriginResourceType=Device
+    '''
+
+    _class_info = {'name': '', 'decorators': {'OriginResourceType': 'Device'}, 'docstring': 'An\ object\ used\ for\ testing\ of\ the\ framework\ \@OriginResourceType\=Device'}
+
+    def __init__(self, _id='', ts_created='', lcstate_transitions=None, availability_transitions=None, resource=None, ext_associations=None, computed=None, policies=None, owners=None, orgs=None, attachments=None, policy_count=0):
+        ExtendedResource.__init__(self, _id, ts_created, lcstate_transitions, availability_transitions, resource, ext_associations, computed, policies, owners, orgs, attachments)
+        self.type_ = 'TestExtendedResourceDevice'
+        self.policy_count = policy_count
+
+    _schema = dict(ExtendedResource._schema.items() + {
+                'policy_count': {'type': 'int', 'default': 0, 'decorators': {"hasPolicy": ""}, 'description': ''},
+              }.items())
+
+class TestExtendedResourceBad(ExtendedResource):
+    '''
+    An object used for testing of the framework @OriginResourceType=Org
+    '''
+
+    _class_info = {'name': '', 'decorators': {'OriginResourceType': 'Org'}, 'docstring': 'An\ object\ used\ for\ testing\ of\ the\ framework\ \@OriginResourceType\=Org'}
+
+    def __init__(self, _id='', ts_created='', lcstate_transitions=None, availability_transitions=None, resource=None, ext_associations=None, computed=None, policies=None, owners=None, orgs=None, attachments=None, policy_count=0):
+        ExtendedResource.__init__(self, _id, ts_created, lcstate_transitions, availability_transitions, resource, ext_associations, computed, policies, owners, orgs, attachments)
+        self.type_ = 'TestExtendedResourceBad'
+        self.policy_count = policy_count
+
+    _schema = dict(ExtendedResource._schema.items() + {
+                'policy_count': {'type': 'int', 'default': 0, 'decorators': {"hasPolicy": ""}, 'description': ''},
+              }.items())
+
+class TestExtendedInformationResource(ExtendedResource):
+    '''
+    @OriginResourceType=InformationResource
+    '''
+
+    _class_info = {'name': '', 'decorators': {'OriginResourceType': 'InformationResource'}, 'docstring': '\@OriginResourceType\=InformationResource'}
+
+    def __init__(self, _id='', ts_created='', lcstate_transitions=None, availability_transitions=None, resource=None, ext_associations=None, computed=None, policies=None, owners=None, orgs=None, attachments=None, user_id=''):
+        ExtendedResource.__init__(self, _id, ts_created, lcstate_transitions, availability_transitions, resource, ext_associations, computed, policies, owners, orgs, attachments)
+        self.type_ = 'TestExtendedInformationResource'
+        self.user_id = user_id
+
+    _schema = dict(ExtendedResource._schema.items() + {
+                'user_id': {'type': 'str', 'default': '', 'decorators': {"Method": "get_user_id_test"}, 'description': ''},
+              }.items())
+
+class ExtendedInformationResource(ExtendedResource):
+    '''
+    @OriginResourceType=InformationResource
+    '''
+
+    _class_info = {'name': '', 'decorators': {'OriginResourceType': 'InformationResource'}, 'docstring': '\@OriginResourceType\=InformationResource'}
+
+    def __init__(self, _id='', ts_created='', lcstate_transitions=None, availability_transitions=None, resource=None, ext_associations=None, computed=None, policies=None, owners=None, orgs=None, attachments=None):
+        ExtendedResource.__init__(self, _id, ts_created, lcstate_transitions, availability_transitions, resource, ext_associations, computed, policies, owners, orgs, attachments)
+        self.type_ = 'ExtendedInformationResource'
+
+    _schema = dict(ExtendedResource._schema.items() + {
+              }.items())
+
+class ExtendedTaskableResource(ExtendedResource):
+    '''
+    @OriginResourceType=TaskableResource
+    '''
+
+    _class_info = {'name': '', 'decorators': {'OriginResourceType': 'TaskableResource'}, 'docstring': '\@OriginResourceType\=TaskableResource'}
+
+    def __init__(self, _id='', ts_created='', lcstate_transitions=None, availability_transitions=None, resource=None, ext_associations=None, computed=None, policies=None, owners=None, orgs=None, attachments=None):
+        ExtendedResource.__init__(self, _id, ts_created, lcstate_transitions, availability_transitions, resource, ext_associations, computed, policies, owners, orgs, attachments)
+        self.type_ = 'ExtendedTaskableResource'
+
+    _schema = dict(ExtendedResource._schema.items() + {
+              }.items())
+
+class Phone(IonObjectBase):
+    '''
+    Holds a phone number and indicates its type.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Holds\ a\ phone\ number\ and\ indicates\ its\ type\.'}
+
+    def __init__(self, phone_number='', phone_type=''):
+        self.type_ = 'Phone'
+        # The phone number.  phone number is assumed US if no '+' prefix exists to specify a country code
+        self.phone_number = phone_number
+        # The type of phone number
+        self.phone_type = phone_type
+
+    _schema = {
+                'phone_number': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ The\ phone\ number\.\ \ phone\ number\ is\ assumed\ US\ if\ no\ \'\+\'\ prefix\ exists\ to\ specify\ a\ country\ code'},
+                'phone_type': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ The\ type\ of\ phone\ number'},
+              }
+
+class ContactInformation(IonObjectBase):
+    '''
+    Data structure for representing contact information uniformly across resources.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Data\ structure\ for\ representing\ contact\ information\ uniformly\ across\ resources\.'}
+
+    def __init__(self, organization_name='', individual_names_given='', individual_name_family='', street_address='', city='', postal_code='', country='', phones=None, email='', administrative_area='', position_name='', roles=None, url='', variables=None):
+        self.type_ = 'ContactInformation'
+        # The name of the organization.  Can be used in place of an individually-named contact when appropriate.
+        self.organization_name = organization_name
+        # The given, i.e. first and optionally middle, name(s)
+        self.individual_names_given = individual_names_given
+        # The family, aka last, name
+        self.individual_name_family = individual_name_family
+        # The street address portion of the mailing address
+        self.street_address = street_address
+        # The city part of the address
+        self.city = city
+        # The postal code, i.e. zip code
+        self.postal_code = postal_code
+        # The country part of the address.
+        self.country = country
+        # A list of phone contacts as a lists of Phone object
+        self.phones = phones or []
+        # Primary email for the contact
+        self.email = email
+        # Any placenames that are less specific than country and more specific than city, e.g. state or province.
+        self.administrative_area = administrative_area
+        # The position or role of the contact. For example, it may be preferable to name "OOI Data Curator" as a contact
+        # instead of giving an individual's name, since the individual may change through time
+        self.position_name = position_name
+        # The list of roles this contact has, e.g. owner, custodian, PointOfcontact
+        self.roles = roles or []
+        # URL for the contact
+        self.url = url
+        # A list holding the extra information about user so that specific variables do not need to be held,
+        # e.g. IM, alternate phone, second address, facebook, etc.
+        self.variables = variables or {}
+
+    _schema = {
+                'organization_name': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ The\ name\ of\ the\ organization\.\ \ Can\ be\ used\ in\ place\ of\ an\ individually\-named\ contact\ when\ appropriate\.'},
+                'individual_names_given': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ The\ given\,\ i\.e\.\ first\ and\ optionally\ middle\,\ name\(s\)'},
+                'individual_name_family': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ The\ family\,\ aka\ last\,\ name'},
+                'street_address': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ The\ street\ address\ portion\ of\ the\ mailing\ address'},
+                'city': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ The\ city\ part\ of\ the\ address'},
+                'postal_code': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ The\ postal\ code\,\ i\.e\.\ zip\ code'},
+                'country': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ The\ country\ part\ of\ the\ address\.'},
+                'phones': {'type': 'list', 'default': [], 'decorators': {"ContentType": "Phone"}, 'description': '\ A\ list\ of\ phone\ contacts\ as\ a\ lists\ of\ Phone\ object\ list\ of\ phone\ objects'},
+                'email': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Primary\ email\ for\ the\ contact'},
+                'administrative_area': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Any\ placenames\ that\ are\ less\ specific\ than\ country\ and\ more\ specific\ than\ city\,\ e\.g\.\ state\ or\ province\.'},
+                'position_name': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ The\ position\ or\ role\ of\ the\ contact\.\ For\ example\,\ it\ may\ be\ preferable\ to\ name\ \"OOI\ Data\ Curator\"\ as\ a\ contact\ \ instead\ of\ giving\ an\ individual\'s\ name\,\ since\ the\ individual\ may\ change\ through\ time\ the\ position\ or\ role\ of\ the\ contact'},
+                'roles': {'type': 'list', 'default': [], 'decorators': {"ContentType": "str"}, 'description': '\ The\ list\ of\ roles\ this\ contact\ has\,\ e\.g\.\ owner\,\ custodian\,\ PointOfcontact'},
+                'url': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ URL\ for\ the\ contact'},
+                'variables': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': '\ A\ list\ holding\ the\ extra\ information\ about\ user\ so\ that\ specific\ variables\ do\ not\ need\ to\ be\ held\,\ \ e\.g\.\ IM\,\ alternate\ phone\,\ second\ address\,\ facebook\,\ etc\.'},
+              }
+
+class Institution(IonObjectBase):
+    '''
+    Data structure for representing institution information uniformly across resources
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Data\ structure\ for\ representing\ institution\ information\ uniformly\ across\ resources'}
+
+    def __init__(self, name='', phone='', email='', website=''):
+        self.type_ = 'Institution'
+        # Name of the institution
+        self.name = name
+        # Primary phone for the institution
+        self.phone = phone
+        # Primary email for the institution
+        self.email = email
+        # Website URL for the institution
+        self.website = website
+
+    _schema = {
+                'name': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Name\ of\ the\ institution'},
+                'phone': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Primary\ phone\ for\ the\ institution'},
+                'email': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Primary\ email\ for\ the\ institution'},
+                'website': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Website\ URL\ for\ the\ institution'},
+              }
+
+class GeospatialCoordinateReferenceSystem(IonObjectBase):
+    '''
+    Data structure for representing geospatial and vertical coordinate reference systems uniformly across resources.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Data\ structure\ for\ representing\ geospatial\ and\ vertical\ coordinate\ reference\ systems\ uniformly\ across\ resources\.'}
+
+    def __init__(self, geospatial_geodetic_crs='', geospatial_vertical_crs='', geospatial_latitude_units='', geospatial_longitude_units='', geospatial_vertical_units='', geospatial_vertical_positive=''):
+        self.type_ = 'GeospatialCoordinateReferenceSystem'
+        # The geospatial coordinate reference system, expressed as a URI (ideally a URL); incorporates both coordinate
+        # system and datum; may be geodetic horizonal, vertical, or both
+        self.geospatial_geodetic_crs = geospatial_geodetic_crs
+        # The vertical coordinate reference system, expressed as a URI (ideally a URL); incorporates both
+        # coordinate system and datum
+        self.geospatial_vertical_crs = geospatial_vertical_crs
+        # Specifies the units of measure for latitude
+        self.geospatial_latitude_units = geospatial_latitude_units
+        # Specifies the units of measure for longitude
+        self.geospatial_longitude_units = geospatial_longitude_units
+        # The units of measure for the vertical location; overrides the geospatial_vertical_crs, if those units are different
+        self.geospatial_vertical_units = geospatial_vertical_units
+        # Specifies the direction meant by more positive vertical location values; up indicates more positive
+        # values are further from earth's center.
+        self.geospatial_vertical_positive = geospatial_vertical_positive
+
+    _schema = {
+                'geospatial_geodetic_crs': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ The\ geospatial\ coordinate\ reference\ system\,\ expressed\ as\ a\ URI\ \(ideally\ a\ URL\)\;\ incorporates\ both\ coordinate\ \ system\ and\ datum\;\ may\ be\ geodetic\ horizonal\,\ vertical\,\ or\ both'},
+                'geospatial_vertical_crs': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ The\ vertical\ coordinate\ reference\ system\,\ expressed\ as\ a\ URI\ \(ideally\ a\ URL\)\;\ incorporates\ both\ \ coordinate\ system\ and\ datum'},
+                'geospatial_latitude_units': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Specifies\ the\ units\ of\ measure\ for\ latitude'},
+                'geospatial_longitude_units': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Specifies\ the\ units\ of\ measure\ for\ longitude'},
+                'geospatial_vertical_units': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ The\ units\ of\ measure\ for\ the\ vertical\ location\;\ overrides\ the\ geospatial\_vertical\_crs\,\ if\ those\ units\ are\ different'},
+                'geospatial_vertical_positive': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Specifies\ the\ direction\ meant\ by\ more\ positive\ vertical\ location\ values\;\ up\ indicates\ more\ positive\ \ values\ are\ further\ from\ earth\'s\ center\.'},
+              }
+
+class GeospatialBounds(IonObjectBase):
+    '''
+    Data structure for representing geospatial bounds uniformly across resources, including vertical bounds.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Data\ structure\ for\ representing\ geospatial\ bounds\ uniformly\ across\ resources\,\ including\ vertical\ bounds\.'}
+
+    def __init__(self, geospatial_latitude_limit_north=0.0, geospatial_latitude_limit_south=0.0, geospatial_longitude_limit_east=0.0, geospatial_longitude_limit_west=0.0, geospatial_vertical_min=0.0, geospatial_vertical_max=0.0):
+        self.type_ = 'GeospatialBounds'
+        # Specifies one or both limits, for any or all of an entity's latitude, longitude, and vertical position,
+        # with respect to a geospatial CRS
+        self.geospatial_latitude_limit_north = geospatial_latitude_limit_north
+        # Specifies the southernmost latitude
+        self.geospatial_latitude_limit_south = geospatial_latitude_limit_south
+        # Specifies the easternmost longitude (if the value is smaller than the minimum longitude, the bounds fall
+        # on either side of the 18th meridian, and the enclosed area includes that meridian)
+        self.geospatial_longitude_limit_east = geospatial_longitude_limit_east
+        # Specifies the westernmost longitude (if the value is larger than the maximum longitude, the bounds fall
+        # on either side of the 180th meridian, and the enclosed area includes that meridian)
+        self.geospatial_longitude_limit_west = geospatial_longitude_limit_west
+        # Specifies the (numerically) minimum vertical position; if the vertical/z axis positive (geospatial_vertical_positive)
+        # is down, the minimum value will be further away from earth center than the maximum value
+        self.geospatial_vertical_min = geospatial_vertical_min
+        # Specifies the (numerically) maximum vertical position; if the vertical/z axis positive (geospatial_vertical_positive)
+        # is down, the maximum value will be closer to earth center than the minimum value
+        self.geospatial_vertical_max = geospatial_vertical_max
+
+    _schema = {
+                'geospatial_latitude_limit_north': {'type': 'float', 'default': 0.0, 'decorators': {}, 'description': '\ Specifies\ one\ or\ both\ limits\,\ for\ any\ or\ all\ of\ an\ entity\'s\ latitude\,\ longitude\,\ and\ vertical\ position\,\ \ with\ respect\ to\ a\ geospatial\ CRS'},
+                'geospatial_latitude_limit_south': {'type': 'float', 'default': 0.0, 'decorators': {}, 'description': '\ Specifies\ the\ southernmost\ latitude'},
+                'geospatial_longitude_limit_east': {'type': 'float', 'default': 0.0, 'decorators': {}, 'description': '\ Specifies\ the\ easternmost\ longitude\ \(if\ the\ value\ is\ smaller\ than\ the\ minimum\ longitude\,\ the\ bounds\ fall\ \ on\ either\ side\ of\ the\ 18th\ meridian\,\ and\ the\ enclosed\ area\ includes\ that\ meridian\)'},
+                'geospatial_longitude_limit_west': {'type': 'float', 'default': 0.0, 'decorators': {}, 'description': '\ Specifies\ the\ westernmost\ longitude\ \(if\ the\ value\ is\ larger\ than\ the\ maximum\ longitude\,\ the\ bounds\ fall\ \ on\ either\ side\ of\ the\ 180th\ meridian\,\ and\ the\ enclosed\ area\ includes\ that\ meridian\)'},
+                'geospatial_vertical_min': {'type': 'float', 'default': 0.0, 'decorators': {}, 'description': '\ Specifies\ the\ \(numerically\)\ minimum\ vertical\ position\;\ if\ the\ vertical\/z\ axis\ positive\ \(geospatial\_vertical\_positive\)\ \ is\ down\,\ the\ minimum\ value\ will\ be\ further\ away\ from\ earth\ center\ than\ the\ maximum\ value'},
+                'geospatial_vertical_max': {'type': 'float', 'default': 0.0, 'decorators': {}, 'description': '\ Specifies\ the\ \(numerically\)\ maximum\ vertical\ position\;\ if\ the\ vertical\/z\ axis\ positive\ \(geospatial\_vertical\_positive\)\ \ is\ down\,\ the\ maximum\ value\ will\ be\ closer\ to\ earth\ center\ than\ the\ minimum\ value'},
+              }
+
+class GeospatialPoint(IonObjectBase):
+    '''
+    Data structure for representing a geospatial point uniformly across resources.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Data\ structure\ for\ representing\ a\ geospatial\ point\ uniformly\ across\ resources\.'}
+
+    def __init__(self, geospatial_vertical_location=0.0, geospatial_vertical_accuracy=0.0, geospatial_latitude=0.0, geospatial_longitude=0.0, geospatial_horizontal_accuracy=0.0):
+        self.type_ = 'GeospatialPoint'
+        # Specifies a vertical position (relative to the datum, along the axis direction specified by geospatial_vertical_positive)
+        self.geospatial_vertical_location = geospatial_vertical_location
+        # The accuracy of the vertical value, expressed in the same units
+        self.geospatial_vertical_accuracy = geospatial_vertical_accuracy
+        # Specifies the latitude, longitude, and/or vertical location of an entity, with respect to a geospatial CRS
+        self.geospatial_latitude = geospatial_latitude
+        # Specifies the longitude
+        self.geospatial_longitude = geospatial_longitude
+        # The accuracy of the lat/lon info, expressed in the same units as the lat/lon fields
+        self.geospatial_horizontal_accuracy = geospatial_horizontal_accuracy
+
+    _schema = {
+                'geospatial_vertical_location': {'type': 'float', 'default': 0.0, 'decorators': {}, 'description': '\ Specifies\ a\ vertical\ position\ \(relative\ to\ the\ datum\,\ along\ the\ axis\ direction\ specified\ by\ geospatial\_vertical\_positive\)'},
+                'geospatial_vertical_accuracy': {'type': 'float', 'default': 0.0, 'decorators': {}, 'description': '\ The\ accuracy\ of\ the\ vertical\ value\,\ expressed\ in\ the\ same\ units'},
+                'geospatial_latitude': {'type': 'float', 'default': 0.0, 'decorators': {}, 'description': '\ Specifies\ the\ latitude\,\ longitude\,\ and\/or\ vertical\ location\ of\ an\ entity\,\ with\ respect\ to\ a\ geospatial\ CRS'},
+                'geospatial_longitude': {'type': 'float', 'default': 0.0, 'decorators': {}, 'description': '\ Specifies\ the\ longitude'},
+                'geospatial_horizontal_accuracy': {'type': 'float', 'default': 0.0, 'decorators': {}, 'description': '\ The\ accuracy\ of\ the\ lat\/lon\ info\,\ expressed\ in\ the\ same\ units\ as\ the\ lat\/lon\ fields'},
+              }
+
+class GeospatialLocation(IonObjectBase):
+    '''
+    Simplified data structure for representing a geospatial point uniformly across resources.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Simplified\ data\ structure\ for\ representing\ a\ geospatial\ point\ uniformly\ across\ resources\.'}
+
+    def __init__(self, latitude=0.0, longitude=0.0, elevation=0.0):
+        self.type_ = 'GeospatialLocation'
+        # Specifies the latitude in WGS84 CRS
+        self.latitude = latitude
+        # Specifies the longitude in WGS84 CRS
+        self.longitude = longitude
+        # Specifies a vertical position
+        self.elevation = elevation
+
+    _schema = {
+                'latitude': {'type': 'float', 'default': 0.0, 'decorators': {}, 'description': '\ Specifies\ the\ latitude\ in\ WGS84\ CRS'},
+                'longitude': {'type': 'float', 'default': 0.0, 'decorators': {}, 'description': '\ Specifies\ the\ longitude\ in\ WGS84\ CRS'},
+                'elevation': {'type': 'float', 'default': 0.0, 'decorators': {}, 'description': '\ Specifies\ a\ vertical\ position'},
+              }
+
+class GeospatialIndex(IonObjectBase):
+    '''
+    Object representing the geospatial location in a searchable index (deprecated)
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Object\ representing\ the\ geospatial\ location\ in\ a\ searchable\ index\ \(deprecated\)'}
+
+    def __init__(self, lat=0.0, lon=0.0):
+        self.type_ = 'GeospatialIndex'
+        self.lat = lat
+        self.lon = lon
+
+    _schema = {
+                'lat': {'type': 'float', 'default': 0.0, 'decorators': {}, 'description': ''},
+                'lon': {'type': 'float', 'default': 0.0, 'decorators': {}, 'description': ''},
+              }
+
+class TemporalBounds(IonObjectBase):
+    '''
+    Data structure for representing temporal bounds uniformly across resources.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Data\ structure\ for\ representing\ temporal\ bounds\ uniformly\ across\ resources\.'}
+
+    def __init__(self, name='', start_datetime='', end_datetime=''):
+        self.type_ = 'TemporalBounds'
+        # Allows the kind of datetime to be specified, in cases where more than one TemporalBounds is used.
+        # For example to differentiate the planned vs actual deployment datetimes.
+        self.name = name
+        # The start of the timespan (string with number of seconds since epoch)
+        self.start_datetime = start_datetime
+        # The end of the timespan (string with number of seconds since epoch)
+        self.end_datetime = end_datetime
+
+    _schema = {
+                'name': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Allows\ the\ kind\ of\ datetime\ to\ be\ specified\,\ in\ cases\ where\ more\ than\ one\ TemporalBounds\ is\ used\.\ \ For\ example\ to\ differentiate\ the\ planned\ vs\ actual\ deployment\ datetimes\.'},
+                'start_datetime': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ The\ start\ of\ the\ timespan\ \(string\ with\ number\ of\ seconds\ since\ epoch\)'},
+                'end_datetime': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ The\ end\ of\ the\ timespan\ \(string\ with\ number\ of\ seconds\ since\ epoch\)'},
+              }
+
+class OrgDetails(IonObjectBase):
+    '''
+    Object holding additional details for an Org to be extended
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Object\ holding\ additional\ details\ for\ an\ Org\ to\ be\ extended'}
+
+    def __init__(self):
+        self.type_ = 'OrgDetails'
+
+    _schema = {
+              }
+
+class IdentityDetails(IonObjectBase):
+    '''
+    Object holding additional details for ActorIdentity to be extended
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Object\ holding\ additional\ details\ for\ ActorIdentity\ to\ be\ extended'}
+
+    def __init__(self):
+        self.type_ = 'IdentityDetails'
+
+    _schema = {
+              }
+
+class AgentCapability(IonObjectBase):
+    '''
+    Describes a specific capability of an agent
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Describes\ a\ specific\ capability\ of\ an\ agent'}
+
+    def __init__(self, name='', cap_type=CapabilityType.AGT_CMD, restrictions=None, schema=None):
+        self.type_ = 'AgentCapability'
+        # Capability name
+        self.name = name
+        # Capability type
+        self.cap_type = cap_type
+        # Known restrictions when issuing this agent capability
+        self.restrictions = restrictions or {}
+        # Capability schema
+        self.schema = schema or {}
+
+    _schema = {
+                'name': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Capability\ name'},
+                'cap_type': {'type': 'int', 'default': CapabilityType.AGT_CMD, 'enum_type': 'CapabilityType', 'decorators': {}, 'description': '\ Capability\ type'},
+                'restrictions': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': '\ Known\ restrictions\ when\ issuing\ this\ agent\ capability'},
+                'schema': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': '\ Capability\ schema'},
+              }
+
+class AgentCommand(IonObjectBase):
+    '''
+    Holds a command to a resource agent
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Holds\ a\ command\ to\ a\ resource\ agent'}
+
+    def __init__(self, command_id='', command='', args=None, kwargs=None):
+        self.type_ = 'AgentCommand'
+        # Unique identifier for this specific command
+        self.command_id = command_id
+        # The actual command code
+        self.command = command
+        # Additional positional args for the command
+        self.args = args or []
+        # Additional keyword args for the command
+        self.kwargs = kwargs or {}
+
+    _schema = {
+                'command_id': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Unique\ identifier\ for\ this\ specific\ command'},
+                'command': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ The\ actual\ command\ code'},
+                'args': {'type': 'list', 'default': [], 'decorators': {}, 'description': '\ Additional\ positional\ args\ for\ the\ command'},
+                'kwargs': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': '\ Additional\ keyword\ args\ for\ the\ command'},
+              }
+
+class AgentCommandResult(IonObjectBase):
+    '''
+    Holds the status of the execution of a command to a resource agent
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Holds\ the\ status\ of\ the\ execution\ of\ a\ command\ to\ a\ resource\ agent'}
+
+    def __init__(self, command_id='', command='', ts_execute='', status='', result=''):
+        self.type_ = 'AgentCommandResult'
+        # Unique identifier of a previously issued command
+        self.command_id = command_id
+        # The actual command code
+        self.command = command
+        # Timestamp when the command started to execute
+        self.ts_execute = ts_execute
+        # Result status of command
+        self.status = status
+        # Result value of command execution
+        self.result = result
+
+    _schema = {
+                'command_id': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Unique\ identifier\ of\ a\ previously\ issued\ command'},
+                'command': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ The\ actual\ command\ code'},
+                'ts_execute': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Timestamp\ when\ the\ command\ started\ to\ execute'},
+                'status': {'type': 'str', 'default': '', 'decorators': {"ContentType": "int,str"}, 'description': '\ Result\ status\ of\ command'},
+                'result': {'type': 'str', 'default': '', 'decorators': {"ContentType": "list,str,dict"}, 'description': '\ Result\ value\ of\ command\ execution'},
+              }
+
+class AgentSchema(IonObjectBase):
+    '''
+    Defines the command and parameter schema for a resource agent representing a taskable resource.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Defines\ the\ command\ and\ parameter\ schema\ for\ a\ resource\ agent\ representing\ a\ taskable\ resource\.'}
+
+    def __init__(self, agent_schema='', resource_schema=''):
+        self.type_ = 'AgentSchema'
+        self.agent_schema = agent_schema
+        self.resource_schema = resource_schema
+
+    _schema = {
+                'agent_schema': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'resource_schema': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+              }
+
+class AgentDefinition(InformationResource):
+    '''
+    Describes a type of agent. Abstract base type.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Describes\ a\ type\ of\ agent\.\ Abstract\ base\ type\.'}
+
+    def __init__(self, name='', description='', lcstate='DRAFT', availability='PRIVATE', visibility=ResourceVisibilityEnum.PUBLIC, ts_created='', ts_updated='', alt_ids=None, addl=None, agent_version='', agent_default_config=None):
+        InformationResource.__init__(self, name, description, lcstate, availability, visibility, ts_created, ts_updated, alt_ids, addl)
+        self.type_ = 'AgentDefinition'
+        # Released version of driver code package. NOTE: this is set instead of the driver_version
+        self.agent_version = agent_version
+        # The default settings for this agent (pubrate, etc)
+        self.agent_default_config = agent_default_config or {}
+
+    _schema = dict(InformationResource._schema.items() + {
+                'agent_version': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Released\ version\ of\ driver\ code\ package\.\ NOTE\:\ this\ is\ set\ instead\ of\ the\ driver\_version'},
+                'agent_default_config': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': '\ The\ default\ settings\ for\ this\ agent\ \(pubrate\,\ etc\)'},
+              }.items())
+
+class AgentInstance(InformationResource):
+    '''
+    Describes a running or scheduled agent representing a single resource. Abstract base type.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Describes\ a\ running\ or\ scheduled\ agent\ representing\ a\ single\ resource\.\ Abstract\ base\ type\.'}
+
+    def __init__(self, name='', description='', lcstate='DRAFT', availability='PRIVATE', visibility=ResourceVisibilityEnum.PUBLIC, ts_created='', ts_updated='', alt_ids=None, addl=None, deployment_type='', driver_config=None, saved_agent_state=None):
+        InformationResource.__init__(self, name, description, lcstate, availability, visibility, ts_created, ts_updated, alt_ids, addl)
+        self.type_ = 'AgentInstance'
+        # The type of agent deployment
+        self.deployment_type = deployment_type
+        # Specific config for the agent driver, such as connection ports
+        self.driver_config = driver_config or {}
+        # Agent process state from prior agent run
+        self.saved_agent_state = saved_agent_state or {}
+
+    _schema = dict(InformationResource._schema.items() + {
+                'deployment_type': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ The\ type\ of\ agent\ deployment'},
+                'driver_config': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': '\ Specific\ config\ for\ the\ agent\ driver\,\ such\ as\ connection\ ports'},
+                'saved_agent_state': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': '\ Agent\ process\ state\ from\ prior\ agent\ run'},
+              }.items())
+
+class DirEntry(IonObjectBase):
+    '''
+    Node and leaf object within a directory tree
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Node\ and\ leaf\ object\ within\ a\ directory\ tree'}
+
+    def __init__(self, org='', parent='', key='', attributes=None, ts_created='', ts_updated=''):
+        self.type_ = 'DirEntry'
+        # Name of the Org this directory entry belongs to
+        self.org = org
+        # Path of the parent node within the directory tree
+        self.parent = parent
+        # Name of this node (composite or leaf) in the directory tree
+        self.key = key
+        # Key-value attributes associated to this node in the directory tree
+        self.attributes = attributes or {}
+        # Timestamp str in millis in UNIX epoch when this node was created
+        self.ts_created = ts_created
+        # Timestamp str in millis in UNIX epoch when this node was updated
+        self.ts_updated = ts_updated
+
+    _schema = {
+                'org': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Name\ of\ the\ Org\ this\ directory\ entry\ belongs\ to'},
+                'parent': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Path\ of\ the\ parent\ node\ within\ the\ directory\ tree'},
+                'key': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Name\ of\ this\ node\ \(composite\ or\ leaf\)\ in\ the\ directory\ tree'},
+                'attributes': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': '\ Key\-value\ attributes\ associated\ to\ this\ node\ in\ the\ directory\ tree'},
+                'ts_created': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Timestamp\ str\ in\ millis\ in\ UNIX\ epoch\ when\ this\ node\ was\ created'},
+                'ts_updated': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Timestamp\ str\ in\ millis\ in\ UNIX\ epoch\ when\ this\ node\ was\ updated'},
+              }
+
+class View(InformationResource):
+    '''
+    Specifies a standing, parameterizable query for resources and events. Can represent a "saved search".
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Specifies\ a\ standing\,\ parameterizable\ query\ for\ resources\ and\ events\.\ Can\ represent\ a\ \"saved\ search\"\.'}
+
+    def __init__(self, name='', description='', lcstate='DRAFT', availability='PRIVATE', visibility=ResourceVisibilityEnum.PUBLIC, ts_created='', ts_updated='', alt_ids=None, addl=None, view_type='', view_definition=None, view_parameters=None, param_values=None):
+        InformationResource.__init__(self, name, description, lcstate, availability, visibility, ts_created, ts_updated, alt_ids, addl)
+        self.type_ = 'View'
+        # Designates the type of view definition
+        self.view_type = view_type
+        # Detailed definition of the view according to the type
+        self.view_definition = view_definition or {}
+        # Definition of parameterized values within the view definition
+        self.view_parameters = view_parameters or []
+        # Default or filled set of parameterized values (matching view_parameters)
+        self.param_values = param_values or {}
+
+    _schema = dict(InformationResource._schema.items() + {
+                'view_type': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Designates\ the\ type\ of\ view\ definition'},
+                'view_definition': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': '\ Detailed\ definition\ of\ the\ view\ according\ to\ the\ type'},
+                'view_parameters': {'type': 'list', 'default': [], 'decorators': {"ContentType": "CustomAttribute"}, 'description': '\ Definition\ of\ parameterized\ values\ within\ the\ view\ definition'},
+                'param_values': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': '\ Default\ or\ filled\ set\ of\ parameterized\ values\ \(matching\ view\_parameters\)'},
+              }.items())
+
+class CapabilityContainer(TaskableResource):
+    '''
+    A capability container within the system, with the ability to host processes.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'A\ capability\ container\ within\ the\ system\,\ with\ the\ ability\ to\ host\ processes\.'}
+
+    def __init__(self, name='', description='', lcstate='DRAFT', availability='PRIVATE', visibility=ResourceVisibilityEnum.PUBLIC, ts_created='', ts_updated='', alt_ids=None, addl=None, version='', technology='Python', cc_agent='', execution_engine_config=None, container_info=None, status_log=None):
+        TaskableResource.__init__(self, name, description, lcstate, availability, visibility, ts_created, ts_updated, alt_ids, addl)
+        self.type_ = 'CapabilityContainer'
+        # Version identifier for this container type
+        self.version = version
+        # Class of technology
+        self.technology = technology
+        # Exchange name of the agent representing the container
+        self.cc_agent = cc_agent
+        # Execution engine config
+        self.execution_engine_config = execution_engine_config or {}
+        # Additional descriptive attributes about container and container's host system
+        self.container_info = container_info or {}
+        # Log of most recent container status snapshots
+        self.status_log = status_log or []
+
+    _schema = dict(TaskableResource._schema.items() + {
+                'version': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Version\ identifier\ for\ this\ container\ type'},
+                'technology': {'type': 'str', 'default': 'Python', 'decorators': {}, 'description': '\ Class\ of\ technology'},
+                'cc_agent': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Exchange\ name\ of\ the\ agent\ representing\ the\ container'},
+                'execution_engine_config': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': '\ Execution\ engine\ config'},
+                'container_info': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': '\ Additional\ descriptive\ attributes\ about\ container\ and\ container\'s\ host\ system'},
+                'status_log': {'type': 'list', 'default': [], 'decorators': {}, 'description': '\ Log\ of\ most\ recent\ container\ status\ snapshots'},
+              }.items())
+
+class ContainerHeartbeat(IonObjectBase):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, container_id='', ts='', attributes=None):
+        self.type_ = 'ContainerHeartbeat'
+        self.container_id = container_id
+        self.ts = ts
+        self.attributes = attributes or {}
+
+    _schema = {
+                'container_id': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'ts': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'attributes': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': ''},
+              }
+
+class ProcessArgument(IonObjectBase):
+    '''
+    Defines one argument that a process can receive on startup. This does not set an instance value.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Defines\ one\ argument\ that\ a\ process\ can\ receive\ on\ startup\.\ This\ does\ not\ set\ an\ instance\ value\.'}
+
+    def __init__(self, name='', type='', description='', default=None):
+        self.type_ = 'ProcessArgument'
+        self.name = name
+        self.type = type
+        self.description = description
+        self.default = default
+
+    _schema = {
+                'name': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'type': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'description': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'default': {'type': 'NoneType', 'default': None, 'decorators': {}, 'description': ''},
+              }
+
+class AbstractProcessDefinitionDetailType(IonObjectBase):
+    '''
+    Enumerates the possible deployments modes for an agent. Values include: PROCESS=One process per resource; SERVICE=One service per resource type Enumerates possible states of container processes. Enumerates possible states of system services. Abstract base type for process definition details attributes
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Enumerates\ the\ possible\ deployments\ modes\ for\ an\ agent\.\ Values\ include\:\ PROCESS\=One\ process\ per\ resource\;\ SERVICE\=One\ service\ per\ resource\ type\ Enumerates\ possible\ states\ of\ container\ processes\.\ Enumerates\ possible\ states\ of\ system\ services\.\ Abstract\ base\ type\ for\ process\ definition\ details\ attributes'}
+
+    def __init__(self):
+        self.type_ = 'AbstractProcessDefinitionDetailType'
+
+    _schema = {
+              }
+
+class AbstractProcessDetailType(IonObjectBase):
+    '''
+    Abstract base type for process details attributes
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Abstract\ base\ type\ for\ process\ details\ attributes'}
+
+    def __init__(self):
+        self.type_ = 'AbstractProcessDetailType'
+
+    _schema = {
+              }
+
+class ProcessDefinition(ExecutableResource):
+    '''
+    Specifies a type of executable process with references to executable or source code.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Specifies\ a\ type\ of\ executable\ process\ with\ references\ to\ executable\ or\ source\ code\.'}
+
+    def __init__(self, name='', description='', lcstate='DRAFT', availability='PRIVATE', visibility=ResourceVisibilityEnum.PUBLIC, ts_created='', ts_updated='', alt_ids=None, addl=None, definition_type='', version='', module='', class_name='', url='', arguments=None, definition=None):
+        ExecutableResource.__init__(self, name, description, lcstate, availability, visibility, ts_created, ts_updated, alt_ids, addl)
+        self.type_ = 'ProcessDefinition'
+        # Type or process definition
+        self.definition_type = definition_type
+        # Version of the same process definition
+        self.version = version
+        # The source code file in which the code is in
+        self.module = module
+        # The class name within the source code module
+        self.class_name = class_name
+        # location of the module
+        self.url = url
+        # This is a list of supported arguments. Each entry is a ProcessArgument object
+        self.arguments = arguments or []
+        # process definition specific information  that is true for all processes of this type
+        self.definition = definition or AbstractProcessDefinitionDetailType()
+
+    _schema = dict(ExecutableResource._schema.items() + {
+                'definition_type': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Type\ or\ process\ definition'},
+                'version': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Version\ of\ the\ same\ process\ definition'},
+                'module': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ The\ source\ code\ file\ in\ which\ the\ code\ is\ in'},
+                'class_name': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ The\ class\ name\ within\ the\ source\ code\ module'},
+                'url': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ location\ of\ the\ module'},
+                'arguments': {'type': 'list', 'default': [], 'decorators': {}, 'description': '\ This\ is\ a\ list\ of\ supported\ arguments\.\ Each\ entry\ is\ a\ ProcessArgument\ object'},
+                'definition': {'type': 'AbstractProcessDefinitionDetailType', 'default': AbstractProcessDefinitionDetailType(), 'decorators': {}, 'description': '\ process\ definition\ specific\ information\ \ that\ is\ true\ for\ all\ processes\ of\ this\ type'},
+              }.items())
+
+class Process(TaskableResource):
+    '''
+    Represents an executing computational entity in the system, executed by an Execution Engine. An instance of a process definition, of type service, agent or transformation process.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Represents\ an\ executing\ computational\ entity\ in\ the\ system\,\ executed\ by\ an\ Execution\ Engine\.\ An\ instance\ of\ a\ process\ definition\,\ of\ type\ service\,\ agent\ or\ transformation\ process\.'}
+
+    def __init__(self, name='', description='', lcstate='DRAFT', availability='PRIVATE', visibility=ResourceVisibilityEnum.PUBLIC, ts_created='', ts_updated='', alt_ids=None, addl=None, label='', service_name='', process_type='', process_state=ProcessStateEnum.REQUESTED, process_configuration=None, detail=None):
+        TaskableResource.__init__(self, name, description, lcstate, availability, visibility, ts_created, ts_updated, alt_ids, addl)
+        self.type_ = 'Process'
+        # Human legible label
+        self.label = label
+        # RPC interface type, e.g. service name
+        self.service_name = service_name
+        # Indicates a specialized type of CC process
+        self.process_type = process_type
+        # Last known state
+        self.process_state = process_state
+        # Config override for process
+        self.process_configuration = process_configuration or {}
+        # instance specific information
+        self.detail = detail or AbstractProcessDetailType()
+
+    _schema = dict(TaskableResource._schema.items() + {
+                'label': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Human\ legible\ label'},
+                'service_name': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ RPC\ interface\ type\,\ e\.g\.\ service\ name'},
+                'process_type': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Indicates\ a\ specialized\ type\ of\ CC\ process'},
+                'process_state': {'type': 'int', 'default': ProcessStateEnum.REQUESTED, 'enum_type': 'ProcessStateEnum', 'decorators': {}, 'description': '\ Last\ known\ state'},
+                'process_configuration': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': '\ Config\ override\ for\ process'},
+                'detail': {'type': 'AbstractProcessDetailType', 'default': AbstractProcessDetailType(), 'decorators': {}, 'description': '\ instance\ specific\ information'},
+              }.items())
+
+class ProcessTarget(IonObjectBase):
+    '''
+    Describes request scheduling a process on specific resources
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Describes\ request\ scheduling\ a\ process\ on\ specific\ resources'}
+
+    def __init__(self, execution_engine_id='', node_exclusive='', constraints=None):
+        self.type_ = 'ProcessTarget'
+        self.execution_engine_id = execution_engine_id
+        self.node_exclusive = node_exclusive
+        self.constraints = constraints or {}
+
+    _schema = {
+                'execution_engine_id': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'node_exclusive': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'constraints': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': ''},
+              }
+
+class ProcessSchedule(IonObjectBase):
+    '''
+    Describes request to schedule a process at a certain time or modality
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Describes\ request\ to\ schedule\ a\ process\ at\ a\ certain\ time\ or\ modality'}
+
+    def __init__(self, schedule_mode=ProcessScheduleMode.IMMEDIATE, restart_mode=ProcessRestartMode.NEVER, queueing_mode=ProcessQueueingMode.ALWAYS, schedule=None, target=None):
+        self.type_ = 'ProcessSchedule'
+        self.schedule_mode = schedule_mode
+        self.restart_mode = restart_mode
+        self.queueing_mode = queueing_mode
+        self.schedule = schedule
+        self.target = target or ProcessTarget()
+
+    _schema = {
+                'schedule_mode': {'type': 'int', 'default': ProcessScheduleMode.IMMEDIATE, 'enum_type': 'ProcessScheduleMode', 'decorators': {}, 'description': ''},
+                'restart_mode': {'type': 'int', 'default': ProcessRestartMode.NEVER, 'enum_type': 'ProcessRestartMode', 'decorators': {}, 'description': ''},
+                'queueing_mode': {'type': 'int', 'default': ProcessQueueingMode.ALWAYS, 'enum_type': 'ProcessQueueingMode', 'decorators': {}, 'description': ''},
+                'schedule': {'type': 'NoneType', 'default': None, 'decorators': {}, 'description': ''},
+                'target': {'type': 'ProcessTarget', 'default': ProcessTarget(), 'decorators': {}, 'description': ''},
+              }
+
+class ProcessState(IonObjectBase):
+    '''
+    Object keeping a persistent state of a process in the system, so that another process can pick the the same state in case of restart, recovery or migration.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Object\ keeping\ a\ persistent\ state\ of\ a\ process\ in\ the\ system\,\ so\ that\ another\ process\ can\ pick\ the\ the\ same\ state\ in\ case\ of\ restart\,\ recovery\ or\ migration\.'}
+
+    def __init__(self, state=None, ts='', process_type=None):
+        self.type_ = 'ProcessState'
+        self.state = state
+        self.ts = ts
+        self.process_type = process_type
+
+    _schema = {
+                'state': {'type': 'NoneType', 'default': None, 'decorators': {}, 'description': ''},
+                'ts': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'process_type': {'type': 'NoneType', 'default': None, 'decorators': {}, 'description': ''},
+              }
+
+class ServiceDefinition(ExecutableResource):
+    '''
+    Represents a type of service, available for instantiation within the OOI Integrated Observatory Network.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Represents\ a\ type\ of\ service\,\ available\ for\ instantiation\ within\ the\ OOI\ Integrated\ Observatory\ Network\.'}
+
+    def __init__(self, name='', description='', lcstate='DRAFT', availability='PRIVATE', visibility=ResourceVisibilityEnum.PUBLIC, ts_created='', ts_updated='', alt_ids=None, addl=None, definition_type='ion_svc_yml_1', definition='', operations=None, namespace=''):
+        ExecutableResource.__init__(self, name, description, lcstate, availability, visibility, ts_created, ts_updated, alt_ids, addl)
+        self.type_ = 'ServiceDefinition'
+        # The language of service specification. For future extensibility
+        self.definition_type = definition_type
+        # The actual service specification
+        self.definition = definition
+        # List of operations in this service.
+        self.operations = operations or []
+        # Relative path for specific service definition, e.g. "coi"
+        self.namespace = namespace
+
+    _schema = dict(ExecutableResource._schema.items() + {
+                'definition_type': {'type': 'str', 'default': 'ion_svc_yml_1', 'decorators': {}, 'description': '\ The\ language\ of\ service\ specification\.\ For\ future\ extensibility'},
+                'definition': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ The\ actual\ service\ specification'},
+                'operations': {'type': 'list', 'default': [], 'decorators': {}, 'description': '\ List\ of\ operations\ in\ this\ service\.'},
+                'namespace': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Relative\ path\ for\ specific\ service\ definition\,\ e\.g\.\ \"coi\"'},
+              }.items())
+
+class Service(TaskableResource):
+    '''
+    Represents an instance of a service definition, available for use within the OOI Integrated Observatory Network.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Represents\ an\ instance\ of\ a\ service\ definition\,\ available\ for\ use\ within\ the\ OOI\ Integrated\ Observatory\ Network\.'}
+
+    def __init__(self, name='', description='', lcstate='DRAFT', availability='PRIVATE', visibility=ResourceVisibilityEnum.PUBLIC, ts_created='', ts_updated='', alt_ids=None, addl=None, exchange_name='', state=ServiceStateEnum.PENDING, policy=None):
+        TaskableResource.__init__(self, name, description, lcstate, availability, visibility, ts_created, ts_updated, alt_ids, addl)
+        self.type_ = 'Service'
+        # The fully qualified name under which the service is available in the system
+        self.exchange_name = exchange_name
+        # Current service state as ServiceStateEnum value
+        self.state = state
+        # The policy pertaining to the service
+        self.policy = policy or {}
+
+    _schema = dict(TaskableResource._schema.items() + {
+                'exchange_name': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ The\ fully\ qualified\ name\ under\ which\ the\ service\ is\ available\ in\ the\ system'},
+                'state': {'type': 'int', 'default': ServiceStateEnum.PENDING, 'enum_type': 'ServiceStateEnum', 'decorators': {}, 'description': '\ Current\ service\ state\ as\ ServiceStateEnum\ value'},
+                'policy': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': '\ The\ policy\ pertaining\ to\ the\ service'},
+              }.items())
+
+class ContainerManagementPredicate(IonObjectBase):
+    '''
+    base class for all predicate types that select which containers should run a particular requested action
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'base\ class\ for\ all\ predicate\ types\ that\ select\ which\ containers\ should\ run\ a\ particular\ requested\ action'}
+
+    def __init__(self):
+        self.type_ = 'ContainerManagementPredicate'
+
+    _schema = {
+              }
+
+class ContainerManagementAction(IonObjectBase):
+    '''
+    base class for all requested actions for container management
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'base\ class\ for\ all\ requested\ actions\ for\ container\ management'}
+
+    def __init__(self):
+        self.type_ = 'ContainerManagementAction'
+
+    _schema = {
+              }
+
+class AllContainers(ContainerManagementPredicate):
+    '''
+    ########## PREDICATE TYPES ############# indicate that the request should be run on all containers
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': '\#\#\#\#\#\#\#\#\#\#\ PREDICATE\ TYPES\ \#\#\#\#\#\#\#\#\#\#\#\#\#\ indicate\ that\ the\ request\ should\ be\ run\ on\ all\ containers'}
+
+    def __init__(self, peer=None):
+        ContainerManagementPredicate.__init__(self)
+        self.type_ = 'AllContainers'
+        self.peer = peer
+
+    _schema = dict(ContainerManagementPredicate._schema.items() + {
+                'peer': {'type': 'NoneType', 'default': None, 'decorators': {"module": "pyon.container.management", "class": "AllContainers"}, 'description': ''},
+              }.items())
+
+class ChangeLogLevel(ContainerManagementAction):
+    '''
+    ########## ACTION TYPES #############
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': '\#\#\#\#\#\#\#\#\#\#\ ACTION\ TYPES\ \#\#\#\#\#\#\#\#\#\#\#\#\#'}
+
+    def __init__(self, logger='', level='', recursive=True):
+        ContainerManagementAction.__init__(self)
+        self.type_ = 'ChangeLogLevel'
+        self.logger = logger
+        self.level = level
+        self.recursive = recursive
+
+    _schema = dict(ContainerManagementAction._schema.items() + {
+                'logger': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'level': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'recursive': {'type': 'bool', 'default': True, 'decorators': {}, 'description': ''},
+              }.items())
+
+class ReportStatistics(ContainerManagementAction):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self):
+        ContainerManagementAction.__init__(self)
+        self.type_ = 'ReportStatistics'
+
+    _schema = dict(ContainerManagementAction._schema.items() + {
+              }.items())
+
+class ClearStatistics(ContainerManagementAction):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self):
+        ContainerManagementAction.__init__(self)
+        self.type_ = 'ClearStatistics'
+
+    _schema = dict(ContainerManagementAction._schema.items() + {
+              }.items())
+
+class ResetPolicyCache(ContainerManagementAction):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self):
+        ContainerManagementAction.__init__(self)
+        self.type_ = 'ResetPolicyCache'
+
+    _schema = dict(ContainerManagementAction._schema.items() + {
+              }.items())
+
+class TriggerGarbageCollection(ContainerManagementAction):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self):
+        ContainerManagementAction.__init__(self)
+        self.type_ = 'TriggerGarbageCollection'
+
+    _schema = dict(ContainerManagementAction._schema.items() + {
+              }.items())
+
+class TriggerContainerSnapshot(ContainerManagementAction):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, snapshot_id='', include_snapshots=None, exclude_snapshots=None, take_at_time='', clear_all=False, persist_snapshot=True, snapshot_kwargs=None):
+        ContainerManagementAction.__init__(self)
+        self.type_ = 'TriggerContainerSnapshot'
+        self.snapshot_id = snapshot_id
+        self.include_snapshots = include_snapshots or []
+        self.exclude_snapshots = exclude_snapshots or []
+        self.take_at_time = take_at_time
+        self.clear_all = clear_all
+        self.persist_snapshot = persist_snapshot
+        self.snapshot_kwargs = snapshot_kwargs or {}
+
+    _schema = dict(ContainerManagementAction._schema.items() + {
+                'snapshot_id': {'type': 'str', 'default': '', 'decorators': {}, 'description': 'Unique\ identifier\ for\ a\ snapshot'},
+                'include_snapshots': {'type': 'list', 'default': [], 'decorators': {}, 'description': 'List\ of\ special\ snapshots\ to\ include'},
+                'exclude_snapshots': {'type': 'list', 'default': [], 'decorators': {}, 'description': 'List\ of\ special\ snapshots\ to\ exclude'},
+                'take_at_time': {'type': 'str', 'default': '', 'decorators': {}, 'description': 'System\ timestamp\ for\ time\ when\ to\ take\ the\ snapshot'},
+                'clear_all': {'type': 'bool', 'default': False, 'decorators': {}, 'description': 'If\ True\,\ clear\ snapshots'},
+                'persist_snapshot': {'type': 'bool', 'default': True, 'decorators': {}, 'description': 'If\ True\,\ persist\ snapshot\,\ otherwise\ log'},
+                'snapshot_kwargs': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': 'Arbitrary\ args\ for\ snapshot'},
+              }.items())
+
+class StartGeventBlock(ContainerManagementAction):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, alarm_mode=False):
+        ContainerManagementAction.__init__(self)
+        self.type_ = 'StartGeventBlock'
+        self.alarm_mode = alarm_mode
+
+    _schema = dict(ContainerManagementAction._schema.items() + {
+                'alarm_mode': {'type': 'bool', 'default': False, 'decorators': {}, 'description': 'Use\ thread\ monitor\ mode\ to\ detect\ blocking\ instead\ of\ alarm\ mode'},
+              }.items())
+
+class StopGeventBlock(ContainerManagementAction):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self):
+        ContainerManagementAction.__init__(self)
+        self.type_ = 'StopGeventBlock'
+
+    _schema = dict(ContainerManagementAction._schema.items() + {
+              }.items())
+
+class PrepareSystemShutdown(ContainerManagementAction):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, mode=''):
+        ContainerManagementAction.__init__(self)
+        self.type_ = 'PrepareSystemShutdown'
+        self.mode = mode
+
+    _schema = dict(ContainerManagementAction._schema.items() + {
+                'mode': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+              }.items())
+
+class SecurityToken(IonObjectBase):
+    '''
+    Enumerates the possible types of security tokens Holds information for a user specific authorization token
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Enumerates\ the\ possible\ types\ of\ security\ tokens\ Holds\ information\ for\ a\ user\ specific\ authorization\ token'}
+
+    def __init__(self, token_string='', token_type=TokenTypeEnum.ACTOR_SECRET, expires='', status='', actor_id=None, merge_email='', attributes=None):
+        self.type_ = 'SecurityToken'
+        # The token secret
+        self.token_string = token_string
+        # The type of token - one of enum
+        self.token_type = token_type
+        # Timestamp (UNIX epoch) for when the token expires in UTC
+        self.expires = expires
+        # One of OPEN, VERIFIED, EXPIRED, CANCELLED
+        self.status = status
+        # ID of an actor identity.
+        self.actor_id = actor_id
+        # Email address of merge account
+        self.merge_email = merge_email
+        # Additional token attributes
+        self.attributes = attributes or {}
+
+    _schema = {
+                'token_string': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ The\ token\ secret'},
+                'token_type': {'type': 'int', 'default': TokenTypeEnum.ACTOR_SECRET, 'enum_type': 'TokenTypeEnum', 'decorators': {}, 'description': '\ The\ type\ of\ token\ \-\ one\ of\ enum'},
+                'expires': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Timestamp\ \(UNIX\ epoch\)\ for\ when\ the\ token\ expires\ in\ UTC'},
+                'status': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ One\ of\ OPEN\,\ VERIFIED\,\ EXPIRED\,\ CANCELLED'},
+                'actor_id': {'type': 'NoneType', 'default': None, 'decorators': {}, 'description': '\ ID\ of\ an\ actor\ identity\.'},
+                'merge_email': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Email\ address\ of\ merge\ account'},
+                'attributes': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': '\ Additional\ token\ attributes'},
+              }
+
+class Credentials(IonObjectBase):
+    '''
+    One set of user credentials from an external identity provider
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'One\ set\ of\ user\ credentials\ from\ an\ external\ identity\ provider'}
+
+    def __init__(self, authentication_service='', identity_provider='', username='', password_salt='', password_hash=''):
+        self.type_ = 'Credentials'
+        # Service that authenticates an actor
+        self.authentication_service = authentication_service
+        # Service that identities the specific actor.
+        self.identity_provider = identity_provider
+        # Actual credentials
+        self.username = username
+        self.password_salt = password_salt
+        self.password_hash = password_hash
+
+    _schema = {
+                'authentication_service': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Service\ that\ authenticates\ an\ actor'},
+                'identity_provider': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Service\ that\ identities\ the\ specific\ actor\.'},
+                'username': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Actual\ credentials'},
+                'password_salt': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'password_hash': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+              }
+
+class ActorIdentity(SystemResource):
+    '''
+    Enumerates the possible types of security tokens A registered system identity
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Enumerates\ the\ possible\ types\ of\ security\ tokens\ A\ registered\ system\ identity'}
+
+    def __init__(self, name='', description='', lcstate='DRAFT', availability='PRIVATE', visibility=ResourceVisibilityEnum.PUBLIC, ts_created='', ts_updated='', alt_ids=None, addl=None, actor_type='', details=None, credentials=None, auth_status=AuthStatusEnum.ENABLED, auth_count=0, auth_fail_count=0, auth_ts_last='', auth_ts_last_fail='', passwd_reset_token=None, session=None, session_expiry=''):
+        SystemResource.__init__(self, name, description, lcstate, availability, visibility, ts_created, ts_updated, alt_ids, addl)
+        self.type_ = 'ActorIdentity'
+        # The type of actor. One of user, agent, system, org
+        self.actor_type = actor_type
+        # Additional details object depending on actor type
+        self.details = details or IdentityDetails()
+        # Login credentials
+        self.credentials = credentials or []
+        # Current authentication status
+        self.auth_status = auth_status
+        # Number of successful authentications
+        self.auth_count = auth_count
+        # Number of failed logins since last successful login
+        self.auth_fail_count = auth_fail_count
+        # Last successful login
+        self.auth_ts_last = auth_ts_last
+        # Last successful login
+        self.auth_ts_last_fail = auth_ts_last_fail
+        # Password reset token
+        self.passwd_reset_token = passwd_reset_token or SecurityToken()
+        # Session information (cleared on
+        self.session = session or {}
+        # Session expiry
+        self.session_expiry = session_expiry
+
+    _schema = dict(SystemResource._schema.items() + {
+                'actor_type': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ The\ type\ of\ actor\.\ One\ of\ user\,\ agent\,\ system\,\ org'},
+                'details': {'type': 'IdentityDetails', 'default': IdentityDetails(), 'decorators': {}, 'description': '\ Additional\ details\ object\ depending\ on\ actor\ type'},
+                'credentials': {'type': 'list', 'default': [], 'decorators': {"ContentType": "Credentials"}, 'description': '\ Login\ credentials'},
+                'auth_status': {'type': 'int', 'default': AuthStatusEnum.ENABLED, 'enum_type': 'AuthStatusEnum', 'decorators': {}, 'description': '\ Current\ authentication\ status'},
+                'auth_count': {'type': 'int', 'default': 0, 'decorators': {}, 'description': '\ Number\ of\ successful\ authentications'},
+                'auth_fail_count': {'type': 'int', 'default': 0, 'decorators': {}, 'description': '\ Number\ of\ failed\ logins\ since\ last\ successful\ login'},
+                'auth_ts_last': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Last\ successful\ login'},
+                'auth_ts_last_fail': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Last\ successful\ login'},
+                'passwd_reset_token': {'type': 'SecurityToken', 'default': SecurityToken(), 'decorators': {}, 'description': '\ Password\ reset\ token'},
+                'session': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': '\ Session\ information\ \(cleared\ on'},
+                'session_expiry': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Session\ expiry'},
+              }.items())
+
+class UserIdentityDetails(IdentityDetails):
+    '''
+    Details for an individual registered with the system, with contact and profile information.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Details\ for\ an\ individual\ registered\ with\ the\ system\,\ with\ contact\ and\ profile\ information\.'}
+
+    def __init__(self, contact=None, tokens=None, profile=None, location=None):
+        IdentityDetails.__init__(self)
+        self.type_ = 'UserIdentityDetails'
+        # Describes user attributes as ContactInformation object
+        self.contact = contact or ContactInformation()
+        # List of user specific TokenInformation for authorization purposes
+        self.tokens = tokens or []
+        # Key-value properties for the user; e.g. for configuration or UI preferences
+        self.profile = profile or {}
+        # Registered location, e.g. derived from contact address
+        self.location = location or GeospatialLocation()
+
+    _schema = dict(IdentityDetails._schema.items() + {
+                'contact': {'type': 'ContactInformation', 'default': ContactInformation(), 'decorators': {}, 'description': '\ Describes\ user\ attributes\ as\ ContactInformation\ object'},
+                'tokens': {'type': 'list', 'default': [], 'decorators': {}, 'description': '\ List\ of\ user\ specific\ TokenInformation\ for\ authorization\ purposes'},
+                'profile': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': '\ Key\-value\ properties\ for\ the\ user\;\ e\.g\.\ for\ configuration\ or\ UI\ preferences'},
+                'location': {'type': 'GeospatialLocation', 'default': GeospatialLocation(), 'decorators': {}, 'description': '\ Registered\ location\,\ e\.g\.\ derived\ from\ contact\ address'},
+              }.items())
+
+class OAuthClientIdentityDetails(IdentityDetails):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, is_confidential=False, client_secret='', redirect_uris='', default_scopes=''):
+        IdentityDetails.__init__(self)
+        self.type_ = 'OAuthClientIdentityDetails'
+        # Is this a confidential client?
+        self.is_confidential = is_confidential
+        # Client secret
+        self.client_secret = client_secret
+        # Space separated list of https URLs for secure redirect
+        self.redirect_uris = redirect_uris
+        # Space separated list of scopes
+        self.default_scopes = default_scopes
+
+    _schema = dict(IdentityDetails._schema.items() + {
+                'is_confidential': {'type': 'bool', 'default': False, 'decorators': {}, 'description': '\ Is\ this\ a\ confidential\ client\?'},
+                'client_secret': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Client\ secret'},
+                'redirect_uris': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Space\ separated\ list\ of\ https\ URLs\ for\ secure\ redirect'},
+                'default_scopes': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Space\ separated\ list\ of\ scopes'},
+              }.items())
+
+class ExchangeSpace(InformationResource):
+    '''
+    Distributed namespace of Exchange participants, operated within one domain of authority.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Distributed\ namespace\ of\ Exchange\ participants\,\ operated\ within\ one\ domain\ of\ authority\.'}
+
+    def __init__(self, name='', description='', lcstate='DRAFT', availability='PRIVATE', visibility=ResourceVisibilityEnum.PUBLIC, ts_created='', ts_updated='', alt_ids=None, addl=None):
+        InformationResource.__init__(self, name, description, lcstate, availability, visibility, ts_created, ts_updated, alt_ids, addl)
+        self.type_ = 'ExchangeSpace'
+
+    _schema = dict(InformationResource._schema.items() + {
+              }.items())
+
+class ExchangeName(InformationResource):
+    '''
+    RCommunicating participant within an Exchange Space.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'RCommunicating\ participant\ within\ an\ Exchange\ Space\.'}
+
+    def __init__(self, name='', description='', lcstate='DRAFT', availability='PRIVATE', visibility=ResourceVisibilityEnum.PUBLIC, ts_created='', ts_updated='', alt_ids=None, addl=None, xn_type=''):
+        InformationResource.__init__(self, name, description, lcstate, availability, visibility, ts_created, ts_updated, alt_ids, addl)
+        self.type_ = 'ExchangeName'
+        # Type of exchange name. One of service, process, queue
+        self.xn_type = xn_type
+
+    _schema = dict(InformationResource._schema.items() + {
+                'xn_type': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Type\ of\ exchange\ name\.\ One\ of\ service\,\ process\,\ queue'},
+              }.items())
+
+class ExchangePoint(InformationResource):
+    '''
+    A message router within an Exchange Space.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'A\ message\ router\ within\ an\ Exchange\ Space\.'}
+
+    def __init__(self, name='', description='', lcstate='DRAFT', availability='PRIVATE', visibility=ResourceVisibilityEnum.PUBLIC, ts_created='', ts_updated='', alt_ids=None, addl=None, topology_type=''):
+        InformationResource.__init__(self, name, description, lcstate, availability, visibility, ts_created, ts_updated, alt_ids, addl)
+        self.type_ = 'ExchangePoint'
+        # Type of routing scheme.
+        self.topology_type = topology_type
+
+    _schema = dict(InformationResource._schema.items() + {
+                'topology_type': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Type\ of\ routing\ scheme\.'},
+              }.items())
+
+class ExchangeBroker(InformationResource):
+    '''
+    A message broker
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'A\ message\ broker'}
+
+    def __init__(self, name='', description='', lcstate='DRAFT', availability='PRIVATE', visibility=ResourceVisibilityEnum.PUBLIC, ts_created='', ts_updated='', alt_ids=None, addl=None, impl_type='', impl_version=''):
+        InformationResource.__init__(self, name, description, lcstate, availability, visibility, ts_created, ts_updated, alt_ids, addl)
+        self.type_ = 'ExchangeBroker'
+        self.impl_type = impl_type
+        self.impl_version = impl_version
+
+    _schema = dict(InformationResource._schema.items() + {
+                'impl_type': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'impl_version': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+              }.items())
+
+class StreamRoute(IonObjectBase):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, exchange_point='', routing_key='', credentials=None):
+        self.type_ = 'StreamRoute'
+        self.exchange_point = exchange_point
+        self.routing_key = routing_key
+        self.credentials = credentials or {}
+
+    _schema = {
+                'exchange_point': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'routing_key': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'credentials': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': ''},
+              }
+
+class Stream(InformationResource):
+    '''
+    Identified, unbounded sequence of data messages published with a unique topic.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Identified\,\ unbounded\ sequence\ of\ data\ messages\ published\ with\ a\ unique\ topic\.'}
+
+    def __init__(self, name='', description='', lcstate='DRAFT', availability='PRIVATE', visibility=ResourceVisibilityEnum.PUBLIC, ts_created='', ts_updated='', alt_ids=None, addl=None, stream_route=None, persisted=False, stream_type='', stream_name=''):
+        InformationResource.__init__(self, name, description, lcstate, availability, visibility, ts_created, ts_updated, alt_ids, addl)
+        self.type_ = 'Stream'
+        self.stream_route = stream_route or StreamRoute()
+        self.persisted = persisted
+        # stream type of stream
+        self.stream_type = stream_type
+        # The stream name identified by the stream configuration
+        self.stream_name = stream_name
+
+    _schema = dict(InformationResource._schema.items() + {
+                'stream_route': {'type': 'StreamRoute', 'default': StreamRoute(), 'decorators': {}, 'description': ''},
+                'persisted': {'type': 'bool', 'default': False, 'decorators': {}, 'description': ''},
+                'stream_type': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ stream\ type\ of\ stream'},
+                'stream_name': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ The\ stream\ name\ identified\ by\ the\ stream\ configuration'},
+              }.items())
+
+class StreamDefinition(InformationResource):
+    '''
+    Describes the format, structure, and characteristics of a stream and its granules (data records).
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Describes\ the\ format\,\ structure\,\ and\ characteristics\ of\ a\ stream\ and\ its\ granules\ \(data\ records\)\.'}
+
+    def __init__(self, name='', description='', lcstate='DRAFT', availability='PRIVATE', visibility=ResourceVisibilityEnum.PUBLIC, ts_created='', ts_updated='', alt_ids=None, addl=None, parameter_dictionary=None, stream_type='', available_fields=None, stream_configuration=None):
+        InformationResource.__init__(self, name, description, lcstate, availability, visibility, ts_created, ts_updated, alt_ids, addl)
+        self.type_ = 'StreamDefinition'
+        self.parameter_dictionary = parameter_dictionary or {}
+        self.stream_type = stream_type
+        self.available_fields = available_fields or []
+        self.stream_configuration = stream_configuration or {}
+
+    _schema = dict(InformationResource._schema.items() + {
+                'parameter_dictionary': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': ''},
+                'stream_type': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'available_fields': {'type': 'list', 'default': [], 'decorators': {}, 'description': ''},
+                'stream_configuration': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': ''},
+              }.items())
+
+class Subscription(InformationResource):
+    '''
+    Represents a standing request to receive information from streaming sources. Typically, represents a pubsub queue receiving science data granules from a data stream.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Represents\ a\ standing\ request\ to\ receive\ information\ from\ streaming\ sources\.\ Typically\,\ represents\ a\ pubsub\ queue\ receiving\ science\ data\ granules\ from\ a\ data\ stream\.'}
+
+    def __init__(self, name='', description='', lcstate='DRAFT', availability='PRIVATE', visibility=ResourceVisibilityEnum.PUBLIC, ts_created='', ts_updated='', alt_ids=None, addl=None, exchange_points=None, exchange_name='', activated=False):
+        InformationResource.__init__(self, name, description, lcstate, availability, visibility, ts_created, ts_updated, alt_ids, addl)
+        self.type_ = 'Subscription'
+        self.exchange_points = exchange_points or []
+        self.exchange_name = exchange_name
+        self.activated = activated
+
+    _schema = dict(InformationResource._schema.items() + {
+                'exchange_points': {'type': 'list', 'default': [], 'decorators': {}, 'description': ''},
+                'exchange_name': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'activated': {'type': 'bool', 'default': False, 'decorators': {}, 'description': ''},
+              }.items())
+
+class Granule(IonObjectBase):
+    '''
+    Object containing data to be transported in messages on data streams.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Object\ containing\ data\ to\ be\ transported\ in\ messages\ on\ data\ streams\.'}
+
+    def __init__(self, param_dictionary=None, record_dictionary=None, stream_definition_id='', stream_definition=None, domain=None, locator=None, data_producer_id='', provider_metadata_update=None, creation_timestamp=0.0, connection_id='', connection_index=''):
+        self.type_ = 'Granule'
+        # Contains the relevant parts of the parameter dictionary definition for this granule and stream
+        self.param_dictionary = param_dictionary or {}
+        # The data content of this granule
+        self.record_dictionary = record_dictionary or {}
+        # References the stream definition for this stream
+        self.stream_definition_id = stream_definition_id
+        # Contains the relevant parts of the stream definition
+        self.stream_definition = stream_definition or {}
+        # Defines the domain pertinent to this granule's data
+        self.domain = domain or []
+        # Locates this granule's data content within the coverage domain
+        self.locator = locator or {}
+        # Identifies a data producer
+        self.data_producer_id = data_producer_id
+        # Informs about any updates to data producer metadata
+        self.provider_metadata_update = provider_metadata_update or {}
+        # Timestamp of granule creation
+        self.creation_timestamp = creation_timestamp
+        # UUID for Connection (instrument)
+        self.connection_id = connection_id
+        # Connection window index
+        self.connection_index = connection_index
+
+    _schema = {
+                'param_dictionary': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': '\ Contains\ the\ relevant\ parts\ of\ the\ parameter\ dictionary\ definition\ for\ this\ granule\ and\ stream'},
+                'record_dictionary': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': '\ The\ data\ content\ of\ this\ granule'},
+                'stream_definition_id': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ References\ the\ stream\ definition\ for\ this\ stream'},
+                'stream_definition': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': '\ Contains\ the\ relevant\ parts\ of\ the\ stream\ definition'},
+                'domain': {'type': 'list', 'default': [], 'decorators': {}, 'description': '\ Defines\ the\ domain\ pertinent\ to\ this\ granule\'s\ data'},
+                'locator': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': '\ Locates\ this\ granule\'s\ data\ content\ within\ the\ coverage\ domain'},
+                'data_producer_id': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Identifies\ a\ data\ producer'},
+                'provider_metadata_update': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': '\ Informs\ about\ any\ updates\ to\ data\ producer\ metadata'},
+                'creation_timestamp': {'type': 'float', 'default': 0.0, 'decorators': {}, 'description': '\ Timestamp\ of\ granule\ creation'},
+                'connection_id': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ UUID\ for\ Connection\ \(instrument\)'},
+                'connection_index': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Connection\ window\ index'},
+              }
+
+class DataPacket(IonObjectBase):
+    '''
+    Object containing a self described data packet similar to a Granule
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Object\ containing\ a\ self\ described\ data\ packet\ similar\ to\ a\ Granule'}
+
+    def __init__(self, ts_created='', producer_id='', stream_name='', resource_id='', packet_class='data', packet_type='', data=None):
+        self.type_ = 'DataPacket'
+        # Producer information
+        self.ts_created = ts_created
+        self.producer_id = producer_id
+        self.stream_name = stream_name
+        # Origin information
+        self.resource_id = resource_id
+        # Content information
+        self.packet_class = packet_class
+        self.packet_type = packet_type
+        # Content
+        self.data = data or {}
+
+    _schema = {
+                'ts_created': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Producer\ information'},
+                'producer_id': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'stream_name': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'resource_id': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Origin\ information'},
+                'packet_class': {'type': 'str', 'default': 'data', 'decorators': {}, 'description': '\ Content\ information'},
+                'packet_type': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'data': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': '\ Content'},
+              }
+
+class AsyncResultMsg(IonObjectBase):
+    '''
+    Object containing information related to a remote callback's completion that can be waited on
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Object\ containing\ information\ related\ to\ a\ remote\ callback\'s\ completion\ that\ can\ be\ waited\ on'}
+
+    def __init__(self, request_id='', ts='', result=None, status=200, attributes=None):
+        self.type_ = 'AsyncResultMsg'
+        # Original request ID
+        self.request_id = request_id
+        # Timestamp of successful execution
+        self.ts = ts
+        # Result to be delivered, or error
+        self.result = result or {}
+        # Status code
+        self.status = status
+        # Additional attributes
+        self.attributes = attributes or {}
+
+    _schema = {
+                'request_id': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Original\ request\ ID'},
+                'ts': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Timestamp\ of\ successful\ execution'},
+                'result': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': '\ Result\ to\ be\ delivered\,\ or\ error'},
+                'status': {'type': 'int', 'default': 200, 'decorators': {}, 'description': '\ Status\ code'},
+                'attributes': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': '\ Additional\ attributes'},
+              }
+
+class Org(SystemResource):
+    '''
+    A domain of authority that provides the context within which policy applies to registered member individuals and resources.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'A\ domain\ of\ authority\ that\ provides\ the\ context\ within\ which\ policy\ applies\ to\ registered\ member\ individuals\ and\ resources\.'}
+
+    def __init__(self, name='', description='', lcstate='DRAFT', availability='PRIVATE', visibility=ResourceVisibilityEnum.PUBLIC, ts_created='', ts_updated='', alt_ids=None, addl=None, org_governance_name='', org_type='', institution=None, url='', contacts=None, details=None):
+        SystemResource.__init__(self, name, description, lcstate, availability, visibility, ts_created, ts_updated, alt_ids, addl)
+        self.type_ = 'Org'
+        # A permanent human readable identifier for the Org.
+        self.org_governance_name = org_governance_name
+        # Specializes the type of Org as OrgTypeEnum value
+        self.org_type = org_type
+        # Identifies the institution that operates the Org/Facility
+        self.institution = institution or Institution()
+        # A URL for the Org
+        self.url = url
+        # A list of ContactInformation entities that serves as a contact point
+        self.contacts = contacts or []
+        # Additional information specific to the org type
+        self.details = details or OrgDetails()
+
+    _schema = dict(SystemResource._schema.items() + {
+                'org_governance_name': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ A\ permanent\ human\ readable\ identifier\ for\ the\ Org\.'},
+                'org_type': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Specializes\ the\ type\ of\ Org\ as\ OrgTypeEnum\ value'},
+                'institution': {'type': 'Institution', 'default': Institution(), 'decorators': {}, 'description': '\ Identifies\ the\ institution\ that\ operates\ the\ Org\/Facility'},
+                'url': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ A\ URL\ for\ the\ Org'},
+                'contacts': {'type': 'list', 'default': [], 'decorators': {"ContentType": "ContactInformation"}, 'description': '\ A\ list\ of\ ContactInformation\ entities\ that\ serves\ as\ a\ contact\ point'},
+                'details': {'type': 'OrgDetails', 'default': OrgDetails(), 'decorators': {}, 'description': '\ Additional\ information\ specific\ to\ the\ org\ type'},
+              }.items())
+
+class ServiceAgreementProposal(IonObjectBase):
+    '''
+    Enumerates possible proposal originator roles Enumerates possible status status values for  the proposal Object representing a current proposal for a service agreement. The proposal may contain several items of different type, or can be a composite of service agreement proposals.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Enumerates\ possible\ proposal\ originator\ roles\ Enumerates\ possible\ status\ status\ values\ for\ \ the\ proposal\ Object\ representing\ a\ current\ proposal\ for\ a\ service\ agreement\.\ The\ proposal\ may\ contain\ several\ items\ of\ different\ type\,\ or\ can\ be\ a\ composite\ of\ service\ agreement\ proposals\.'}
+
+    def __init__(self, negotiation_id='', originator=ProposalOriginatorEnum.CONSUMER, consumer='', provider='', broker='', sequence_num=0, proposal_status=ProposalStatusEnum.INITIAL, expiration='0', description='', conditions=None, clauses=None):
+        self.type_ = 'ServiceAgreementProposal'
+        # What negotiation resource is this part of
+        self.negotiation_id = negotiation_id
+        # Role of the originator as ProposalOriginatorEnum value
+        self.originator = originator
+        # Who will be the consumer of this proposal - such as an actor id
+        self.consumer = consumer
+        # Who will be the provider of this proposal - such as an org id
+        self.provider = provider
+        # Optional identifier if proposal is brokered by third party
+        self.broker = broker
+        # Keeps track of the sequence of proposals within a negotiation
+        self.sequence_num = sequence_num
+        # Status of the proposal as ProposalStatusEnum value
+        self.proposal_status = proposal_status
+        # Expiration that will be used with resultant Commitment if accepted - 0 is unlimited
+        self.expiration = expiration
+        # Optional description of proposal - if set in initial proposal will be copied to Negotiation description
+        self.description = description
+        # Optional collection of additional conditions
+        self.conditions = conditions or {}
+        # Optional collection of additional clauses
+        self.clauses = clauses or {}
+
+    _schema = {
+                'negotiation_id': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ What\ negotiation\ resource\ is\ this\ part\ of'},
+                'originator': {'type': 'int', 'default': ProposalOriginatorEnum.CONSUMER, 'enum_type': 'ProposalOriginatorEnum', 'decorators': {}, 'description': '\ Role\ of\ the\ originator\ as\ ProposalOriginatorEnum\ value'},
+                'consumer': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Who\ will\ be\ the\ consumer\ of\ this\ proposal\ \-\ such\ as\ an\ actor\ id'},
+                'provider': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Who\ will\ be\ the\ provider\ of\ this\ proposal\ \-\ such\ as\ an\ org\ id'},
+                'broker': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Optional\ identifier\ if\ proposal\ is\ brokered\ by\ third\ party'},
+                'sequence_num': {'type': 'int', 'default': 0, 'decorators': {}, 'description': '\ Keeps\ track\ of\ the\ sequence\ of\ proposals\ within\ a\ negotiation'},
+                'proposal_status': {'type': 'int', 'default': ProposalStatusEnum.INITIAL, 'enum_type': 'ProposalStatusEnum', 'decorators': {}, 'description': '\ Status\ of\ the\ proposal\ as\ ProposalStatusEnum\ value'},
+                'expiration': {'type': 'str', 'default': '0', 'decorators': {}, 'description': '\ Expiration\ that\ will\ be\ used\ with\ resultant\ Commitment\ if\ accepted\ \-\ 0\ is\ unlimited'},
+                'description': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Optional\ description\ of\ proposal\ \-\ if\ set\ in\ initial\ proposal\ will\ be\ copied\ to\ Negotiation\ description'},
+                'conditions': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': '\ Optional\ collection\ of\ additional\ conditions'},
+                'clauses': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': '\ Optional\ collection\ of\ additional\ clauses'},
+              }
+
+class Negotiation(InformationResource):
+    '''
+    Enumerates the possible types of Negotiation. Enumerates the status values for a Negotiation. Describes an interaction between multiple system participants with the intent of negotiating a mutual contract with commitments for each participant.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Enumerates\ the\ possible\ types\ of\ Negotiation\.\ Enumerates\ the\ status\ values\ for\ a\ Negotiation\.\ Describes\ an\ interaction\ between\ multiple\ system\ participants\ with\ the\ intent\ of\ negotiating\ a\ mutual\ contract\ with\ commitments\ for\ each\ participant\.'}
+
+    def __init__(self, name='', description='', lcstate='DRAFT', availability='PRIVATE', visibility=ResourceVisibilityEnum.PUBLIC, ts_created='', ts_updated='', alt_ids=None, addl=None, negotiation_type=NegotiationTypeEnum.REQUEST, negotiation_status=NegotiationStatusEnum.OPEN, reason='', proposals=None):
+        InformationResource.__init__(self, name, description, lcstate, availability, visibility, ts_created, ts_updated, alt_ids, addl)
+        self.type_ = 'Negotiation'
+        # Specific variant of negotiation as NegotiationTypeEnum value
+        self.negotiation_type = negotiation_type
+        # Current status of negotiation as NegotiationStatusEnum value.
+        self.negotiation_status = negotiation_status
+        # Describes a reason for a status (optional)
+        self.reason = reason
+        # A list of service agreement proposals (SAP) describing the sequent steps of the negotiation.
+        # The last SAP in the list is considered the most recent one.
+        self.proposals = proposals or []
+
+    _schema = dict(InformationResource._schema.items() + {
+                'negotiation_type': {'type': 'int', 'default': NegotiationTypeEnum.REQUEST, 'enum_type': 'NegotiationTypeEnum', 'decorators': {}, 'description': '\ Specific\ variant\ of\ negotiation\ as\ NegotiationTypeEnum\ value'},
+                'negotiation_status': {'type': 'int', 'default': NegotiationStatusEnum.OPEN, 'enum_type': 'NegotiationStatusEnum', 'decorators': {}, 'description': '\ Current\ status\ of\ negotiation\ as\ NegotiationStatusEnum\ value\.'},
+                'reason': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Describes\ a\ reason\ for\ a\ status\ \(optional\)'},
+                'proposals': {'type': 'list', 'default': [], 'decorators': {"ContentType": "ServiceAgreementProposal"}, 'description': '\ A\ list\ of\ service\ agreement\ proposals\ \(SAP\)\ describing\ the\ sequent\ steps\ of\ the\ negotiation\.\ \ The\ last\ SAP\ in\ the\ list\ is\ considered\ the\ most\ recent\ one\.'},
+              }.items())
+
+class NegotiationRequest(IonObjectBase):
+    '''
+    This is a proxy object used to convey a contextualized negotiation to the UI in lieu of actual Negotiation objects.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'This\ is\ a\ proxy\ object\ used\ to\ convey\ a\ contextualized\ negotiation\ to\ the\ UI\ in\ lieu\ of\ actual\ Negotiation\ objects\.'}
+
+    def __init__(self, ts_updated='', negotiation_id=None, negotiation_type='', negotiation_status='', request_type='', originator='', description='', reason=''):
+        self.type_ = 'NegotiationRequest'
+        self.ts_updated = ts_updated
+        self.negotiation_id = negotiation_id
+        self.negotiation_type = negotiation_type
+        self.negotiation_status = negotiation_status
+        self.request_type = request_type
+        self.originator = originator
+        self.description = description
+        self.reason = reason
+
+    _schema = {
+                'ts_updated': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'negotiation_id': {'type': 'NoneType', 'default': None, 'decorators': {}, 'description': ''},
+                'negotiation_type': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'negotiation_status': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'request_type': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'originator': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'description': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'reason': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+              }
+
+class OrgUserNegotiationRequest(NegotiationRequest):
+    '''
+    Resource specific negotiation requests
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Resource\ specific\ negotiation\ requests'}
+
+    def __init__(self, ts_updated='', negotiation_id=None, negotiation_type='', negotiation_status='', request_type='', originator='', description='', reason='', org_id='', user_id='', name=''):
+        NegotiationRequest.__init__(self, ts_updated, negotiation_id, negotiation_type, negotiation_status, request_type, originator, description, reason)
+        self.type_ = 'OrgUserNegotiationRequest'
+        self.org_id = org_id
+        self.user_id = user_id
+        self.name = name
+
+    _schema = dict(NegotiationRequest._schema.items() + {
+                'org_id': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'user_id': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'name': {'type': 'str', 'default': '', 'decorators': {}, 'description': 'This\ can\ be\ set\ to\ the\ Org\ name\ or\ User\ name\ depending\ upon\ which\ service\ fulfills'},
+              }.items())
+
+class AbstractBaseCommitment(IonObjectBase):
+    '''
+    A subtype for all specific commitments
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'A\ subtype\ for\ all\ specific\ commitments'}
+
+    def __init__(self):
+        self.type_ = 'AbstractBaseCommitment'
+
+    _schema = {
+              }
+
+class Commitment(InformationResource):
+    '''
+    Represents a standing obligation of one participant to another participant. Commitments can be tracked and violations against commitments can be sanctioned.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Represents\ a\ standing\ obligation\ of\ one\ participant\ to\ another\ participant\.\ Commitments\ can\ be\ tracked\ and\ violations\ against\ commitments\ can\ be\ sanctioned\.'}
+
+    def __init__(self, name='', description='', lcstate='DRAFT', availability='PRIVATE', visibility=ResourceVisibilityEnum.PUBLIC, ts_created='', ts_updated='', alt_ids=None, addl=None, provider='', consumer='', expiration='0', commitment=None):
+        InformationResource.__init__(self, name, description, lcstate, availability, visibility, ts_created, ts_updated, alt_ids, addl)
+        self.type_ = 'Commitment'
+        self.provider = provider
+        self.consumer = consumer
+        self.expiration = expiration
+        self.commitment = commitment or AbstractBaseCommitment()
+
+    _schema = dict(InformationResource._schema.items() + {
+                'provider': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'consumer': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'expiration': {'type': 'str', 'default': '0', 'decorators': {}, 'description': 'Expiration\ of\ the\ Commitment\ \-\ 0\ is\ unlimited'},
+                'commitment': {'type': 'AbstractBaseCommitment', 'default': AbstractBaseCommitment(), 'decorators': {}, 'description': ''},
+              }.items())
+
+class ResourceCommitment(AbstractBaseCommitment):
+    '''
+    An internal specific commitment object for resources
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'An\ internal\ specific\ commitment\ object\ for\ resources'}
+
+    def __init__(self, resource_id='', exclusive=False):
+        AbstractBaseCommitment.__init__(self)
+        self.type_ = 'ResourceCommitment'
+        self.resource_id = resource_id
+        self.exclusive = exclusive
+
+    _schema = dict(AbstractBaseCommitment._schema.items() + {
+                'resource_id': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'exclusive': {'type': 'bool', 'default': False, 'decorators': {}, 'description': ''},
+              }.items())
+
+class ResourceCommitmentStatus(IonObjectBase):
+    '''
+    Reports the status of shared and exclusive commitments for a resource
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Reports\ the\ status\ of\ shared\ and\ exclusive\ commitments\ for\ a\ resource'}
+
+    def __init__(self, shared=False, exclusive=False):
+        self.type_ = 'ResourceCommitmentStatus'
+        self.shared = shared
+        self.exclusive = exclusive
+
+    _schema = {
+                'shared': {'type': 'bool', 'default': False, 'decorators': {}, 'description': ''},
+                'exclusive': {'type': 'bool', 'default': False, 'decorators': {}, 'description': ''},
+              }
+
+class EnrollmentProposal(ServiceAgreementProposal):
+    '''
+    Describes a proposal for enrolling a user in an Org/facility.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Describes\ a\ proposal\ for\ enrolling\ a\ user\ in\ an\ Org\/facility\.'}
+
+    def __init__(self, negotiation_id='', originator=ProposalOriginatorEnum.CONSUMER, consumer='', provider='', broker='', sequence_num=0, proposal_status=ProposalStatusEnum.INITIAL, expiration='0', description='', conditions=None, clauses=None):
+        ServiceAgreementProposal.__init__(self, negotiation_id, originator, consumer, provider, broker, sequence_num, proposal_status, expiration, description, conditions, clauses)
+        self.type_ = 'EnrollmentProposal'
+
+    _schema = dict(ServiceAgreementProposal._schema.items() + {
+              }.items())
+
+class RequestRoleProposal(ServiceAgreementProposal):
+    '''
+    Describes a proposal for granting a user a specific role in an Org/facility.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Describes\ a\ proposal\ for\ granting\ a\ user\ a\ specific\ role\ in\ an\ Org\/facility\.'}
+
+    def __init__(self, negotiation_id='', originator=ProposalOriginatorEnum.CONSUMER, consumer='', provider='', broker='', sequence_num=0, proposal_status=ProposalStatusEnum.INITIAL, expiration='0', description='', conditions=None, clauses=None, role_name=''):
+        ServiceAgreementProposal.__init__(self, negotiation_id, originator, consumer, provider, broker, sequence_num, proposal_status, expiration, description, conditions, clauses)
+        self.type_ = 'RequestRoleProposal'
+        self.role_name = role_name
+
+    _schema = dict(ServiceAgreementProposal._schema.items() + {
+                'role_name': {'type': 'str', 'default': '', 'decorators': {"EventData": ""}, 'description': ''},
+              }.items())
+
+class AcquireResourceProposal(ServiceAgreementProposal):
+    '''
+    Describes a proposal for acquiring a resource by a user within an Org/facility.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Describes\ a\ proposal\ for\ acquiring\ a\ resource\ by\ a\ user\ within\ an\ Org\/facility\.'}
+
+    def __init__(self, negotiation_id='', originator=ProposalOriginatorEnum.CONSUMER, consumer='', provider='', broker='', sequence_num=0, proposal_status=ProposalStatusEnum.INITIAL, expiration='0', description='', conditions=None, clauses=None, resource_id=''):
+        ServiceAgreementProposal.__init__(self, negotiation_id, originator, consumer, provider, broker, sequence_num, proposal_status, expiration, description, conditions, clauses)
+        self.type_ = 'AcquireResourceProposal'
+        self.resource_id = resource_id
+
+    _schema = dict(ServiceAgreementProposal._schema.items() + {
+                'resource_id': {'type': 'str', 'default': '', 'decorators': {"EventData": ""}, 'description': ''},
+              }.items())
+
+class AcquireResourceExclusiveProposal(AcquireResourceProposal):
+    '''
+    Describes a proposal for acquiring a resource exclusively by a user within an Org/facility.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Describes\ a\ proposal\ for\ acquiring\ a\ resource\ exclusively\ by\ a\ user\ within\ an\ Org\/facility\.'}
+
+    def __init__(self, negotiation_id='', originator=ProposalOriginatorEnum.CONSUMER, consumer='', provider='', broker='', sequence_num=0, proposal_status=ProposalStatusEnum.INITIAL, expiration='0', description='', conditions=None, clauses=None, resource_id=''):
+        AcquireResourceProposal.__init__(self, negotiation_id, originator, consumer, provider, broker, sequence_num, proposal_status, expiration, description, conditions, clauses, resource_id)
+        self.type_ = 'AcquireResourceExclusiveProposal'
+
+    _schema = dict(AcquireResourceProposal._schema.items() + {
+              }.items())
+
+class UserRole(SystemResource):
+    '''
+    Defines a named set of responsibilities and authorities that a user may fulfill within one Org when interacting with resources.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Defines\ a\ named\ set\ of\ responsibilities\ and\ authorities\ that\ a\ user\ may\ fulfill\ within\ one\ Org\ when\ interacting\ with\ resources\.'}
+
+    def __init__(self, name='', description='', lcstate='DRAFT', availability='PRIVATE', visibility=ResourceVisibilityEnum.PUBLIC, ts_created='', ts_updated='', alt_ids=None, addl=None, governance_name='', org_governance_name=''):
+        SystemResource.__init__(self, name, description, lcstate, availability, visibility, ts_created, ts_updated, alt_ids, addl)
+        self.type_ = 'UserRole'
+        # A permanent valid human readable identifier for the role
+        self.governance_name = governance_name
+        # The permanent Org name this role pertains to
+        self.org_governance_name = org_governance_name
+
+    _schema = dict(SystemResource._schema.items() + {
+                'governance_name': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ A\ permanent\ valid\ human\ readable\ identifier\ for\ the\ role'},
+                'org_governance_name': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ The\ permanent\ Org\ name\ this\ role\ pertains\ to'},
+              }.items())
+
+class PolicyDetails(IonObjectBase):
+    '''
+    Enumerates the possible types of policies Abstract base type for details related to a specific policy type
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Enumerates\ the\ possible\ types\ of\ policies\ Abstract\ base\ type\ for\ details\ related\ to\ a\ specific\ policy\ type'}
+
+    def __init__(self):
+        self.type_ = 'PolicyDetails'
+
+    _schema = {
+              }
+
+class Policy(SystemResource):
+    '''
+    Specifies a set of rules applicable when interacting with designated system resources.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Specifies\ a\ set\ of\ rules\ applicable\ when\ interacting\ with\ designated\ system\ resources\.'}
+
+    def __init__(self, name='', description='', lcstate='DRAFT', availability='PRIVATE', visibility=ResourceVisibilityEnum.PUBLIC, ts_created='', ts_updated='', alt_ids=None, addl=None, enabled=True, ordinal=0, policy_type=PolicyTypeEnum.COMMON_SERVICE_ACCESS, definition='', definition_type='XACML_2.0', details=None):
+        SystemResource.__init__(self, name, description, lcstate, availability, visibility, ts_created, ts_updated, alt_ids, addl)
+        self.type_ = 'Policy'
+        # Should the policy be enforced?
+        self.enabled = enabled
+        # For ordering of this policy relative to other applicable policies - if equal, ts_created matters
+        self.ordinal = ordinal
+        # Specific type of policy
+        self.policy_type = policy_type
+        # Holds the policy rule definition text
+        self.definition = definition
+        # Identifies the type of policy definition
+        self.definition_type = definition_type
+        # Hold additional policy details as nested object of PolicyDetails
+        self.details = details or PolicyDetails()
+
+    _schema = dict(SystemResource._schema.items() + {
+                'enabled': {'type': 'bool', 'default': True, 'decorators': {}, 'description': '\ Should\ the\ policy\ be\ enforced\?'},
+                'ordinal': {'type': 'int', 'default': 0, 'decorators': {}, 'description': '\ For\ ordering\ of\ this\ policy\ relative\ to\ other\ applicable\ policies\ \-\ if\ equal\,\ ts\_created\ matters'},
+                'policy_type': {'type': 'int', 'default': PolicyTypeEnum.COMMON_SERVICE_ACCESS, 'enum_type': 'PolicyTypeEnum', 'decorators': {}, 'description': '\ Specific\ type\ of\ policy'},
+                'definition': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Holds\ the\ policy\ rule\ definition\ text'},
+                'definition_type': {'type': 'str', 'default': 'XACML_2.0', 'decorators': {}, 'description': '\ Identifies\ the\ type\ of\ policy\ definition'},
+                'details': {'type': 'PolicyDetails', 'default': PolicyDetails(), 'decorators': {}, 'description': '\ Hold\ additional\ policy\ details\ as\ nested\ object\ of\ PolicyDetails'},
+              }.items())
+
+class AccessPolicyDetails(PolicyDetails):
+    '''
+    Base type to hold a policy access rule
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Base\ type\ to\ hold\ a\ policy\ access\ rule'}
+
+    def __init__(self):
+        PolicyDetails.__init__(self)
+        self.type_ = 'AccessPolicyDetails'
+
+    _schema = dict(PolicyDetails._schema.items() + {
+              }.items())
+
+class ResourceAccessPolicyDetails(AccessPolicyDetails):
+    '''
+    Holds a policy access rule for a specific resource
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Holds\ a\ policy\ access\ rule\ for\ a\ specific\ resource'}
+
+    def __init__(self, resource_id=''):
+        AccessPolicyDetails.__init__(self)
+        self.type_ = 'ResourceAccessPolicyDetails'
+        # Contains the id of the resource to which policy applies
+        self.resource_id = resource_id
+
+    _schema = dict(AccessPolicyDetails._schema.items() + {
+                'resource_id': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Contains\ the\ id\ of\ the\ resource\ to\ which\ policy\ applies'},
+              }.items())
+
+class ServiceAccessPolicyDetails(AccessPolicyDetails):
+    '''
+    Holds a policy access rule for a specific service
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Holds\ a\ policy\ access\ rule\ for\ a\ specific\ service'}
+
+    def __init__(self, service_name=''):
+        AccessPolicyDetails.__init__(self)
+        self.type_ = 'ServiceAccessPolicyDetails'
+        self.service_name = service_name
+
+    _schema = dict(AccessPolicyDetails._schema.items() + {
+                'service_name': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+              }.items())
+
+class OperationPreconditionPolicyDetails(PolicyDetails):
+    '''
+    Base type for operation precondition policies
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Base\ type\ for\ operation\ precondition\ policies'}
+
+    def __init__(self, op='', preconditions=None):
+        PolicyDetails.__init__(self)
+        self.type_ = 'OperationPreconditionPolicyDetails'
+        # Service operation
+        self.op = op
+        # A list of precondition methods or snippets of code
+        self.preconditions = preconditions or []
+
+    _schema = dict(PolicyDetails._schema.items() + {
+                'op': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ Service\ operation'},
+                'preconditions': {'type': 'list', 'default': [], 'decorators': {}, 'description': '\ A\ list\ of\ precondition\ methods\ or\ snippets\ of\ code'},
+              }.items())
+
+class ServiceOperationPreconditionPolicyDetails(OperationPreconditionPolicyDetails):
+    '''
+    Holds a service operation precondition policy
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Holds\ a\ service\ operation\ precondition\ policy'}
+
+    def __init__(self, op='', preconditions=None, service_name=''):
+        OperationPreconditionPolicyDetails.__init__(self, op, preconditions)
+        self.type_ = 'ServiceOperationPreconditionPolicyDetails'
+        self.service_name = service_name
+
+    _schema = dict(OperationPreconditionPolicyDetails._schema.items() + {
+                'service_name': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+              }.items())
+
+class ProcessOperationPreconditionPolicyDetails(OperationPreconditionPolicyDetails):
+    '''
+    Holds a process operation precondition policy
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Holds\ a\ process\ operation\ precondition\ policy'}
+
+    def __init__(self, op='', preconditions=None, process_key='', process_key_type=None):
+        OperationPreconditionPolicyDetails.__init__(self, op, preconditions)
+        self.type_ = 'ProcessOperationPreconditionPolicyDetails'
+        # ID, name or other descriptor for processes
+        self.process_key = process_key
+        # What is process_key?
+        self.process_key_type = process_key_type
+
+    _schema = dict(OperationPreconditionPolicyDetails._schema.items() + {
+                'process_key': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ ID\,\ name\ or\ other\ descriptor\ for\ processes'},
+                'process_key_type': {'type': 'NoneType', 'default': None, 'decorators': {}, 'description': '\ What\ is\ process\_key\?'},
+              }.items())
+
+class RoleScope(IonObjectBase):
+    '''
+    Defines the scope of applicability of policy, i.e. the subset of resources
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Defines\ the\ scope\ of\ applicability\ of\ policy\,\ i\.e\.\ the\ subset\ of\ resources'}
+
+    def __init__(self, resource_list=None):
+        self.type_ = 'RoleScope'
+        self.resource_list = resource_list or {}
+
+    _schema = {
+                'resource_list': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': ''},
+              }
+
+class Event(IonObjectBase):
+    '''
+    Base type for all events in the system
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Base\ type\ for\ all\ events\ in\ the\ system'}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id=''):
+        self.type_ = 'Event'
+        self.origin = origin
+        self.origin_type = origin_type
+        self.description = description
+        self.ts_created = ts_created
+        self.base_types = base_types or []
+        self.sub_type = sub_type
+        self.actor_id = actor_id
+
+    _schema = {
+                'origin': {'type': 'str', 'default': '', 'decorators': {}, 'description': 'the\ origin\ of\ the\ event\ \(content\ specific\ to\ subtype\)\.\ Mostly\ a\ resource\ id'},
+                'origin_type': {'type': 'str', 'default': '', 'decorators': {}, 'description': 'the\ type\ of\ origin\ \(e\.g\.\ resource\ type\,\ etc\)\ or\ empty'},
+                'description': {'type': 'str', 'default': '', 'decorators': {}, 'description': 'readable\ description\ of\ the\ event\ \(not\ required\)'},
+                'ts_created': {'type': 'str', 'default': '', 'decorators': {}, 'description': 'timestamp\ of\ event\ created\ in\ millis\ in\ UNIX\ epoch'},
+                'base_types': {'type': 'list', 'default': [], 'decorators': {}, 'description': 'List\ of\ event\ super\ types'},
+                'sub_type': {'type': 'str', 'default': '', 'decorators': {}, 'description': 'A\ specialization\ of\ the\ event\_type\ expressed\ by\ this\ object\ type\ \(or\ empty\)'},
+                'actor_id': {'type': 'str', 'default': '', 'decorators': {}, 'description': 'The\ actor\ ID\ requesting\ the\ action\ causing\ the\ event'},
+              }
+
+class EventComputedAttributes(IonObjectBase):
+    '''
+    Object containing additional computed information about one Event
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Object\ containing\ additional\ computed\ information\ about\ one\ Event'}
+
+    def __init__(self, event=None, event_id='', ts_computed='', event_summary='', special_attributes='', event_attributes_formatted=''):
+        self.type_ = 'EventComputedAttributes'
+        self.event = event or Event()
+        self.event_id = event_id
+        self.ts_computed = ts_computed
+        self.event_summary = event_summary
+        self.special_attributes = special_attributes
+        self.event_attributes_formatted = event_attributes_formatted
+
+    _schema = {
+                'event': {'type': 'Event', 'default': Event(), 'decorators': {}, 'description': 'The\ actual\ event\ object\ or\ None'},
+                'event_id': {'type': 'str', 'default': '', 'decorators': {}, 'description': 'The\ event\ id\ of\ the\ described\ Event'},
+                'ts_computed': {'type': 'str', 'default': '', 'decorators': {}, 'description': 'Timestamp\ when\ event\ attributes\ were\ computed'},
+                'event_summary': {'type': 'str', 'default': '', 'decorators': {}, 'description': 'A\ summary\ str\ describing\ event\ based\ on\ type\ and\ core\ attributes'},
+                'special_attributes': {'type': 'str', 'default': '', 'decorators': {}, 'description': 'A\ str\ with\ additional\ event\ attributes\ in\ printable\ form'},
+                'event_attributes_formatted': {'type': 'str', 'default': '', 'decorators': {}, 'description': 'A\ str\ with\ event\ attributes\ in\ pretty\ printed\ form\ with\ newlines'},
+              }
+
+class ResourceEvent(Event):
+    '''
+    ------------------------------------------------------------------------------------ Resource Events Events about the registration of a resource in the registry and its lifecycle  origin: set to the resource_id origin_type: the type of resource sub_type: event specific ------------------------------------------------------------------------------------ Base type for resource related events in the system.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': '\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\ Resource\ Events\ Events\ about\ the\ registration\ of\ a\ resource\ in\ the\ registry\ and\ its\ lifecycle\ \ origin\:\ set\ to\ the\ resource\_id\ origin\_type\:\ the\ type\ of\ resource\ sub\_type\:\ event\ specific\ \-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\ Base\ type\ for\ resource\ related\ events\ in\ the\ system\.'}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id=''):
+        Event.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id)
+        self.type_ = 'ResourceEvent'
+
+    _schema = dict(Event._schema.items() + {
+              }.items())
+
+class ResourceLifecycleEvent(ResourceEvent):
+    '''
+    Event indicating that a resource changed its life cycle or was created. The subtype is lcstate.availability (allowing *.PRIVATE queries)
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Event\ indicating\ that\ a\ resource\ changed\ its\ life\ cycle\ or\ was\ created\.\ The\ subtype\ is\ lcstate\.availability\ \(allowing\ \*\.PRIVATE\ queries\)'}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id='', lcstate='', lcstate_before='', availability='', availability_before='', transition_event=''):
+        ResourceEvent.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id)
+        self.type_ = 'ResourceLifecycleEvent'
+        self.lcstate = lcstate
+        self.lcstate_before = lcstate_before
+        self.availability = availability
+        self.availability_before = availability_before
+        self.transition_event = transition_event
+
+    _schema = dict(ResourceEvent._schema.items() + {
+                'lcstate': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'lcstate_before': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'availability': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'availability_before': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'transition_event': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+              }.items())
+
+class ResourceModifiedEvent(ResourceEvent):
+    '''
+    Event indicating that resource attributes were changed or the resource was created or deleted
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Event\ indicating\ that\ resource\ attributes\ were\ changed\ or\ the\ resource\ was\ created\ or\ deleted'}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id='', mod_type=ResourceModificationType.UPDATE):
+        ResourceEvent.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id)
+        self.type_ = 'ResourceModifiedEvent'
+        self.mod_type = mod_type
+
+    _schema = dict(ResourceEvent._schema.items() + {
+                'mod_type': {'type': 'int', 'default': ResourceModificationType.UPDATE, 'enum_type': 'ResourceModificationType', 'decorators': {}, 'description': ''},
+              }.items())
+
+class ResourceCommandEvent(ResourceEvent):
+    '''
+    Event indicating that a (taskable) resource was commanded and a result is available
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Event\ indicating\ that\ a\ \(taskable\)\ resource\ was\ commanded\ and\ a\ result\ is\ available'}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id='', command='', result=''):
+        ResourceEvent.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id)
+        self.type_ = 'ResourceCommandEvent'
+        self.command = command
+        self.result = result
+
+    _schema = dict(ResourceEvent._schema.items() + {
+                'command': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'result': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+              }.items())
+
+class ResourceOperatorEvent(ResourceEvent):
+    '''
+    Event created by an operator of a resource, for instance to manually indicate a modification or error.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Event\ created\ by\ an\ operator\ of\ a\ resource\,\ for\ instance\ to\ manually\ indicate\ a\ modification\ or\ error\.'}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id=''):
+        ResourceEvent.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id)
+        self.type_ = 'ResourceOperatorEvent'
+
+    _schema = dict(ResourceEvent._schema.items() + {
+              }.items())
+
+class ResourceIssueReportedEvent(ResourceEvent):
+    '''
+    Event created when a user reports an issue, contains a generated guid in the description that should line up with the email.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Event\ created\ when\ a\ user\ reports\ an\ issue\,\ contains\ a\ generated\ guid\ in\ the\ description\ that\ should\ line\ up\ with\ the\ email\.'}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id=''):
+        ResourceEvent.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id)
+        self.type_ = 'ResourceIssueReportedEvent'
+
+    _schema = dict(ResourceEvent._schema.items() + {
+              }.items())
+
+class DirectoryEvent(Event):
+    '''
+    ------------------------------------------------------------------------------------ Directory Events Events about the registration of an entry in the directory  origin: set to the org_id + ".DIR" sub_type: event specific ------------------------------------------------------------------------------------ Base type for directory related events in the system.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': '\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\ Directory\ Events\ Events\ about\ the\ registration\ of\ an\ entry\ in\ the\ directory\ \ origin\:\ set\ to\ the\ org\_id\ \+\ \"\.DIR\"\ sub\_type\:\ event\ specific\ \-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\ Base\ type\ for\ directory\ related\ events\ in\ the\ system\.'}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id=''):
+        Event.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id)
+        self.type_ = 'DirectoryEvent'
+
+    _schema = dict(Event._schema.items() + {
+              }.items())
+
+class DirectoryModifiedEvent(DirectoryEvent):
+    '''
+    Event indicating that directory attributes were changed or the entry was created or deleted. sub_type: REGISTER/UNREGISTER.path.to.parent
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Event\ indicating\ that\ directory\ attributes\ were\ changed\ or\ the\ entry\ was\ created\ or\ deleted\.\ sub\_type\:\ REGISTER\/UNREGISTER\.path\.to\.parent'}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id='', org='', parent='', key='', mod_type=DirectoryModificationType.CREATE):
+        DirectoryEvent.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id)
+        self.type_ = 'DirectoryModifiedEvent'
+        self.org = org
+        self.parent = parent
+        self.key = key
+        self.mod_type = mod_type
+
+    _schema = dict(DirectoryEvent._schema.items() + {
+                'org': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'parent': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'key': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'mod_type': {'type': 'int', 'default': DirectoryModificationType.CREATE, 'enum_type': 'DirectoryModificationType', 'decorators': {}, 'description': ''},
+              }.items())
+
+class ResourceAgentEvent(Event):
+    '''
+    ------------------------------------------------------------------------------------ Agent Events Events about an agent in the system (but not about the controlled device or the registry entry) origin: the resource_id of the agent origin_type: type of agent resource sub_type: event specific ------------------------------------------------------------------------------------
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': '\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\ Agent\ Events\ Events\ about\ an\ agent\ in\ the\ system\ \(but\ not\ about\ the\ controlled\ device\ or\ the\ registry\ entry\)\ origin\:\ the\ resource\_id\ of\ the\ agent\ origin\_type\:\ type\ of\ agent\ resource\ sub\_type\:\ event\ specific\ \-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-'}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id=''):
+        Event.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id)
+        self.type_ = 'ResourceAgentEvent'
+
+    _schema = dict(Event._schema.items() + {
+              }.items())
+
+class ResourceAgentCommandEvent(ResourceAgentEvent):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id='', command='', execute_command='', args=None, kwargs=None, result=None):
+        ResourceAgentEvent.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id)
+        self.type_ = 'ResourceAgentCommandEvent'
+        self.command = command
+        self.execute_command = execute_command
+        self.args = args or []
+        self.kwargs = kwargs or {}
+        self.result = result or {}
+
+    _schema = dict(ResourceAgentEvent._schema.items() + {
+                'command': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'execute_command': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'args': {'type': 'list', 'default': [], 'decorators': {}, 'description': ''},
+                'kwargs': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': ''},
+                'result': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': ''},
+              }.items())
+
+class ResourceAgentErrorEvent(ResourceAgentEvent):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id='', command='', execute_command='', args=None, kwargs=None, error_type='', error_msg='', error_code=-1):
+        ResourceAgentEvent.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id)
+        self.type_ = 'ResourceAgentErrorEvent'
+        self.command = command
+        self.execute_command = execute_command
+        self.args = args or []
+        self.kwargs = kwargs or {}
+        self.error_type = error_type
+        self.error_msg = error_msg
+        self.error_code = error_code
+
+    _schema = dict(ResourceAgentEvent._schema.items() + {
+                'command': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'execute_command': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'args': {'type': 'list', 'default': [], 'decorators': {}, 'description': ''},
+                'kwargs': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': ''},
+                'error_type': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'error_msg': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'error_code': {'type': 'int', 'default': -1, 'decorators': {}, 'description': ''},
+              }.items())
+
+class ResourceAgentIOEvent(ResourceAgentEvent):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id='', source_type='', stats=None):
+        ResourceAgentEvent.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id)
+        self.type_ = 'ResourceAgentIOEvent'
+        self.source_type = source_type
+        self.stats = stats or {}
+
+    _schema = dict(ResourceAgentEvent._schema.items() + {
+                'source_type': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'stats': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': ''},
+              }.items())
+
+class ResourceAgentConnectionLostErrorEvent(ResourceAgentEvent):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id='', error_msg='Connection to resource device was lost.', error_code=-1):
+        ResourceAgentEvent.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id)
+        self.type_ = 'ResourceAgentConnectionLostErrorEvent'
+        self.error_msg = error_msg
+        self.error_code = error_code
+
+    _schema = dict(ResourceAgentEvent._schema.items() + {
+                'error_msg': {'type': 'str', 'default': 'Connection to resource device was lost.', 'decorators': {}, 'description': ''},
+                'error_code': {'type': 'int', 'default': -1, 'decorators': {}, 'description': ''},
+              }.items())
+
+class ResourceAgentStateEvent(ResourceAgentEvent):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id='', state=''):
+        ResourceAgentEvent.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id)
+        self.type_ = 'ResourceAgentStateEvent'
+        self.state = state
+
+    _schema = dict(ResourceAgentEvent._schema.items() + {
+                'state': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+              }.items())
+
+class ResourceAgentResourceStateEvent(ResourceAgentEvent):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id='', state=''):
+        ResourceAgentEvent.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id)
+        self.type_ = 'ResourceAgentResourceStateEvent'
+        self.state = state
+
+    _schema = dict(ResourceAgentEvent._schema.items() + {
+                'state': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+              }.items())
+
+class ResourceAgentResourceConfigEvent(ResourceAgentEvent):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id='', config=None):
+        ResourceAgentEvent.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id)
+        self.type_ = 'ResourceAgentResourceConfigEvent'
+        self.config = config or {}
+
+    _schema = dict(ResourceAgentEvent._schema.items() + {
+                'config': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': ''},
+              }.items())
+
+class ResourceAgentAsyncResultEvent(ResourceAgentEvent):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id='', command='', desc='', result=''):
+        ResourceAgentEvent.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id)
+        self.type_ = 'ResourceAgentAsyncResultEvent'
+        self.command = command
+        self.desc = desc
+        self.result = result
+
+    _schema = dict(ResourceAgentEvent._schema.items() + {
+                'command': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'desc': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'result': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+              }.items())
+
+class ResourceAgentLifecycleEvent(ResourceAgentEvent):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id='', process_id='', agent_state='', execution_status=ResourceAgentExecutionStatus.OK):
+        ResourceAgentEvent.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id)
+        self.type_ = 'ResourceAgentLifecycleEvent'
+        # sub_types: STARTED, STOPPED
+        self.process_id = process_id
+        self.agent_state = agent_state
+        self.execution_status = execution_status
+
+    _schema = dict(ResourceAgentEvent._schema.items() + {
+                'process_id': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ sub\_types\:\ STARTED\,\ STOPPED'},
+                'agent_state': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'execution_status': {'type': 'int', 'default': ResourceAgentExecutionStatus.OK, 'enum_type': 'ResourceAgentExecutionStatus', 'decorators': {}, 'description': ''},
+              }.items())
+
+class DeviceEvent(Event):
+    '''
+    ------------------------------------------------------------------------------------ Device Events Events from a resource agent about the manipulation of an external taskable resource (called "device") origin: resource_id of the device origin_type: type of device resource sub_type: event specific ------------------------------------------------------------------------------------ Base type of events related to physical devices such as instruments
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': '\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\ Device\ Events\ Events\ from\ a\ resource\ agent\ about\ the\ manipulation\ of\ an\ external\ taskable\ resource\ \(called\ \"device\"\)\ origin\:\ resource\_id\ of\ the\ device\ origin\_type\:\ type\ of\ device\ resource\ sub\_type\:\ event\ specific\ \-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\ Base\ type\ of\ events\ related\ to\ physical\ devices\ such\ as\ instruments'}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id=''):
+        Event.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id)
+        self.type_ = 'DeviceEvent'
+
+    _schema = dict(Event._schema.items() + {
+              }.items())
+
+class DeviceSpecificLifecycleEvent(DeviceEvent):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id=''):
+        DeviceEvent.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id)
+        self.type_ = 'DeviceSpecificLifecycleEvent'
+
+    _schema = dict(DeviceEvent._schema.items() + {
+              }.items())
+
+class DeviceCommonLifecycleEvent(DeviceEvent):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id=''):
+        DeviceEvent.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id)
+        self.type_ = 'DeviceCommonLifecycleEvent'
+
+    _schema = dict(DeviceEvent._schema.items() + {
+              }.items())
+
+class DeviceCommandEvent(ResourceCommandEvent):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id='', command='', result=''):
+        ResourceCommandEvent.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id, command, result)
+        self.type_ = 'DeviceCommandEvent'
+
+    _schema = dict(ResourceCommandEvent._schema.items() + {
+              }.items())
+
+class DeviceOperatorEvent(ResourceOperatorEvent):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id=''):
+        ResourceOperatorEvent.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id)
+        self.type_ = 'DeviceOperatorEvent'
+
+    _schema = dict(ResourceOperatorEvent._schema.items() + {
+              }.items())
+
+class PlatformEvent(DeviceEvent):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id=''):
+        DeviceEvent.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id)
+        self.type_ = 'PlatformEvent'
+
+    _schema = dict(DeviceEvent._schema.items() + {
+              }.items())
+
+class InformationContentEvent(Event):
+    '''
+    ------------------------------------------------------------------------------------ Information Content Events Events about the content of an information resource  origin: set to the resource_id origin_type: the type of resource ------------------------------------------------------------------------------------
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': '\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\ Information\ Content\ Events\ Events\ about\ the\ content\ of\ an\ information\ resource\ \ origin\:\ set\ to\ the\ resource\_id\ origin\_type\:\ the\ type\ of\ resource\ \-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-'}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id='', author=''):
+        Event.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id)
+        self.type_ = 'InformationContentEvent'
+        self.author = author
+
+    _schema = dict(Event._schema.items() + {
+                'author': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+              }.items())
+
+class InformationContentModifiedEvent(InformationContentEvent):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id='', author=''):
+        InformationContentEvent.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id, author)
+        self.type_ = 'InformationContentModifiedEvent'
+        # origin is the resource identifier
+        # ts created should reflect when the change occurred
+
+    _schema = dict(InformationContentEvent._schema.items() + {
+              }.items())
+
+class InformationContentStatusEvent(InformationContentEvent):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id='', author='', status=InformationStatus.NORMAL):
+        InformationContentEvent.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id, author)
+        self.type_ = 'InformationContentStatusEvent'
+        # description should be filled in
+        # New status of the information
+        self.status = status
+
+    _schema = dict(InformationContentEvent._schema.items() + {
+                'status': {'type': 'int', 'default': InformationStatus.NORMAL, 'enum_type': 'InformationStatus', 'decorators': {}, 'description': '\ origin\ is\ the\ resource\ identifier\ \ ts\ created\ should\ reflect\ when\ the\ change\ occurred\ \ description\ should\ be\ filled\ in\ \ New\ status\ of\ the\ information'},
+              }.items())
+
+class InformationContentAccessedEvent(InformationContentEvent):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id='', author='', access_params=None):
+        InformationContentEvent.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id, author)
+        self.type_ = 'InformationContentAccessedEvent'
+        # The origin_type identifies the type of resource, e.g. DataProduct.
+        # The sub_type identifies the type of access using the InformationContentAccessEnum
+        # Additional information about access
+        self.access_params = access_params or {}
+
+    _schema = dict(InformationContentEvent._schema.items() + {
+                'access_params': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': '\ The\ origin\_type\ identifies\ the\ type\ of\ resource\,\ e\.g\.\ DataProduct\.\ \ The\ sub\_type\ identifies\ the\ type\ of\ access\ using\ the\ InformationContentAccessEnum\ \ Additional\ information\ about\ access'},
+              }.items())
+
+class ExceptionEvent(Event):
+    '''
+    Seems to be needed/used only by transforms when an error is encountered
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Seems\ to\ be\ needed\/used\ only\ by\ transforms\ when\ an\ error\ is\ encountered'}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id='', exception_type='', exception_message=''):
+        Event.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id)
+        self.type_ = 'ExceptionEvent'
+        self.exception_type = exception_type
+        self.exception_message = exception_message
+
+    _schema = dict(Event._schema.items() + {
+                'exception_type': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'exception_message': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+              }.items())
+
+class NegotiationEvent(Event):
+    '''
+    ------------------------------------------------------------------------------------ Policy / Governance Event Events about policy in the system ------------------------------------------------------------------------------------
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': '\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\ Policy\ \/\ Governance\ Event\ Events\ about\ policy\ in\ the\ system\ \-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-'}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id='', originator=''):
+        Event.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id)
+        self.type_ = 'NegotiationEvent'
+        # The origin is the id of the negotiation id
+        self.originator = originator
+
+    _schema = dict(Event._schema.items() + {
+                'originator': {'type': 'str', 'default': '', 'decorators': {}, 'description': '\ The\ origin\ is\ the\ id\ of\ the\ negotiation\ id'},
+              }.items())
+
+class EnrollmentNegotiationStatusEvent(NegotiationEvent):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id='', originator=''):
+        NegotiationEvent.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id, originator)
+        self.type_ = 'EnrollmentNegotiationStatusEvent'
+
+    _schema = dict(NegotiationEvent._schema.items() + {
+              }.items())
+
+class RequestRoleNegotiationStatusEvent(NegotiationEvent):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id='', originator='', role_name=''):
+        NegotiationEvent.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id, originator)
+        self.type_ = 'RequestRoleNegotiationStatusEvent'
+        self.role_name = role_name
+
+    _schema = dict(NegotiationEvent._schema.items() + {
+                'role_name': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+              }.items())
+
+class AcquireResourceNegotiationStatusEvent(NegotiationEvent):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id='', originator='', resource_id=''):
+        NegotiationEvent.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id, originator)
+        self.type_ = 'AcquireResourceNegotiationStatusEvent'
+        self.resource_id = resource_id
+
+    _schema = dict(NegotiationEvent._schema.items() + {
+                'resource_id': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+              }.items())
+
+class AcquireResourceExclusiveNegotiationStatusEvent(AcquireResourceNegotiationStatusEvent):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id='', originator='', resource_id=''):
+        AcquireResourceNegotiationStatusEvent.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id, originator, resource_id)
+        self.type_ = 'AcquireResourceExclusiveNegotiationStatusEvent'
+
+    _schema = dict(AcquireResourceNegotiationStatusEvent._schema.items() + {
+              }.items())
+
+class PolicyEvent(Event):
+    '''
+    Base Policy Event
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Base\ Policy\ Event'}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id=''):
+        Event.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id)
+        self.type_ = 'PolicyEvent'
+
+    _schema = dict(Event._schema.items() + {
+              }.items())
+
+class ResourcePolicyEvent(PolicyEvent):
+    '''
+    The ResourcePolicyEvent is a little different than a Policy resource object event, in that it does not get published when the underlying policy object is updated in the resource registry but by business logic in the Policy Management Service as appropriate, like when it is assigned or removed from a resource The origin is the policy_id
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'The\ ResourcePolicyEvent\ is\ a\ little\ different\ than\ a\ Policy\ resource\ object\ event\,\ in\ that\ it\ does\ not\ get\ published\ when\ the\ underlying\ policy\ object\ is\ updated\ in\ the\ resource\ registry\ but\ by\ business\ logic\ in\ the\ Policy\ Management\ Service\ as\ appropriate\,\ like\ when\ it\ is\ assigned\ or\ removed\ from\ a\ resource\ The\ origin\ is\ the\ policy\_id'}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id='', resource_id='', resource_type='', resource_name='', op=''):
+        PolicyEvent.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id)
+        self.type_ = 'ResourcePolicyEvent'
+        self.resource_id = resource_id
+        self.resource_type = resource_type
+        self.resource_name = resource_name
+        self.op = op
+
+    _schema = dict(PolicyEvent._schema.items() + {
+                'resource_id': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'resource_type': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'resource_name': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'op': {'type': 'str', 'default': '', 'decorators': {}, 'description': 'Optional\ op\ name'},
+              }.items())
+
+class RelatedResourcePolicyEvent(PolicyEvent):
+    '''
+    The RelatedResourcePolicyEvent is different than a ResourcePolicyEvent object, in that it does not get published when the underlying policy object is updated in the resource registry but by business logic in the Policy Management Service when a related resource's policy is updated. The origin is the policy_id
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'The\ RelatedResourcePolicyEvent\ is\ different\ than\ a\ ResourcePolicyEvent\ object\,\ in\ that\ it\ does\ not\ get\ published\ when\ the\ underlying\ policy\ object\ is\ updated\ in\ the\ resource\ registry\ but\ by\ business\ logic\ in\ the\ Policy\ Management\ Service\ when\ a\ related\ resource\'s\ policy\ is\ updated\.\ The\ origin\ is\ the\ policy\_id'}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id='', resource_id=''):
+        PolicyEvent.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id)
+        self.type_ = 'RelatedResourcePolicyEvent'
+        self.resource_id = resource_id
+
+    _schema = dict(PolicyEvent._schema.items() + {
+                'resource_id': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+              }.items())
+
+class ServicePolicyEvent(PolicyEvent):
+    '''
+    The ServicePolicyEvent is a little different that a Policy resource object event, in that it does not get published when the underlying policy object is updated in the resource registry but by business logic in the Policy Management Service as appropriate, like when it is assigned or removed from a service The origin is the policy_id
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'The\ ServicePolicyEvent\ is\ a\ little\ different\ that\ a\ Policy\ resource\ object\ event\,\ in\ that\ it\ does\ not\ get\ published\ when\ the\ underlying\ policy\ object\ is\ updated\ in\ the\ resource\ registry\ but\ by\ business\ logic\ in\ the\ Policy\ Management\ Service\ as\ appropriate\,\ like\ when\ it\ is\ assigned\ or\ removed\ from\ a\ service\ The\ origin\ is\ the\ policy\_id'}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id='', service_name='', op=''):
+        PolicyEvent.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id)
+        self.type_ = 'ServicePolicyEvent'
+        #If the service_name is not set to a specific name, then all services are assumed.
+        self.service_name = service_name
+        self.op = op
+
+    _schema = dict(PolicyEvent._schema.items() + {
+                'service_name': {'type': 'str', 'default': '', 'decorators': {}, 'description': 'If\ the\ service\_name\ is\ not\ set\ to\ a\ specific\ name\,\ then\ all\ services\ are\ assumed\.'},
+                'op': {'type': 'str', 'default': '', 'decorators': {}, 'description': 'Optional\ op\ name'},
+              }.items())
+
+class AuthenticationEvent(Event):
+    '''
+    Fired when an actor authenticates or fails to authenticate. origin is actor_id, subtype is SUCCESS, FAIL
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Fired\ when\ an\ actor\ authenticates\ or\ fails\ to\ authenticate\.\ origin\ is\ actor\_id\,\ subtype\ is\ SUCCESS\,\ FAIL'}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id='', username='', auth_count=0, auth_status=0):
+        Event.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id)
+        self.type_ = 'AuthenticationEvent'
+        self.username = username
+        self.auth_count = auth_count
+        self.auth_status = auth_status
+
+    _schema = dict(Event._schema.items() + {
+                'username': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'auth_count': {'type': 'int', 'default': 0, 'decorators': {}, 'description': ''},
+                'auth_status': {'type': 'int', 'default': 0, 'decorators': {}, 'description': ''},
+              }.items())
+
+class UserRoleCacheResetEvent(PolicyEvent):
+    '''
+    This event is used to flush the caches containing user roles
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'This\ event\ is\ used\ to\ flush\ the\ caches\ containing\ user\ roles'}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id=''):
+        PolicyEvent.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id)
+        self.type_ = 'UserRoleCacheResetEvent'
+
+    _schema = dict(PolicyEvent._schema.items() + {
+              }.items())
+
+class OrgEvent(Event):
+    '''
+    ------------------------------------------------------------------------------------ Org Event Events from an Org about its members or resources ------------------------------------------------------------------------------------ Base Org Event The origin is the org_id for all events based off of this OrgEvent
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': '\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\ Org\ Event\ Events\ from\ an\ Org\ about\ its\ members\ or\ resources\ \-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\ Base\ Org\ Event\ The\ origin\ is\ the\ org\_id\ for\ all\ events\ based\ off\ of\ this\ OrgEvent'}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id='', org_name=''):
+        Event.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id)
+        self.type_ = 'OrgEvent'
+        self.org_name = org_name
+
+    _schema = dict(Event._schema.items() + {
+                'org_name': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+              }.items())
+
+class UserRoleModifiedEvent(OrgEvent):
+    '''
+    This event is used as a parent event for User Role related events
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'This\ event\ is\ used\ as\ a\ parent\ event\ for\ User\ Role\ related\ events'}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id='', org_name='', role_name=''):
+        OrgEvent.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id, org_name)
+        self.type_ = 'UserRoleModifiedEvent'
+        self.role_name = role_name
+
+    _schema = dict(OrgEvent._schema.items() + {
+                'role_name': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+              }.items())
+
+class OrgNegotiationInitiatedEvent(OrgEvent):
+    '''
+    The following events are published when Org actions occur
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'The\ following\ events\ are\ published\ when\ Org\ actions\ occur'}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id='', org_name='', negotiation_id=''):
+        OrgEvent.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id, org_name)
+        self.type_ = 'OrgNegotiationInitiatedEvent'
+        self.negotiation_id = negotiation_id
+
+    _schema = dict(OrgEvent._schema.items() + {
+                'negotiation_id': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+              }.items())
+
+class OrgMembershipGrantedEvent(OrgEvent):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id='', org_name=''):
+        OrgEvent.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id, org_name)
+        self.type_ = 'OrgMembershipGrantedEvent'
+
+    _schema = dict(OrgEvent._schema.items() + {
+              }.items())
+
+class OrgMembershipCancelledEvent(OrgEvent):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id='', org_name=''):
+        OrgEvent.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id, org_name)
+        self.type_ = 'OrgMembershipCancelledEvent'
+
+    _schema = dict(OrgEvent._schema.items() + {
+              }.items())
+
+class UserRoleGrantedEvent(UserRoleModifiedEvent):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id='', org_name='', role_name=''):
+        UserRoleModifiedEvent.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id, org_name, role_name)
+        self.type_ = 'UserRoleGrantedEvent'
+
+    _schema = dict(UserRoleModifiedEvent._schema.items() + {
+              }.items())
+
+class UserRoleRevokedEvent(UserRoleModifiedEvent):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id='', org_name='', role_name=''):
+        UserRoleModifiedEvent.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id, org_name, role_name)
+        self.type_ = 'UserRoleRevokedEvent'
+
+    _schema = dict(UserRoleModifiedEvent._schema.items() + {
+              }.items())
+
+class ResourceSharedEvent(OrgEvent):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id='', org_name='', resource_id=''):
+        OrgEvent.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id, org_name)
+        self.type_ = 'ResourceSharedEvent'
+        self.resource_id = resource_id
+
+    _schema = dict(OrgEvent._schema.items() + {
+                'resource_id': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+              }.items())
+
+class ResourceUnsharedEvent(OrgEvent):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id='', org_name='', resource_id=''):
+        OrgEvent.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id, org_name)
+        self.type_ = 'ResourceUnsharedEvent'
+        self.resource_id = resource_id
+
+    _schema = dict(OrgEvent._schema.items() + {
+                'resource_id': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+              }.items())
+
+class ResourceCommitmentCreatedEvent(OrgEvent):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id='', org_name='', resource_id='', commitment_id='', commitment_type=''):
+        OrgEvent.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id, org_name)
+        self.type_ = 'ResourceCommitmentCreatedEvent'
+        self.resource_id = resource_id
+        self.commitment_id = commitment_id
+        self.commitment_type = commitment_type
+
+    _schema = dict(OrgEvent._schema.items() + {
+                'resource_id': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'commitment_id': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'commitment_type': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+              }.items())
+
+class ResourceCommitmentReleasedEvent(OrgEvent):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id='', org_name='', resource_id='', commitment_id='', commitment_type=''):
+        OrgEvent.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id, org_name)
+        self.type_ = 'ResourceCommitmentReleasedEvent'
+        self.resource_id = resource_id
+        self.commitment_id = commitment_id
+        self.commitment_type = commitment_type
+
+    _schema = dict(OrgEvent._schema.items() + {
+                'resource_id': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'commitment_id': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'commitment_type': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+              }.items())
+
+class ContainerConfigModifiedEvent(Event):
+    '''
+    ------------------------------------------------------------------------------------ Execution Event Events about compute resources (containers, processes, EPUs, EEs) ------------------------------------------------------------------------------------
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': '\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\ Execution\ Event\ Events\ about\ compute\ resources\ \(containers\,\ processes\,\ EPUs\,\ EEs\)\ \-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-\-'}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id=''):
+        Event.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id)
+        self.type_ = 'ContainerConfigModifiedEvent'
+
+    _schema = dict(Event._schema.items() + {
+              }.items())
+
+class ContainerLifecycleEvent(Event):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id='', state=ContainerStateEnum.START, host=''):
+        Event.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id)
+        self.type_ = 'ContainerLifecycleEvent'
+        # The origin is the container id
+        self.state = state
+        self.host = host
+
+    _schema = dict(Event._schema.items() + {
+                'state': {'type': 'int', 'default': ContainerStateEnum.START, 'enum_type': 'ContainerStateEnum', 'decorators': {}, 'description': '\ The\ origin\ is\ the\ container\ id'},
+                'host': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+              }.items())
+
+class ProcessLifecycleEvent(Event):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id='', state=ProcessStateEnum.REQUESTED, container_id='', process_type='', process_name='', process_resource_id='', service_name=''):
+        Event.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id)
+        self.type_ = 'ProcessLifecycleEvent'
+        # The origin is the process id
+        self.state = state
+        self.container_id = container_id
+        self.process_type = process_type
+        self.process_name = process_name
+        self.process_resource_id = process_resource_id
+        self.service_name = service_name
+
+    _schema = dict(Event._schema.items() + {
+                'state': {'type': 'int', 'default': ProcessStateEnum.REQUESTED, 'enum_type': 'ProcessStateEnum', 'decorators': {}, 'description': '\ The\ origin\ is\ the\ process\ id'},
+                'container_id': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'process_type': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'process_name': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'process_resource_id': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'service_name': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+              }.items())
+
+class TimerEvent(Event):
+    '''
+    Event for the scheduler's timer functionality
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'Event\ for\ the\ scheduler\'s\ timer\ functionality'}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id=''):
+        Event.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id)
+        self.type_ = 'TimerEvent'
+
+    _schema = dict(Event._schema.items() + {
+              }.items())
+
+class SchedulerEvent(Event):
+    '''
+    The Scheduler fires off this event so that services can react to it and perform tasks
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'The\ Scheduler\ fires\ off\ this\ event\ so\ that\ services\ can\ react\ to\ it\ and\ perform\ tasks'}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id=''):
+        Event.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id)
+        self.type_ = 'SchedulerEvent'
+
+    _schema = dict(Event._schema.items() + {
+              }.items())
+
+class ReloadUserInfoEvent(Event):
+    '''
+    a reload_user_info event generated when a notification is created, updated or deleted
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'a\ reload\_user\_info\ event\ generated\ when\ a\ notification\ is\ created\,\ updated\ or\ deleted'}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id='', notification_id=''):
+        Event.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id)
+        self.type_ = 'ReloadUserInfoEvent'
+        self.notification_id = notification_id
+
+    _schema = dict(Event._schema.items() + {
+                'notification_id': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+              }.items())
+
+class ContainerManagementRequest(Event):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id='', predicate=None, action=None):
+        Event.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id)
+        self.type_ = 'ContainerManagementRequest'
+        self.predicate = predicate or ContainerManagementPredicate()
+        self.action = action or ContainerManagementAction()
+
+    _schema = dict(Event._schema.items() + {
+                'predicate': {'type': 'ContainerManagementPredicate', 'default': ContainerManagementPredicate(), 'decorators': {}, 'description': ''},
+                'action': {'type': 'ContainerManagementAction', 'default': ContainerManagementAction(), 'decorators': {}, 'description': ''},
+              }.items())
+
+class ContainerManagementResult(Event):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id='', action=None, outcome=''):
+        Event.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id)
+        self.type_ = 'ContainerManagementResult'
+        self.action = action or ContainerManagementAction()
+        self.outcome = outcome
+
+    _schema = dict(Event._schema.items() + {
+                'action': {'type': 'ContainerManagementAction', 'default': ContainerManagementAction(), 'decorators': {}, 'description': ''},
+                'outcome': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+              }.items())
+
+class ExtendedPhone(Phone):
+    '''
+    These are used for tests - do not remove!
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'These\ are\ used\ for\ tests\ \-\ do\ not\ remove\!'}
+
+    def __init__(self, phone_number='', phone_type=''):
+        Phone.__init__(self, phone_number, phone_type)
+        self.type_ = 'ExtendedPhone'
+
+    _schema = dict(Phone._schema.items() + {
+              }.items())
+
+class Bad_Phone(IonObjectBase):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, phone_number='', phone_type='', sms=0):
+        self.type_ = 'Bad_Phone'
+        self.phone_number = phone_number
+        self.phone_type = phone_type
+        self.sms = sms
+
+    _schema = {
+                'phone_number': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'phone_type': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'sms': {'type': 'int', 'default': 0, 'decorators': {}, 'description': ''},
+              }
+
+class Deco_Example(IonObjectBase):
+    '''
+    This is example for adding decorators @SpecialObject @OriginResourceType=MyObject
+    '''
+
+    _class_info = {'name': '', 'decorators': {'OriginResourceType': 'MyObject', 'SpecialObject': ''}, 'docstring': 'This\ is\ example\ for\ adding\ decorators\ \@SpecialObject\ \@OriginResourceType\=MyObject'}
+
+    def __init__(self, unsigned_short_int=1, a_float=2.0, list1=None, list2=None, dict1=None, dict2=None, an_important_value=None, us_phone_number='', foo2=''):
+        self.type_ = 'Deco_Example'
+        # This attribute is decorated to define the valid value
+        # range for the numeric type (int in this case).
+        self.unsigned_short_int = unsigned_short_int
+        # This attribute is decorated to define the valid value
+        # range for the numeric type (float in this case).
+        self.a_float = a_float
+        # This attribute is decorated to define the type(s)
+        # which can be present in the list attribute.
+        self.list1 = list1 or []
+        # This attribute is decorated to define the valid length
+        # of the list.
+        self.list2 = list2 or []
+        # This attribute is decorated to define the type(s)
+        # which can be present in the dict value set.
+        self.dict1 = dict1 or {}
+        # This attribute is decorated to define the valid length
+        # of the dict.
+        self.dict2 = dict2 or {}
+        # This attribute is decorated to indicate the attribute
+        # cannot be null.
+        self.an_important_value = an_important_value
+        # This attribue is decorated to define the required string pattern.
+        self.us_phone_number = us_phone_number
+        # This attribute is decorated with an arbitrary user defined
+        # decorator, the implied meaning of which is determined by the
+        # code that chooses to utilize it.
+        self.foo2 = foo2
+
+    _schema = {
+                'unsigned_short_int': {'type': 'int', 'default': 1, 'decorators': {"ValueRange": "0,65535"}, 'description': '\ This\ attribute\ is\ decorated\ to\ define\ the\ valid\ value\ \ range\ for\ the\ numeric\ type\ \(int\ in\ this\ case\)\.'},
+                'a_float': {'type': 'float', 'default': 2.0, 'decorators': {"ValueRange": "1.234,5.0"}, 'description': '\ This\ attribute\ is\ decorated\ to\ define\ the\ valid\ value\ \ range\ for\ the\ numeric\ type\ \(float\ in\ this\ case\)\.'},
+                'list1': {'type': 'list', 'default': [], 'decorators': {"ContentType": "Phone, int"}, 'description': '\ This\ attribute\ is\ decorated\ to\ define\ the\ type\(s\)\ \ which\ can\ be\ present\ in\ the\ list\ attribute\.'},
+                'list2': {'type': 'list', 'default': [], 'decorators': {"ContentCount": "1,2"}, 'description': '\ This\ attribute\ is\ decorated\ to\ define\ the\ valid\ length\ \ of\ the\ list\.'},
+                'dict1': {'type': 'dict', 'default': {}, 'decorators': {"ContentType": "int,float"}, 'description': '\ This\ attribute\ is\ decorated\ to\ define\ the\ type\(s\)\ \ which\ can\ be\ present\ in\ the\ dict\ value\ set\.'},
+                'dict2': {'type': 'dict', 'default': {}, 'decorators': {"ContentCount": "1,2"}, 'description': '\ This\ attribute\ is\ decorated\ to\ define\ the\ valid\ length\ \ of\ the\ dict\.'},
+                'an_important_value': {'type': 'NoneType', 'default': None, 'decorators': {"Required": "", "ValuePattern": "(^(CAM|CO2|CTD|DO2)$)"}, 'description': '\ This\ attribute\ is\ decorated\ to\ indicate\ the\ attribute\ \ cannot\ be\ null\.'},
+                'us_phone_number': {'type': 'str', 'default': '', 'decorators': {"ValuePattern": "(^\d{3}-\d{3}-\d{4}$)"}, 'description': '\ This\ attribue\ is\ decorated\ to\ define\ the\ required\ string\ pattern\.'},
+                'foo2': {'type': 'str', 'default': '', 'decorators': {"ABC": "123"}, 'description': '\ This\ attribute\ is\ decorated\ with\ an\ arbitrary\ user\ defined\ \ decorator\,\ the\ implied\ meaning\ of\ which\ is\ determined\ by\ the\ \ code\ that\ chooses\ to\ utilize\ it\.'},
+              }
+
+class SampleObject(IonObjectBase):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, name='', time='1341269890404', an_int=0, q_float=0.0, a_str='', none_val=None, a_dict=None, a_list=None, an_enum=SampleEnum.SUNDAY, another_enum=AnEnum.VALUE2, abstract_val=None):
+        self.type_ = 'SampleObject'
+        self.name = name
+        self.time = time
+        self.an_int = an_int
+        self.q_float = q_float
+        self.a_str = a_str
+        self.none_val = none_val
+        self.a_dict = a_dict or {}
+        self.a_list = a_list or []
+        self.an_enum = an_enum
+        self.another_enum = another_enum
+        # attribute can be of any type that extends Resource
+        self.abstract_val = abstract_val or InformationResource()
+
+    _schema = {
+                'name': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'time': {'type': 'str', 'default': '1341269890404', 'decorators': {}, 'description': ''},
+                'an_int': {'type': 'int', 'default': 0, 'decorators': {}, 'description': ''},
+                'q_float': {'type': 'float', 'default': 0.0, 'decorators': {}, 'description': ''},
+                'a_str': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'none_val': {'type': 'NoneType', 'default': None, 'decorators': {}, 'description': ''},
+                'a_dict': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': ''},
+                'a_list': {'type': 'list', 'default': [], 'decorators': {}, 'description': ''},
+                'an_enum': {'type': 'int', 'default': SampleEnum.SUNDAY, 'enum_type': 'SampleEnum', 'decorators': {}, 'description': ''},
+                'another_enum': {'type': 'int', 'default': AnEnum.VALUE2, 'enum_type': 'AnEnum', 'decorators': {}, 'description': ''},
+                'abstract_val': {'type': 'InformationResource', 'default': InformationResource(), 'decorators': {}, 'description': '\ attribute\ can\ be\ of\ any\ type\ that\ extends\ Resource'},
+              }
+
+class SampleResource(Resource):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, name='', description='', lcstate='DRAFT', availability='PRIVATE', visibility=ResourceVisibilityEnum.PUBLIC, ts_created='', ts_updated='', alt_ids=None, addl=None, num=0, other_field='', list_element=None, dict_element=None):
+        Resource.__init__(self, name, description, lcstate, availability, visibility, ts_created, ts_updated, alt_ids, addl)
+        self.type_ = 'SampleResource'
+        self.num = num
+        self.other_field = other_field
+        self.list_element = list_element or []
+        self.dict_element = dict_element or {}
+
+    _schema = dict(Resource._schema.items() + {
+                'num': {'type': 'int', 'default': 0, 'decorators': {}, 'description': ''},
+                'other_field': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'list_element': {'type': 'list', 'default': [], 'decorators': {}, 'description': ''},
+                'dict_element': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': ''},
+              }.items())
+
+class SampleEvent(Event):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id='', num=0, other_field='', list_element=None, dict_element=None):
+        Event.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id)
+        self.type_ = 'SampleEvent'
+        self.num = num
+        self.other_field = other_field
+        self.list_element = list_element or []
+        self.dict_element = dict_element or {}
+
+    _schema = dict(Event._schema.items() + {
+                'num': {'type': 'int', 'default': 0, 'decorators': {}, 'description': ''},
+                'other_field': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'list_element': {'type': 'list', 'default': [], 'decorators': {}, 'description': ''},
+                'dict_element': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': ''},
+              }.items())
+
+class SampleComplexEvent(Event):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, origin='', origin_type='', description='', ts_created='', base_types=None, sub_type='', actor_id='', num=0, other_field='', list_element=None, dict_element=None, resource=None):
+        Event.__init__(self, origin, origin_type, description, ts_created, base_types, sub_type, actor_id)
+        self.type_ = 'SampleComplexEvent'
+        self.num = num
+        self.other_field = other_field
+        self.list_element = list_element or []
+        self.dict_element = dict_element or {}
+        self.resource = resource or {}
+
+    _schema = dict(Event._schema.items() + {
+                'num': {'type': 'int', 'default': 0, 'decorators': {}, 'description': ''},
+                'other_field': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'list_element': {'type': 'list', 'default': [], 'decorators': {}, 'description': ''},
+                'dict_element': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': ''},
+                'resource': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': ''},
+              }.items())
+
+class TestDeviceModel(AppResource):
+    '''
+    The resources here are used for testing purposes. They provide various geospatial and other attribute types and also define associations and lifecycle to match an observatory resource model.
+    '''
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': 'The\ resources\ here\ are\ used\ for\ testing\ purposes\.\ They\ provide\ various\ geospatial\ and\ other\ attribute\ types\ and\ also\ define\ associations\ and\ lifecycle\ to\ match\ an\ observatory\ resource\ model\.'}
+
+    def __init__(self, name='', description='', lcstate='DRAFT', availability='PRIVATE', visibility=ResourceVisibilityEnum.PUBLIC, ts_created='', ts_updated='', alt_ids=None, addl=None, manufacturer='', attributes=None):
+        AppResource.__init__(self, name, description, lcstate, availability, visibility, ts_created, ts_updated, alt_ids, addl)
+        self.type_ = 'TestDeviceModel'
+        self.manufacturer = manufacturer
+        self.attributes = attributes or {}
+
+    _schema = dict(AppResource._schema.items() + {
+                'manufacturer': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'attributes': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': ''},
+              }.items())
+
+class TestDevice(TaskableResource):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, name='', description='', lcstate='DRAFT', availability='PRIVATE', visibility=ResourceVisibilityEnum.PUBLIC, ts_created='', ts_updated='', alt_ids=None, addl=None, location=None, geospatial_bounds=None, geospatial_crs=None, keywords=None):
+        TaskableResource.__init__(self, name, description, lcstate, availability, visibility, ts_created, ts_updated, alt_ids, addl)
+        self.type_ = 'TestDevice'
+        self.location = location or GeospatialLocation()
+        self.geospatial_bounds = geospatial_bounds or GeospatialBounds()
+        self.geospatial_crs = geospatial_crs or GeospatialCoordinateReferenceSystem()
+        # Tags
+        self.keywords = keywords or []
+
+    _schema = dict(TaskableResource._schema.items() + {
+                'location': {'type': 'GeospatialLocation', 'default': GeospatialLocation(), 'decorators': {}, 'description': ''},
+                'geospatial_bounds': {'type': 'GeospatialBounds', 'default': GeospatialBounds(), 'decorators': {}, 'description': ''},
+                'geospatial_crs': {'type': 'GeospatialCoordinateReferenceSystem', 'default': GeospatialCoordinateReferenceSystem(), 'decorators': {}, 'description': ''},
+                'keywords': {'type': 'list', 'default': [], 'decorators': {"ContentType": "str"}, 'description': '\ Tags'},
+              }.items())
+
+class TestInstrument(TestDevice):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, name='', description='', lcstate='DRAFT', availability='PRIVATE', visibility=ResourceVisibilityEnum.PUBLIC, ts_created='', ts_updated='', alt_ids=None, addl=None, location=None, geospatial_bounds=None, geospatial_crs=None, keywords=None, firmware_version='', boundary=None):
+        TestDevice.__init__(self, name, description, lcstate, availability, visibility, ts_created, ts_updated, alt_ids, addl, location, geospatial_bounds, geospatial_crs, keywords)
+        self.type_ = 'TestInstrument'
+        self.firmware_version = firmware_version
+        self.boundary = boundary or {}
+
+    _schema = dict(TestDevice._schema.items() + {
+                'firmware_version': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'boundary': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': ''},
+              }.items())
+
+class TestPlatform(TestDevice):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, name='', description='', lcstate='DRAFT', availability='PRIVATE', visibility=ResourceVisibilityEnum.PUBLIC, ts_created='', ts_updated='', alt_ids=None, addl=None, location=None, geospatial_bounds=None, geospatial_crs=None, keywords=None, hardware_version='', boundary=None):
+        TestDevice.__init__(self, name, description, lcstate, availability, visibility, ts_created, ts_updated, alt_ids, addl, location, geospatial_bounds, geospatial_crs, keywords)
+        self.type_ = 'TestPlatform'
+        self.hardware_version = hardware_version
+        self.boundary = boundary or {}
+
+    _schema = dict(TestDevice._schema.items() + {
+                'hardware_version': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+                'boundary': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': ''},
+              }.items())
+
+class TestSite(AppResource):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, name='', description='', lcstate='DRAFT', availability='PRIVATE', visibility=ResourceVisibilityEnum.PUBLIC, ts_created='', ts_updated='', alt_ids=None, addl=None, location=None, geospatial_bounds=None, geospatial_crs=None, temporal_bounds=None, boundary=None):
+        AppResource.__init__(self, name, description, lcstate, availability, visibility, ts_created, ts_updated, alt_ids, addl)
+        self.type_ = 'TestSite'
+        self.location = location or GeospatialLocation()
+        self.geospatial_bounds = geospatial_bounds or GeospatialBounds()
+        self.geospatial_crs = geospatial_crs or GeospatialCoordinateReferenceSystem()
+        self.temporal_bounds = temporal_bounds or TemporalBounds()
+        self.boundary = boundary or {}
+
+    _schema = dict(AppResource._schema.items() + {
+                'location': {'type': 'GeospatialLocation', 'default': GeospatialLocation(), 'decorators': {}, 'description': ''},
+                'geospatial_bounds': {'type': 'GeospatialBounds', 'default': GeospatialBounds(), 'decorators': {}, 'description': ''},
+                'geospatial_crs': {'type': 'GeospatialCoordinateReferenceSystem', 'default': GeospatialCoordinateReferenceSystem(), 'decorators': {}, 'description': ''},
+                'temporal_bounds': {'type': 'TemporalBounds', 'default': TemporalBounds(), 'decorators': {}, 'description': ''},
+                'boundary': {'type': 'dict', 'default': {}, 'decorators': {}, 'description': ''},
+              }.items())
+
+class TestDataset(InformationResource):
+
+    _class_info = {'name': '', 'decorators': {}, 'docstring': ''}
+
+    def __init__(self, name='', description='', lcstate='DRAFT', availability='PRIVATE', visibility=ResourceVisibilityEnum.PUBLIC, ts_created='', ts_updated='', alt_ids=None, addl=None, location=None, geospatial_bounds=None, geospatial_crs=None, temporal_bounds=None):
+        InformationResource.__init__(self, name, description, lcstate, availability, visibility, ts_created, ts_updated, alt_ids, addl)
+        self.type_ = 'TestDataset'
+        self.location = location or GeospatialLocation()
+        self.geospatial_bounds = geospatial_bounds or GeospatialBounds()
+        self.geospatial_crs = geospatial_crs or GeospatialCoordinateReferenceSystem()
+        self.temporal_bounds = temporal_bounds or TemporalBounds()
+
+    _schema = dict(InformationResource._schema.items() + {
+                'location': {'type': 'GeospatialLocation', 'default': GeospatialLocation(), 'decorators': {}, 'description': ''},
+                'geospatial_bounds': {'type': 'GeospatialBounds', 'default': GeospatialBounds(), 'decorators': {}, 'description': ''},
+                'geospatial_crs': {'type': 'GeospatialCoordinateReferenceSystem', 'default': GeospatialCoordinateReferenceSystem(), 'decorators': {}, 'description': ''},
+                'temporal_bounds': {'type': 'TemporalBounds', 'default': TemporalBounds(), 'decorators': {}, 'description': ''},
+              }.items())
@@ -0,0 +1,495 @@
+#!/usr/bin/env python
+#
+# File generated on 2026-10-16 20:36:13.253562
+#
+
+from zope.interface import Interface, implements
+
+from collections import OrderedDict, defaultdict
+
+import interface.objects
+from pyon.core.bootstrap import IonObject
+from pyon.ion.resregistry import ResourceRegistryServiceWrapper
+from pyon.ion.service import BaseService, BaseClients
+from pyon.net.endpoint import RPCClient
+from pyon.ion.endpoint import ProcessRPCClient
+from pyon.util.log import log
+
+
+SCHEMA_JSON = """{
+    "dependencies": [], 
+    "description": "The Capability Container messaging interface", 
+    "name": "container_agent", 
+    "op_list": [
+        "status", 
+        "start_app", 
+        "stop_container", 
+        "start_app_from_url", 
+        "terminate_process", 
+        "start_rel_from_url", 
+        "spawn_process", 
+        "start_rel"
+    ], 
+    "operations": {
+        "spawn_process": {
+            "description": "Spawn a process with given name (just a human readable label), from the provided Python module and class, and optional config override params. If no process_id is given, a new unique ID is generated for this process; otherwise the caller is responsible for making sure the ID is unique in the system.", 
+            "in": {
+                "cls": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "cls", 
+                    "type": "str"
+                }, 
+                "config": {
+                    "decorators": {}, 
+                    "default": {}, 
+                    "description": "", 
+                    "name": "config", 
+                    "type": "dict"
+                }, 
+                "module": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "module", 
+                    "type": "str"
+                }, 
+                "name": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "name", 
+                    "type": "str"
+                }, 
+                "process_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "process_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "process_id", 
+                "config", 
+                "name", 
+                "module", 
+                "cls"
+            ], 
+            "out": {
+                "process_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "process_id", 
+                    "type": "str"
+                }
+            }, 
+            "out_list": [
+                "process_id"
+            ], 
+            "spec": null, 
+            "throws": null
+        }, 
+        "start_app": {
+            "description": "Start a container application, i.e. a set of processes from a given app definition.", 
+            "in": {
+                "appdef": {
+                    "decorators": {}, 
+                    "default": null, 
+                    "description": "", 
+                    "name": "appdef", 
+                    "type": "NoneType"
+                }, 
+                "config": {
+                    "decorators": {}, 
+                    "default": null, 
+                    "description": "", 
+                    "name": "config", 
+                    "type": "NoneType"
+                }
+            }, 
+            "in_list": [
+                "appdef", 
+                "config"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": null
+        }, 
+        "start_app_from_url": {
+            "description": "Start a container application, i.e. a set of processes from a given app file.", 
+            "in": {
+                "app_url": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "app_url", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "app_url"
+            ], 
+            "out": {
+                "success": {
+                    "decorators": {}, 
+                    "default": true, 
+                    "description": "", 
+                    "name": "success", 
+                    "type": "bool"
+                }
+            }, 
+            "out_list": [
+                "success"
+            ], 
+            "spec": null, 
+            "throws": null
+        }, 
+        "start_rel": {
+            "description": "Start a container deployment, i.e. a set of processes from a given deploy definition.", 
+            "in": {
+                "rel": {
+                    "decorators": {}, 
+                    "default": null, 
+                    "description": "", 
+                    "name": "rel", 
+                    "type": "NoneType"
+                }
+            }, 
+            "in_list": [
+                "rel"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": null
+        }, 
+        "start_rel_from_url": {
+            "description": "Start a container deployment, i.e. a set of processes from a given deploy file.", 
+            "in": {
+                "rel_url": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "rel_url", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "rel_url"
+            ], 
+            "out": {
+                "success": {
+                    "decorators": {}, 
+                    "default": true, 
+                    "description": "", 
+                    "name": "success", 
+                    "type": "bool"
+                }
+            }, 
+            "out_list": [
+                "success"
+            ], 
+            "spec": null, 
+            "throws": null
+        }, 
+        "status": {
+            "description": "Provides status information and stats for the container.", 
+            "in": {}, 
+            "in_list": [], 
+            "out": {
+                "cstatus": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "cstatus", 
+                    "type": "str"
+                }
+            }, 
+            "out_list": [
+                "cstatus"
+            ], 
+            "spec": null, 
+            "throws": null
+        }, 
+        "stop_container": {
+            "description": "Shutdown the container gracefully after shutting down all processes on it.", 
+            "in": {}, 
+            "in_list": [], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": null
+        }, 
+        "terminate_process": {
+            "description": "Terminates a process and all its resources. Termination is graceful with timeout.", 
+            "in": {
+                "process_id": {
+                    "decorators": {}, 
+                    "default": null, 
+                    "description": "", 
+                    "name": "process_id", 
+                    "type": "NoneType"
+                }
+            }, 
+            "in_list": [
+                "process_id"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": null
+        }
+    }, 
+    "spec": ""
+}"""
+
+
+class ContainerAgentDependentClients(BaseClients):
+    def __init__(self, process=None):
+        self._process = process
+        BaseClients.__init__(self)
+
+
+
+
+class IContainerAgent(Interface):
+    """None
+    """
+
+    def status():
+        """Provides status information and stats for the container.
+
+        @retval cstatus    str
+        """
+        pass
+
+    def start_app(appdef=None, config=None):
+        """Start a container application, i.e. a set of processes from a given app definition.
+
+        @param appdef    NoneType
+        @param config    NoneType
+        """
+        pass
+
+    def stop_container():
+        """Shutdown the container gracefully after shutting down all processes on it.
+        """
+        pass
+
+    def start_app_from_url(app_url=''):
+        """Start a container application, i.e. a set of processes from a given app file.
+
+        @param app_url    str
+        @retval success    bool
+        """
+        pass
+
+    def terminate_process(process_id=None):
+        """Terminates a process and all its resources. Termination is graceful with timeout.
+
+        @param process_id    NoneType
+        """
+        pass
+
+    def start_rel_from_url(rel_url=''):
+        """Start a container deployment, i.e. a set of processes from a given deploy file.
+
+        @param rel_url    str
+        @retval success    bool
+        """
+        pass
+
+    def spawn_process(process_id='', config=None, name='', module='', cls=''):
+        """Spawn a process with given name (just a human readable label), from the provided Python module and class,
+        and optional config override params. If no process_id is given, a new unique ID is generated for this
+        process; otherwise the caller is responsible for making sure the ID is unique in the system.
+
+        @param process_id    str
+        @param config    dict
+        @param name    str
+        @param module    str
+        @param cls    str
+        @retval process_id    str
+        """
+        pass
+
+    def start_rel(rel=None):
+        """Start a container deployment, i.e. a set of processes from a given deploy definition.
+
+        @param rel    NoneType
+        """
+        pass
+
+class BaseContainerAgent(BaseService):
+    implements(IContainerAgent)
+    """None
+    """
+    SCHEMA_JSON=SCHEMA_JSON
+    name = 'container_agent'
+    dependencies = []
+
+    def __init__(self, *args, **kwargs):
+        BaseService.__init__(self, *args, **kwargs)
+        self.clients = ContainerAgentDependentClients(process=self)
+
+
+    def status(self):
+        """Provides status information and stats for the container.
+
+        @retval cstatus    str
+        """
+        pass
+
+    def start_app(self, appdef=None, config=None):
+        """Start a container application, i.e. a set of processes from a given app definition.
+
+        @param appdef    NoneType
+        @param config    NoneType
+        """
+        pass
+
+    def stop_container(self):
+        """Shutdown the container gracefully after shutting down all processes on it.
+        """
+        pass
+
+    def start_app_from_url(self, app_url=''):
+        """Start a container application, i.e. a set of processes from a given app file.
+
+        @param app_url    str
+        @retval success    bool
+        """
+        pass
+
+    def terminate_process(self, process_id=None):
+        """Terminates a process and all its resources. Termination is graceful with timeout.
+
+        @param process_id    NoneType
+        """
+        pass
+
+    def start_rel_from_url(self, rel_url=''):
+        """Start a container deployment, i.e. a set of processes from a given deploy file.
+
+        @param rel_url    str
+        @retval success    bool
+        """
+        pass
+
+    def spawn_process(self, process_id='', config=None, name='', module='', cls=''):
+        """Spawn a process with given name (just a human readable label), from the provided Python module and class,
+        and optional config override params. If no process_id is given, a new unique ID is generated for this
+        process; otherwise the caller is responsible for making sure the ID is unique in the system.
+
+        @param process_id    str
+        @param config    dict
+        @param name    str
+        @param module    str
+        @param cls    str
+        @retval process_id    str
+        """
+        pass
+
+    def start_rel(self, rel=None):
+        """Start a container deployment, i.e. a set of processes from a given deploy definition.
+
+        @param rel    NoneType
+        """
+        pass
+
+
+
+
+class ContainerAgentClientMixin(object):
+    """
+    # @todo Fill in client documentation.
+    """
+    #implements(IContainerAgent)
+
+
+    def status(self, headers=None, timeout=None):
+        """Provides status information and stats for the container.
+
+        @retval cstatus    str
+        """
+        return self.request(IonObject('container_agent_status_in', **{}), op='status', headers=headers, timeout=timeout)
+
+    def start_app(self, appdef=None, config=None, headers=None, timeout=None):
+        """Start a container application, i.e. a set of processes from a given app definition.
+
+        @param appdef    NoneType
+        @param config    NoneType
+        """
+        return self.request(IonObject('container_agent_start_app_in', **{'appdef': appdef or None, 'config': config or None}), op='start_app', headers=headers, timeout=timeout)
+
+    def stop_container(self, headers=None, timeout=None):
+        """Shutdown the container gracefully after shutting down all processes on it.
+        """
+        return self.request(IonObject('container_agent_stop_container_in', **{}), op='stop_container', headers=headers, timeout=timeout)
+
+    def start_app_from_url(self, app_url='', headers=None, timeout=None):
+        """Start a container application, i.e. a set of processes from a given app file.
+
+        @param app_url    str
+        @retval success    bool
+        """
+        return self.request(IonObject('container_agent_start_app_from_url_in', **{'app_url': app_url}), op='start_app_from_url', headers=headers, timeout=timeout)
+
+    def terminate_process(self, process_id=None, headers=None, timeout=None):
+        """Terminates a process and all its resources. Termination is graceful with timeout.
+
+        @param process_id    NoneType
+        """
+        return self.request(IonObject('container_agent_terminate_process_in', **{'process_id': process_id or None}), op='terminate_process', headers=headers, timeout=timeout)
+
+    def start_rel_from_url(self, rel_url='', headers=None, timeout=None):
+        """Start a container deployment, i.e. a set of processes from a given deploy file.
+
+        @param rel_url    str
+        @retval success    bool
+        """
+        return self.request(IonObject('container_agent_start_rel_from_url_in', **{'rel_url': rel_url}), op='start_rel_from_url', headers=headers, timeout=timeout)
+
+    def spawn_process(self, process_id='', config=None, name='', module='', cls='', headers=None, timeout=None):
+        """Spawn a process with given name (just a human readable label), from the provided Python module and class,
+        and optional config override params. If no process_id is given, a new unique ID is generated for this
+        process; otherwise the caller is responsible for making sure the ID is unique in the system.
+
+        @param process_id    str
+        @param config    dict
+        @param name    str
+        @param module    str
+        @param cls    str
+        @retval process_id    str
+        """
+        return self.request(IonObject('container_agent_spawn_process_in', **{'process_id': process_id, 'config': config or None, 'name': name, 'module': module, 'cls': cls}), op='spawn_process', headers=headers, timeout=timeout)
+
+    def start_rel(self, rel=None, headers=None, timeout=None):
+        """Start a container deployment, i.e. a set of processes from a given deploy definition.
+
+        @param rel    NoneType
+        """
+        return self.request(IonObject('container_agent_start_rel_in', **{'rel': rel or None}), op='start_rel', headers=headers, timeout=timeout)
+
+
+
+class ContainerAgentClient(RPCClient, ContainerAgentClientMixin):
+    def __init__(self, to_name=None, node=None, **kwargs):
+        to_name = to_name or 'container_agent'
+        RPCClient.__init__(self, to_name=to_name, node=node, **kwargs)
+        ContainerAgentClientMixin.__init__(self)
+
+
+class ContainerAgentProcessClient(ProcessRPCClient, ContainerAgentClientMixin):
+    def __init__(self, process=None, to_name=None, node=None, **kwargs):
+        to_name = to_name or 'container_agent'
+        ProcessRPCClient.__init__(self, process=process, to_name=to_name, node=node, **kwargs)
+        ContainerAgentClientMixin.__init__(self)
+
+
+
+
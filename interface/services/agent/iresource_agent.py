@@ -0,0 +1,1032 @@
+#!/usr/bin/env python
+#
+# File generated on 2026-10-16 20:36:13.253562
+#
+
+from zope.interface import Interface, implements
+
+from collections import OrderedDict, defaultdict
+
+import interface.objects
+from pyon.core.bootstrap import IonObject
+from pyon.ion.resregistry import ResourceRegistryServiceWrapper
+from pyon.ion.service import BaseService, BaseClients
+from pyon.net.endpoint import RPCClient
+from pyon.ion.endpoint import ProcessRPCClient
+from pyon.util.log import log
+
+
+SCHEMA_JSON = """{
+    "dependencies": [], 
+    "description": "Behaviors for any resource agent", 
+    "name": "resource_agent", 
+    "op_list": [
+        "set_resource", 
+        "get_agent_state", 
+        "ping_agent", 
+        "get_capabilities", 
+        "ping_resource", 
+        "execute_resource", 
+        "negotiate", 
+        "set_agent", 
+        "execute_agent", 
+        "get_agent", 
+        "get_resource_state", 
+        "get_resource"
+    ], 
+    "operations": {
+        "execute_agent": {
+            "description": "Execute command on the agent. @param resource_id The id of the resource agennt. @param command An AgentCommand containing the command. @retval result An AgentCommandResult containing the result. @throws BadRequest if the command was malformed. @throws NotFound if the command is not available in current state.", 
+            "in": {
+                "command": {
+                    "decorators": {}, 
+                    "default": "!AgentCommand", 
+                    "description": "", 
+                    "name": "command", 
+                    "type": "AgentCommand"
+                }, 
+                "resource_id": {
+                    "decorators": {
+                        "ResourceId": ""
+                    }, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "resource_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "command", 
+                "resource_id"
+            ], 
+            "out": {
+                "result": {
+                    "decorators": {}, 
+                    "default": "!AgentCommandResult", 
+                    "description": "", 
+                    "name": "result", 
+                    "type": "AgentCommandResult"
+                }
+            }, 
+            "out_list": [
+                "result"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "if the command was malformed.", 
+                "NotFound": "if the command is not implemented in the agent."
+            }
+        }, 
+        "execute_resource": {
+            "description": "Execute command on the resource represented by agent. @param resource_id The id of the resource agennt. @param command An AgentCommand containing the command. @retval result An AgentCommandResult containing the result. @throws BadRequest if the command was malformed. @throws NotFound if the command is not available in current state. @throws ResourceError if the resource produced an error during execution.", 
+            "in": {
+                "command": {
+                    "decorators": {}, 
+                    "default": "!AgentCommand", 
+                    "description": "", 
+                    "name": "command", 
+                    "type": "AgentCommand"
+                }, 
+                "resource_id": {
+                    "decorators": {
+                        "ResourceId": ""
+                    }, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "resource_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "command", 
+                "resource_id"
+            ], 
+            "out": {
+                "result": {
+                    "decorators": {}, 
+                    "default": "!AgentCommandResult", 
+                    "description": "", 
+                    "name": "result", 
+                    "type": "AgentCommandResult"
+                }
+            }, 
+            "out_list": [
+                "result"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "if the command was malformed.", 
+                "NotFound": "if the command is not implemented in the agent.", 
+                "ResourceError": "if the resource produced an error."
+            }
+        }, 
+        "get_agent": {
+            "description": "Return the value of the given agent parameters. @param resource_id The id of the resource agennt. @param params A list of parameters names to query. @retval A dict of parameter name-value pairs. @throws BadRequest if the command was malformed. @throws NotFound if the agent does not support the parameter.", 
+            "in": {
+                "params": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "params", 
+                    "type": "list"
+                }, 
+                "resource_id": {
+                    "decorators": {
+                        "ResourceId": ""
+                    }, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "resource_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "params", 
+                "resource_id"
+            ], 
+            "out": {
+                "result": {
+                    "decorators": {}, 
+                    "default": {}, 
+                    "description": "", 
+                    "name": "result", 
+                    "type": "dict"
+                }
+            }, 
+            "out_list": [
+                "result"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "if the command was malformed.", 
+                "NotFound": "if the parameter does not exist."
+            }
+        }, 
+        "get_agent_state": {
+            "description": "Return the current resource agent common state. @param resource_id The id of the resource agennt. @retval A str containing the current agent state.", 
+            "in": {
+                "resource_id": {
+                    "decorators": {
+                        "ResourceId": ""
+                    }, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "resource_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "resource_id"
+            ], 
+            "out": {
+                "result": {
+                    "decorators": {}, 
+                    "default": "str", 
+                    "description": "", 
+                    "name": "result", 
+                    "type": "str"
+                }
+            }, 
+            "out_list": [
+                "result"
+            ], 
+            "spec": null, 
+            "throws": null
+        }, 
+        "get_capabilities": {
+            "description": "Introspect for agent capabilities. @param resource_id The id of the resource agent. @param current_state Flag indicating to return capabilities for current state only (default True). @retval List of AgentCapabilities objects.", 
+            "in": {
+                "current_state": {
+                    "decorators": {}, 
+                    "default": true, 
+                    "description": "", 
+                    "name": "current_state", 
+                    "type": "bool"
+                }, 
+                "resource_id": {
+                    "decorators": {
+                        "ResourceId": ""
+                    }, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "resource_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "current_state", 
+                "resource_id"
+            ], 
+            "out": {
+                "capability_list": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "capability_list", 
+                    "type": "list"
+                }
+            }, 
+            "out_list": [
+                "capability_list"
+            ], 
+            "spec": null, 
+            "throws": null
+        }, 
+        "get_resource": {
+            "description": "Return the value of the given resource parameter. @param resource_id The id of the resource agennt. @param params A list of parameters names to query. @retval A dict of parameter name-value pairs. @throws BadRequest if the command was malformed. @throws NotFound if the resource does not support the parameter.", 
+            "in": {
+                "params": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "params", 
+                    "type": "list"
+                }, 
+                "resource_id": {
+                    "decorators": {
+                        "ResourceId": ""
+                    }, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "resource_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "params", 
+                "resource_id"
+            ], 
+            "out": {
+                "result": {
+                    "decorators": {}, 
+                    "default": {}, 
+                    "description": "", 
+                    "name": "result", 
+                    "type": "dict"
+                }
+            }, 
+            "out_list": [
+                "result"
+            ], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "if the parameter does not exist."
+            }
+        }, 
+        "get_resource_state": {
+            "description": "Return the current resource specific state, if available. @param resource_id The id of the resource agennt. @retval A str containing the current resource specific state.", 
+            "in": {
+                "resource_id": {
+                    "decorators": {
+                        "ResourceId": ""
+                    }, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "resource_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "resource_id"
+            ], 
+            "out": {
+                "result": {
+                    "decorators": {}, 
+                    "default": "str", 
+                    "description": "", 
+                    "name": "result", 
+                    "type": "str"
+                }
+            }, 
+            "out_list": [
+                "result"
+            ], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "if the resource does not utilize a specific state machine.", 
+                "ResourceError": "if the resource failed while trying to get the state."
+            }
+        }, 
+        "negotiate": {
+            "description": "Initiate a negotiation with this agent. The subject of this negotiation is the given ServiceAgreementProposal. The response is either a new ServiceAgreementProposal as counter-offer, or the same ServiceAgreementProposal indicating the offer has been accepted. NEEDS REFINEMENT.", 
+            "in": {
+                "resource_id": {
+                    "decorators": {
+                        "ResourceId": ""
+                    }, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "resource_id", 
+                    "type": "str"
+                }, 
+                "sap_in": {
+                    "decorators": {}, 
+                    "default": "!ServiceAgreementProposal", 
+                    "description": "", 
+                    "name": "sap_in", 
+                    "type": "ServiceAgreementProposal"
+                }
+            }, 
+            "in_list": [
+                "sap_in", 
+                "resource_id"
+            ], 
+            "out": {
+                "sap_out": {
+                    "decorators": {}, 
+                    "default": "!ServiceAgreementProposal", 
+                    "description": "", 
+                    "name": "sap_out", 
+                    "type": "ServiceAgreementProposal"
+                }
+            }, 
+            "out_list": [
+                "sap_out"
+            ], 
+            "spec": null, 
+            "throws": null
+        }, 
+        "ping_agent": {
+            "description": "Ping the agent. @param resource_id The id of the resource agennt. @retval A str containing a string representation of the agent and a timestamp.", 
+            "in": {
+                "resource_id": {
+                    "decorators": {
+                        "ResourceId": ""
+                    }, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "resource_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "resource_id"
+            ], 
+            "out": {
+                "result": {
+                    "decorators": {}, 
+                    "default": "str", 
+                    "description": "", 
+                    "name": "result", 
+                    "type": "str"
+                }
+            }, 
+            "out_list": [
+                "result"
+            ], 
+            "spec": null, 
+            "throws": null
+        }, 
+        "ping_resource": {
+            "description": "Ping the resource. @param resource_id The id of the resource agennt. @retval A str containing a string representation of the resource and timestamp.", 
+            "in": {
+                "resource_id": {
+                    "decorators": {
+                        "ResourceId": ""
+                    }, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "resource_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "resource_id"
+            ], 
+            "out": {
+                "result": {
+                    "decorators": {}, 
+                    "default": "str", 
+                    "description": "", 
+                    "name": "result", 
+                    "type": "str"
+                }
+            }, 
+            "out_list": [
+                "result"
+            ], 
+            "spec": null, 
+            "throws": null
+        }, 
+        "set_agent": {
+            "description": "Set the value of the given agent parameters. @param resource_id The id of the resource agennt. @param params A dict of resource parameter name-value pairs. @throws BadRequest if the command was malformed. @throws NotFound if a parameter is not supported by the resource.", 
+            "in": {
+                "params": {
+                    "decorators": {}, 
+                    "default": {}, 
+                    "description": "", 
+                    "name": "params", 
+                    "type": "dict"
+                }, 
+                "resource_id": {
+                    "decorators": {
+                        "ResourceId": ""
+                    }, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "resource_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "params", 
+                "resource_id"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "if the command was malformed.", 
+                "NotFound": "if the parameter does not exist."
+            }
+        }, 
+        "set_resource": {
+            "description": "Set the value of the given resource parameters. @param resource_id The id of the resource agennt. @param params A dict of resource parameter name-value pairs. @throws BadRequest if the command was malformed. @throws NotFound if a parameter is not supported by the resource. @throws ResourceError if the resource encountered an error while setting the parameters.", 
+            "in": {
+                "params": {
+                    "decorators": {}, 
+                    "default": {}, 
+                    "description": "", 
+                    "name": "params", 
+                    "type": "dict"
+                }, 
+                "resource_id": {
+                    "decorators": {
+                        "ResourceId": ""
+                    }, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "resource_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "params", 
+                "resource_id"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "if the command was malformed.", 
+                "NotFound": "if the parameter does not exist.", 
+                "ResourceError": "if the resource failed while trying to set the parameter."
+            }
+        }
+    }, 
+    "spec": "https://confluence.oceanobservatories.org/display/syseng/CIAD+CEI+OV+Resource+Agent"
+}"""
+
+
+class ResourceAgentDependentClients(BaseClients):
+    def __init__(self, process=None):
+        self._process = process
+        BaseClients.__init__(self)
+
+
+
+
+class IResourceAgent(Interface):
+    """Behaviors for any resource agent
+
+    @see https://confluence.oceanobservatories.org/display/syseng/CIAD+CEI+OV+Resource+Agent
+    """
+
+    def set_resource(params=None, resource_id=''):
+        """Set the value of the given resource parameters.
+        @param resource_id The id of the resource agennt.
+        @param params A dict of resource parameter name-value pairs.
+        @throws BadRequest if the command was malformed.
+        @throws NotFound if a parameter is not supported by the resource.
+        @throws ResourceError if the resource encountered an error while setting
+        the parameters.
+
+        @param params    dict
+        @param resource_id    str
+        @throws NotFound    if the parameter does not exist.
+        @throws ResourceError    if the resource failed while trying to set the parameter.
+        @throws BadRequest    if the command was malformed.
+        """
+        pass
+
+    def get_agent_state(resource_id=''):
+        """Return the current resource agent common state.
+        @param resource_id The id of the resource agennt.
+        @retval A str containing the current agent state.
+
+        @param resource_id    str
+        @retval result    str
+        """
+        pass
+
+    def ping_agent(resource_id=''):
+        """Ping the agent.
+        @param resource_id The id of the resource agennt.
+        @retval A str containing a string representation of the agent
+        and a timestamp.
+
+        @param resource_id    str
+        @retval result    str
+        """
+        pass
+
+    def get_capabilities(current_state=True, resource_id=''):
+        """Introspect for agent capabilities.
+        @param resource_id The id of the resource agent.
+        @param current_state Flag indicating to return capabilities for current
+        state only (default True).
+        @retval List of AgentCapabilities objects.
+
+        @param current_state    bool
+        @param resource_id    str
+        @retval capability_list    list
+        """
+        pass
+
+    def ping_resource(resource_id=''):
+        """Ping the resource.
+        @param resource_id The id of the resource agennt.
+        @retval A str containing a string representation of the resource and
+        timestamp.
+
+        @param resource_id    str
+        @retval result    str
+        """
+        pass
+
+    def execute_resource(command=None, resource_id=''):
+        """Execute command on the resource represented by agent.
+        @param resource_id The id of the resource agennt.
+        @param command An AgentCommand containing the command.
+        @retval result An AgentCommandResult containing the result.
+        @throws BadRequest if the command was malformed.
+        @throws NotFound if the command is not available in current state.
+        @throws ResourceError if the resource produced an error during execution.
+
+        @param command    AgentCommand
+        @param resource_id    str
+        @retval result    AgentCommandResult
+        @throws NotFound    if the command is not implemented in the agent.
+        @throws ResourceError    if the resource produced an error.
+        @throws BadRequest    if the command was malformed.
+        """
+        pass
+
+    def negotiate(sap_in=None, resource_id=''):
+        """Initiate a negotiation with this agent. The subject of this negotiation is the given
+        ServiceAgreementProposal. The response is either a new ServiceAgreementProposal as counter-offer,
+        or the same ServiceAgreementProposal indicating the offer has been accepted.
+        NEEDS REFINEMENT.
+
+        @param sap_in    ServiceAgreementProposal
+        @param resource_id    str
+        @retval sap_out    ServiceAgreementProposal
+        """
+        pass
+
+    def set_agent(params=None, resource_id=''):
+        """Set the value of the given agent parameters.
+        @param resource_id The id of the resource agennt.
+        @param params A dict of resource parameter name-value pairs.
+        @throws BadRequest if the command was malformed.
+        @throws NotFound if a parameter is not supported by the resource.
+
+        @param params    dict
+        @param resource_id    str
+        @throws NotFound    if the parameter does not exist.
+        @throws BadRequest    if the command was malformed.
+        """
+        pass
+
+    def execute_agent(command=None, resource_id=''):
+        """Execute command on the agent.
+        @param resource_id The id of the resource agennt.
+        @param command An AgentCommand containing the command.
+        @retval result An AgentCommandResult containing the result.
+        @throws BadRequest if the command was malformed.
+        @throws NotFound if the command is not available in current state.      
+
+        @param command    AgentCommand
+        @param resource_id    str
+        @retval result    AgentCommandResult
+        @throws NotFound    if the command is not implemented in the agent.
+        @throws BadRequest    if the command was malformed.
+        """
+        pass
+
+    def get_agent(params=None, resource_id=''):
+        """Return the value of the given agent parameters.
+        @param resource_id The id of the resource agennt.
+        @param params A list of parameters names to query.
+        @retval A dict of parameter name-value pairs.
+        @throws BadRequest if the command was malformed.
+        @throws NotFound if the agent does not support the parameter.
+
+        @param params    list
+        @param resource_id    str
+        @retval result    AgentCommandResult
+        @throws NotFound    if the parameter does not exist.
+        @throws BadRequest    if the command was malformed.
+        """
+        pass
+
+    def get_resource_state(resource_id=''):
+        """Return the current resource specific state, if available.
+        @param resource_id The id of the resource agennt.
+        @retval A str containing the current resource specific state.
+
+        @param resource_id    str
+        @retval result    str
+        @throws NotFound    if the resource does not utilize a specific state machine.
+        @throws ResourceError    if the resource failed while trying to get the state.
+        """
+        pass
+
+    def get_resource(params=None, resource_id=''):
+        """Return the value of the given resource parameter.
+        @param resource_id The id of the resource agennt.
+        @param params A list of parameters names to query.
+        @retval A dict of parameter name-value pairs.
+        @throws BadRequest if the command was malformed.
+        @throws NotFound if the resource does not support the parameter.
+
+        @param params    list
+        @param resource_id    str
+        @retval result    AgentCommandResult
+        @throws NotFound    if the parameter does not exist.
+        """
+        pass
+
+class BaseResourceAgent(BaseService):
+    implements(IResourceAgent)
+    """Behaviors for any resource agent
+
+    @see https://confluence.oceanobservatories.org/display/syseng/CIAD+CEI+OV+Resource+Agent
+    """
+    SCHEMA_JSON=SCHEMA_JSON
+    name = 'resource_agent'
+    dependencies = []
+
+    def __init__(self, *args, **kwargs):
+        BaseService.__init__(self, *args, **kwargs)
+        self.clients = ResourceAgentDependentClients(process=self)
+
+
+    def set_resource(self, params=None, resource_id=''):
+        """Set the value of the given resource parameters.
+        @param resource_id The id of the resource agennt.
+        @param params A dict of resource parameter name-value pairs.
+        @throws BadRequest if the command was malformed.
+        @throws NotFound if a parameter is not supported by the resource.
+        @throws ResourceError if the resource encountered an error while setting
+        the parameters.
+
+        @param params    dict
+        @param resource_id    str
+        @throws NotFound    if the parameter does not exist.
+        @throws ResourceError    if the resource failed while trying to set the parameter.
+        @throws BadRequest    if the command was malformed.
+        """
+        pass
+
+    def get_agent_state(self, resource_id=''):
+        """Return the current resource agent common state.
+        @param resource_id The id of the resource agennt.
+        @retval A str containing the current agent state.
+
+        @param resource_id    str
+        @retval result    str
+        """
+        pass
+
+    def ping_agent(self, resource_id=''):
+        """Ping the agent.
+        @param resource_id The id of the resource agennt.
+        @retval A str containing a string representation of the agent
+        and a timestamp.
+
+        @param resource_id    str
+        @retval result    str
+        """
+        pass
+
+    def get_capabilities(self, current_state=True, resource_id=''):
+        """Introspect for agent capabilities.
+        @param resource_id The id of the resource agent.
+        @param current_state Flag indicating to return capabilities for current
+        state only (default True).
+        @retval List of AgentCapabilities objects.
+
+        @param current_state    bool
+        @param resource_id    str
+        @retval capability_list    list
+        """
+        pass
+
+    def ping_resource(self, resource_id=''):
+        """Ping the resource.
+        @param resource_id The id of the resource agennt.
+        @retval A str containing a string representation of the resource and
+        timestamp.
+
+        @param resource_id    str
+        @retval result    str
+        """
+        pass
+
+    def execute_resource(self, command=None, resource_id=''):
+        """Execute command on the resource represented by agent.
+        @param resource_id The id of the resource agennt.
+        @param command An AgentCommand containing the command.
+        @retval result An AgentCommandResult containing the result.
+        @throws BadRequest if the command was malformed.
+        @throws NotFound if the command is not available in current state.
+        @throws ResourceError if the resource produced an error during execution.
+
+        @param command    AgentCommand
+        @param resource_id    str
+        @retval result    AgentCommandResult
+        @throws NotFound    if the command is not implemented in the agent.
+        @throws ResourceError    if the resource produced an error.
+        @throws BadRequest    if the command was malformed.
+        """
+        pass
+
+    def negotiate(self, sap_in=None, resource_id=''):
+        """Initiate a negotiation with this agent. The subject of this negotiation is the given
+        ServiceAgreementProposal. The response is either a new ServiceAgreementProposal as counter-offer,
+        or the same ServiceAgreementProposal indicating the offer has been accepted.
+        NEEDS REFINEMENT.
+
+        @param sap_in    ServiceAgreementProposal
+        @param resource_id    str
+        @retval sap_out    ServiceAgreementProposal
+        """
+        pass
+
+    def set_agent(self, params=None, resource_id=''):
+        """Set the value of the given agent parameters.
+        @param resource_id The id of the resource agennt.
+        @param params A dict of resource parameter name-value pairs.
+        @throws BadRequest if the command was malformed.
+        @throws NotFound if a parameter is not supported by the resource.
+
+        @param params    dict
+        @param resource_id    str
+        @throws NotFound    if the parameter does not exist.
+        @throws BadRequest    if the command was malformed.
+        """
+        pass
+
+    def execute_agent(self, command=None, resource_id=''):
+        """Execute command on the agent.
+        @param resource_id The id of the resource agennt.
+        @param command An AgentCommand containing the command.
+        @retval result An AgentCommandResult containing the result.
+        @throws BadRequest if the command was malformed.
+        @throws NotFound if the command is not available in current state.      
+
+        @param command    AgentCommand
+        @param resource_id    str
+        @retval result    AgentCommandResult
+        @throws NotFound    if the command is not implemented in the agent.
+        @throws BadRequest    if the command was malformed.
+        """
+        pass
+
+    def get_agent(self, params=None, resource_id=''):
+        """Return the value of the given agent parameters.
+        @param resource_id The id of the resource agennt.
+        @param params A list of parameters names to query.
+        @retval A dict of parameter name-value pairs.
+        @throws BadRequest if the command was malformed.
+        @throws NotFound if the agent does not support the parameter.
+
+        @param params    list
+        @param resource_id    str
+        @retval result    AgentCommandResult
+        @throws NotFound    if the parameter does not exist.
+        @throws BadRequest    if the command was malformed.
+        """
+        pass
+
+    def get_resource_state(self, resource_id=''):
+        """Return the current resource specific state, if available.
+        @param resource_id The id of the resource agennt.
+        @retval A str containing the current resource specific state.
+
+        @param resource_id    str
+        @retval result    str
+        @throws NotFound    if the resource does not utilize a specific state machine.
+        @throws ResourceError    if the resource failed while trying to get the state.
+        """
+        pass
+
+    def get_resource(self, params=None, resource_id=''):
+        """Return the value of the given resource parameter.
+        @param resource_id The id of the resource agennt.
+        @param params A list of parameters names to query.
+        @retval A dict of parameter name-value pairs.
+        @throws BadRequest if the command was malformed.
+        @throws NotFound if the resource does not support the parameter.
+
+        @param params    list
+        @param resource_id    str
+        @retval result    AgentCommandResult
+        @throws NotFound    if the parameter does not exist.
+        """
+        pass
+
+
+
+
+class ResourceAgentClientMixin(object):
+    """
+    # @todo Fill in client documentation.
+    """
+    #implements(IResourceAgent)
+
+
+    def set_resource(self, params=None, resource_id='', headers=None, timeout=None):
+        """Set the value of the given resource parameters.
+        @param resource_id The id of the resource agennt.
+        @param params A dict of resource parameter name-value pairs.
+        @throws BadRequest if the command was malformed.
+        @throws NotFound if a parameter is not supported by the resource.
+        @throws ResourceError if the resource encountered an error while setting
+        the parameters.
+
+        @param params    dict
+        @param resource_id    str
+        @throws NotFound    if the parameter does not exist.
+        @throws ResourceError    if the resource failed while trying to set the parameter.
+        @throws BadRequest    if the command was malformed.
+        """
+        return self.request(IonObject('resource_agent_set_resource_in', **{'params': params or None, 'resource_id': resource_id}), op='set_resource', headers=headers, timeout=timeout)
+
+    def get_agent_state(self, resource_id='', headers=None, timeout=None):
+        """Return the current resource agent common state.
+        @param resource_id The id of the resource agennt.
+        @retval A str containing the current agent state.
+
+        @param resource_id    str
+        @retval result    str
+        """
+        return self.request(IonObject('resource_agent_get_agent_state_in', **{'resource_id': resource_id}), op='get_agent_state', headers=headers, timeout=timeout)
+
+    def ping_agent(self, resource_id='', headers=None, timeout=None):
+        """Ping the agent.
+        @param resource_id The id of the resource agennt.
+        @retval A str containing a string representation of the agent
+        and a timestamp.
+
+        @param resource_id    str
+        @retval result    str
+        """
+        return self.request(IonObject('resource_agent_ping_agent_in', **{'resource_id': resource_id}), op='ping_agent', headers=headers, timeout=timeout)
+
+    def get_capabilities(self, current_state=True, resource_id='', headers=None, timeout=None):
+        """Introspect for agent capabilities.
+        @param resource_id The id of the resource agent.
+        @param current_state Flag indicating to return capabilities for current
+        state only (default True).
+        @retval List of AgentCapabilities objects.
+
+        @param current_state    bool
+        @param resource_id    str
+        @retval capability_list    list
+        """
+        return self.request(IonObject('resource_agent_get_capabilities_in', **{'current_state': current_state, 'resource_id': resource_id}), op='get_capabilities', headers=headers, timeout=timeout)
+
+    def ping_resource(self, resource_id='', headers=None, timeout=None):
+        """Ping the resource.
+        @param resource_id The id of the resource agennt.
+        @retval A str containing a string representation of the resource and
+        timestamp.
+
+        @param resource_id    str
+        @retval result    str
+        """
+        return self.request(IonObject('resource_agent_ping_resource_in', **{'resource_id': resource_id}), op='ping_resource', headers=headers, timeout=timeout)
+
+    def execute_resource(self, command=None, resource_id='', headers=None, timeout=None):
+        """Execute command on the resource represented by agent.
+        @param resource_id The id of the resource agennt.
+        @param command An AgentCommand containing the command.
+        @retval result An AgentCommandResult containing the result.
+        @throws BadRequest if the command was malformed.
+        @throws NotFound if the command is not available in current state.
+        @throws ResourceError if the resource produced an error during execution.
+
+        @param command    AgentCommand
+        @param resource_id    str
+        @retval result    AgentCommandResult
+        @throws NotFound    if the command is not implemented in the agent.
+        @throws ResourceError    if the resource produced an error.
+        @throws BadRequest    if the command was malformed.
+        """
+        return self.request(IonObject('resource_agent_execute_resource_in', **{'command': command or None, 'resource_id': resource_id}), op='execute_resource', headers=headers, timeout=timeout)
+
+    def negotiate(self, sap_in=None, resource_id='', headers=None, timeout=None):
+        """Initiate a negotiation with this agent. The subject of this negotiation is the given
+        ServiceAgreementProposal. The response is either a new ServiceAgreementProposal as counter-offer,
+        or the same ServiceAgreementProposal indicating the offer has been accepted.
+        NEEDS REFINEMENT.
+
+        @param sap_in    ServiceAgreementProposal
+        @param resource_id    str
+        @retval sap_out    ServiceAgreementProposal
+        """
+        return self.request(IonObject('resource_agent_negotiate_in', **{'sap_in': sap_in or None, 'resource_id': resource_id}), op='negotiate', headers=headers, timeout=timeout)
+
+    def set_agent(self, params=None, resource_id='', headers=None, timeout=None):
+        """Set the value of the given agent parameters.
+        @param resource_id The id of the resource agennt.
+        @param params A dict of resource parameter name-value pairs.
+        @throws BadRequest if the command was malformed.
+        @throws NotFound if a parameter is not supported by the resource.
+
+        @param params    dict
+        @param resource_id    str
+        @throws NotFound    if the parameter does not exist.
+        @throws BadRequest    if the command was malformed.
+        """
+        return self.request(IonObject('resource_agent_set_agent_in', **{'params': params or None, 'resource_id': resource_id}), op='set_agent', headers=headers, timeout=timeout)
+
+    def execute_agent(self, command=None, resource_id='', headers=None, timeout=None):
+        """Execute command on the agent.
+        @param resource_id The id of the resource agennt.
+        @param command An AgentCommand containing the command.
+        @retval result An AgentCommandResult containing the result.
+        @throws BadRequest if the command was malformed.
+        @throws NotFound if the command is not available in current state.      
+
+        @param command    AgentCommand
+        @param resource_id    str
+        @retval result    AgentCommandResult
+        @throws NotFound    if the command is not implemented in the agent.
+        @throws BadRequest    if the command was malformed.
+        """
+        return self.request(IonObject('resource_agent_execute_agent_in', **{'command': command or None, 'resource_id': resource_id}), op='execute_agent', headers=headers, timeout=timeout)
+
+    def get_agent(self, params=None, resource_id='', headers=None, timeout=None):
+        """Return the value of the given agent parameters.
+        @param resource_id The id of the resource agennt.
+        @param params A list of parameters names to query.
+        @retval A dict of parameter name-value pairs.
+        @throws BadRequest if the command was malformed.
+        @throws NotFound if the agent does not support the parameter.
+
+        @param params    list
+        @param resource_id    str
+        @retval result    AgentCommandResult
+        @throws NotFound    if the parameter does not exist.
+        @throws BadRequest    if the command was malformed.
+        """
+        return self.request(IonObject('resource_agent_get_agent_in', **{'params': params or None, 'resource_id': resource_id}), op='get_agent', headers=headers, timeout=timeout)
+
+    def get_resource_state(self, resource_id='', headers=None, timeout=None):
+        """Return the current resource specific state, if available.
+        @param resource_id The id of the resource agennt.
+        @retval A str containing the current resource specific state.
+
+        @param resource_id    str
+        @retval result    str
+        @throws NotFound    if the resource does not utilize a specific state machine.
+        @throws ResourceError    if the resource failed while trying to get the state.
+        """
+        return self.request(IonObject('resource_agent_get_resource_state_in', **{'resource_id': resource_id}), op='get_resource_state', headers=headers, timeout=timeout)
+
+    def get_resource(self, params=None, resource_id='', headers=None, timeout=None):
+        """Return the value of the given resource parameter.
+        @param resource_id The id of the resource agennt.
+        @param params A list of parameters names to query.
+        @retval A dict of parameter name-value pairs.
+        @throws BadRequest if the command was malformed.
+        @throws NotFound if the resource does not support the parameter.
+
+        @param params    list
+        @param resource_id    str
+        @retval result    AgentCommandResult
+        @throws NotFound    if the parameter does not exist.
+        """
+        return self.request(IonObject('resource_agent_get_resource_in', **{'params': params or None, 'resource_id': resource_id}), op='get_resource', headers=headers, timeout=timeout)
+
+
+
+class ResourceAgentClient(RPCClient, ResourceAgentClientMixin):
+    def __init__(self, to_name=None, node=None, **kwargs):
+        to_name = to_name or 'resource_agent'
+        RPCClient.__init__(self, to_name=to_name, node=node, **kwargs)
+        ResourceAgentClientMixin.__init__(self)
+
+
+class ResourceAgentProcessClient(ProcessRPCClient, ResourceAgentClientMixin):
+    def __init__(self, process=None, to_name=None, node=None, **kwargs):
+        to_name = to_name or 'resource_agent'
+        ProcessRPCClient.__init__(self, process=process, to_name=to_name, node=node, **kwargs)
+        ResourceAgentClientMixin.__init__(self)
+
+
+
+
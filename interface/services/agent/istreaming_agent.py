@@ -0,0 +1,495 @@
+#!/usr/bin/env python
+#
+# File generated on 2026-10-16 20:36:13.253562
+#
+
+from zope.interface import Interface, implements
+
+from collections import OrderedDict, defaultdict
+
+import interface.objects
+from pyon.core.bootstrap import IonObject
+from pyon.ion.resregistry import ResourceRegistryServiceWrapper
+from pyon.ion.service import BaseService, BaseClients
+from pyon.net.endpoint import RPCClient
+from pyon.ion.endpoint import ProcessRPCClient
+from pyon.util.log import log
+
+
+SCHEMA_JSON = """{
+    "dependencies": [], 
+    "description": "Behaviors for a simple streaming agent", 
+    "name": "streaming_agent", 
+    "op_list": [
+        "disconnect", 
+        "acquire_data", 
+        "stop_streaming", 
+        "get_params", 
+        "get_status", 
+        "connect", 
+        "start_streaming", 
+        "set_params"
+    ], 
+    "operations": {
+        "acquire_data": {
+            "description": "Instructs the agent to acquire new data if available and publish on the defined channels. If not already connected, will connect automatically.", 
+            "in": {
+                "streaming_args": {
+                    "decorators": {}, 
+                    "default": {}, 
+                    "description": "", 
+                    "name": "streaming_args", 
+                    "type": "dict"
+                }
+            }, 
+            "in_list": [
+                "streaming_args"
+            ], 
+            "out": {
+                "data_stats": {
+                    "decorators": {}, 
+                    "default": {}, 
+                    "description": "", 
+                    "name": "data_stats", 
+                    "type": "dict"
+                }
+            }, 
+            "out_list": [
+                "data_stats"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "arguments invalid or incomplete", 
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "connect": {
+            "description": "Instructs the agent to connect to the data source and check validity of all connection params. No data will be provided yet.", 
+            "in": {
+                "connect_args": {
+                    "decorators": {}, 
+                    "default": {}, 
+                    "description": "", 
+                    "name": "connect_args", 
+                    "type": "dict"
+                }
+            }, 
+            "in_list": [
+                "connect_args"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "arguments invalid or incomplete", 
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "disconnect": {
+            "description": "Instructs the agent to disconnect and cease all activity. If agent was streaming, will stop streaming first.", 
+            "in": {}, 
+            "in_list": [], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "arguments invalid or incomplete", 
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "get_params": {
+            "description": "Returns current values for agent parameters.", 
+            "in": {
+                "param_list": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "param_list", 
+                    "type": "list"
+                }
+            }, 
+            "in_list": [
+                "param_list"
+            ], 
+            "out": {
+                "params": {
+                    "decorators": {}, 
+                    "default": {}, 
+                    "description": "", 
+                    "name": "params", 
+                    "type": "dict"
+                }
+            }, 
+            "out_list": [
+                "params"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "arguments invalid or incomplete", 
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "get_status": {
+            "description": "Requests status from the agent.", 
+            "in": {}, 
+            "in_list": [], 
+            "out": {
+                "agent_status": {
+                    "decorators": {}, 
+                    "default": {}, 
+                    "description": "", 
+                    "name": "agent_status", 
+                    "type": "dict"
+                }
+            }, 
+            "out_list": [
+                "agent_status"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "arguments invalid or incomplete", 
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "set_params": {
+            "description": "Sets one or multiple parameters in the agent.", 
+            "in": {
+                "params": {
+                    "decorators": {}, 
+                    "default": {}, 
+                    "description": "", 
+                    "name": "params", 
+                    "type": "dict"
+                }
+            }, 
+            "in_list": [
+                "params"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "arguments invalid or incomplete", 
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "start_streaming": {
+            "description": "Instructs the agent to start streaming in recurring intervals or on arrival of data. If not already connected, will connect automatically.", 
+            "in": {
+                "streaming_args": {
+                    "decorators": {}, 
+                    "default": {}, 
+                    "description": "", 
+                    "name": "streaming_args", 
+                    "type": "dict"
+                }
+            }, 
+            "in_list": [
+                "streaming_args"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "arguments invalid or incomplete", 
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "stop_streaming": {
+            "description": "Instructs the agent to stop streaming and remain passive but connected.", 
+            "in": {}, 
+            "in_list": [], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "arguments invalid or incomplete", 
+                "NotFound": "object with specified id does not exist"
+            }
+        }
+    }, 
+    "spec": ""
+}"""
+
+
+class StreamingAgentDependentClients(BaseClients):
+    def __init__(self, process=None):
+        self._process = process
+        BaseClients.__init__(self)
+
+
+
+
+class IStreamingAgent(Interface):
+    """None
+    """
+
+    def disconnect():
+        """Instructs the agent to disconnect and cease all activity.
+        If agent was streaming, will stop streaming first.
+
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        pass
+
+    def acquire_data(streaming_args=None):
+        """Instructs the agent to acquire new data if available and publish on the defined channels.
+        If not already connected, will connect automatically.
+
+        @param streaming_args    dict
+        @retval data_stats    dict
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        pass
+
+    def stop_streaming():
+        """Instructs the agent to stop streaming and remain passive but connected.
+
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        pass
+
+    def get_params(param_list=None):
+        """Returns current values for agent parameters.
+
+        @param param_list    list
+        @retval params    dict
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        pass
+
+    def get_status():
+        """Requests status from the agent.
+
+        @retval agent_status    dict
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        pass
+
+    def connect(connect_args=None):
+        """Instructs the agent to connect to the data source and check validity
+        of all connection params. No data will be provided yet.
+
+        @param connect_args    dict
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        pass
+
+    def start_streaming(streaming_args=None):
+        """Instructs the agent to start streaming in recurring intervals or on arrival of data.
+        If not already connected, will connect automatically.
+
+        @param streaming_args    dict
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        pass
+
+    def set_params(params=None):
+        """Sets one or multiple parameters in the agent.
+
+        @param params    dict
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        pass
+
+class BaseStreamingAgent(BaseService):
+    implements(IStreamingAgent)
+    """None
+    """
+    SCHEMA_JSON=SCHEMA_JSON
+    name = 'streaming_agent'
+    dependencies = []
+
+    def __init__(self, *args, **kwargs):
+        BaseService.__init__(self, *args, **kwargs)
+        self.clients = StreamingAgentDependentClients(process=self)
+
+
+    def disconnect(self):
+        """Instructs the agent to disconnect and cease all activity.
+        If agent was streaming, will stop streaming first.
+
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        pass
+
+    def acquire_data(self, streaming_args=None):
+        """Instructs the agent to acquire new data if available and publish on the defined channels.
+        If not already connected, will connect automatically.
+
+        @param streaming_args    dict
+        @retval data_stats    dict
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        pass
+
+    def stop_streaming(self):
+        """Instructs the agent to stop streaming and remain passive but connected.
+
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        pass
+
+    def get_params(self, param_list=None):
+        """Returns current values for agent parameters.
+
+        @param param_list    list
+        @retval params    dict
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        pass
+
+    def get_status(self):
+        """Requests status from the agent.
+
+        @retval agent_status    dict
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        pass
+
+    def connect(self, connect_args=None):
+        """Instructs the agent to connect to the data source and check validity
+        of all connection params. No data will be provided yet.
+
+        @param connect_args    dict
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        pass
+
+    def start_streaming(self, streaming_args=None):
+        """Instructs the agent to start streaming in recurring intervals or on arrival of data.
+        If not already connected, will connect automatically.
+
+        @param streaming_args    dict
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        pass
+
+    def set_params(self, params=None):
+        """Sets one or multiple parameters in the agent.
+
+        @param params    dict
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        pass
+
+
+
+
+class StreamingAgentClientMixin(object):
+    """
+    # @todo Fill in client documentation.
+    """
+    #implements(IStreamingAgent)
+
+
+    def disconnect(self, headers=None, timeout=None):
+        """Instructs the agent to disconnect and cease all activity.
+        If agent was streaming, will stop streaming first.
+
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        return self.request(IonObject('streaming_agent_disconnect_in', **{}), op='disconnect', headers=headers, timeout=timeout)
+
+    def acquire_data(self, streaming_args=None, headers=None, timeout=None):
+        """Instructs the agent to acquire new data if available and publish on the defined channels.
+        If not already connected, will connect automatically.
+
+        @param streaming_args    dict
+        @retval data_stats    dict
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        return self.request(IonObject('streaming_agent_acquire_data_in', **{'streaming_args': streaming_args or None}), op='acquire_data', headers=headers, timeout=timeout)
+
+    def stop_streaming(self, headers=None, timeout=None):
+        """Instructs the agent to stop streaming and remain passive but connected.
+
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        return self.request(IonObject('streaming_agent_stop_streaming_in', **{}), op='stop_streaming', headers=headers, timeout=timeout)
+
+    def get_params(self, param_list=None, headers=None, timeout=None):
+        """Returns current values for agent parameters.
+
+        @param param_list    list
+        @retval params    dict
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        return self.request(IonObject('streaming_agent_get_params_in', **{'param_list': param_list or None}), op='get_params', headers=headers, timeout=timeout)
+
+    def get_status(self, headers=None, timeout=None):
+        """Requests status from the agent.
+
+        @retval agent_status    dict
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        return self.request(IonObject('streaming_agent_get_status_in', **{}), op='get_status', headers=headers, timeout=timeout)
+
+    def connect(self, connect_args=None, headers=None, timeout=None):
+        """Instructs the agent to connect to the data source and check validity
+        of all connection params. No data will be provided yet.
+
+        @param connect_args    dict
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        return self.request(IonObject('streaming_agent_connect_in', **{'connect_args': connect_args or None}), op='connect', headers=headers, timeout=timeout)
+
+    def start_streaming(self, streaming_args=None, headers=None, timeout=None):
+        """Instructs the agent to start streaming in recurring intervals or on arrival of data.
+        If not already connected, will connect automatically.
+
+        @param streaming_args    dict
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        return self.request(IonObject('streaming_agent_start_streaming_in', **{'streaming_args': streaming_args or None}), op='start_streaming', headers=headers, timeout=timeout)
+
+    def set_params(self, params=None, headers=None, timeout=None):
+        """Sets one or multiple parameters in the agent.
+
+        @param params    dict
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        return self.request(IonObject('streaming_agent_set_params_in', **{'params': params or None}), op='set_params', headers=headers, timeout=timeout)
+
+
+
+class StreamingAgentClient(RPCClient, StreamingAgentClientMixin):
+    def __init__(self, to_name=None, node=None, **kwargs):
+        to_name = to_name or 'streaming_agent'
+        RPCClient.__init__(self, to_name=to_name, node=node, **kwargs)
+        StreamingAgentClientMixin.__init__(self)
+
+
+class StreamingAgentProcessClient(ProcessRPCClient, StreamingAgentClientMixin):
+    def __init__(self, process=None, to_name=None, node=None, **kwargs):
+        to_name = to_name or 'streaming_agent'
+        ProcessRPCClient.__init__(self, process=process, to_name=to_name, node=node, **kwargs)
+        StreamingAgentClientMixin.__init__(self)
+
+
+
+
@@ -0,0 +1,349 @@
+#!/usr/bin/env python
+#
+# File generated on 2026-10-16 20:36:13.253562
+#
+
+from zope.interface import Interface, implements
+
+from collections import OrderedDict, defaultdict
+
+import interface.objects
+from pyon.core.bootstrap import IonObject
+from pyon.ion.resregistry import ResourceRegistryServiceWrapper
+from pyon.ion.service import BaseService, BaseClients
+from pyon.net.endpoint import RPCClient
+from pyon.ion.endpoint import ProcessRPCClient
+from pyon.util.log import log
+
+
+SCHEMA_JSON = """{
+    "dependencies": [], 
+    "description": "Provides a lookup directory of important information of an Org.", 
+    "name": "directory", 
+    "op_list": [
+        "unregister", 
+        "register", 
+        "lookup", 
+        "find"
+    ], 
+    "operations": {
+        "find": {
+            "description": "Find an entry in the directory based on a starting location in the hierarchy and optional pattern.", 
+            "in": {
+                "parent": {
+                    "decorators": {}, 
+                    "default": "/", 
+                    "description": "", 
+                    "name": "parent", 
+                    "type": "str"
+                }, 
+                "pattern": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "pattern", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "pattern", 
+                "parent"
+            ], 
+            "out": {
+                "entry_list": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "entry_list", 
+                    "type": "list"
+                }
+            }, 
+            "out_list": [
+                "entry_list"
+            ], 
+            "spec": null, 
+            "throws": null
+        }, 
+        "lookup": {
+            "description": "Lookup an entry from the directory, given the qualified key", 
+            "in": {
+                "qualified_key": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "qualified_key", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "qualified_key"
+            ], 
+            "out": {
+                "attributes": {
+                    "decorators": {}, 
+                    "default": {}, 
+                    "description": "", 
+                    "name": "attributes", 
+                    "type": "dict"
+                }
+            }, 
+            "out_list": [
+                "attributes"
+            ], 
+            "spec": null, 
+            "throws": null
+        }, 
+        "register": {
+            "description": "Register and entry in the directory. This action is idempotent and acts as both create and update, based on the key.", 
+            "in": {
+                "attributes": {
+                    "decorators": {}, 
+                    "default": {}, 
+                    "description": "", 
+                    "name": "attributes", 
+                    "type": "dict"
+                }, 
+                "key": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "key", 
+                    "type": "str"
+                }, 
+                "parent": {
+                    "decorators": {}, 
+                    "default": "/", 
+                    "description": "", 
+                    "name": "parent", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "attributes", 
+                "parent", 
+                "key"
+            ], 
+            "out": {
+                "old_attributes": {
+                    "decorators": {}, 
+                    "default": {}, 
+                    "description": "", 
+                    "name": "old_attributes", 
+                    "type": "dict"
+                }
+            }, 
+            "out_list": [
+                "old_attributes"
+            ], 
+            "spec": null, 
+            "throws": null
+        }, 
+        "unregister": {
+            "description": "Unregister an entry in the directory.", 
+            "in": {
+                "key": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "key", 
+                    "type": "str"
+                }, 
+                "parent": {
+                    "decorators": {}, 
+                    "default": "/", 
+                    "description": "", 
+                    "name": "parent", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "parent", 
+                "key"
+            ], 
+            "out": {
+                "old_attributes": {
+                    "decorators": {}, 
+                    "default": {}, 
+                    "description": "", 
+                    "name": "old_attributes", 
+                    "type": "dict"
+                }
+            }, 
+            "out_list": [
+                "old_attributes"
+            ], 
+            "spec": null, 
+            "throws": null
+        }
+    }, 
+    "spec": ""
+}"""
+
+
+class DirectoryServiceDependentClients(BaseClients):
+    def __init__(self, process=None):
+        self._process = process
+        BaseClients.__init__(self)
+
+
+
+
+class IDirectoryService(Interface):
+    """None
+    """
+
+    def unregister(parent='/', key=''):
+        """Unregister an entry in the directory.
+
+        @param parent    str
+        @param key    str
+        @retval old_attributes    dict
+        """
+        pass
+
+    def register(attributes=None, parent='/', key=''):
+        """Register and entry in the directory. This action is idempotent and acts as
+        both create and update, based on the key.
+
+        @param attributes    dict
+        @param parent    str
+        @param key    str
+        @retval old_attributes    dict
+        """
+        pass
+
+    def lookup(qualified_key=''):
+        """Lookup an entry from the directory, given the qualified key
+
+        @param qualified_key    str
+        @retval attributes    dict
+        """
+        pass
+
+    def find(pattern='', parent='/'):
+        """Find an entry in the directory based on a starting location in the hierarchy
+        and optional pattern.
+
+        @param pattern    str
+        @param parent    str
+        @retval entry_list    list
+        """
+        pass
+
+class BaseDirectoryService(BaseService):
+    implements(IDirectoryService)
+    """None
+    """
+    SCHEMA_JSON=SCHEMA_JSON
+    name = 'directory'
+    dependencies = []
+
+    def __init__(self, *args, **kwargs):
+        BaseService.__init__(self, *args, **kwargs)
+        self.clients = DirectoryServiceDependentClients(process=self)
+
+
+    def unregister(self, parent='/', key=''):
+        """Unregister an entry in the directory.
+
+        @param parent    str
+        @param key    str
+        @retval old_attributes    dict
+        """
+        pass
+
+    def register(self, attributes=None, parent='/', key=''):
+        """Register and entry in the directory. This action is idempotent and acts as
+        both create and update, based on the key.
+
+        @param attributes    dict
+        @param parent    str
+        @param key    str
+        @retval old_attributes    dict
+        """
+        pass
+
+    def lookup(self, qualified_key=''):
+        """Lookup an entry from the directory, given the qualified key
+
+        @param qualified_key    str
+        @retval attributes    dict
+        """
+        pass
+
+    def find(self, pattern='', parent='/'):
+        """Find an entry in the directory based on a starting location in the hierarchy
+        and optional pattern.
+
+        @param pattern    str
+        @param parent    str
+        @retval entry_list    list
+        """
+        pass
+
+
+
+
+class DirectoryServiceClientMixin(object):
+    """
+    # @todo Fill in client documentation.
+    """
+    #implements(IDirectoryService)
+
+
+    def unregister(self, parent='/', key='', headers=None, timeout=None):
+        """Unregister an entry in the directory.
+
+        @param parent    str
+        @param key    str
+        @retval old_attributes    dict
+        """
+        return self.request(IonObject('directory_unregister_in', **{'parent': parent, 'key': key}), op='unregister', headers=headers, timeout=timeout)
+
+    def register(self, attributes=None, parent='/', key='', headers=None, timeout=None):
+        """Register and entry in the directory. This action is idempotent and acts as
+        both create and update, based on the key.
+
+        @param attributes    dict
+        @param parent    str
+        @param key    str
+        @retval old_attributes    dict
+        """
+        return self.request(IonObject('directory_register_in', **{'attributes': attributes or None, 'parent': parent, 'key': key}), op='register', headers=headers, timeout=timeout)
+
+    def lookup(self, qualified_key='', headers=None, timeout=None):
+        """Lookup an entry from the directory, given the qualified key
+
+        @param qualified_key    str
+        @retval attributes    dict
+        """
+        return self.request(IonObject('directory_lookup_in', **{'qualified_key': qualified_key}), op='lookup', headers=headers, timeout=timeout)
+
+    def find(self, pattern='', parent='/', headers=None, timeout=None):
+        """Find an entry in the directory based on a starting location in the hierarchy
+        and optional pattern.
+
+        @param pattern    str
+        @param parent    str
+        @retval entry_list    list
+        """
+        return self.request(IonObject('directory_find_in', **{'pattern': pattern, 'parent': parent}), op='find', headers=headers, timeout=timeout)
+
+
+
+class DirectoryServiceClient(RPCClient, DirectoryServiceClientMixin):
+    def __init__(self, to_name=None, node=None, **kwargs):
+        to_name = to_name or 'directory'
+        RPCClient.__init__(self, to_name=to_name, node=node, **kwargs)
+        DirectoryServiceClientMixin.__init__(self)
+
+
+class DirectoryServiceProcessClient(ProcessRPCClient, DirectoryServiceClientMixin):
+    def __init__(self, process=None, to_name=None, node=None, **kwargs):
+        to_name = to_name or 'directory'
+        ProcessRPCClient.__init__(self, process=process, to_name=to_name, node=node, **kwargs)
+        DirectoryServiceClientMixin.__init__(self)
+
+
+
+
@@ -0,0 +1,1505 @@
+#!/usr/bin/env python
+#
+# File generated on 2026-10-16 20:36:13.253562
+#
+
+from zope.interface import Interface, implements
+
+from collections import OrderedDict, defaultdict
+
+import interface.objects
+from pyon.core.bootstrap import IonObject
+from pyon.ion.resregistry import ResourceRegistryServiceWrapper
+from pyon.ion.service import BaseService, BaseClients
+from pyon.net.endpoint import RPCClient
+from pyon.ion.endpoint import ProcessRPCClient
+from pyon.util.log import log
+from interface.services.core.iresource_registry_service import ResourceRegistryServiceProcessClient
+
+SCHEMA_JSON = """{
+    "dependencies": [
+        "resource_registry"
+    ], 
+    "description": "Stores identities of users and resources, including bindings of internal     identities to external identities. Also stores metadata such as a user profile.", 
+    "name": "identity_management", 
+    "op_list": [
+        "set_user_password", 
+        "read_authentication_token", 
+        "find_actor_identity_by_name", 
+        "update_authentication_token", 
+        "find_actor_identity_by_username", 
+        "define_identity_details", 
+        "check_authentication_token", 
+        "check_actor_credentials", 
+        "is_user_existing", 
+        "request_password_reset", 
+        "read_actor_identity", 
+        "read_identity_details", 
+        "register_credentials", 
+        "set_actor_auth_status", 
+        "create_authentication_token", 
+        "unregister_credentials", 
+        "reset_password", 
+        "delete_actor_identity", 
+        "update_actor_identity", 
+        "set_actor_credentials", 
+        "create_actor_identity", 
+        "invalidate_authentication_token"
+    ], 
+    "operations": {
+        "check_actor_credentials": {
+            "description": "Checks username, password credentials for given actor.", 
+            "in": {
+                "password": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "password", 
+                    "type": "str"
+                }, 
+                "username": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "username", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "username", 
+                "password"
+            ], 
+            "out": {
+                "actor_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "actor_id", 
+                    "type": "str"
+                }
+            }, 
+            "out_list": [
+                "actor_id"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "for invalid arguments", 
+                "NotFound": "if actor not found"
+            }
+        }, 
+        "check_authentication_token": {
+            "description": "Checks given token and returns a dict with actor id if valid.", 
+            "in": {
+                "token_string": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "token_string", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "token_string"
+            ], 
+            "out": {
+                "token_info": {
+                    "decorators": {}, 
+                    "default": {}, 
+                    "description": "", 
+                    "name": "token_info", 
+                    "type": "dict"
+                }
+            }, 
+            "out_list": [
+                "token_info"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "Illegal parameter type of value", 
+                "NotFound": "Token string not found", 
+                "Unauthorized": "Token not valid anymore or otherwise"
+            }
+        }, 
+        "create_actor_identity": {
+            "description": "Persists the provided ActorIdentity object. The id string returned is the internal id by which users should be represented in message headers for policy enforcement, etc.", 
+            "in": {
+                "actor_identity": {
+                    "decorators": {}, 
+                    "default": "!ActorIdentity", 
+                    "description": "", 
+                    "name": "actor_identity", 
+                    "type": "ActorIdentity"
+                }
+            }, 
+            "in_list": [
+                "actor_identity"
+            ], 
+            "out": {
+                "actor_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "actor_id", 
+                    "type": "str"
+                }
+            }, 
+            "out_list": [
+                "actor_id"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "if object passed has _id or _rev attribute"
+            }
+        }, 
+        "create_authentication_token": {
+            "description": "Create an authentication token for provided actor id with a given start time and validity. start_time defaults to current time if empty and uses a system timestamp. validity is in seconds and must be set.", 
+            "in": {
+                "actor_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "actor_id", 
+                    "type": "str"
+                }, 
+                "start_time": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "start_time", 
+                    "type": "str"
+                }, 
+                "validity": {
+                    "decorators": {}, 
+                    "default": 0, 
+                    "description": "", 
+                    "name": "validity", 
+                    "type": "int"
+                }
+            }, 
+            "in_list": [
+                "start_time", 
+                "actor_id", 
+                "validity"
+            ], 
+            "out": {
+                "token_string": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "token_string", 
+                    "type": "str"
+                }
+            }, 
+            "out_list": [
+                "token_string"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "Illegal parameter type of value", 
+                "NotFound": "Object not found"
+            }
+        }, 
+        "define_identity_details": {
+            "description": "Sets identity details, e.g. user info, for actor with actor_id.", 
+            "in": {
+                "actor_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "actor_id", 
+                    "type": "str"
+                }, 
+                "identity_details": {
+                    "decorators": {}, 
+                    "default": "!IdentityDetails", 
+                    "description": "", 
+                    "name": "identity_details", 
+                    "type": "IdentityDetails"
+                }
+            }, 
+            "in_list": [
+                "actor_id", 
+                "identity_details"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "if object passed has _id or _rev attribute", 
+                "NotFound": "ActorIdentity object does not exist"
+            }
+        }, 
+        "delete_actor_identity": {
+            "description": "For now, permanently deletes ActorIdentity object with the specified id. Throws exception if id does not match any persisted ActorIdentity.", 
+            "in": {
+                "actor_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "actor_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "actor_id"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "find_actor_identity_by_name": {
+            "description": "Return the ActorIdentity object whose name attribute matches the passed value.", 
+            "in": {
+                "name": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "name", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "name"
+            ], 
+            "out": {
+                "user_info": {
+                    "decorators": {}, 
+                    "default": "!ActorIdentity", 
+                    "description": "", 
+                    "name": "user_info", 
+                    "type": "ActorIdentity"
+                }
+            }, 
+            "out_list": [
+                "user_info"
+            ], 
+            "spec": null, 
+            "throws": {
+                "Inconsistent": "Multiple ActorIdentity objects matched name", 
+                "NotFound": "failed to find ActorIdentity"
+            }
+        }, 
+        "find_actor_identity_by_username": {
+            "description": "Returns actor_id for actor with given username", 
+            "in": {
+                "username": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "username", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "username"
+            ], 
+            "out": {
+                "actor_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "actor_id", 
+                    "type": "str"
+                }
+            }, 
+            "out_list": [
+                "actor_id"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "for invalid arguments", 
+                "NotFound": "if no actor found"
+            }
+        }, 
+        "invalidate_authentication_token": {
+            "description": "Invalidates an authentication token, but leaves it in place for auditing purposes.", 
+            "in": {
+                "token_string": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "token_string", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "token_string"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "Illegal parameter type of value", 
+                "NotFound": "Token string not found"
+            }
+        }, 
+        "is_user_existing": {
+            "description": "Returns True of a user exists for given username", 
+            "in": {
+                "username": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "username", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "username"
+            ], 
+            "out": {
+                "user_exists": {
+                    "decorators": {}, 
+                    "default": false, 
+                    "description": "", 
+                    "name": "user_exists", 
+                    "type": "bool"
+                }
+            }, 
+            "out_list": [
+                "user_exists"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "for invalid arguments"
+            }
+        }, 
+        "read_actor_identity": {
+            "description": "Returns the ActorIdentity object for the specified user id. Throws exception if id does not match any persisted ActorIdentity objects.", 
+            "in": {
+                "actor_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "actor_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "actor_id"
+            ], 
+            "out": {
+                "actor_identity": {
+                    "decorators": {}, 
+                    "default": "!ActorIdentity", 
+                    "description": "", 
+                    "name": "actor_identity", 
+                    "type": "ActorIdentity"
+                }
+            }, 
+            "out_list": [
+                "actor_identity"
+            ], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "read_authentication_token": {
+            "description": "Returns the token object for given actor authentication token string.", 
+            "in": {
+                "token_string": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "token_string", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "token_string"
+            ], 
+            "out": {
+                "token": {
+                    "decorators": {}, 
+                    "default": "!SecurityToken", 
+                    "description": "", 
+                    "name": "token", 
+                    "type": "SecurityToken"
+                }
+            }, 
+            "out_list": [
+                "token"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "Illegal parameter type of value", 
+                "NotFound": "Token string not found"
+            }
+        }, 
+        "read_identity_details": {
+            "description": "Reads identity details for actor with actor_id.", 
+            "in": {
+                "actor_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "actor_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "actor_id"
+            ], 
+            "out": {
+                "identity_details": {
+                    "decorators": {}, 
+                    "default": "!IdentityDetails", 
+                    "description": "", 
+                    "name": "identity_details", 
+                    "type": "IdentityDetails"
+                }
+            }, 
+            "out_list": [
+                "identity_details"
+            ], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "if actor does not exist"
+            }
+        }, 
+        "register_credentials": {
+            "description": "Adds Credentials object to actor with actor_id.", 
+            "in": {
+                "actor_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "actor_id", 
+                    "type": "str"
+                }, 
+                "credentials": {
+                    "decorators": {}, 
+                    "default": "!Credentials", 
+                    "description": "", 
+                    "name": "credentials", 
+                    "type": "Credentials"
+                }
+            }, 
+            "in_list": [
+                "credentials", 
+                "actor_id"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "for invalid arguments", 
+                "NotFound": "ActorIdentity object does not exist"
+            }
+        }, 
+        "request_password_reset": {
+            "description": "Create a password reset token for actor with given username.", 
+            "in": {
+                "username": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "username", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "username"
+            ], 
+            "out": {
+                "reset_token": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "reset_token", 
+                    "type": "str"
+                }
+            }, 
+            "out_list": [
+                "reset_token"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "for invalid arguments", 
+                "Inconsistent": "Multiple ActorIdentity objects matched name", 
+                "NotFound": "failed to find ActorIdentity"
+            }
+        }, 
+        "reset_password": {
+            "description": "Check reset token and set new password for user.", 
+            "in": {
+                "new_password": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "new_password", 
+                    "type": "str"
+                }, 
+                "token_string": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "token_string", 
+                    "type": "str"
+                }, 
+                "username": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "username", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "username", 
+                "token_string", 
+                "new_password"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "for invalid arguments", 
+                "Inconsistent": "Multiple ActorIdentity objects matched name", 
+                "NotFound": "failed to find ActorIdentity"
+            }
+        }, 
+        "set_actor_auth_status": {
+            "description": "Sets the auth status for an actor.", 
+            "in": {
+                "actor_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "actor_id", 
+                    "type": "str"
+                }, 
+                "status": {
+                    "decorators": {}, 
+                    "default": "!AuthStatusEnum", 
+                    "description": "", 
+                    "name": "status", 
+                    "type": "AuthStatusEnum"
+                }
+            }, 
+            "in_list": [
+                "status", 
+                "actor_id"
+            ], 
+            "out": {
+                "prev_status": {
+                    "decorators": {}, 
+                    "default": "!AuthStatusEnum", 
+                    "description": "", 
+                    "name": "prev_status", 
+                    "type": "AuthStatusEnum"
+                }
+            }, 
+            "out_list": [
+                "prev_status"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "for invalid arguments", 
+                "NotFound": "if actor not found"
+            }
+        }, 
+        "set_actor_credentials": {
+            "description": "Sets username, password credentials for given actor.", 
+            "in": {
+                "actor_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "actor_id", 
+                    "type": "str"
+                }, 
+                "password": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "password", 
+                    "type": "str"
+                }, 
+                "username": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "username", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "username", 
+                "password", 
+                "actor_id"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "for invalid arguments", 
+                "NotFound": "if actor not found"
+            }
+        }, 
+        "set_user_password": {
+            "description": "Sets password credentials for actor with given username.", 
+            "in": {
+                "password": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "password", 
+                    "type": "str"
+                }, 
+                "username": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "username", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "username", 
+                "password"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "for invalid arguments", 
+                "NotFound": "if actor not found"
+            }
+        }, 
+        "unregister_credentials": {
+            "description": "Removes credentials with given username from actor with actor_id.", 
+            "in": {
+                "actor_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "actor_id", 
+                    "type": "str"
+                }, 
+                "credentials_name": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "credentials_name", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "credentials_name", 
+                "actor_id"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "for invalid arguments", 
+                "NotFound": "if Credentials  do not exist"
+            }
+        }, 
+        "update_actor_identity": {
+            "description": "Updates the provided ActorIdentity object.  Throws NotFound exception if an existing version of ActorIdentity is not found.  Throws Conflict if the provided ActorIdentity object is not based on the latest persisted version of the object.", 
+            "in": {
+                "actor_identity": {
+                    "decorators": {}, 
+                    "default": "!ActorIdentity", 
+                    "description": "", 
+                    "name": "actor_identity", 
+                    "type": "ActorIdentity"
+                }
+            }, 
+            "in_list": [
+                "actor_identity"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "if object does not have _id or _rev attribute", 
+                "Conflict": "object not based on latest persisted object version", 
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "update_authentication_token": {
+            "description": "Updates the given token.", 
+            "in": {
+                "token": {
+                    "decorators": {}, 
+                    "default": "!SecurityToken", 
+                    "description": "", 
+                    "name": "token", 
+                    "type": "SecurityToken"
+                }
+            }, 
+            "in_list": [
+                "token"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "Illegal parameter type of value", 
+                "NotFound": "Token not found"
+            }
+        }
+    }, 
+    "spec": ""
+}"""
+
+
+class IdentityManagementServiceDependentClients(BaseClients):
+    def __init__(self, process=None):
+        self._process = process
+        BaseClients.__init__(self)
+        self._resource_registry = ResourceRegistryServiceProcessClient(process=process)
+
+    @property
+    def resource_registry(self):
+        if self._process.container is not None and self._process.container.has_capability("RESOURCE_REGISTRY"):
+            return ResourceRegistryServiceWrapper(self._process.container.resource_registry, self._process)
+        return self._resource_registry
+
+
+
+class IIdentityManagementService(Interface):
+    """None
+    """
+
+    def set_user_password(username='', password=''):
+        """Sets password credentials for actor with given username.
+
+        @param username    str
+        @param password    str
+        @throws NotFound    if actor not found
+        @throws BadRequest    for invalid arguments
+        """
+        pass
+
+    def read_authentication_token(token_string=''):
+        """Returns the token object for given actor authentication token string.
+
+        @param token_string    str
+        @retval token    SecurityToken
+        @throws NotFound    Token string not found
+        @throws BadRequest    Illegal parameter type of value
+        """
+        pass
+
+    def find_actor_identity_by_name(name=''):
+        """Return the ActorIdentity object whose name attribute matches the passed value.
+
+        @param name    str
+        @retval user_info    ActorIdentity
+        @throws NotFound    failed to find ActorIdentity
+        @throws Inconsistent    Multiple ActorIdentity objects matched name
+        """
+        pass
+
+    def update_authentication_token(token=None):
+        """Updates the given token.
+
+        @param token    SecurityToken
+        @throws NotFound    Token not found
+        @throws BadRequest    Illegal parameter type of value
+        """
+        pass
+
+    def find_actor_identity_by_username(username=''):
+        """Returns actor_id for actor with given username
+
+        @param username    str
+        @retval actor_id    str
+        @throws NotFound    if no actor found
+        @throws BadRequest    for invalid arguments
+        """
+        pass
+
+    def define_identity_details(actor_id='', identity_details=None):
+        """Sets identity details, e.g. user info, for actor with actor_id.
+
+        @param actor_id    str
+        @param identity_details    IdentityDetails
+        @throws NotFound    ActorIdentity object does not exist
+        @throws BadRequest    if object passed has _id or _rev attribute
+        """
+        pass
+
+    def check_authentication_token(token_string=''):
+        """Checks given token and returns a dict with actor id if valid.
+
+        @param token_string    str
+        @retval token_info    dict
+        @throws NotFound    Token string not found
+        @throws BadRequest    Illegal parameter type of value
+        @throws Unauthorized    Token not valid anymore or otherwise
+        """
+        pass
+
+    def check_actor_credentials(username='', password=''):
+        """Checks username, password credentials for given actor.
+
+        @param username    str
+        @param password    str
+        @retval actor_id    str
+        @throws NotFound    if actor not found
+        @throws BadRequest    for invalid arguments
+        """
+        pass
+
+    def is_user_existing(username=''):
+        """Returns True of a user exists for given username
+
+        @param username    str
+        @retval user_exists    bool
+        @throws BadRequest    for invalid arguments
+        """
+        pass
+
+    def request_password_reset(username=''):
+        """Create a password reset token for actor with given username.
+
+        @param username    str
+        @retval reset_token    str
+        @throws NotFound    failed to find ActorIdentity
+        @throws Inconsistent    Multiple ActorIdentity objects matched name
+        @throws BadRequest    for invalid arguments
+        """
+        pass
+
+    def read_actor_identity(actor_id=''):
+        """Returns the ActorIdentity object for the specified user id.
+        Throws exception if id does not match any persisted ActorIdentity
+        objects.
+
+        @param actor_id    str
+        @retval actor_identity    ActorIdentity
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def read_identity_details(actor_id=''):
+        """Reads identity details for actor with actor_id.
+
+        @param actor_id    str
+        @retval identity_details    IdentityDetails
+        @throws NotFound    if actor does not exist
+        """
+        pass
+
+    def register_credentials(credentials=None, actor_id=''):
+        """Adds Credentials object to actor with actor_id.
+
+        @param credentials    Credentials
+        @param actor_id    str
+        @throws NotFound    ActorIdentity object does not exist
+        @throws BadRequest    for invalid arguments
+        """
+        pass
+
+    def set_actor_auth_status(status=None, actor_id=''):
+        """Sets the auth status for an actor.
+
+        @param status    AuthStatusEnum
+        @param actor_id    str
+        @retval prev_status    AuthStatusEnum
+        @throws NotFound    if actor not found
+        @throws BadRequest    for invalid arguments
+        """
+        pass
+
+    def create_authentication_token(start_time='', actor_id='', validity=0):
+        """Create an authentication token for provided actor id with a given start time and validity.
+        start_time defaults to current time if empty and uses a system timestamp.
+        validity is in seconds and must be set.
+
+        @param start_time    str
+        @param actor_id    str
+        @param validity    int
+        @retval token_string    str
+        @throws NotFound    Object not found
+        @throws BadRequest    Illegal parameter type of value
+        """
+        pass
+
+    def unregister_credentials(credentials_name='', actor_id=''):
+        """Removes credentials with given username from actor with actor_id.
+
+        @param credentials_name    str
+        @param actor_id    str
+        @throws NotFound    if Credentials  do not exist
+        @throws BadRequest    for invalid arguments
+        """
+        pass
+
+    def reset_password(username='', token_string='', new_password=''):
+        """Check reset token and set new password for user.
+
+        @param username    str
+        @param token_string    str
+        @param new_password    str
+        @throws NotFound    failed to find ActorIdentity
+        @throws Inconsistent    Multiple ActorIdentity objects matched name
+        @throws BadRequest    for invalid arguments
+        """
+        pass
+
+    def delete_actor_identity(actor_id=''):
+        """For now, permanently deletes ActorIdentity object with the specified
+        id. Throws exception if id does not match any persisted ActorIdentity.
+
+        @param actor_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def update_actor_identity(actor_identity=None):
+        """Updates the provided ActorIdentity object.  Throws NotFound exception if
+        an existing version of ActorIdentity is not found.  Throws Conflict if
+        the provided ActorIdentity object is not based on the latest persisted
+        version of the object.
+
+        @param actor_identity    ActorIdentity
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    if object does not have _id or _rev attribute
+        @throws Conflict    object not based on latest persisted object version
+        """
+        pass
+
+    def set_actor_credentials(username='', password='', actor_id=''):
+        """Sets username, password credentials for given actor.
+
+        @param username    str
+        @param password    str
+        @param actor_id    str
+        @throws NotFound    if actor not found
+        @throws BadRequest    for invalid arguments
+        """
+        pass
+
+    def create_actor_identity(actor_identity=None):
+        """Persists the provided ActorIdentity object. The id string returned
+        is the internal id by which users should be represented in message
+        headers for policy enforcement, etc. 
+
+        @param actor_identity    ActorIdentity
+        @retval actor_id    str
+        @throws BadRequest    if object passed has _id or _rev attribute
+        """
+        pass
+
+    def invalidate_authentication_token(token_string=''):
+        """Invalidates an authentication token, but leaves it in place for auditing purposes.
+
+        @param token_string    str
+        @throws NotFound    Token string not found
+        @throws BadRequest    Illegal parameter type of value
+        """
+        pass
+
+class BaseIdentityManagementService(BaseService):
+    implements(IIdentityManagementService)
+    """None
+    """
+    SCHEMA_JSON=SCHEMA_JSON
+    name = 'identity_management'
+    dependencies = ['resource_registry']
+
+    def __init__(self, *args, **kwargs):
+        BaseService.__init__(self, *args, **kwargs)
+        self.clients = IdentityManagementServiceDependentClients(process=self)
+
+
+    def set_user_password(self, username='', password=''):
+        """Sets password credentials for actor with given username.
+
+        @param username    str
+        @param password    str
+        @throws NotFound    if actor not found
+        @throws BadRequest    for invalid arguments
+        """
+        pass
+
+    def read_authentication_token(self, token_string=''):
+        """Returns the token object for given actor authentication token string.
+
+        @param token_string    str
+        @retval token    SecurityToken
+        @throws NotFound    Token string not found
+        @throws BadRequest    Illegal parameter type of value
+        """
+        pass
+
+    def find_actor_identity_by_name(self, name=''):
+        """Return the ActorIdentity object whose name attribute matches the passed value.
+
+        @param name    str
+        @retval user_info    ActorIdentity
+        @throws NotFound    failed to find ActorIdentity
+        @throws Inconsistent    Multiple ActorIdentity objects matched name
+        """
+        pass
+
+    def update_authentication_token(self, token=None):
+        """Updates the given token.
+
+        @param token    SecurityToken
+        @throws NotFound    Token not found
+        @throws BadRequest    Illegal parameter type of value
+        """
+        pass
+
+    def find_actor_identity_by_username(self, username=''):
+        """Returns actor_id for actor with given username
+
+        @param username    str
+        @retval actor_id    str
+        @throws NotFound    if no actor found
+        @throws BadRequest    for invalid arguments
+        """
+        pass
+
+    def define_identity_details(self, actor_id='', identity_details=None):
+        """Sets identity details, e.g. user info, for actor with actor_id.
+
+        @param actor_id    str
+        @param identity_details    IdentityDetails
+        @throws NotFound    ActorIdentity object does not exist
+        @throws BadRequest    if object passed has _id or _rev attribute
+        """
+        pass
+
+    def check_authentication_token(self, token_string=''):
+        """Checks given token and returns a dict with actor id if valid.
+
+        @param token_string    str
+        @retval token_info    dict
+        @throws NotFound    Token string not found
+        @throws BadRequest    Illegal parameter type of value
+        @throws Unauthorized    Token not valid anymore or otherwise
+        """
+        pass
+
+    def check_actor_credentials(self, username='', password=''):
+        """Checks username, password credentials for given actor.
+
+        @param username    str
+        @param password    str
+        @retval actor_id    str
+        @throws NotFound    if actor not found
+        @throws BadRequest    for invalid arguments
+        """
+        pass
+
+    def is_user_existing(self, username=''):
+        """Returns True of a user exists for given username
+
+        @param username    str
+        @retval user_exists    bool
+        @throws BadRequest    for invalid arguments
+        """
+        pass
+
+    def request_password_reset(self, username=''):
+        """Create a password reset token for actor with given username.
+
+        @param username    str
+        @retval reset_token    str
+        @throws NotFound    failed to find ActorIdentity
+        @throws Inconsistent    Multiple ActorIdentity objects matched name
+        @throws BadRequest    for invalid arguments
+        """
+        pass
+
+    def read_actor_identity(self, actor_id=''):
+        """Returns the ActorIdentity object for the specified user id.
+        Throws exception if id does not match any persisted ActorIdentity
+        objects.
+
+        @param actor_id    str
+        @retval actor_identity    ActorIdentity
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def read_identity_details(self, actor_id=''):
+        """Reads identity details for actor with actor_id.
+
+        @param actor_id    str
+        @retval identity_details    IdentityDetails
+        @throws NotFound    if actor does not exist
+        """
+        pass
+
+    def register_credentials(self, credentials=None, actor_id=''):
+        """Adds Credentials object to actor with actor_id.
+
+        @param credentials    Credentials
+        @param actor_id    str
+        @throws NotFound    ActorIdentity object does not exist
+        @throws BadRequest    for invalid arguments
+        """
+        pass
+
+    def set_actor_auth_status(self, status=None, actor_id=''):
+        """Sets the auth status for an actor.
+
+        @param status    AuthStatusEnum
+        @param actor_id    str
+        @retval prev_status    AuthStatusEnum
+        @throws NotFound    if actor not found
+        @throws BadRequest    for invalid arguments
+        """
+        pass
+
+    def create_authentication_token(self, start_time='', actor_id='', validity=0):
+        """Create an authentication token for provided actor id with a given start time and validity.
+        start_time defaults to current time if empty and uses a system timestamp.
+        validity is in seconds and must be set.
+
+        @param start_time    str
+        @param actor_id    str
+        @param validity    int
+        @retval token_string    str
+        @throws NotFound    Object not found
+        @throws BadRequest    Illegal parameter type of value
+        """
+        pass
+
+    def unregister_credentials(self, credentials_name='', actor_id=''):
+        """Removes credentials with given username from actor with actor_id.
+
+        @param credentials_name    str
+        @param actor_id    str
+        @throws NotFound    if Credentials  do not exist
+        @throws BadRequest    for invalid arguments
+        """
+        pass
+
+    def reset_password(self, username='', token_string='', new_password=''):
+        """Check reset token and set new password for user.
+
+        @param username    str
+        @param token_string    str
+        @param new_password    str
+        @throws NotFound    failed to find ActorIdentity
+        @throws Inconsistent    Multiple ActorIdentity objects matched name
+        @throws BadRequest    for invalid arguments
+        """
+        pass
+
+    def delete_actor_identity(self, actor_id=''):
+        """For now, permanently deletes ActorIdentity object with the specified
+        id. Throws exception if id does not match any persisted ActorIdentity.
+
+        @param actor_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def update_actor_identity(self, actor_identity=None):
+        """Updates the provided ActorIdentity object.  Throws NotFound exception if
+        an existing version of ActorIdentity is not found.  Throws Conflict if
+        the provided ActorIdentity object is not based on the latest persisted
+        version of the object.
+
+        @param actor_identity    ActorIdentity
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    if object does not have _id or _rev attribute
+        @throws Conflict    object not based on latest persisted object version
+        """
+        pass
+
+    def set_actor_credentials(self, username='', password='', actor_id=''):
+        """Sets username, password credentials for given actor.
+
+        @param username    str
+        @param password    str
+        @param actor_id    str
+        @throws NotFound    if actor not found
+        @throws BadRequest    for invalid arguments
+        """
+        pass
+
+    def create_actor_identity(self, actor_identity=None):
+        """Persists the provided ActorIdentity object. The id string returned
+        is the internal id by which users should be represented in message
+        headers for policy enforcement, etc. 
+
+        @param actor_identity    ActorIdentity
+        @retval actor_id    str
+        @throws BadRequest    if object passed has _id or _rev attribute
+        """
+        pass
+
+    def invalidate_authentication_token(self, token_string=''):
+        """Invalidates an authentication token, but leaves it in place for auditing purposes.
+
+        @param token_string    str
+        @throws NotFound    Token string not found
+        @throws BadRequest    Illegal parameter type of value
+        """
+        pass
+
+
+
+
+class IdentityManagementServiceClientMixin(object):
+    """
+    # @todo Fill in client documentation.
+    """
+    #implements(IIdentityManagementService)
+
+
+    def set_user_password(self, username='', password='', headers=None, timeout=None):
+        """Sets password credentials for actor with given username.
+
+        @param username    str
+        @param password    str
+        @throws NotFound    if actor not found
+        @throws BadRequest    for invalid arguments
+        """
+        return self.request(IonObject('identity_management_set_user_password_in', **{'username': username, 'password': password}), op='set_user_password', headers=headers, timeout=timeout)
+
+    def read_authentication_token(self, token_string='', headers=None, timeout=None):
+        """Returns the token object for given actor authentication token string.
+
+        @param token_string    str
+        @retval token    SecurityToken
+        @throws NotFound    Token string not found
+        @throws BadRequest    Illegal parameter type of value
+        """
+        return self.request(IonObject('identity_management_read_authentication_token_in', **{'token_string': token_string}), op='read_authentication_token', headers=headers, timeout=timeout)
+
+    def find_actor_identity_by_name(self, name='', headers=None, timeout=None):
+        """Return the ActorIdentity object whose name attribute matches the passed value.
+
+        @param name    str
+        @retval user_info    ActorIdentity
+        @throws NotFound    failed to find ActorIdentity
+        @throws Inconsistent    Multiple ActorIdentity objects matched name
+        """
+        return self.request(IonObject('identity_management_find_actor_identity_by_name_in', **{'name': name}), op='find_actor_identity_by_name', headers=headers, timeout=timeout)
+
+    def update_authentication_token(self, token=None, headers=None, timeout=None):
+        """Updates the given token.
+
+        @param token    SecurityToken
+        @throws NotFound    Token not found
+        @throws BadRequest    Illegal parameter type of value
+        """
+        return self.request(IonObject('identity_management_update_authentication_token_in', **{'token': token or None}), op='update_authentication_token', headers=headers, timeout=timeout)
+
+    def find_actor_identity_by_username(self, username='', headers=None, timeout=None):
+        """Returns actor_id for actor with given username
+
+        @param username    str
+        @retval actor_id    str
+        @throws NotFound    if no actor found
+        @throws BadRequest    for invalid arguments
+        """
+        return self.request(IonObject('identity_management_find_actor_identity_by_username_in', **{'username': username}), op='find_actor_identity_by_username', headers=headers, timeout=timeout)
+
+    def define_identity_details(self, actor_id='', identity_details=None, headers=None, timeout=None):
+        """Sets identity details, e.g. user info, for actor with actor_id.
+
+        @param actor_id    str
+        @param identity_details    IdentityDetails
+        @throws NotFound    ActorIdentity object does not exist
+        @throws BadRequest    if object passed has _id or _rev attribute
+        """
+        return self.request(IonObject('identity_management_define_identity_details_in', **{'actor_id': actor_id, 'identity_details': identity_details or None}), op='define_identity_details', headers=headers, timeout=timeout)
+
+    def check_authentication_token(self, token_string='', headers=None, timeout=None):
+        """Checks given token and returns a dict with actor id if valid.
+
+        @param token_string    str
+        @retval token_info    dict
+        @throws NotFound    Token string not found
+        @throws BadRequest    Illegal parameter type of value
+        @throws Unauthorized    Token not valid anymore or otherwise
+        """
+        return self.request(IonObject('identity_management_check_authentication_token_in', **{'token_string': token_string}), op='check_authentication_token', headers=headers, timeout=timeout)
+
+    def check_actor_credentials(self, username='', password='', headers=None, timeout=None):
+        """Checks username, password credentials for given actor.
+
+        @param username    str
+        @param password    str
+        @retval actor_id    str
+        @throws NotFound    if actor not found
+        @throws BadRequest    for invalid arguments
+        """
+        return self.request(IonObject('identity_management_check_actor_credentials_in', **{'username': username, 'password': password}), op='check_actor_credentials', headers=headers, timeout=timeout)
+
+    def is_user_existing(self, username='', headers=None, timeout=None):
+        """Returns True of a user exists for given username
+
+        @param username    str
+        @retval user_exists    bool
+        @throws BadRequest    for invalid arguments
+        """
+        return self.request(IonObject('identity_management_is_user_existing_in', **{'username': username}), op='is_user_existing', headers=headers, timeout=timeout)
+
+    def request_password_reset(self, username='', headers=None, timeout=None):
+        """Create a password reset token for actor with given username.
+
+        @param username    str
+        @retval reset_token    str
+        @throws NotFound    failed to find ActorIdentity
+        @throws Inconsistent    Multiple ActorIdentity objects matched name
+        @throws BadRequest    for invalid arguments
+        """
+        return self.request(IonObject('identity_management_request_password_reset_in', **{'username': username}), op='request_password_reset', headers=headers, timeout=timeout)
+
+    def read_actor_identity(self, actor_id='', headers=None, timeout=None):
+        """Returns the ActorIdentity object for the specified user id.
+        Throws exception if id does not match any persisted ActorIdentity
+        objects.
+
+        @param actor_id    str
+        @retval actor_identity    ActorIdentity
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('identity_management_read_actor_identity_in', **{'actor_id': actor_id}), op='read_actor_identity', headers=headers, timeout=timeout)
+
+    def read_identity_details(self, actor_id='', headers=None, timeout=None):
+        """Reads identity details for actor with actor_id.
+
+        @param actor_id    str
+        @retval identity_details    IdentityDetails
+        @throws NotFound    if actor does not exist
+        """
+        return self.request(IonObject('identity_management_read_identity_details_in', **{'actor_id': actor_id}), op='read_identity_details', headers=headers, timeout=timeout)
+
+    def register_credentials(self, credentials=None, actor_id='', headers=None, timeout=None):
+        """Adds Credentials object to actor with actor_id.
+
+        @param credentials    Credentials
+        @param actor_id    str
+        @throws NotFound    ActorIdentity object does not exist
+        @throws BadRequest    for invalid arguments
+        """
+        return self.request(IonObject('identity_management_register_credentials_in', **{'credentials': credentials or None, 'actor_id': actor_id}), op='register_credentials', headers=headers, timeout=timeout)
+
+    def set_actor_auth_status(self, status=None, actor_id='', headers=None, timeout=None):
+        """Sets the auth status for an actor.
+
+        @param status    AuthStatusEnum
+        @param actor_id    str
+        @retval prev_status    AuthStatusEnum
+        @throws NotFound    if actor not found
+        @throws BadRequest    for invalid arguments
+        """
+        return self.request(IonObject('identity_management_set_actor_auth_status_in', **{'status': status or None, 'actor_id': actor_id}), op='set_actor_auth_status', headers=headers, timeout=timeout)
+
+    def create_authentication_token(self, start_time='', actor_id='', validity=0, headers=None, timeout=None):
+        """Create an authentication token for provided actor id with a given start time and validity.
+        start_time defaults to current time if empty and uses a system timestamp.
+        validity is in seconds and must be set.
+
+        @param start_time    str
+        @param actor_id    str
+        @param validity    int
+        @retval token_string    str
+        @throws NotFound    Object not found
+        @throws BadRequest    Illegal parameter type of value
+        """
+        return self.request(IonObject('identity_management_create_authentication_token_in', **{'start_time': start_time, 'actor_id': actor_id, 'validity': validity}), op='create_authentication_token', headers=headers, timeout=timeout)
+
+    def unregister_credentials(self, credentials_name='', actor_id='', headers=None, timeout=None):
+        """Removes credentials with given username from actor with actor_id.
+
+        @param credentials_name    str
+        @param actor_id    str
+        @throws NotFound    if Credentials  do not exist
+        @throws BadRequest    for invalid arguments
+        """
+        return self.request(IonObject('identity_management_unregister_credentials_in', **{'credentials_name': credentials_name, 'actor_id': actor_id}), op='unregister_credentials', headers=headers, timeout=timeout)
+
+    def reset_password(self, username='', token_string='', new_password='', headers=None, timeout=None):
+        """Check reset token and set new password for user.
+
+        @param username    str
+        @param token_string    str
+        @param new_password    str
+        @throws NotFound    failed to find ActorIdentity
+        @throws Inconsistent    Multiple ActorIdentity objects matched name
+        @throws BadRequest    for invalid arguments
+        """
+        return self.request(IonObject('identity_management_reset_password_in', **{'username': username, 'token_string': token_string, 'new_password': new_password}), op='reset_password', headers=headers, timeout=timeout)
+
+    def delete_actor_identity(self, actor_id='', headers=None, timeout=None):
+        """For now, permanently deletes ActorIdentity object with the specified
+        id. Throws exception if id does not match any persisted ActorIdentity.
+
+        @param actor_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('identity_management_delete_actor_identity_in', **{'actor_id': actor_id}), op='delete_actor_identity', headers=headers, timeout=timeout)
+
+    def update_actor_identity(self, actor_identity=None, headers=None, timeout=None):
+        """Updates the provided ActorIdentity object.  Throws NotFound exception if
+        an existing version of ActorIdentity is not found.  Throws Conflict if
+        the provided ActorIdentity object is not based on the latest persisted
+        version of the object.
+
+        @param actor_identity    ActorIdentity
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    if object does not have _id or _rev attribute
+        @throws Conflict    object not based on latest persisted object version
+        """
+        return self.request(IonObject('identity_management_update_actor_identity_in', **{'actor_identity': actor_identity or None}), op='update_actor_identity', headers=headers, timeout=timeout)
+
+    def set_actor_credentials(self, username='', password='', actor_id='', headers=None, timeout=None):
+        """Sets username, password credentials for given actor.
+
+        @param username    str
+        @param password    str
+        @param actor_id    str
+        @throws NotFound    if actor not found
+        @throws BadRequest    for invalid arguments
+        """
+        return self.request(IonObject('identity_management_set_actor_credentials_in', **{'username': username, 'password': password, 'actor_id': actor_id}), op='set_actor_credentials', headers=headers, timeout=timeout)
+
+    def create_actor_identity(self, actor_identity=None, headers=None, timeout=None):
+        """Persists the provided ActorIdentity object. The id string returned
+        is the internal id by which users should be represented in message
+        headers for policy enforcement, etc. 
+
+        @param actor_identity    ActorIdentity
+        @retval actor_id    str
+        @throws BadRequest    if object passed has _id or _rev attribute
+        """
+        return self.request(IonObject('identity_management_create_actor_identity_in', **{'actor_identity': actor_identity or None}), op='create_actor_identity', headers=headers, timeout=timeout)
+
+    def invalidate_authentication_token(self, token_string='', headers=None, timeout=None):
+        """Invalidates an authentication token, but leaves it in place for auditing purposes.
+
+        @param token_string    str
+        @throws NotFound    Token string not found
+        @throws BadRequest    Illegal parameter type of value
+        """
+        return self.request(IonObject('identity_management_invalidate_authentication_token_in', **{'token_string': token_string}), op='invalidate_authentication_token', headers=headers, timeout=timeout)
+
+
+
+class IdentityManagementServiceClient(RPCClient, IdentityManagementServiceClientMixin):
+    def __init__(self, to_name=None, node=None, **kwargs):
+        to_name = to_name or 'identity_management'
+        RPCClient.__init__(self, to_name=to_name, node=node, **kwargs)
+        IdentityManagementServiceClientMixin.__init__(self)
+
+
+class IdentityManagementServiceProcessClient(ProcessRPCClient, IdentityManagementServiceClientMixin):
+    def __init__(self, process=None, to_name=None, node=None, **kwargs):
+        to_name = to_name or 'identity_management'
+        ProcessRPCClient.__init__(self, process=process, to_name=to_name, node=node, **kwargs)
+        IdentityManagementServiceClientMixin.__init__(self)
+
+
+
+
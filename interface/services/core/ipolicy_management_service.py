@@ -0,0 +1,1419 @@
+#!/usr/bin/env python
+#
+# File generated on 2026-10-16 20:36:13.253562
+#
+
+from zope.interface import Interface, implements
+
+from collections import OrderedDict, defaultdict
+
+import interface.objects
+from pyon.core.bootstrap import IonObject
+from pyon.ion.resregistry import ResourceRegistryServiceWrapper
+from pyon.ion.service import BaseService, BaseClients
+from pyon.net.endpoint import RPCClient
+from pyon.ion.endpoint import ProcessRPCClient
+from pyon.util.log import log
+from interface.services.core.iresource_registry_service import ResourceRegistryServiceProcessClient
+
+SCHEMA_JSON = """{
+    "dependencies": [
+        "resource_registry"
+    ], 
+    "description": "Provides the interface to define and manage policy and a repository to store and retrieve policy     and templates for policy definitions.", 
+    "name": "policy_management", 
+    "op_list": [
+        "get_active_service_access_policy_rules", 
+        "read_policy", 
+        "enable_policy", 
+        "get_active_service_operation_preconditions", 
+        "create_service_access_policy", 
+        "get_active_resource_access_policy_rules", 
+        "add_process_operation_precondition_policy", 
+        "delete_policy", 
+        "add_service_operation_precondition_policy", 
+        "get_active_process_operation_preconditions", 
+        "find_resource_policies", 
+        "create_policy", 
+        "remove_resource_policy", 
+        "update_policy", 
+        "create_common_service_access_policy", 
+        "add_resource_policy", 
+        "create_resource_access_policy", 
+        "disable_policy"
+    ], 
+    "operations": {
+        "add_process_operation_precondition_policy": {
+            "description": "Helper operation for adding a precondition policy for a specific process operation. The precondition method must return a tuple (boolean, string).", 
+            "in": {
+                "op": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "op", 
+                    "type": "str"
+                }, 
+                "policy_content": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "Can be a local method name or snippet of code", 
+                    "name": "policy_content", 
+                    "type": "str"
+                }, 
+                "process_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "process_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "process_id", 
+                "policy_content", 
+                "op"
+            ], 
+            "out": {
+                "policy_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "policy_id", 
+                    "type": "str"
+                }
+            }, 
+            "out_list": [
+                "policy_id"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "If any of the parameters are not set."
+            }
+        }, 
+        "add_resource_policy": {
+            "description": "Associates a policy to a specific resource", 
+            "in": {
+                "policy_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "policy_id", 
+                    "type": "str"
+                }, 
+                "resource_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "resource_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "resource_id", 
+                "policy_id"
+            ], 
+            "out": {
+                "success": {
+                    "decorators": {}, 
+                    "default": true, 
+                    "description": "", 
+                    "name": "success", 
+                    "type": "bool"
+                }
+            }, 
+            "out_list": [
+                "success"
+            ], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "add_service_operation_precondition_policy": {
+            "description": "Helper operation for adding a precondition policy for a specific service operation. The precondition method must return a tuple (boolean, string).", 
+            "in": {
+                "op": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "op", 
+                    "type": "str"
+                }, 
+                "policy_content": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "Can be a local method name or snippet of code", 
+                    "name": "policy_content", 
+                    "type": "str"
+                }, 
+                "service_name": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "service_name", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "service_name", 
+                "policy_content", 
+                "op"
+            ], 
+            "out": {
+                "policy_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "policy_id", 
+                    "type": "str"
+                }
+            }, 
+            "out_list": [
+                "policy_id"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "If any of the parameters are not set."
+            }
+        }, 
+        "create_common_service_access_policy": {
+            "description": "Helper operation for creating a service access policy common to all services.", 
+            "in": {
+                "description": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "description", 
+                    "type": "str"
+                }, 
+                "ordinal": {
+                    "decorators": {}, 
+                    "default": 0, 
+                    "description": "", 
+                    "name": "ordinal", 
+                    "type": "int"
+                }, 
+                "policy_name": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "policy_name", 
+                    "type": "str"
+                }, 
+                "policy_rule": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "policy_rule", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "policy_rule", 
+                "ordinal", 
+                "description", 
+                "policy_name"
+            ], 
+            "out": {
+                "policy_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "policy_id", 
+                    "type": "str"
+                }
+            }, 
+            "out_list": [
+                "policy_id"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "If any of the parameters are not set."
+            }
+        }, 
+        "create_policy": {
+            "description": "Persists the provided Policy object The id string returned is the internal id by which Policy will be identified in the data store.", 
+            "in": {
+                "policy": {
+                    "decorators": {}, 
+                    "default": "!Policy", 
+                    "description": "", 
+                    "name": "policy", 
+                    "type": "Policy"
+                }
+            }, 
+            "in_list": [
+                "policy"
+            ], 
+            "out": {
+                "policy_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "policy_id", 
+                    "type": "str"
+                }
+            }, 
+            "out_list": [
+                "policy_id"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "if object passed has _id or _rev attribute"
+            }
+        }, 
+        "create_resource_access_policy": {
+            "description": "Helper operation for creating an access policy for a specific resource.", 
+            "in": {
+                "description": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "description", 
+                    "type": "str"
+                }, 
+                "ordinal": {
+                    "decorators": {}, 
+                    "default": 0, 
+                    "description": "", 
+                    "name": "ordinal", 
+                    "type": "int"
+                }, 
+                "policy_name": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "policy_name", 
+                    "type": "str"
+                }, 
+                "policy_rule": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "policy_rule", 
+                    "type": "str"
+                }, 
+                "resource_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "resource_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "policy_rule", 
+                "ordinal", 
+                "resource_id", 
+                "description", 
+                "policy_name"
+            ], 
+            "out": {
+                "policy_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "policy_id", 
+                    "type": "str"
+                }
+            }, 
+            "out_list": [
+                "policy_id"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "If any of the parameters are not set."
+            }
+        }, 
+        "create_service_access_policy": {
+            "description": "Helper operation for creating an access policy for a specific service.", 
+            "in": {
+                "description": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "description", 
+                    "type": "str"
+                }, 
+                "ordinal": {
+                    "decorators": {}, 
+                    "default": 0, 
+                    "description": "", 
+                    "name": "ordinal", 
+                    "type": "int"
+                }, 
+                "policy_name": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "policy_name", 
+                    "type": "str"
+                }, 
+                "policy_rule": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "policy_rule", 
+                    "type": "str"
+                }, 
+                "service_name": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "service_name", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "policy_rule", 
+                "service_name", 
+                "ordinal", 
+                "description", 
+                "policy_name"
+            ], 
+            "out": {
+                "policy_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "policy_id", 
+                    "type": "str"
+                }
+            }, 
+            "out_list": [
+                "policy_id"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "If any of the parameters are not set."
+            }
+        }, 
+        "delete_policy": {
+            "description": "For now, permanently deletes Policy object with the specified id. Throws exception if id does not match any persisted Policy.", 
+            "in": {
+                "policy_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "policy_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "policy_id"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "disable_policy": {
+            "description": "Resets a flag to disable the use of the policy", 
+            "in": {
+                "policy_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "policy_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "policy_id"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "enable_policy": {
+            "description": "Sets a flag to enable the use of the policy rule", 
+            "in": {
+                "policy_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "policy_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "policy_id"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "find_resource_policies": {
+            "description": "Finds all policies associated with a specific resource", 
+            "in": {
+                "resource_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "resource_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "resource_id"
+            ], 
+            "out": {
+                "policy_list": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "policy_list", 
+                    "type": "list"
+                }
+            }, 
+            "out_list": [
+                "policy_list"
+            ], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "get_active_process_operation_preconditions": {
+            "description": "Generates the set of all enabled precondition policies for the specified process operation within the specified Org. If the org_name is not provided, then the root ION Org will be assumed.", 
+            "in": {
+                "op": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "op", 
+                    "type": "str"
+                }, 
+                "org_name": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "org_name", 
+                    "type": "str"
+                }, 
+                "process_key": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "process_key", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "org_name", 
+                "process_key", 
+                "op"
+            ], 
+            "out": {
+                "policy_list": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "policy_list", 
+                    "type": "list"
+                }
+            }, 
+            "out_list": [
+                "policy_list"
+            ], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "get_active_resource_access_policy_rules": {
+            "description": "Generates the set of all enabled access policies for the specified resource within the specified Org. If the org_name is not provided, then the root ION Org will be assumed. Returns a list of Policy objects ordered by ordinal then ts_created.", 
+            "in": {
+                "org_name": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "org_name", 
+                    "type": "str"
+                }, 
+                "resource_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "resource_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "org_name", 
+                "resource_id"
+            ], 
+            "out": {
+                "policy_list": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "policy_list", 
+                    "type": "list"
+                }
+            }, 
+            "out_list": [
+                "policy_list"
+            ], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "get_active_service_access_policy_rules": {
+            "description": "Generates the set of all enabled access policies for the specified service within the specified Org. This includes common access, service access and service precondition policies. If service_name is empty, only the common service polices are returned. If the org_name is not provided, then the root ION Org will be assumed. Returns a list of Policy objects ordered by ordinal then ts_created.", 
+            "in": {
+                "org_name": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "org_name", 
+                    "type": "str"
+                }, 
+                "service_name": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "service_name", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "org_name", 
+                "service_name"
+            ], 
+            "out": {
+                "policy_list": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "policy_list", 
+                    "type": "list"
+                }
+            }, 
+            "out_list": [
+                "policy_list"
+            ], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "get_active_service_operation_preconditions": {
+            "description": "Generates the set of all enabled precondition policies for the specified service operation within the specified Org. If the org_name is not provided, then the root ION Org will be assumed.", 
+            "in": {
+                "op": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "op", 
+                    "type": "str"
+                }, 
+                "org_name": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "org_name", 
+                    "type": "str"
+                }, 
+                "service_name": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "service_name", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "org_name", 
+                "service_name", 
+                "op"
+            ], 
+            "out": {
+                "policy_list": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "policy_list", 
+                    "type": "list"
+                }
+            }, 
+            "out_list": [
+                "policy_list"
+            ], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "read_policy": {
+            "description": "Returns the Policy object for the specified policy id. Throws exception if id does not match any persisted Policy objects.", 
+            "in": {
+                "policy_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "policy_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "policy_id"
+            ], 
+            "out": {
+                "policy": {
+                    "decorators": {}, 
+                    "default": "!Policy", 
+                    "description": "", 
+                    "name": "policy", 
+                    "type": "Policy"
+                }
+            }, 
+            "out_list": [
+                "policy"
+            ], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "remove_resource_policy": {
+            "description": "Removes an association for a policy to a specific resource", 
+            "in": {
+                "policy_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "policy_id", 
+                    "type": "str"
+                }, 
+                "resource_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "resource_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "resource_id", 
+                "policy_id"
+            ], 
+            "out": {
+                "success": {
+                    "decorators": {}, 
+                    "default": true, 
+                    "description": "", 
+                    "name": "success", 
+                    "type": "bool"
+                }
+            }, 
+            "out_list": [
+                "success"
+            ], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "update_policy": {
+            "description": "Updates the provided Policy object.  Throws NotFound exception if an existing version of Policy is not found.  Throws Conflict if the provided Policy object is not based on the latest persisted version of the object.", 
+            "in": {
+                "policy": {
+                    "decorators": {}, 
+                    "default": "!Policy", 
+                    "description": "", 
+                    "name": "policy", 
+                    "type": "Policy"
+                }
+            }, 
+            "in_list": [
+                "policy"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "if object does not have _id or _rev attribute", 
+                "Conflict": "object not based on latest persisted object version", 
+                "NotFound": "object with specified id does not exist"
+            }
+        }
+    }, 
+    "spec": "https://confluence.oceanobservatories.org/display/syseng/CIAD+COI+OV+Policy+Management+Service"
+}"""
+
+
+class PolicyManagementServiceDependentClients(BaseClients):
+    def __init__(self, process=None):
+        self._process = process
+        BaseClients.__init__(self)
+        self._resource_registry = ResourceRegistryServiceProcessClient(process=process)
+
+    @property
+    def resource_registry(self):
+        if self._process.container is not None and self._process.container.has_capability("RESOURCE_REGISTRY"):
+            return ResourceRegistryServiceWrapper(self._process.container.resource_registry, self._process)
+        return self._resource_registry
+
+
+
+class IPolicyManagementService(Interface):
+    """Provides the interface to define and manage policy and a repository to store and retrieve policy
+    and templates for policy definitions.
+
+    @see https://confluence.oceanobservatories.org/display/syseng/CIAD+COI+OV+Policy+Management+Service
+    """
+
+    def get_active_service_access_policy_rules(org_name='', service_name=''):
+        """Generates the set of all enabled access policies for the specified service within the specified Org.
+        This includes common access, service access and service precondition policies.
+        If service_name is empty, only the common service polices are returned.
+        If the org_name is not provided, then the root ION Org will be assumed.
+        Returns a list of Policy objects ordered by ordinal then ts_created.
+
+        @param org_name    str
+        @param service_name    str
+        @retval policy_list    list
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def read_policy(policy_id=''):
+        """Returns the Policy object for the specified policy id.
+        Throws exception if id does not match any persisted Policy
+        objects.
+
+        @param policy_id    str
+        @retval policy    Policy
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def enable_policy(policy_id=''):
+        """Sets a flag to enable the use of the policy rule
+
+        @param policy_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def get_active_service_operation_preconditions(org_name='', service_name='', op=''):
+        """Generates the set of all enabled precondition policies for the specified service operation
+        within the specified Org. If the org_name is not provided, then the root ION Org will be assumed.
+
+        @param org_name    str
+        @param service_name    str
+        @param op    str
+        @retval policy_list    list
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def create_service_access_policy(policy_rule='', service_name='', ordinal=0, description='', policy_name=''):
+        """Helper operation for creating an access policy for a specific service.
+
+        @param policy_rule    str
+        @param service_name    str
+        @param ordinal    int
+        @param description    str
+        @param policy_name    str
+        @retval policy_id    str
+        @throws BadRequest    If any of the parameters are not set.
+        """
+        pass
+
+    def get_active_resource_access_policy_rules(org_name='', resource_id=''):
+        """Generates the set of all enabled access policies for the specified resource within the specified Org.
+        If the org_name is not provided, then the root ION Org will be assumed.
+        Returns a list of Policy objects ordered by ordinal then ts_created.
+
+        @param org_name    str
+        @param resource_id    str
+        @retval policy_list    list
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def add_process_operation_precondition_policy(process_id='', policy_content='', op=''):
+        """Helper operation for adding a precondition policy for a specific process operation.
+        The precondition method must return a tuple (boolean, string).
+
+        @param process_id    str
+        @param policy_content    str
+        @param op    str
+        @retval policy_id    str
+        @throws BadRequest    If any of the parameters are not set.
+        """
+        pass
+
+    def delete_policy(policy_id=''):
+        """For now, permanently deletes Policy object with the specified
+        id. Throws exception if id does not match any persisted Policy.
+
+        @param policy_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def add_service_operation_precondition_policy(service_name='', policy_content='', op=''):
+        """Helper operation for adding a precondition policy for a specific service operation.
+        The precondition method must return a tuple (boolean, string).
+
+        @param service_name    str
+        @param policy_content    str
+        @param op    str
+        @retval policy_id    str
+        @throws BadRequest    If any of the parameters are not set.
+        """
+        pass
+
+    def get_active_process_operation_preconditions(org_name='', process_key='', op=''):
+        """Generates the set of all enabled precondition policies for the specified process operation
+        within the specified Org. If the org_name is not provided, then the root ION Org will be assumed.
+
+        @param org_name    str
+        @param process_key    str
+        @param op    str
+        @retval policy_list    list
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def find_resource_policies(resource_id=''):
+        """Finds all policies associated with a specific resource
+
+        @param resource_id    str
+        @retval policy_list    list
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def create_policy(policy=None):
+        """Persists the provided Policy object The id string returned
+        is the internal id by which Policy will be identified in the data store.
+
+        @param policy    Policy
+        @retval policy_id    str
+        @throws BadRequest    if object passed has _id or _rev attribute
+        """
+        pass
+
+    def remove_resource_policy(resource_id='', policy_id=''):
+        """Removes an association for a policy to a specific resource
+
+        @param resource_id    str
+        @param policy_id    str
+        @retval success    bool
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def update_policy(policy=None):
+        """Updates the provided Policy object.  Throws NotFound exception if
+        an existing version of Policy is not found.  Throws Conflict if
+        the provided Policy object is not based on the latest persisted
+        version of the object.
+
+        @param policy    Policy
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    if object does not have _id or _rev attribute
+        @throws Conflict    object not based on latest persisted object version
+        """
+        pass
+
+    def create_common_service_access_policy(policy_rule='', ordinal=0, description='', policy_name=''):
+        """Helper operation for creating a service access policy common to all services.
+
+        @param policy_rule    str
+        @param ordinal    int
+        @param description    str
+        @param policy_name    str
+        @retval policy_id    str
+        @throws BadRequest    If any of the parameters are not set.
+        """
+        pass
+
+    def add_resource_policy(resource_id='', policy_id=''):
+        """Associates a policy to a specific resource
+
+        @param resource_id    str
+        @param policy_id    str
+        @retval success    bool
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def create_resource_access_policy(policy_rule='', ordinal=0, resource_id='', description='', policy_name=''):
+        """Helper operation for creating an access policy for a specific resource.
+
+        @param policy_rule    str
+        @param ordinal    int
+        @param resource_id    str
+        @param description    str
+        @param policy_name    str
+        @retval policy_id    str
+        @throws BadRequest    If any of the parameters are not set.
+        """
+        pass
+
+    def disable_policy(policy_id=''):
+        """Resets a flag to disable the use of the policy
+
+        @param policy_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+class BasePolicyManagementService(BaseService):
+    implements(IPolicyManagementService)
+    """Provides the interface to define and manage policy and a repository to store and retrieve policy
+    and templates for policy definitions.
+
+    @see https://confluence.oceanobservatories.org/display/syseng/CIAD+COI+OV+Policy+Management+Service
+    """
+    SCHEMA_JSON=SCHEMA_JSON
+    name = 'policy_management'
+    dependencies = ['resource_registry']
+
+    def __init__(self, *args, **kwargs):
+        BaseService.__init__(self, *args, **kwargs)
+        self.clients = PolicyManagementServiceDependentClients(process=self)
+
+
+    def get_active_service_access_policy_rules(self, org_name='', service_name=''):
+        """Generates the set of all enabled access policies for the specified service within the specified Org.
+        This includes common access, service access and service precondition policies.
+        If service_name is empty, only the common service polices are returned.
+        If the org_name is not provided, then the root ION Org will be assumed.
+        Returns a list of Policy objects ordered by ordinal then ts_created.
+
+        @param org_name    str
+        @param service_name    str
+        @retval policy_list    list
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def read_policy(self, policy_id=''):
+        """Returns the Policy object for the specified policy id.
+        Throws exception if id does not match any persisted Policy
+        objects.
+
+        @param policy_id    str
+        @retval policy    Policy
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def enable_policy(self, policy_id=''):
+        """Sets a flag to enable the use of the policy rule
+
+        @param policy_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def get_active_service_operation_preconditions(self, org_name='', service_name='', op=''):
+        """Generates the set of all enabled precondition policies for the specified service operation
+        within the specified Org. If the org_name is not provided, then the root ION Org will be assumed.
+
+        @param org_name    str
+        @param service_name    str
+        @param op    str
+        @retval policy_list    list
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def create_service_access_policy(self, policy_rule='', service_name='', ordinal=0, description='', policy_name=''):
+        """Helper operation for creating an access policy for a specific service.
+
+        @param policy_rule    str
+        @param service_name    str
+        @param ordinal    int
+        @param description    str
+        @param policy_name    str
+        @retval policy_id    str
+        @throws BadRequest    If any of the parameters are not set.
+        """
+        pass
+
+    def get_active_resource_access_policy_rules(self, org_name='', resource_id=''):
+        """Generates the set of all enabled access policies for the specified resource within the specified Org.
+        If the org_name is not provided, then the root ION Org will be assumed.
+        Returns a list of Policy objects ordered by ordinal then ts_created.
+
+        @param org_name    str
+        @param resource_id    str
+        @retval policy_list    list
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def add_process_operation_precondition_policy(self, process_id='', policy_content='', op=''):
+        """Helper operation for adding a precondition policy for a specific process operation.
+        The precondition method must return a tuple (boolean, string).
+
+        @param process_id    str
+        @param policy_content    str
+        @param op    str
+        @retval policy_id    str
+        @throws BadRequest    If any of the parameters are not set.
+        """
+        pass
+
+    def delete_policy(self, policy_id=''):
+        """For now, permanently deletes Policy object with the specified
+        id. Throws exception if id does not match any persisted Policy.
+
+        @param policy_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def add_service_operation_precondition_policy(self, service_name='', policy_content='', op=''):
+        """Helper operation for adding a precondition policy for a specific service operation.
+        The precondition method must return a tuple (boolean, string).
+
+        @param service_name    str
+        @param policy_content    str
+        @param op    str
+        @retval policy_id    str
+        @throws BadRequest    If any of the parameters are not set.
+        """
+        pass
+
+    def get_active_process_operation_preconditions(self, org_name='', process_key='', op=''):
+        """Generates the set of all enabled precondition policies for the specified process operation
+        within the specified Org. If the org_name is not provided, then the root ION Org will be assumed.
+
+        @param org_name    str
+        @param process_key    str
+        @param op    str
+        @retval policy_list    list
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def find_resource_policies(self, resource_id=''):
+        """Finds all policies associated with a specific resource
+
+        @param resource_id    str
+        @retval policy_list    list
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def create_policy(self, policy=None):
+        """Persists the provided Policy object The id string returned
+        is the internal id by which Policy will be identified in the data store.
+
+        @param policy    Policy
+        @retval policy_id    str
+        @throws BadRequest    if object passed has _id or _rev attribute
+        """
+        pass
+
+    def remove_resource_policy(self, resource_id='', policy_id=''):
+        """Removes an association for a policy to a specific resource
+
+        @param resource_id    str
+        @param policy_id    str
+        @retval success    bool
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def update_policy(self, policy=None):
+        """Updates the provided Policy object.  Throws NotFound exception if
+        an existing version of Policy is not found.  Throws Conflict if
+        the provided Policy object is not based on the latest persisted
+        version of the object.
+
+        @param policy    Policy
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    if object does not have _id or _rev attribute
+        @throws Conflict    object not based on latest persisted object version
+        """
+        pass
+
+    def create_common_service_access_policy(self, policy_rule='', ordinal=0, description='', policy_name=''):
+        """Helper operation for creating a service access policy common to all services.
+
+        @param policy_rule    str
+        @param ordinal    int
+        @param description    str
+        @param policy_name    str
+        @retval policy_id    str
+        @throws BadRequest    If any of the parameters are not set.
+        """
+        pass
+
+    def add_resource_policy(self, resource_id='', policy_id=''):
+        """Associates a policy to a specific resource
+
+        @param resource_id    str
+        @param policy_id    str
+        @retval success    bool
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def create_resource_access_policy(self, policy_rule='', ordinal=0, resource_id='', description='', policy_name=''):
+        """Helper operation for creating an access policy for a specific resource.
+
+        @param policy_rule    str
+        @param ordinal    int
+        @param resource_id    str
+        @param description    str
+        @param policy_name    str
+        @retval policy_id    str
+        @throws BadRequest    If any of the parameters are not set.
+        """
+        pass
+
+    def disable_policy(self, policy_id=''):
+        """Resets a flag to disable the use of the policy
+
+        @param policy_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+
+
+
+class PolicyManagementServiceClientMixin(object):
+    """
+    # @todo Fill in client documentation.
+    """
+    #implements(IPolicyManagementService)
+
+
+    def get_active_service_access_policy_rules(self, org_name='', service_name='', headers=None, timeout=None):
+        """Generates the set of all enabled access policies for the specified service within the specified Org.
+        This includes common access, service access and service precondition policies.
+        If service_name is empty, only the common service polices are returned.
+        If the org_name is not provided, then the root ION Org will be assumed.
+        Returns a list of Policy objects ordered by ordinal then ts_created.
+
+        @param org_name    str
+        @param service_name    str
+        @retval policy_list    list
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('policy_management_get_active_service_access_policy_rules_in', **{'org_name': org_name, 'service_name': service_name}), op='get_active_service_access_policy_rules', headers=headers, timeout=timeout)
+
+    def read_policy(self, policy_id='', headers=None, timeout=None):
+        """Returns the Policy object for the specified policy id.
+        Throws exception if id does not match any persisted Policy
+        objects.
+
+        @param policy_id    str
+        @retval policy    Policy
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('policy_management_read_policy_in', **{'policy_id': policy_id}), op='read_policy', headers=headers, timeout=timeout)
+
+    def enable_policy(self, policy_id='', headers=None, timeout=None):
+        """Sets a flag to enable the use of the policy rule
+
+        @param policy_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('policy_management_enable_policy_in', **{'policy_id': policy_id}), op='enable_policy', headers=headers, timeout=timeout)
+
+    def get_active_service_operation_preconditions(self, org_name='', service_name='', op='', headers=None, timeout=None):
+        """Generates the set of all enabled precondition policies for the specified service operation
+        within the specified Org. If the org_name is not provided, then the root ION Org will be assumed.
+
+        @param org_name    str
+        @param service_name    str
+        @param op    str
+        @retval policy_list    list
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('policy_management_get_active_service_operation_preconditions_in', **{'org_name': org_name, 'service_name': service_name, 'op': op}), op='get_active_service_operation_preconditions', headers=headers, timeout=timeout)
+
+    def create_service_access_policy(self, policy_rule='', service_name='', ordinal=0, description='', policy_name='', headers=None, timeout=None):
+        """Helper operation for creating an access policy for a specific service.
+
+        @param policy_rule    str
+        @param service_name    str
+        @param ordinal    int
+        @param description    str
+        @param policy_name    str
+        @retval policy_id    str
+        @throws BadRequest    If any of the parameters are not set.
+        """
+        return self.request(IonObject('policy_management_create_service_access_policy_in', **{'policy_rule': policy_rule, 'service_name': service_name, 'ordinal': ordinal, 'description': description, 'policy_name': policy_name}), op='create_service_access_policy', headers=headers, timeout=timeout)
+
+    def get_active_resource_access_policy_rules(self, org_name='', resource_id='', headers=None, timeout=None):
+        """Generates the set of all enabled access policies for the specified resource within the specified Org.
+        If the org_name is not provided, then the root ION Org will be assumed.
+        Returns a list of Policy objects ordered by ordinal then ts_created.
+
+        @param org_name    str
+        @param resource_id    str
+        @retval policy_list    list
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('policy_management_get_active_resource_access_policy_rules_in', **{'org_name': org_name, 'resource_id': resource_id}), op='get_active_resource_access_policy_rules', headers=headers, timeout=timeout)
+
+    def add_process_operation_precondition_policy(self, process_id='', policy_content='', op='', headers=None, timeout=None):
+        """Helper operation for adding a precondition policy for a specific process operation.
+        The precondition method must return a tuple (boolean, string).
+
+        @param process_id    str
+        @param policy_content    str
+        @param op    str
+        @retval policy_id    str
+        @throws BadRequest    If any of the parameters are not set.
+        """
+        return self.request(IonObject('policy_management_add_process_operation_precondition_policy_in', **{'process_id': process_id, 'policy_content': policy_content, 'op': op}), op='add_process_operation_precondition_policy', headers=headers, timeout=timeout)
+
+    def delete_policy(self, policy_id='', headers=None, timeout=None):
+        """For now, permanently deletes Policy object with the specified
+        id. Throws exception if id does not match any persisted Policy.
+
+        @param policy_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('policy_management_delete_policy_in', **{'policy_id': policy_id}), op='delete_policy', headers=headers, timeout=timeout)
+
+    def add_service_operation_precondition_policy(self, service_name='', policy_content='', op='', headers=None, timeout=None):
+        """Helper operation for adding a precondition policy for a specific service operation.
+        The precondition method must return a tuple (boolean, string).
+
+        @param service_name    str
+        @param policy_content    str
+        @param op    str
+        @retval policy_id    str
+        @throws BadRequest    If any of the parameters are not set.
+        """
+        return self.request(IonObject('policy_management_add_service_operation_precondition_policy_in', **{'service_name': service_name, 'policy_content': policy_content, 'op': op}), op='add_service_operation_precondition_policy', headers=headers, timeout=timeout)
+
+    def get_active_process_operation_preconditions(self, org_name='', process_key='', op='', headers=None, timeout=None):
+        """Generates the set of all enabled precondition policies for the specified process operation
+        within the specified Org. If the org_name is not provided, then the root ION Org will be assumed.
+
+        @param org_name    str
+        @param process_key    str
+        @param op    str
+        @retval policy_list    list
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('policy_management_get_active_process_operation_preconditions_in', **{'org_name': org_name, 'process_key': process_key, 'op': op}), op='get_active_process_operation_preconditions', headers=headers, timeout=timeout)
+
+    def find_resource_policies(self, resource_id='', headers=None, timeout=None):
+        """Finds all policies associated with a specific resource
+
+        @param resource_id    str
+        @retval policy_list    list
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('policy_management_find_resource_policies_in', **{'resource_id': resource_id}), op='find_resource_policies', headers=headers, timeout=timeout)
+
+    def create_policy(self, policy=None, headers=None, timeout=None):
+        """Persists the provided Policy object The id string returned
+        is the internal id by which Policy will be identified in the data store.
+
+        @param policy    Policy
+        @retval policy_id    str
+        @throws BadRequest    if object passed has _id or _rev attribute
+        """
+        return self.request(IonObject('policy_management_create_policy_in', **{'policy': policy or None}), op='create_policy', headers=headers, timeout=timeout)
+
+    def remove_resource_policy(self, resource_id='', policy_id='', headers=None, timeout=None):
+        """Removes an association for a policy to a specific resource
+
+        @param resource_id    str
+        @param policy_id    str
+        @retval success    bool
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('policy_management_remove_resource_policy_in', **{'resource_id': resource_id, 'policy_id': policy_id}), op='remove_resource_policy', headers=headers, timeout=timeout)
+
+    def update_policy(self, policy=None, headers=None, timeout=None):
+        """Updates the provided Policy object.  Throws NotFound exception if
+        an existing version of Policy is not found.  Throws Conflict if
+        the provided Policy object is not based on the latest persisted
+        version of the object.
+
+        @param policy    Policy
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    if object does not have _id or _rev attribute
+        @throws Conflict    object not based on latest persisted object version
+        """
+        return self.request(IonObject('policy_management_update_policy_in', **{'policy': policy or None}), op='update_policy', headers=headers, timeout=timeout)
+
+    def create_common_service_access_policy(self, policy_rule='', ordinal=0, description='', policy_name='', headers=None, timeout=None):
+        """Helper operation for creating a service access policy common to all services.
+
+        @param policy_rule    str
+        @param ordinal    int
+        @param description    str
+        @param policy_name    str
+        @retval policy_id    str
+        @throws BadRequest    If any of the parameters are not set.
+        """
+        return self.request(IonObject('policy_management_create_common_service_access_policy_in', **{'policy_rule': policy_rule, 'ordinal': ordinal, 'description': description, 'policy_name': policy_name}), op='create_common_service_access_policy', headers=headers, timeout=timeout)
+
+    def add_resource_policy(self, resource_id='', policy_id='', headers=None, timeout=None):
+        """Associates a policy to a specific resource
+
+        @param resource_id    str
+        @param policy_id    str
+        @retval success    bool
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('policy_management_add_resource_policy_in', **{'resource_id': resource_id, 'policy_id': policy_id}), op='add_resource_policy', headers=headers, timeout=timeout)
+
+    def create_resource_access_policy(self, policy_rule='', ordinal=0, resource_id='', description='', policy_name='', headers=None, timeout=None):
+        """Helper operation for creating an access policy for a specific resource.
+
+        @param policy_rule    str
+        @param ordinal    int
+        @param resource_id    str
+        @param description    str
+        @param policy_name    str
+        @retval policy_id    str
+        @throws BadRequest    If any of the parameters are not set.
+        """
+        return self.request(IonObject('policy_management_create_resource_access_policy_in', **{'policy_rule': policy_rule, 'ordinal': ordinal, 'resource_id': resource_id, 'description': description, 'policy_name': policy_name}), op='create_resource_access_policy', headers=headers, timeout=timeout)
+
+    def disable_policy(self, policy_id='', headers=None, timeout=None):
+        """Resets a flag to disable the use of the policy
+
+        @param policy_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('policy_management_disable_policy_in', **{'policy_id': policy_id}), op='disable_policy', headers=headers, timeout=timeout)
+
+
+
+class PolicyManagementServiceClient(RPCClient, PolicyManagementServiceClientMixin):
+    def __init__(self, to_name=None, node=None, **kwargs):
+        to_name = to_name or 'policy_management'
+        RPCClient.__init__(self, to_name=to_name, node=node, **kwargs)
+        PolicyManagementServiceClientMixin.__init__(self)
+
+
+class PolicyManagementServiceProcessClient(ProcessRPCClient, PolicyManagementServiceClientMixin):
+    def __init__(self, process=None, to_name=None, node=None, **kwargs):
+        to_name = to_name or 'policy_management'
+        ProcessRPCClient.__init__(self, process=process, to_name=to_name, node=node, **kwargs)
+        PolicyManagementServiceClientMixin.__init__(self)
+
+
+
+
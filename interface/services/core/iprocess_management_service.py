@@ -0,0 +1,622 @@
+#!/usr/bin/env python
+#
+# File generated on 2026-10-16 20:36:13.253562
+#
+
+from zope.interface import Interface, implements
+
+from collections import OrderedDict, defaultdict
+
+import interface.objects
+from pyon.core.bootstrap import IonObject
+from pyon.ion.resregistry import ResourceRegistryServiceWrapper
+from pyon.ion.service import BaseService, BaseClients
+from pyon.net.endpoint import RPCClient
+from pyon.ion.endpoint import ProcessRPCClient
+from pyon.util.log import log
+from interface.services.core.iresource_registry_service import ResourceRegistryServiceProcessClient
+
+SCHEMA_JSON = """{
+    "dependencies": [
+        "resource_registry"
+    ], 
+    "description": "Service to create, read, update and delete process definitions and processes,     and manage process execution.  Process definitions represent executables.     Processes represent the executing code within the system.", 
+    "name": "process_management", 
+    "op_list": [
+        "delete_process_definition", 
+        "create_process", 
+        "read_process", 
+        "list_processes", 
+        "create_process_definition", 
+        "schedule_process", 
+        "cancel_process", 
+        "read_process_definition"
+    ], 
+    "operations": {
+        "cancel_process": {
+            "description": "Cancels the execution of the given process id.", 
+            "in": {
+                "process_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "process_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "process_id"
+            ], 
+            "out": {
+                "success": {
+                    "decorators": {}, 
+                    "default": true, 
+                    "description": "", 
+                    "name": "success", 
+                    "type": "bool"
+                }
+            }, 
+            "out_list": [
+                "success"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "arguments invalid or incomplete", 
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "create_process": {
+            "description": "Create a process resource and process id. Does not yet start the process. Argument process is optional and may contain attributes for the Process resource", 
+            "in": {
+                "process": {
+                    "decorators": {}, 
+                    "default": "!Process", 
+                    "description": "", 
+                    "name": "process", 
+                    "type": "Process"
+                }, 
+                "process_definition_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "process_definition_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "process", 
+                "process_definition_id"
+            ], 
+            "out": {
+                "process_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "process_id", 
+                    "type": "str"
+                }
+            }, 
+            "out_list": [
+                "process_id"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "arguments invalid or incomplete", 
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "create_process_definition": {
+            "description": "Creates a ProcessDefinition based on given object.", 
+            "in": {
+                "process_definition": {
+                    "decorators": {}, 
+                    "default": "!ProcessDefinition", 
+                    "description": "", 
+                    "name": "process_definition", 
+                    "type": "ProcessDefinition"
+                }
+            }, 
+            "in_list": [
+                "process_definition"
+            ], 
+            "out": {
+                "process_definition_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "process_definition_id", 
+                    "type": "str"
+                }
+            }, 
+            "out_list": [
+                "process_definition_id"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "arguments invalid or incomplete"
+            }
+        }, 
+        "delete_process_definition": {
+            "description": "Deletes/retires a ProcessDefinition.", 
+            "in": {
+                "process_definition_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "process_definition_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "process_definition_id"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "arguments invalid or incomplete", 
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "list_processes": {
+            "description": "Lists managed processes", 
+            "in": {}, 
+            "in_list": [], 
+            "out": {
+                "processes": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "processes", 
+                    "type": "list"
+                }
+            }, 
+            "out_list": [
+                "processes"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "arguments invalid or incomplete"
+            }
+        }, 
+        "read_process": {
+            "description": "Returns a Process as an object.", 
+            "in": {
+                "process_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "process_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "process_id"
+            ], 
+            "out": {
+                "process": {
+                    "decorators": {}, 
+                    "default": "!Process", 
+                    "description": "", 
+                    "name": "process", 
+                    "type": "Process"
+                }
+            }, 
+            "out_list": [
+                "process"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "arguments invalid or incomplete", 
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "read_process_definition": {
+            "description": "Returns a ProcessDefinition as object.", 
+            "in": {
+                "process_definition_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "process_definition_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "process_definition_id"
+            ], 
+            "out": {
+                "process_definition": {
+                    "decorators": {}, 
+                    "default": "!ProcessDefinition", 
+                    "description": "", 
+                    "name": "process_definition", 
+                    "type": "ProcessDefinition"
+                }
+            }, 
+            "out_list": [
+                "process_definition"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "arguments invalid or incomplete", 
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "schedule_process": {
+            "description": "Schedule a process definition for execution on an Execution Engine. If no process id is given, a new unique ID is generated.", 
+            "in": {
+                "configuration": {
+                    "decorators": {}, 
+                    "default": {}, 
+                    "description": "", 
+                    "name": "configuration", 
+                    "type": "dict"
+                }, 
+                "name": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "name", 
+                    "type": "str"
+                }, 
+                "process_definition_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "process_definition_id", 
+                    "type": "str"
+                }, 
+                "process_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "process_id", 
+                    "type": "str"
+                }, 
+                "schedule": {
+                    "decorators": {}, 
+                    "default": "!ProcessSchedule", 
+                    "description": "", 
+                    "name": "schedule", 
+                    "type": "ProcessSchedule"
+                }
+            }, 
+            "in_list": [
+                "process_definition_id", 
+                "process_id", 
+                "name", 
+                "configuration", 
+                "schedule"
+            ], 
+            "out": {
+                "process_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "process_id", 
+                    "type": "str"
+                }
+            }, 
+            "out_list": [
+                "process_id"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "arguments invalid or incomplete", 
+                "NotFound": "object with specified id does not exist"
+            }
+        }
+    }, 
+    "spec": ""
+}"""
+
+
+class ProcessManagementServiceDependentClients(BaseClients):
+    def __init__(self, process=None):
+        self._process = process
+        BaseClients.__init__(self)
+        self._resource_registry = ResourceRegistryServiceProcessClient(process=process)
+
+    @property
+    def resource_registry(self):
+        if self._process.container is not None and self._process.container.has_capability("RESOURCE_REGISTRY"):
+            return ResourceRegistryServiceWrapper(self._process.container.resource_registry, self._process)
+        return self._resource_registry
+
+
+
+class IProcessManagementService(Interface):
+    """None
+    """
+
+    def delete_process_definition(process_definition_id=''):
+        """Deletes/retires a ProcessDefinition.
+
+        @param process_definition_id    str
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        pass
+
+    def create_process(process=None, process_definition_id=''):
+        """Create a process resource and process id. Does not yet start the process.
+        Argument process is optional and may contain attributes for the Process resource
+
+        @param process    Process
+        @param process_definition_id    str
+        @retval process_id    str
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        pass
+
+    def read_process(process_id=''):
+        """Returns a Process as an object.
+
+        @param process_id    str
+        @retval process    Process
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        pass
+
+    def list_processes():
+        """Lists managed processes
+
+        @retval processes    list
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        pass
+
+    def create_process_definition(process_definition=None):
+        """Creates a ProcessDefinition based on given object.
+
+        @param process_definition    ProcessDefinition
+        @retval process_definition_id    str
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        pass
+
+    def schedule_process(process_definition_id='', process_id='', name='', configuration=None, schedule=None):
+        """Schedule a process definition for execution on an Execution Engine. If no process id is given,
+        a new unique ID is generated.
+
+        @param process_definition_id    str
+        @param process_id    str
+        @param name    str
+        @param configuration    dict
+        @param schedule    ProcessSchedule
+        @retval process_id    str
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        pass
+
+    def cancel_process(process_id=''):
+        """Cancels the execution of the given process id.
+
+        @param process_id    str
+        @retval success    bool
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        pass
+
+    def read_process_definition(process_definition_id=''):
+        """Returns a ProcessDefinition as object.
+
+        @param process_definition_id    str
+        @retval process_definition    ProcessDefinition
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        pass
+
+class BaseProcessManagementService(BaseService):
+    implements(IProcessManagementService)
+    """None
+    """
+    SCHEMA_JSON=SCHEMA_JSON
+    name = 'process_management'
+    dependencies = ['resource_registry']
+
+    def __init__(self, *args, **kwargs):
+        BaseService.__init__(self, *args, **kwargs)
+        self.clients = ProcessManagementServiceDependentClients(process=self)
+
+
+    def delete_process_definition(self, process_definition_id=''):
+        """Deletes/retires a ProcessDefinition.
+
+        @param process_definition_id    str
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        pass
+
+    def create_process(self, process=None, process_definition_id=''):
+        """Create a process resource and process id. Does not yet start the process.
+        Argument process is optional and may contain attributes for the Process resource
+
+        @param process    Process
+        @param process_definition_id    str
+        @retval process_id    str
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        pass
+
+    def read_process(self, process_id=''):
+        """Returns a Process as an object.
+
+        @param process_id    str
+        @retval process    Process
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        pass
+
+    def list_processes(self):
+        """Lists managed processes
+
+        @retval processes    list
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        pass
+
+    def create_process_definition(self, process_definition=None):
+        """Creates a ProcessDefinition based on given object.
+
+        @param process_definition    ProcessDefinition
+        @retval process_definition_id    str
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        pass
+
+    def schedule_process(self, process_definition_id='', process_id='', name='', configuration=None, schedule=None):
+        """Schedule a process definition for execution on an Execution Engine. If no process id is given,
+        a new unique ID is generated.
+
+        @param process_definition_id    str
+        @param process_id    str
+        @param name    str
+        @param configuration    dict
+        @param schedule    ProcessSchedule
+        @retval process_id    str
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        pass
+
+    def cancel_process(self, process_id=''):
+        """Cancels the execution of the given process id.
+
+        @param process_id    str
+        @retval success    bool
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        pass
+
+    def read_process_definition(self, process_definition_id=''):
+        """Returns a ProcessDefinition as object.
+
+        @param process_definition_id    str
+        @retval process_definition    ProcessDefinition
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        pass
+
+
+
+
+class ProcessManagementServiceClientMixin(object):
+    """
+    # @todo Fill in client documentation.
+    """
+    #implements(IProcessManagementService)
+
+
+    def delete_process_definition(self, process_definition_id='', headers=None, timeout=None):
+        """Deletes/retires a ProcessDefinition.
+
+        @param process_definition_id    str
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        return self.request(IonObject('process_management_delete_process_definition_in', **{'process_definition_id': process_definition_id}), op='delete_process_definition', headers=headers, timeout=timeout)
+
+    def create_process(self, process=None, process_definition_id='', headers=None, timeout=None):
+        """Create a process resource and process id. Does not yet start the process.
+        Argument process is optional and may contain attributes for the Process resource
+
+        @param process    Process
+        @param process_definition_id    str
+        @retval process_id    str
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        return self.request(IonObject('process_management_create_process_in', **{'process': process or None, 'process_definition_id': process_definition_id}), op='create_process', headers=headers, timeout=timeout)
+
+    def read_process(self, process_id='', headers=None, timeout=None):
+        """Returns a Process as an object.
+
+        @param process_id    str
+        @retval process    Process
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        return self.request(IonObject('process_management_read_process_in', **{'process_id': process_id}), op='read_process', headers=headers, timeout=timeout)
+
+    def list_processes(self, headers=None, timeout=None):
+        """Lists managed processes
+
+        @retval processes    list
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        return self.request(IonObject('process_management_list_processes_in', **{}), op='list_processes', headers=headers, timeout=timeout)
+
+    def create_process_definition(self, process_definition=None, headers=None, timeout=None):
+        """Creates a ProcessDefinition based on given object.
+
+        @param process_definition    ProcessDefinition
+        @retval process_definition_id    str
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        return self.request(IonObject('process_management_create_process_definition_in', **{'process_definition': process_definition or None}), op='create_process_definition', headers=headers, timeout=timeout)
+
+    def schedule_process(self, process_definition_id='', process_id='', name='', configuration=None, schedule=None, headers=None, timeout=None):
+        """Schedule a process definition for execution on an Execution Engine. If no process id is given,
+        a new unique ID is generated.
+
+        @param process_definition_id    str
+        @param process_id    str
+        @param name    str
+        @param configuration    dict
+        @param schedule    ProcessSchedule
+        @retval process_id    str
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        return self.request(IonObject('process_management_schedule_process_in', **{'process_definition_id': process_definition_id, 'process_id': process_id, 'name': name, 'configuration': configuration or None, 'schedule': schedule or None}), op='schedule_process', headers=headers, timeout=timeout)
+
+    def cancel_process(self, process_id='', headers=None, timeout=None):
+        """Cancels the execution of the given process id.
+
+        @param process_id    str
+        @retval success    bool
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        return self.request(IonObject('process_management_cancel_process_in', **{'process_id': process_id}), op='cancel_process', headers=headers, timeout=timeout)
+
+    def read_process_definition(self, process_definition_id='', headers=None, timeout=None):
+        """Returns a ProcessDefinition as object.
+
+        @param process_definition_id    str
+        @retval process_definition    ProcessDefinition
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    arguments invalid or incomplete
+        """
+        return self.request(IonObject('process_management_read_process_definition_in', **{'process_definition_id': process_definition_id}), op='read_process_definition', headers=headers, timeout=timeout)
+
+
+
+class ProcessManagementServiceClient(RPCClient, ProcessManagementServiceClientMixin):
+    def __init__(self, to_name=None, node=None, **kwargs):
+        to_name = to_name or 'process_management'
+        RPCClient.__init__(self, to_name=to_name, node=node, **kwargs)
+        ProcessManagementServiceClientMixin.__init__(self)
+
+
+class ProcessManagementServiceProcessClient(ProcessRPCClient, ProcessManagementServiceClientMixin):
+    def __init__(self, process=None, to_name=None, node=None, **kwargs):
+        to_name = to_name or 'process_management'
+        ProcessRPCClient.__init__(self, process=process, to_name=to_name, node=node, **kwargs)
+        ProcessManagementServiceClientMixin.__init__(self)
+
+
+
+
@@ -0,0 +1,2575 @@
+#!/usr/bin/env python
+#
+# File generated on 2026-10-16 20:36:13.253562
+#
+
+from zope.interface import Interface, implements
+
+from collections import OrderedDict, defaultdict
+
+import interface.objects
+from pyon.core.bootstrap import IonObject
+from pyon.ion.resregistry import ResourceRegistryServiceWrapper
+from pyon.ion.service import BaseService, BaseClients
+from pyon.net.endpoint import RPCClient
+from pyon.ion.endpoint import ProcessRPCClient
+from pyon.util.log import log
+
+
+SCHEMA_JSON = """{
+    "dependencies": [], 
+    "description": "Service used to create, read, update and delete persistent resources     (IonObjects).  Additionally, provides methods to manipulate     resource associations and resource life cycle state.", 
+    "name": "resource_registry", 
+    "op_list": [
+        "delete_association", 
+        "find_objects", 
+        "read_subject", 
+        "lcs_delete", 
+        "find_resources_ext", 
+        "read", 
+        "retire", 
+        "update", 
+        "find_subjects_mult", 
+        "read_mult", 
+        "create_association", 
+        "find_objects_mult", 
+        "execute_lifecycle_transition", 
+        "get_association", 
+        "find_attachments", 
+        "set_lifecycle_state", 
+        "find_subjects", 
+        "read_object", 
+        "delete_attachment", 
+        "read_attachment", 
+        "create", 
+        "find_resources", 
+        "create_attachment", 
+        "find_associations", 
+        "create_association_mult", 
+        "delete"
+    ], 
+    "operations": {
+        "create": {
+            "description": "Persist an instance of the resource passed in the object param. Returns a tuple (_id, _rev) for the persistend object.", 
+            "in": {
+                "object": {
+                    "decorators": {}, 
+                    "default": "!Resource", 
+                    "description": "", 
+                    "name": "object", 
+                    "type": "Resource"
+                }
+            }, 
+            "in_list": [
+                "object"
+            ], 
+            "out": {
+                "tuple": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "tuple", 
+                    "type": "list"
+                }
+            }, 
+            "out_list": [
+                "tuple"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "object has _id field"
+            }
+        }, 
+        "create_association": {
+            "description": "Create an association between subject and object resources (IonObjects). Subject and object values can be passed as actual object instances or just object ids.  Valid predicates can be found in res/config/associations.yml. Subject and object must be of the proper types for the predicate or an exception will be thrown. Assoc_type is deprecated.", 
+            "in": {
+                "assoc_type": {
+                    "decorators": {}, 
+                    "default": null, 
+                    "description": "", 
+                    "name": "assoc_type", 
+                    "type": "NoneType"
+                }, 
+                "object": {
+                    "decorators": {
+                        "ContentType": "Resource,str"
+                    }, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "object", 
+                    "type": "str"
+                }, 
+                "predicate": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "predicate", 
+                    "type": "str"
+                }, 
+                "subject": {
+                    "decorators": {
+                        "ContentType": "Resource,str"
+                    }, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "subject", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "predicate", 
+                "object", 
+                "assoc_type", 
+                "subject"
+            ], 
+            "out": {
+                "tuple": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "tuple", 
+                    "type": "list"
+                }
+            }, 
+            "out_list": [
+                "tuple"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "subject, predicate or object parameter missing, unknown value passed for the assoc_type parameter, predicate is unknown, subject or object are invalid types for predicate, or subject or object do not have _id field", 
+                "NotFound": "subject or object does not exist"
+            }
+        }, 
+        "create_association_mult": {
+            "description": "Create multiple associations between subject and object resources (IonObjects). Subject and object values can be passed as actual object instances or just object ids.  Valid predicates can be found in res/config/associations.yml. Subject and object must be of the proper types for the predicate or an exception will be thrown.", 
+            "in": {
+                "assoc_list": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "assoc_list", 
+                    "type": "list"
+                }
+            }, 
+            "in_list": [
+                "assoc_list"
+            ], 
+            "out": {
+                "tuple": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "tuple", 
+                    "type": "list"
+                }
+            }, 
+            "out_list": [
+                "tuple"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "subject, predicate or object parameter missing, predicate is unknown, subject or object are invalid types for predicate, or subject or object do not have _id field", 
+                "NotFound": "subject or object does not exist"
+            }
+        }, 
+        "create_attachment": {
+            "description": "Create an Attachment resource associated with another resource. If no resource_id is provided, the attachment is created standalone.", 
+            "in": {
+                "attachment": {
+                    "decorators": {}, 
+                    "default": "!Attachment", 
+                    "description": "", 
+                    "name": "attachment", 
+                    "type": "Attachment"
+                }, 
+                "resource_id": {
+                    "decorators": {
+                        "ResourceId": ""
+                    }, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "resource_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "attachment", 
+                "resource_id"
+            ], 
+            "out": {
+                "attachment_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "attachment_id", 
+                    "type": "str"
+                }
+            }, 
+            "out_list": [
+                "attachment_id"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "bad attachment type or content", 
+                "NotFound": "resource object does not exist if resource_id given"
+            }
+        }, 
+        "delete": {
+            "description": "Permanently delete object in datastores. Throws exception if object does not exist.", 
+            "in": {
+                "object_id": {
+                    "decorators": {
+                        "ResourceId": ""
+                    }, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "object_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "object_id"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object does not exist"
+            }
+        }, 
+        "delete_association": {
+            "description": "For now, permanently delete an association between two resources (IonObjects). Throws exception if association does not exist.", 
+            "in": {
+                "association": {
+                    "decorators": {
+                        "ContentType": "Association,str"
+                    }, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "association", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "association"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "association does not exist"
+            }
+        }, 
+        "delete_attachment": {
+            "description": "Delete an attachment resource and resource associations.", 
+            "in": {
+                "attachment_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "attachment_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "attachment_id"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "attachment does not exist"
+            }
+        }, 
+        "execute_lifecycle_transition": {
+            "description": "Alter object lifecycle according to given transition event. Throws exception if resource object does not exist or given transition_event is unknown/illegal. The new life cycle state after applying the transition is returned.", 
+            "in": {
+                "resource_id": {
+                    "decorators": {
+                        "ResourceId": ""
+                    }, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "resource_id", 
+                    "type": "str"
+                }, 
+                "transition_event": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "transition_event", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "transition_event", 
+                "resource_id"
+            ], 
+            "out": {
+                "lcstate": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "lcstate", 
+                    "type": "str"
+                }
+            }, 
+            "out_list": [
+                "lcstate"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "transition event unknown or illegal in current state; resource type has no lifecycle", 
+                "Conflict": "race condition while trying to update", 
+                "NotFound": "resource object does not exist"
+            }
+        }, 
+        "find_associations": {
+            "description": "Find associations by subject, predicate, object and assoc_type. If subject and object are provided (with optional predicate and assoc_type), the directed association is returned. If subject only is provided (with optional predicate and assoc_type), any associations as subject or object are returned. Or provide predicate only. Returns either a list of Association objects or a list of association ids.", 
+            "in": {
+                "anyside": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "anyside", 
+                    "type": "str"
+                }, 
+                "assoc_type": {
+                    "decorators": {}, 
+                    "default": null, 
+                    "description": "", 
+                    "name": "assoc_type", 
+                    "type": "NoneType"
+                }, 
+                "descending": {
+                    "decorators": {}, 
+                    "default": false, 
+                    "description": "", 
+                    "name": "descending", 
+                    "type": "bool"
+                }, 
+                "id_only": {
+                    "decorators": {}, 
+                    "default": false, 
+                    "description": "", 
+                    "name": "id_only", 
+                    "type": "bool"
+                }, 
+                "limit": {
+                    "decorators": {}, 
+                    "default": 0, 
+                    "description": "", 
+                    "name": "limit", 
+                    "type": "int"
+                }, 
+                "object": {
+                    "decorators": {
+                        "ContentType": "Resource,str"
+                    }, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "object", 
+                    "type": "str"
+                }, 
+                "predicate": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "predicate", 
+                    "type": "str"
+                }, 
+                "skip": {
+                    "decorators": {}, 
+                    "default": 0, 
+                    "description": "", 
+                    "name": "skip", 
+                    "type": "int"
+                }, 
+                "subject": {
+                    "decorators": {
+                        "ContentType": "Resource,str"
+                    }, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "subject", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "predicate", 
+                "id_only", 
+                "skip", 
+                "object", 
+                "limit", 
+                "assoc_type", 
+                "descending", 
+                "anyside", 
+                "subject"
+            ], 
+            "out": {
+                "list": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "list", 
+                    "type": "list"
+                }
+            }, 
+            "out_list": [
+                "list"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "missing parameters, or object id field missing in subject or object"
+            }
+        }, 
+        "find_attachments": {
+            "description": "Returns list of attachment resources for given associated resource id. Can limit the number of results and reverse the sort order. Default result order is oldest attachment first.", 
+            "in": {
+                "descending": {
+                    "decorators": {}, 
+                    "default": false, 
+                    "description": "", 
+                    "name": "descending", 
+                    "type": "bool"
+                }, 
+                "id_only": {
+                    "decorators": {}, 
+                    "default": true, 
+                    "description": "", 
+                    "name": "id_only", 
+                    "type": "bool"
+                }, 
+                "include_content": {
+                    "decorators": {}, 
+                    "default": false, 
+                    "description": "", 
+                    "name": "include_content", 
+                    "type": "bool"
+                }, 
+                "keyword": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "keyword", 
+                    "type": "str"
+                }, 
+                "limit": {
+                    "decorators": {}, 
+                    "default": 0, 
+                    "description": "", 
+                    "name": "limit", 
+                    "type": "int"
+                }, 
+                "resource_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "resource_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "descending", 
+                "keyword", 
+                "id_only", 
+                "limit", 
+                "resource_id", 
+                "include_content"
+            ], 
+            "out": {
+                "attachment_list": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "attachment_list", 
+                    "type": "list"
+                }
+            }, 
+            "out_list": [
+                "attachment_list"
+            ], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "resource does not exist"
+            }
+        }, 
+        "find_objects": {
+            "description": "Find objects (or object ids) by association from a given subject or subject id (if str). Returns a tuple (list_of_objects, list_of_associations) if id_only == False, or (list_of_object_ids, list_of_associations) if id_only == True. Predicate and object_type are optional to narrow the search down. Object_type can only be set if predicate is set as well.", 
+            "in": {
+                "descending": {
+                    "decorators": {}, 
+                    "default": false, 
+                    "description": "", 
+                    "name": "descending", 
+                    "type": "bool"
+                }, 
+                "id_only": {
+                    "decorators": {}, 
+                    "default": false, 
+                    "description": "", 
+                    "name": "id_only", 
+                    "type": "bool"
+                }, 
+                "limit": {
+                    "decorators": {}, 
+                    "default": 0, 
+                    "description": "", 
+                    "name": "limit", 
+                    "type": "int"
+                }, 
+                "object_type": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "object_type", 
+                    "type": "str"
+                }, 
+                "predicate": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "predicate", 
+                    "type": "str"
+                }, 
+                "skip": {
+                    "decorators": {}, 
+                    "default": 0, 
+                    "description": "", 
+                    "name": "skip", 
+                    "type": "int"
+                }, 
+                "subject": {
+                    "decorators": {
+                        "ContentType": "Resource,str"
+                    }, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "subject", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "descending", 
+                "predicate", 
+                "limit", 
+                "id_only", 
+                "skip", 
+                "object_type", 
+                "subject"
+            ], 
+            "out": {
+                "list": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "list", 
+                    "type": "list"
+                }
+            }, 
+            "out_list": [
+                "list"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "missing parameters, or object id field missing in subject"
+            }
+        }, 
+        "find_objects_mult": {
+            "description": "Find associations by a list of subjects.", 
+            "in": {
+                "id_only": {
+                    "decorators": {}, 
+                    "default": false, 
+                    "description": "", 
+                    "name": "id_only", 
+                    "type": "bool"
+                }, 
+                "predicate": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "predicate", 
+                    "type": "str"
+                }, 
+                "subjects": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "subjects", 
+                    "type": "list"
+                }
+            }, 
+            "in_list": [
+                "predicate", 
+                "subjects", 
+                "id_only"
+            ], 
+            "out": {
+                "results": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "results", 
+                    "type": "list"
+                }
+            }, 
+            "out_list": [
+                "results"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "subjects is not a list"
+            }
+        }, 
+        "find_resources": {
+            "description": "Utility method for finding resources via various attributes, including resource type, life cycle state and name. Legal attribute combinations are:   restype   lcstate   restype, lcstate   name   name, restype Returns a tuple (list_of_resources, list_of_matches) if id_only == False or (list_of_resource_ids, list_of_matches) otherwise. List_of_matches is a list of dicts with keys (type, lcstate, name, id), providing further information about the matching resources.", 
+            "in": {
+                "id_only": {
+                    "decorators": {}, 
+                    "default": false, 
+                    "description": "", 
+                    "name": "id_only", 
+                    "type": "bool"
+                }, 
+                "lcstate": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "lcstate", 
+                    "type": "str"
+                }, 
+                "name": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "name", 
+                    "type": "str"
+                }, 
+                "restype": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "restype", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "lcstate", 
+                "restype", 
+                "name", 
+                "id_only"
+            ], 
+            "out": {
+                "list": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "list", 
+                    "type": "list"
+                }
+            }, 
+            "out_list": [
+                "list"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "incompatible parameters"
+            }
+        }, 
+        "find_resources_ext": {
+            "description": "Utility method for finding resources via various attributes, including resource type, life cycle state, name, keyword, nested object type. Allows to influence order and number of results. Legal attribute combinations are:   restype (with optional lcstate)   lcstate   keyword (with optional restype)   nested_type (with optional restype)   attribute name (with optional value), only for specially indexed attribute names   alternative id (with optional alternative id namespace)   name (with optional restype) Returns a tuple (list_of_resources, list_of_matches) if id_only == False or (list_of_resource_ids, list_of_matches) otherwise. List_of_matches is a list of dicts with keys (type, lcstate, name, id), providing further information about the matching resources. Note: Only use this operation with keyword args, never with positional args. Signature will be extended.", 
+            "in": {
+                "alt_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "alt_id", 
+                    "type": "str"
+                }, 
+                "alt_id_ns": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "alt_id_ns", 
+                    "type": "str"
+                }, 
+                "attr_name": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "attr_name", 
+                    "type": "str"
+                }, 
+                "attr_value": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "attr_value", 
+                    "type": "str"
+                }, 
+                "descending": {
+                    "decorators": {}, 
+                    "default": false, 
+                    "description": "", 
+                    "name": "descending", 
+                    "type": "bool"
+                }, 
+                "id_only": {
+                    "decorators": {}, 
+                    "default": false, 
+                    "description": "", 
+                    "name": "id_only", 
+                    "type": "bool"
+                }, 
+                "keyword": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "keyword", 
+                    "type": "str"
+                }, 
+                "lcstate": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "lcstate", 
+                    "type": "str"
+                }, 
+                "limit": {
+                    "decorators": {}, 
+                    "default": 0, 
+                    "description": "", 
+                    "name": "limit", 
+                    "type": "int"
+                }, 
+                "name": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "name", 
+                    "type": "str"
+                }, 
+                "nested_type": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "nested_type", 
+                    "type": "str"
+                }, 
+                "query": {
+                    "decorators": {}, 
+                    "default": {}, 
+                    "description": "", 
+                    "name": "query", 
+                    "type": "dict"
+                }, 
+                "restype": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "restype", 
+                    "type": "str"
+                }, 
+                "skip": {
+                    "decorators": {}, 
+                    "default": 0, 
+                    "description": "", 
+                    "name": "skip", 
+                    "type": "int"
+                }
+            }, 
+            "in_list": [
+                "name", 
+                "keyword", 
+                "nested_type", 
+                "skip", 
+                "id_only", 
+                "attr_name", 
+                "restype", 
+                "descending", 
+                "limit", 
+                "attr_value", 
+                "alt_id_ns", 
+                "query", 
+                "alt_id", 
+                "lcstate"
+            ], 
+            "out": {
+                "list": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "list", 
+                    "type": "list"
+                }
+            }, 
+            "out_list": [
+                "list"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "incompatible parameters"
+            }
+        }, 
+        "find_subjects": {
+            "description": "Find subjects (or subject ids) by association from a given object or object id (if str). Returns a tuple (list_of_subjects, list_of_associations) if id_only == False, or (list_of_subject_ids, list_of_associations) if id_only == True. Predicate and subject_type are optional to narrow the search down. Subject_type can only be set if predicate is set as well.", 
+            "in": {
+                "descending": {
+                    "decorators": {}, 
+                    "default": false, 
+                    "description": "", 
+                    "name": "descending", 
+                    "type": "bool"
+                }, 
+                "id_only": {
+                    "decorators": {}, 
+                    "default": false, 
+                    "description": "", 
+                    "name": "id_only", 
+                    "type": "bool"
+                }, 
+                "limit": {
+                    "decorators": {}, 
+                    "default": 0, 
+                    "description": "", 
+                    "name": "limit", 
+                    "type": "int"
+                }, 
+                "object": {
+                    "decorators": {
+                        "ContentType": "Resource,str"
+                    }, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "object", 
+                    "type": "str"
+                }, 
+                "predicate": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "predicate", 
+                    "type": "str"
+                }, 
+                "skip": {
+                    "decorators": {}, 
+                    "default": 0, 
+                    "description": "", 
+                    "name": "skip", 
+                    "type": "int"
+                }, 
+                "subject_type": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "subject_type", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "descending", 
+                "predicate", 
+                "subject_type", 
+                "limit", 
+                "id_only", 
+                "skip", 
+                "object"
+            ], 
+            "out": {
+                "list": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "list", 
+                    "type": "list"
+                }
+            }, 
+            "out_list": [
+                "list"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "missing parameters, or object id field missing in object"
+            }
+        }, 
+        "find_subjects_mult": {
+            "description": "Find associations by a list of objects.", 
+            "in": {
+                "id_only": {
+                    "decorators": {}, 
+                    "default": false, 
+                    "description": "", 
+                    "name": "id_only", 
+                    "type": "bool"
+                }, 
+                "objects": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "objects", 
+                    "type": "list"
+                }, 
+                "predicate": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "predicate", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "predicate", 
+                "objects", 
+                "id_only"
+            ], 
+            "out": {
+                "results": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "results", 
+                    "type": "list"
+                }
+            }, 
+            "out_list": [
+                "results"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "subjects is not a list"
+            }
+        }, 
+        "get_association": {
+            "description": "Read the association specified by the exact subject, predicate, object and type tuple.  Throws exception if association not found or more than one association satisfies the tuple.", 
+            "in": {
+                "assoc_type": {
+                    "decorators": {}, 
+                    "default": null, 
+                    "description": "", 
+                    "name": "assoc_type", 
+                    "type": "NoneType"
+                }, 
+                "id_only": {
+                    "decorators": {}, 
+                    "default": false, 
+                    "description": "", 
+                    "name": "id_only", 
+                    "type": "bool"
+                }, 
+                "object": {
+                    "decorators": {
+                        "ContentType": "Resource,str"
+                    }, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "object", 
+                    "type": "str"
+                }, 
+                "predicate": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "predicate", 
+                    "type": "str"
+                }, 
+                "subject": {
+                    "decorators": {
+                        "ContentType": "Resource,str"
+                    }, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "subject", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "predicate", 
+                "object", 
+                "subject", 
+                "assoc_type", 
+                "id_only"
+            ], 
+            "out": {
+                "association": {
+                    "decorators": {}, 
+                    "default": {}, 
+                    "description": "", 
+                    "name": "association", 
+                    "type": "dict"
+                }
+            }, 
+            "out_list": [
+                "association"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "missing parameters, or object id field missing in subject or object", 
+                "Inconsistent": "multiple associations satisfy the subject, predicate, object tuple", 
+                "NotFound": "association does not exist"
+            }
+        }, 
+        "lcs_delete": {
+            "description": "Sets resource lifecycle state to DELETED. Throws exception if object does not exist or state transition is not possible.", 
+            "in": {
+                "resource_id": {
+                    "decorators": {
+                        "ResourceId": ""
+                    }, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "resource_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "resource_id"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object does not exist"
+            }
+        }, 
+        "read": {
+            "description": "Read the latest, or optionally the specific, version of resource with id passed in the object_id param. Throws exception if object not found.", 
+            "in": {
+                "object_id": {
+                    "decorators": {
+                        "ResourceId": ""
+                    }, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "object_id", 
+                    "type": "str"
+                }, 
+                "rev_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "rev_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "object_id", 
+                "rev_id"
+            ], 
+            "out": {
+                "object": {
+                    "decorators": {}, 
+                    "default": {}, 
+                    "description": "", 
+                    "name": "object", 
+                    "type": "dict"
+                }
+            }, 
+            "out_list": [
+                "object"
+            ], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "read_attachment": {
+            "description": "Reads an attachment by id, excludes content unless indicated otherwise.", 
+            "in": {
+                "attachment_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "attachment_id", 
+                    "type": "str"
+                }, 
+                "include_content": {
+                    "decorators": {}, 
+                    "default": false, 
+                    "description": "", 
+                    "name": "include_content", 
+                    "type": "bool"
+                }
+            }, 
+            "in_list": [
+                "attachment_id", 
+                "include_content"
+            ], 
+            "out": {
+                "attachment": {
+                    "decorators": {}, 
+                    "default": "!Attachment", 
+                    "description": "", 
+                    "name": "attachment", 
+                    "type": "Attachment"
+                }
+            }, 
+            "out_list": [
+                "attachment"
+            ], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "attachment does not exist"
+            }
+        }, 
+        "read_mult": {
+            "description": "Read the latest resources specified in the paramter.", 
+            "in": {
+                "object_ids": {
+                    "decorators": {
+                        "ResourceId": ""
+                    }, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "object_ids", 
+                    "type": "list"
+                }
+            }, 
+            "in_list": [
+                "object_ids"
+            ], 
+            "out": {
+                "objects": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "objects", 
+                    "type": "list"
+                }
+            }, 
+            "out_list": [
+                "objects"
+            ], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "objects do not exist."
+            }
+        }, 
+        "read_object": {
+            "description": "Returns the object (or object id) by association from a given subject or subject id (if str). Predicate and object_type are optional to narrow the search down. Object_type can only be set if predicate is set as well. Alternatively, an association (or association id) can be given. If no object matches the criteria, NotFound is raised. If more than one object match the criteria, Inconsistent is raised.", 
+            "in": {
+                "assoc": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "assoc", 
+                    "type": "str"
+                }, 
+                "id_only": {
+                    "decorators": {}, 
+                    "default": false, 
+                    "description": "", 
+                    "name": "id_only", 
+                    "type": "bool"
+                }, 
+                "object_type": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "object_type", 
+                    "type": "str"
+                }, 
+                "predicate": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "predicate", 
+                    "type": "str"
+                }, 
+                "subject": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "subject", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "predicate", 
+                "object_type", 
+                "assoc", 
+                "subject", 
+                "id_only"
+            ], 
+            "out": {
+                "list": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "list", 
+                    "type": "list"
+                }
+            }, 
+            "out_list": [
+                "list"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "missing parameters, or object id field missing in subject", 
+                "Inconsistent": "more than one object matching the given criteria", 
+                "NotFound": "object not found"
+            }
+        }, 
+        "read_subject": {
+            "description": "Returns the subject (or subject id) by association from a given object or object id (if str). Predicate and subject_type are optional to narrow the search down. Subject_type can only be set if predicate is set as well. Alternatively, an association (or association id) can be given. If no subject matches the criteria, NotFound is raised. If more than one subject match the criteria, Inconsistent is raised.", 
+            "in": {
+                "assoc": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "assoc", 
+                    "type": "str"
+                }, 
+                "id_only": {
+                    "decorators": {}, 
+                    "default": false, 
+                    "description": "", 
+                    "name": "id_only", 
+                    "type": "bool"
+                }, 
+                "object": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "object", 
+                    "type": "str"
+                }, 
+                "predicate": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "predicate", 
+                    "type": "str"
+                }, 
+                "subject_type": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "subject_type", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "predicate", 
+                "subject_type", 
+                "assoc", 
+                "object", 
+                "id_only"
+            ], 
+            "out": {
+                "list": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "list", 
+                    "type": "list"
+                }
+            }, 
+            "out_list": [
+                "list"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "missing parameters, or object id field missing in object", 
+                "Inconsistent": "more than one subject matching the given criteria", 
+                "NotFound": "subject not found"
+            }
+        }, 
+        "retire": {
+            "description": "Sets resource lifecycle state to RETIRED. Throws exception if object does not exist or state transition is not possible.", 
+            "in": {
+                "resource_id": {
+                    "decorators": {
+                        "ResourceId": ""
+                    }, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "resource_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "resource_id"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object does not exist"
+            }
+        }, 
+        "set_lifecycle_state": {
+            "description": "Alter object lifecycle to set to give lifecycle state. Throws exception if resource object does not exist or given state is unknown/illegal. The optional lcstate argument asserts that the current life cycle state matches.", 
+            "in": {
+                "resource_id": {
+                    "decorators": {
+                        "ResourceId": ""
+                    }, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "resource_id", 
+                    "type": "str"
+                }, 
+                "target_lcstate": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "target_lcstate", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "target_lcstate", 
+                "resource_id"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "target state unknown or resource type has no lifecycle", 
+                "Conflict": "race condition while trying to update", 
+                "NotFound": "resource object does not exist"
+            }
+        }, 
+        "update": {
+            "description": "Persist new version of resource. Throws exception if previous version of object does not exist or object passed is not based on the latest persisted version.", 
+            "in": {
+                "object": {
+                    "decorators": {
+                        "ResourceId": "_id"
+                    }, 
+                    "default": "!Resource", 
+                    "description": "", 
+                    "name": "object", 
+                    "type": "Resource"
+                }
+            }, 
+            "in_list": [
+                "object"
+            ], 
+            "out": {
+                "tuple": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "tuple", 
+                    "type": "list"
+                }
+            }, 
+            "out_list": [
+                "tuple"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "object does not have required _id or _rev or lcstate was modified compared to persisted object version", 
+                "Conflict": "object not based on latest persisted object version", 
+                "NotFound": "object with specified id does not exist"
+            }
+        }
+    }, 
+    "spec": ""
+}"""
+
+
+class ResourceRegistryServiceDependentClients(BaseClients):
+    def __init__(self, process=None):
+        self._process = process
+        BaseClients.__init__(self)
+
+
+
+
+class IResourceRegistryService(Interface):
+    """None
+    """
+
+    def delete_association(association=''):
+        """For now, permanently delete an association between two resources (IonObjects).
+        Throws exception if association does not exist.
+
+        @param association    str
+        @throws NotFound    association does not exist
+        """
+        pass
+
+    def find_objects(descending=False, predicate='', limit=0, id_only=False, skip=0, object_type='', subject=''):
+        """Find objects (or object ids) by association from a given subject or
+        subject id (if str). Returns a tuple (list_of_objects, list_of_associations)
+        if id_only == False, or (list_of_object_ids, list_of_associations)
+        if id_only == True. Predicate and object_type are optional to narrow the
+        search down. Object_type can only be set if predicate is set as well.
+
+        @param descending    bool
+        @param predicate    str
+        @param limit    int
+        @param id_only    bool
+        @param skip    int
+        @param object_type    str
+        @param subject    str
+        @retval list    list
+        @throws BadRequest    missing parameters, or object id field missing in subject
+        """
+        pass
+
+    def read_subject(predicate='', subject_type='', assoc='', object='', id_only=False):
+        """Returns the subject (or subject id) by association from a given object or
+        object id (if str). Predicate and subject_type are optional to narrow the
+        search down. Subject_type can only be set if predicate is set as well.
+        Alternatively, an association (or association id) can be given.
+        If no subject matches the criteria, NotFound is raised. If more than one
+        subject match the criteria, Inconsistent is raised.
+
+        @param predicate    str
+        @param subject_type    str
+        @param assoc    str
+        @param object    str
+        @param id_only    bool
+        @retval list    list
+        @throws NotFound    subject not found
+        @throws Inconsistent    more than one subject matching the given criteria
+        @throws BadRequest    missing parameters, or object id field missing in object
+        """
+        pass
+
+    def lcs_delete(resource_id=''):
+        """Sets resource lifecycle state to DELETED.
+        Throws exception if object does not exist or state transition is not possible.
+
+        @param resource_id    str
+        @throws NotFound    object does not exist
+        """
+        pass
+
+    def find_resources_ext(name='', keyword='', nested_type='', skip=0, id_only=False, attr_name='', restype='', descending=False, limit=0, attr_value='', alt_id_ns='', query=None, alt_id='', lcstate=''):
+        """Utility method for finding resources via various attributes, including resource type,
+        life cycle state, name, keyword, nested object type. Allows to influence order and number
+        of results. Legal attribute combinations are:
+          restype (with optional lcstate)
+          lcstate
+          keyword (with optional restype)
+          nested_type (with optional restype)
+          attribute name (with optional value), only for specially indexed attribute names
+          alternative id (with optional alternative id namespace)
+          name (with optional restype)
+        Returns a tuple (list_of_resources, list_of_matches) if id_only == False or
+        (list_of_resource_ids, list_of_matches) otherwise. List_of_matches is a list of
+        dicts with keys (type, lcstate, name, id), providing further information about the
+        matching resources.
+        Note: Only use this operation with keyword args, never with positional args. Signature will be extended.
+
+        @param name    str
+        @param keyword    str
+        @param nested_type    str
+        @param skip    int
+        @param id_only    bool
+        @param attr_name    str
+        @param restype    str
+        @param descending    bool
+        @param limit    int
+        @param attr_value    str
+        @param alt_id_ns    str
+        @param query    dict
+        @param alt_id    str
+        @param lcstate    str
+        @retval list    list
+        @throws BadRequest    incompatible parameters
+        """
+        pass
+
+    def read(object_id='', rev_id=''):
+        """Read the latest, or optionally the specific, version of resource
+        with id passed in the object_id param. Throws exception if
+        object not found.
+
+        @param object_id    str
+        @param rev_id    str
+        @retval object    dict
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def retire(resource_id=''):
+        """Sets resource lifecycle state to RETIRED.
+        Throws exception if object does not exist or state transition is not possible.
+
+        @param resource_id    str
+        @throws NotFound    object does not exist
+        """
+        pass
+
+    def update(object=None):
+        """Persist new version of resource. Throws exception if previous
+        version of object does not exist or object passed is not based
+        on the latest persisted version.
+
+        @param object    Resource
+        @retval tuple    list
+        @throws NotFound    object with specified id does not exist
+        @throws Conflict    object not based on latest persisted object version
+        @throws BadRequest    object does not have required _id or _rev or lcstate was modified compared to persisted object version
+        """
+        pass
+
+    def find_subjects_mult(predicate='', objects=None, id_only=False):
+        """Find associations by a list of objects.
+
+        @param predicate    str
+        @param objects    list
+        @param id_only    bool
+        @retval results    list
+        @throws BadRequest    subjects is not a list
+        """
+        pass
+
+    def read_mult(object_ids=None):
+        """Read the latest resources specified in the paramter.
+
+        @param object_ids    list
+        @retval objects    list
+        @throws NotFound    objects do not exist.
+        """
+        pass
+
+    def create_association(predicate='', object='', assoc_type=None, subject=''):
+        """Create an association between subject and object resources (IonObjects).
+        Subject and object values can be passed as actual object instances or just
+        object ids.  Valid predicates can be found in res/config/associations.yml.
+        Subject and object must be of the proper types for the predicate or
+        an exception will be thrown.
+        Assoc_type is deprecated.
+
+        @param predicate    str
+        @param object    str
+        @param assoc_type    NoneType
+        @param subject    str
+        @retval tuple    list
+        @throws NotFound    subject or object does not exist
+        @throws BadRequest    subject, predicate or object parameter missing, unknown value passed for the assoc_type parameter, predicate is unknown, subject or object are invalid types for predicate, or subject or object do not have _id field
+        """
+        pass
+
+    def find_objects_mult(predicate='', subjects=None, id_only=False):
+        """Find associations by a list of subjects.
+
+        @param predicate    str
+        @param subjects    list
+        @param id_only    bool
+        @retval results    list
+        @throws BadRequest    subjects is not a list
+        """
+        pass
+
+    def execute_lifecycle_transition(transition_event='', resource_id=''):
+        """Alter object lifecycle according to given transition event. Throws exception
+        if resource object does not exist or given transition_event is unknown/illegal.
+        The new life cycle state after applying the transition is returned.
+
+        @param transition_event    str
+        @param resource_id    str
+        @retval lcstate    str
+        @throws NotFound    resource object does not exist
+        @throws BadRequest    transition event unknown or illegal in current state; resource type has no lifecycle
+        @throws Conflict    race condition while trying to update
+        """
+        pass
+
+    def get_association(predicate='', object='', subject='', assoc_type=None, id_only=False):
+        """Read the association specified by the exact subject, predicate, object
+        and type tuple.  Throws exception if association not found or more than one
+        association satisfies the tuple.
+
+        @param predicate    str
+        @param object    str
+        @param subject    str
+        @param assoc_type    NoneType
+        @param id_only    bool
+        @retval association    dict
+        @throws NotFound    association does not exist
+        @throws Inconsistent    multiple associations satisfy the subject, predicate, object tuple
+        @throws BadRequest    missing parameters, or object id field missing in subject or object
+        """
+        pass
+
+    def find_attachments(descending=False, keyword='', id_only=True, limit=0, resource_id='', include_content=False):
+        """Returns list of attachment resources for given associated resource id.
+        Can limit the number of results and reverse the sort order. Default result order is oldest
+        attachment first.
+
+        @param descending    bool
+        @param keyword    str
+        @param id_only    bool
+        @param limit    int
+        @param resource_id    str
+        @param include_content    bool
+        @retval attachment_list    list
+        @throws NotFound    resource does not exist
+        """
+        pass
+
+    def set_lifecycle_state(target_lcstate='', resource_id=''):
+        """Alter object lifecycle to set to give lifecycle state. Throws exception
+        if resource object does not exist or given state is unknown/illegal.
+        The optional lcstate argument asserts that the current life cycle state matches.
+
+        @param target_lcstate    str
+        @param resource_id    str
+        @throws NotFound    resource object does not exist
+        @throws BadRequest    target state unknown or resource type has no lifecycle
+        @throws Conflict    race condition while trying to update
+        """
+        pass
+
+    def find_subjects(descending=False, predicate='', subject_type='', limit=0, id_only=False, skip=0, object=''):
+        """Find subjects (or subject ids) by association from a given object or
+        object id (if str). Returns a tuple (list_of_subjects, list_of_associations)
+        if id_only == False, or (list_of_subject_ids, list_of_associations)
+        if id_only == True. Predicate and subject_type are optional to narrow the
+        search down. Subject_type can only be set if predicate is set as well.
+
+        @param descending    bool
+        @param predicate    str
+        @param subject_type    str
+        @param limit    int
+        @param id_only    bool
+        @param skip    int
+        @param object    str
+        @retval list    list
+        @throws BadRequest    missing parameters, or object id field missing in object
+        """
+        pass
+
+    def read_object(predicate='', object_type='', assoc='', subject='', id_only=False):
+        """Returns the object (or object id) by association from a given subject or
+        subject id (if str). Predicate and object_type are optional to narrow the
+        search down. Object_type can only be set if predicate is set as well.
+        Alternatively, an association (or association id) can be given.
+        If no object matches the criteria, NotFound is raised. If more than one
+        object match the criteria, Inconsistent is raised.
+
+        @param predicate    str
+        @param object_type    str
+        @param assoc    str
+        @param subject    str
+        @param id_only    bool
+        @retval list    list
+        @throws NotFound    object not found
+        @throws Inconsistent    more than one object matching the given criteria
+        @throws BadRequest    missing parameters, or object id field missing in subject
+        """
+        pass
+
+    def delete_attachment(attachment_id=''):
+        """Delete an attachment resource and resource associations.
+
+        @param attachment_id    str
+        @throws NotFound    attachment does not exist
+        """
+        pass
+
+    def read_attachment(attachment_id='', include_content=False):
+        """Reads an attachment by id, excludes content unless indicated otherwise.
+
+        @param attachment_id    str
+        @param include_content    bool
+        @retval attachment    Attachment
+        @throws NotFound    attachment does not exist
+        """
+        pass
+
+    def create(object=None):
+        """Persist an instance of the resource passed in the object param.
+        Returns a tuple (_id, _rev) for the persistend object.
+
+        @param object    Resource
+        @retval tuple    list
+        @throws BadRequest    object has _id field
+        """
+        pass
+
+    def find_resources(lcstate='', restype='', name='', id_only=False):
+        """Utility method for finding resources via various attributes, including resource type,
+        life cycle state and name. Legal attribute combinations are:
+          restype
+          lcstate
+          restype, lcstate
+          name
+          name, restype
+        Returns a tuple (list_of_resources, list_of_matches) if id_only == False or
+        (list_of_resource_ids, list_of_matches) otherwise. List_of_matches is a list of
+        dicts with keys (type, lcstate, name, id), providing further information about the
+        matching resources.
+
+        @param lcstate    str
+        @param restype    str
+        @param name    str
+        @param id_only    bool
+        @retval list    list
+        @throws BadRequest    incompatible parameters
+        """
+        pass
+
+    def create_attachment(attachment=None, resource_id=''):
+        """Create an Attachment resource associated with another resource.
+        If no resource_id is provided, the attachment is created standalone.
+
+        @param attachment    Attachment
+        @param resource_id    str
+        @retval attachment_id    str
+        @throws NotFound    resource object does not exist if resource_id given
+        @throws BadRequest    bad attachment type or content
+        """
+        pass
+
+    def find_associations(predicate='', id_only=False, skip=0, object='', limit=0, assoc_type=None, descending=False, anyside='', subject=''):
+        """Find associations by subject, predicate, object and assoc_type.
+        If subject and object are provided (with optional predicate and assoc_type),
+        the directed association is returned.
+        If subject only is provided (with optional predicate and assoc_type), any associations
+        as subject or object are returned.
+        Or provide predicate only. Returns either a list
+        of Association objects or a list of association ids.
+
+        @param predicate    str
+        @param id_only    bool
+        @param skip    int
+        @param object    str
+        @param limit    int
+        @param assoc_type    NoneType
+        @param descending    bool
+        @param anyside    str
+        @param subject    str
+        @retval list    list
+        @throws BadRequest    missing parameters, or object id field missing in subject or object
+        """
+        pass
+
+    def create_association_mult(assoc_list=None):
+        """Create multiple associations between subject and object resources (IonObjects).
+        Subject and object values can be passed as actual object instances or just
+        object ids.  Valid predicates can be found in res/config/associations.yml.
+        Subject and object must be of the proper types for the predicate or
+        an exception will be thrown.
+
+        @param assoc_list    list
+        @retval tuple    list
+        @throws NotFound    subject or object does not exist
+        @throws BadRequest    subject, predicate or object parameter missing, predicate is unknown, subject or object are invalid types for predicate, or subject or object do not have _id field
+        """
+        pass
+
+    def delete(object_id=''):
+        """Permanently delete object in datastores.
+        Throws exception if object does not exist.
+
+        @param object_id    str
+        @throws NotFound    object does not exist
+        """
+        pass
+
+class BaseResourceRegistryService(BaseService):
+    implements(IResourceRegistryService)
+    """None
+    """
+    SCHEMA_JSON=SCHEMA_JSON
+    name = 'resource_registry'
+    dependencies = []
+
+    def __init__(self, *args, **kwargs):
+        BaseService.__init__(self, *args, **kwargs)
+        self.clients = ResourceRegistryServiceDependentClients(process=self)
+
+
+    def delete_association(self, association=''):
+        """For now, permanently delete an association between two resources (IonObjects).
+        Throws exception if association does not exist.
+
+        @param association    str
+        @throws NotFound    association does not exist
+        """
+        pass
+
+    def find_objects(self, descending=False, predicate='', limit=0, id_only=False, skip=0, object_type='', subject=''):
+        """Find objects (or object ids) by association from a given subject or
+        subject id (if str). Returns a tuple (list_of_objects, list_of_associations)
+        if id_only == False, or (list_of_object_ids, list_of_associations)
+        if id_only == True. Predicate and object_type are optional to narrow the
+        search down. Object_type can only be set if predicate is set as well.
+
+        @param descending    bool
+        @param predicate    str
+        @param limit    int
+        @param id_only    bool
+        @param skip    int
+        @param object_type    str
+        @param subject    str
+        @retval list    list
+        @throws BadRequest    missing parameters, or object id field missing in subject
+        """
+        pass
+
+    def read_subject(self, predicate='', subject_type='', assoc='', object='', id_only=False):
+        """Returns the subject (or subject id) by association from a given object or
+        object id (if str). Predicate and subject_type are optional to narrow the
+        search down. Subject_type can only be set if predicate is set as well.
+        Alternatively, an association (or association id) can be given.
+        If no subject matches the criteria, NotFound is raised. If more than one
+        subject match the criteria, Inconsistent is raised.
+
+        @param predicate    str
+        @param subject_type    str
+        @param assoc    str
+        @param object    str
+        @param id_only    bool
+        @retval list    list
+        @throws NotFound    subject not found
+        @throws Inconsistent    more than one subject matching the given criteria
+        @throws BadRequest    missing parameters, or object id field missing in object
+        """
+        pass
+
+    def lcs_delete(self, resource_id=''):
+        """Sets resource lifecycle state to DELETED.
+        Throws exception if object does not exist or state transition is not possible.
+
+        @param resource_id    str
+        @throws NotFound    object does not exist
+        """
+        pass
+
+    def find_resources_ext(self, name='', keyword='', nested_type='', skip=0, id_only=False, attr_name='', restype='', descending=False, limit=0, attr_value='', alt_id_ns='', query=None, alt_id='', lcstate=''):
+        """Utility method for finding resources via various attributes, including resource type,
+        life cycle state, name, keyword, nested object type. Allows to influence order and number
+        of results. Legal attribute combinations are:
+          restype (with optional lcstate)
+          lcstate
+          keyword (with optional restype)
+          nested_type (with optional restype)
+          attribute name (with optional value), only for specially indexed attribute names
+          alternative id (with optional alternative id namespace)
+          name (with optional restype)
+        Returns a tuple (list_of_resources, list_of_matches) if id_only == False or
+        (list_of_resource_ids, list_of_matches) otherwise. List_of_matches is a list of
+        dicts with keys (type, lcstate, name, id), providing further information about the
+        matching resources.
+        Note: Only use this operation with keyword args, never with positional args. Signature will be extended.
+
+        @param name    str
+        @param keyword    str
+        @param nested_type    str
+        @param skip    int
+        @param id_only    bool
+        @param attr_name    str
+        @param restype    str
+        @param descending    bool
+        @param limit    int
+        @param attr_value    str
+        @param alt_id_ns    str
+        @param query    dict
+        @param alt_id    str
+        @param lcstate    str
+        @retval list    list
+        @throws BadRequest    incompatible parameters
+        """
+        pass
+
+    def read(self, object_id='', rev_id=''):
+        """Read the latest, or optionally the specific, version of resource
+        with id passed in the object_id param. Throws exception if
+        object not found.
+
+        @param object_id    str
+        @param rev_id    str
+        @retval object    dict
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def retire(self, resource_id=''):
+        """Sets resource lifecycle state to RETIRED.
+        Throws exception if object does not exist or state transition is not possible.
+
+        @param resource_id    str
+        @throws NotFound    object does not exist
+        """
+        pass
+
+    def update(self, object=None):
+        """Persist new version of resource. Throws exception if previous
+        version of object does not exist or object passed is not based
+        on the latest persisted version.
+
+        @param object    Resource
+        @retval tuple    list
+        @throws NotFound    object with specified id does not exist
+        @throws Conflict    object not based on latest persisted object version
+        @throws BadRequest    object does not have required _id or _rev or lcstate was modified compared to persisted object version
+        """
+        pass
+
+    def find_subjects_mult(self, predicate='', objects=None, id_only=False):
+        """Find associations by a list of objects.
+
+        @param predicate    str
+        @param objects    list
+        @param id_only    bool
+        @retval results    list
+        @throws BadRequest    subjects is not a list
+        """
+        pass
+
+    def read_mult(self, object_ids=None):
+        """Read the latest resources specified in the paramter.
+
+        @param object_ids    list
+        @retval objects    list
+        @throws NotFound    objects do not exist.
+        """
+        pass
+
+    def create_association(self, predicate='', object='', assoc_type=None, subject=''):
+        """Create an association between subject and object resources (IonObjects).
+        Subject and object values can be passed as actual object instances or just
+        object ids.  Valid predicates can be found in res/config/associations.yml.
+        Subject and object must be of the proper types for the predicate or
+        an exception will be thrown.
+        Assoc_type is deprecated.
+
+        @param predicate    str
+        @param object    str
+        @param assoc_type    NoneType
+        @param subject    str
+        @retval tuple    list
+        @throws NotFound    subject or object does not exist
+        @throws BadRequest    subject, predicate or object parameter missing, unknown value passed for the assoc_type parameter, predicate is unknown, subject or object are invalid types for predicate, or subject or object do not have _id field
+        """
+        pass
+
+    def find_objects_mult(self, predicate='', subjects=None, id_only=False):
+        """Find associations by a list of subjects.
+
+        @param predicate    str
+        @param subjects    list
+        @param id_only    bool
+        @retval results    list
+        @throws BadRequest    subjects is not a list
+        """
+        pass
+
+    def execute_lifecycle_transition(self, transition_event='', resource_id=''):
+        """Alter object lifecycle according to given transition event. Throws exception
+        if resource object does not exist or given transition_event is unknown/illegal.
+        The new life cycle state after applying the transition is returned.
+
+        @param transition_event    str
+        @param resource_id    str
+        @retval lcstate    str
+        @throws NotFound    resource object does not exist
+        @throws BadRequest    transition event unknown or illegal in current state; resource type has no lifecycle
+        @throws Conflict    race condition while trying to update
+        """
+        pass
+
+    def get_association(self, predicate='', object='', subject='', assoc_type=None, id_only=False):
+        """Read the association specified by the exact subject, predicate, object
+        and type tuple.  Throws exception if association not found or more than one
+        association satisfies the tuple.
+
+        @param predicate    str
+        @param object    str
+        @param subject    str
+        @param assoc_type    NoneType
+        @param id_only    bool
+        @retval association    dict
+        @throws NotFound    association does not exist
+        @throws Inconsistent    multiple associations satisfy the subject, predicate, object tuple
+        @throws BadRequest    missing parameters, or object id field missing in subject or object
+        """
+        pass
+
+    def find_attachments(self, descending=False, keyword='', id_only=True, limit=0, resource_id='', include_content=False):
+        """Returns list of attachment resources for given associated resource id.
+        Can limit the number of results and reverse the sort order. Default result order is oldest
+        attachment first.
+
+        @param descending    bool
+        @param keyword    str
+        @param id_only    bool
+        @param limit    int
+        @param resource_id    str
+        @param include_content    bool
+        @retval attachment_list    list
+        @throws NotFound    resource does not exist
+        """
+        pass
+
+    def set_lifecycle_state(self, target_lcstate='', resource_id=''):
+        """Alter object lifecycle to set to give lifecycle state. Throws exception
+        if resource object does not exist or given state is unknown/illegal.
+        The optional lcstate argument asserts that the current life cycle state matches.
+
+        @param target_lcstate    str
+        @param resource_id    str
+        @throws NotFound    resource object does not exist
+        @throws BadRequest    target state unknown or resource type has no lifecycle
+        @throws Conflict    race condition while trying to update
+        """
+        pass
+
+    def find_subjects(self, descending=False, predicate='', subject_type='', limit=0, id_only=False, skip=0, object=''):
+        """Find subjects (or subject ids) by association from a given object or
+        object id (if str). Returns a tuple (list_of_subjects, list_of_associations)
+        if id_only == False, or (list_of_subject_ids, list_of_associations)
+        if id_only == True. Predicate and subject_type are optional to narrow the
+        search down. Subject_type can only be set if predicate is set as well.
+
+        @param descending    bool
+        @param predicate    str
+        @param subject_type    str
+        @param limit    int
+        @param id_only    bool
+        @param skip    int
+        @param object    str
+        @retval list    list
+        @throws BadRequest    missing parameters, or object id field missing in object
+        """
+        pass
+
+    def read_object(self, predicate='', object_type='', assoc='', subject='', id_only=False):
+        """Returns the object (or object id) by association from a given subject or
+        subject id (if str). Predicate and object_type are optional to narrow the
+        search down. Object_type can only be set if predicate is set as well.
+        Alternatively, an association (or association id) can be given.
+        If no object matches the criteria, NotFound is raised. If more than one
+        object match the criteria, Inconsistent is raised.
+
+        @param predicate    str
+        @param object_type    str
+        @param assoc    str
+        @param subject    str
+        @param id_only    bool
+        @retval list    list
+        @throws NotFound    object not found
+        @throws Inconsistent    more than one object matching the given criteria
+        @throws BadRequest    missing parameters, or object id field missing in subject
+        """
+        pass
+
+    def delete_attachment(self, attachment_id=''):
+        """Delete an attachment resource and resource associations.
+
+        @param attachment_id    str
+        @throws NotFound    attachment does not exist
+        """
+        pass
+
+    def read_attachment(self, attachment_id='', include_content=False):
+        """Reads an attachment by id, excludes content unless indicated otherwise.
+
+        @param attachment_id    str
+        @param include_content    bool
+        @retval attachment    Attachment
+        @throws NotFound    attachment does not exist
+        """
+        pass
+
+    def create(self, object=None):
+        """Persist an instance of the resource passed in the object param.
+        Returns a tuple (_id, _rev) for the persistend object.
+
+        @param object    Resource
+        @retval tuple    list
+        @throws BadRequest    object has _id field
+        """
+        pass
+
+    def find_resources(self, lcstate='', restype='', name='', id_only=False):
+        """Utility method for finding resources via various attributes, including resource type,
+        life cycle state and name. Legal attribute combinations are:
+          restype
+          lcstate
+          restype, lcstate
+          name
+          name, restype
+        Returns a tuple (list_of_resources, list_of_matches) if id_only == False or
+        (list_of_resource_ids, list_of_matches) otherwise. List_of_matches is a list of
+        dicts with keys (type, lcstate, name, id), providing further information about the
+        matching resources.
+
+        @param lcstate    str
+        @param restype    str
+        @param name    str
+        @param id_only    bool
+        @retval list    list
+        @throws BadRequest    incompatible parameters
+        """
+        pass
+
+    def create_attachment(self, attachment=None, resource_id=''):
+        """Create an Attachment resource associated with another resource.
+        If no resource_id is provided, the attachment is created standalone.
+
+        @param attachment    Attachment
+        @param resource_id    str
+        @retval attachment_id    str
+        @throws NotFound    resource object does not exist if resource_id given
+        @throws BadRequest    bad attachment type or content
+        """
+        pass
+
+    def find_associations(self, predicate='', id_only=False, skip=0, object='', limit=0, assoc_type=None, descending=False, anyside='', subject=''):
+        """Find associations by subject, predicate, object and assoc_type.
+        If subject and object are provided (with optional predicate and assoc_type),
+        the directed association is returned.
+        If subject only is provided (with optional predicate and assoc_type), any associations
+        as subject or object are returned.
+        Or provide predicate only. Returns either a list
+        of Association objects or a list of association ids.
+
+        @param predicate    str
+        @param id_only    bool
+        @param skip    int
+        @param object    str
+        @param limit    int
+        @param assoc_type    NoneType
+        @param descending    bool
+        @param anyside    str
+        @param subject    str
+        @retval list    list
+        @throws BadRequest    missing parameters, or object id field missing in subject or object
+        """
+        pass
+
+    def create_association_mult(self, assoc_list=None):
+        """Create multiple associations between subject and object resources (IonObjects).
+        Subject and object values can be passed as actual object instances or just
+        object ids.  Valid predicates can be found in res/config/associations.yml.
+        Subject and object must be of the proper types for the predicate or
+        an exception will be thrown.
+
+        @param assoc_list    list
+        @retval tuple    list
+        @throws NotFound    subject or object does not exist
+        @throws BadRequest    subject, predicate or object parameter missing, predicate is unknown, subject or object are invalid types for predicate, or subject or object do not have _id field
+        """
+        pass
+
+    def delete(self, object_id=''):
+        """Permanently delete object in datastores.
+        Throws exception if object does not exist.
+
+        @param object_id    str
+        @throws NotFound    object does not exist
+        """
+        pass
+
+
+
+
+class ResourceRegistryServiceClientMixin(object):
+    """
+    # @todo Fill in client documentation.
+    """
+    #implements(IResourceRegistryService)
+
+
+    def delete_association(self, association='', headers=None, timeout=None):
+        """For now, permanently delete an association between two resources (IonObjects).
+        Throws exception if association does not exist.
+
+        @param association    str
+        @throws NotFound    association does not exist
+        """
+        return self.request(IonObject('resource_registry_delete_association_in', **{'association': association}), op='delete_association', headers=headers, timeout=timeout)
+
+    def find_objects(self, descending=False, predicate='', limit=0, id_only=False, skip=0, object_type='', subject='', headers=None, timeout=None):
+        """Find objects (or object ids) by association from a given subject or
+        subject id (if str). Returns a tuple (list_of_objects, list_of_associations)
+        if id_only == False, or (list_of_object_ids, list_of_associations)
+        if id_only == True. Predicate and object_type are optional to narrow the
+        search down. Object_type can only be set if predicate is set as well.
+
+        @param descending    bool
+        @param predicate    str
+        @param limit    int
+        @param id_only    bool
+        @param skip    int
+        @param object_type    str
+        @param subject    str
+        @retval list    list
+        @throws BadRequest    missing parameters, or object id field missing in subject
+        """
+        return self.request(IonObject('resource_registry_find_objects_in', **{'descending': descending, 'predicate': predicate, 'limit': limit, 'id_only': id_only, 'skip': skip, 'object_type': object_type, 'subject': subject}), op='find_objects', headers=headers, timeout=timeout)
+
+    def read_subject(self, predicate='', subject_type='', assoc='', object='', id_only=False, headers=None, timeout=None):
+        """Returns the subject (or subject id) by association from a given object or
+        object id (if str). Predicate and subject_type are optional to narrow the
+        search down. Subject_type can only be set if predicate is set as well.
+        Alternatively, an association (or association id) can be given.
+        If no subject matches the criteria, NotFound is raised. If more than one
+        subject match the criteria, Inconsistent is raised.
+
+        @param predicate    str
+        @param subject_type    str
+        @param assoc    str
+        @param object    str
+        @param id_only    bool
+        @retval list    list
+        @throws NotFound    subject not found
+        @throws Inconsistent    more than one subject matching the given criteria
+        @throws BadRequest    missing parameters, or object id field missing in object
+        """
+        return self.request(IonObject('resource_registry_read_subject_in', **{'predicate': predicate, 'subject_type': subject_type, 'assoc': assoc, 'object': object, 'id_only': id_only}), op='read_subject', headers=headers, timeout=timeout)
+
+    def lcs_delete(self, resource_id='', headers=None, timeout=None):
+        """Sets resource lifecycle state to DELETED.
+        Throws exception if object does not exist or state transition is not possible.
+
+        @param resource_id    str
+        @throws NotFound    object does not exist
+        """
+        return self.request(IonObject('resource_registry_lcs_delete_in', **{'resource_id': resource_id}), op='lcs_delete', headers=headers, timeout=timeout)
+
+    def find_resources_ext(self, name='', keyword='', nested_type='', skip=0, id_only=False, attr_name='', restype='', descending=False, limit=0, attr_value='', alt_id_ns='', query=None, alt_id='', lcstate='', headers=None, timeout=None):
+        """Utility method for finding resources via various attributes, including resource type,
+        life cycle state, name, keyword, nested object type. Allows to influence order and number
+        of results. Legal attribute combinations are:
+          restype (with optional lcstate)
+          lcstate
+          keyword (with optional restype)
+          nested_type (with optional restype)
+          attribute name (with optional value), only for specially indexed attribute names
+          alternative id (with optional alternative id namespace)
+          name (with optional restype)
+        Returns a tuple (list_of_resources, list_of_matches) if id_only == False or
+        (list_of_resource_ids, list_of_matches) otherwise. List_of_matches is a list of
+        dicts with keys (type, lcstate, name, id), providing further information about the
+        matching resources.
+        Note: Only use this operation with keyword args, never with positional args. Signature will be extended.
+
+        @param name    str
+        @param keyword    str
+        @param nested_type    str
+        @param skip    int
+        @param id_only    bool
+        @param attr_name    str
+        @param restype    str
+        @param descending    bool
+        @param limit    int
+        @param attr_value    str
+        @param alt_id_ns    str
+        @param query    dict
+        @param alt_id    str
+        @param lcstate    str
+        @retval list    list
+        @throws BadRequest    incompatible parameters
+        """
+        return self.request(IonObject('resource_registry_find_resources_ext_in', **{'name': name, 'keyword': keyword, 'nested_type': nested_type, 'skip': skip, 'id_only': id_only, 'attr_name': attr_name, 'restype': restype, 'descending': descending, 'limit': limit, 'attr_value': attr_value, 'alt_id_ns': alt_id_ns, 'query': query or None, 'alt_id': alt_id, 'lcstate': lcstate}), op='find_resources_ext', headers=headers, timeout=timeout)
+
+    def read(self, object_id='', rev_id='', headers=None, timeout=None):
+        """Read the latest, or optionally the specific, version of resource
+        with id passed in the object_id param. Throws exception if
+        object not found.
+
+        @param object_id    str
+        @param rev_id    str
+        @retval object    dict
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('resource_registry_read_in', **{'object_id': object_id, 'rev_id': rev_id}), op='read', headers=headers, timeout=timeout)
+
+    def retire(self, resource_id='', headers=None, timeout=None):
+        """Sets resource lifecycle state to RETIRED.
+        Throws exception if object does not exist or state transition is not possible.
+
+        @param resource_id    str
+        @throws NotFound    object does not exist
+        """
+        return self.request(IonObject('resource_registry_retire_in', **{'resource_id': resource_id}), op='retire', headers=headers, timeout=timeout)
+
+    def update(self, object=None, headers=None, timeout=None):
+        """Persist new version of resource. Throws exception if previous
+        version of object does not exist or object passed is not based
+        on the latest persisted version.
+
+        @param object    Resource
+        @retval tuple    list
+        @throws NotFound    object with specified id does not exist
+        @throws Conflict    object not based on latest persisted object version
+        @throws BadRequest    object does not have required _id or _rev or lcstate was modified compared to persisted object version
+        """
+        return self.request(IonObject('resource_registry_update_in', **{'object': object or None}), op='update', headers=headers, timeout=timeout)
+
+    def find_subjects_mult(self, predicate='', objects=None, id_only=False, headers=None, timeout=None):
+        """Find associations by a list of objects.
+
+        @param predicate    str
+        @param objects    list
+        @param id_only    bool
+        @retval results    list
+        @throws BadRequest    subjects is not a list
+        """
+        return self.request(IonObject('resource_registry_find_subjects_mult_in', **{'predicate': predicate, 'objects': objects or None, 'id_only': id_only}), op='find_subjects_mult', headers=headers, timeout=timeout)
+
+    def read_mult(self, object_ids=None, headers=None, timeout=None):
+        """Read the latest resources specified in the paramter.
+
+        @param object_ids    list
+        @retval objects    list
+        @throws NotFound    objects do not exist.
+        """
+        return self.request(IonObject('resource_registry_read_mult_in', **{'object_ids': object_ids or None}), op='read_mult', headers=headers, timeout=timeout)
+
+    def create_association(self, predicate='', object='', assoc_type=None, subject='', headers=None, timeout=None):
+        """Create an association between subject and object resources (IonObjects).
+        Subject and object values can be passed as actual object instances or just
+        object ids.  Valid predicates can be found in res/config/associations.yml.
+        Subject and object must be of the proper types for the predicate or
+        an exception will be thrown.
+        Assoc_type is deprecated.
+
+        @param predicate    str
+        @param object    str
+        @param assoc_type    NoneType
+        @param subject    str
+        @retval tuple    list
+        @throws NotFound    subject or object does not exist
+        @throws BadRequest    subject, predicate or object parameter missing, unknown value passed for the assoc_type parameter, predicate is unknown, subject or object are invalid types for predicate, or subject or object do not have _id field
+        """
+        return self.request(IonObject('resource_registry_create_association_in', **{'predicate': predicate, 'object': object, 'assoc_type': assoc_type or None, 'subject': subject}), op='create_association', headers=headers, timeout=timeout)
+
+    def find_objects_mult(self, predicate='', subjects=None, id_only=False, headers=None, timeout=None):
+        """Find associations by a list of subjects.
+
+        @param predicate    str
+        @param subjects    list
+        @param id_only    bool
+        @retval results    list
+        @throws BadRequest    subjects is not a list
+        """
+        return self.request(IonObject('resource_registry_find_objects_mult_in', **{'predicate': predicate, 'subjects': subjects or None, 'id_only': id_only}), op='find_objects_mult', headers=headers, timeout=timeout)
+
+    def execute_lifecycle_transition(self, transition_event='', resource_id='', headers=None, timeout=None):
+        """Alter object lifecycle according to given transition event. Throws exception
+        if resource object does not exist or given transition_event is unknown/illegal.
+        The new life cycle state after applying the transition is returned.
+
+        @param transition_event    str
+        @param resource_id    str
+        @retval lcstate    str
+        @throws NotFound    resource object does not exist
+        @throws BadRequest    transition event unknown or illegal in current state; resource type has no lifecycle
+        @throws Conflict    race condition while trying to update
+        """
+        return self.request(IonObject('resource_registry_execute_lifecycle_transition_in', **{'transition_event': transition_event, 'resource_id': resource_id}), op='execute_lifecycle_transition', headers=headers, timeout=timeout)
+
+    def get_association(self, predicate='', object='', subject='', assoc_type=None, id_only=False, headers=None, timeout=None):
+        """Read the association specified by the exact subject, predicate, object
+        and type tuple.  Throws exception if association not found or more than one
+        association satisfies the tuple.
+
+        @param predicate    str
+        @param object    str
+        @param subject    str
+        @param assoc_type    NoneType
+        @param id_only    bool
+        @retval association    dict
+        @throws NotFound    association does not exist
+        @throws Inconsistent    multiple associations satisfy the subject, predicate, object tuple
+        @throws BadRequest    missing parameters, or object id field missing in subject or object
+        """
+        return self.request(IonObject('resource_registry_get_association_in', **{'predicate': predicate, 'object': object, 'subject': subject, 'assoc_type': assoc_type or None, 'id_only': id_only}), op='get_association', headers=headers, timeout=timeout)
+
+    def find_attachments(self, descending=False, keyword='', id_only=True, limit=0, resource_id='', include_content=False, headers=None, timeout=None):
+        """Returns list of attachment resources for given associated resource id.
+        Can limit the number of results and reverse the sort order. Default result order is oldest
+        attachment first.
+
+        @param descending    bool
+        @param keyword    str
+        @param id_only    bool
+        @param limit    int
+        @param resource_id    str
+        @param include_content    bool
+        @retval attachment_list    list
+        @throws NotFound    resource does not exist
+        """
+        return self.request(IonObject('resource_registry_find_attachments_in', **{'descending': descending, 'keyword': keyword, 'id_only': id_only, 'limit': limit, 'resource_id': resource_id, 'include_content': include_content}), op='find_attachments', headers=headers, timeout=timeout)
+
+    def set_lifecycle_state(self, target_lcstate='', resource_id='', headers=None, timeout=None):
+        """Alter object lifecycle to set to give lifecycle state. Throws exception
+        if resource object does not exist or given state is unknown/illegal.
+        The optional lcstate argument asserts that the current life cycle state matches.
+
+        @param target_lcstate    str
+        @param resource_id    str
+        @throws NotFound    resource object does not exist
+        @throws BadRequest    target state unknown or resource type has no lifecycle
+        @throws Conflict    race condition while trying to update
+        """
+        return self.request(IonObject('resource_registry_set_lifecycle_state_in', **{'target_lcstate': target_lcstate, 'resource_id': resource_id}), op='set_lifecycle_state', headers=headers, timeout=timeout)
+
+    def find_subjects(self, descending=False, predicate='', subject_type='', limit=0, id_only=False, skip=0, object='', headers=None, timeout=None):
+        """Find subjects (or subject ids) by association from a given object or
+        object id (if str). Returns a tuple (list_of_subjects, list_of_associations)
+        if id_only == False, or (list_of_subject_ids, list_of_associations)
+        if id_only == True. Predicate and subject_type are optional to narrow the
+        search down. Subject_type can only be set if predicate is set as well.
+
+        @param descending    bool
+        @param predicate    str
+        @param subject_type    str
+        @param limit    int
+        @param id_only    bool
+        @param skip    int
+        @param object    str
+        @retval list    list
+        @throws BadRequest    missing parameters, or object id field missing in object
+        """
+        return self.request(IonObject('resource_registry_find_subjects_in', **{'descending': descending, 'predicate': predicate, 'subject_type': subject_type, 'limit': limit, 'id_only': id_only, 'skip': skip, 'object': object}), op='find_subjects', headers=headers, timeout=timeout)
+
+    def read_object(self, predicate='', object_type='', assoc='', subject='', id_only=False, headers=None, timeout=None):
+        """Returns the object (or object id) by association from a given subject or
+        subject id (if str). Predicate and object_type are optional to narrow the
+        search down. Object_type can only be set if predicate is set as well.
+        Alternatively, an association (or association id) can be given.
+        If no object matches the criteria, NotFound is raised. If more than one
+        object match the criteria, Inconsistent is raised.
+
+        @param predicate    str
+        @param object_type    str
+        @param assoc    str
+        @param subject    str
+        @param id_only    bool
+        @retval list    list
+        @throws NotFound    object not found
+        @throws Inconsistent    more than one object matching the given criteria
+        @throws BadRequest    missing parameters, or object id field missing in subject
+        """
+        return self.request(IonObject('resource_registry_read_object_in', **{'predicate': predicate, 'object_type': object_type, 'assoc': assoc, 'subject': subject, 'id_only': id_only}), op='read_object', headers=headers, timeout=timeout)
+
+    def delete_attachment(self, attachment_id='', headers=None, timeout=None):
+        """Delete an attachment resource and resource associations.
+
+        @param attachment_id    str
+        @throws NotFound    attachment does not exist
+        """
+        return self.request(IonObject('resource_registry_delete_attachment_in', **{'attachment_id': attachment_id}), op='delete_attachment', headers=headers, timeout=timeout)
+
+    def read_attachment(self, attachment_id='', include_content=False, headers=None, timeout=None):
+        """Reads an attachment by id, excludes content unless indicated otherwise.
+
+        @param attachment_id    str
+        @param include_content    bool
+        @retval attachment    Attachment
+        @throws NotFound    attachment does not exist
+        """
+        return self.request(IonObject('resource_registry_read_attachment_in', **{'attachment_id': attachment_id, 'include_content': include_content}), op='read_attachment', headers=headers, timeout=timeout)
+
+    def create(self, object=None, headers=None, timeout=None):
+        """Persist an instance of the resource passed in the object param.
+        Returns a tuple (_id, _rev) for the persistend object.
+
+        @param object    Resource
+        @retval tuple    list
+        @throws BadRequest    object has _id field
+        """
+        return self.request(IonObject('resource_registry_create_in', **{'object': object or None}), op='create', headers=headers, timeout=timeout)
+
+    def find_resources(self, lcstate='', restype='', name='', id_only=False, headers=None, timeout=None):
+        """Utility method for finding resources via various attributes, including resource type,
+        life cycle state and name. Legal attribute combinations are:
+          restype
+          lcstate
+          restype, lcstate
+          name
+          name, restype
+        Returns a tuple (list_of_resources, list_of_matches) if id_only == False or
+        (list_of_resource_ids, list_of_matches) otherwise. List_of_matches is a list of
+        dicts with keys (type, lcstate, name, id), providing further information about the
+        matching resources.
+
+        @param lcstate    str
+        @param restype    str
+        @param name    str
+        @param id_only    bool
+        @retval list    list
+        @throws BadRequest    incompatible parameters
+        """
+        return self.request(IonObject('resource_registry_find_resources_in', **{'lcstate': lcstate, 'restype': restype, 'name': name, 'id_only': id_only}), op='find_resources', headers=headers, timeout=timeout)
+
+    def create_attachment(self, attachment=None, resource_id='', headers=None, timeout=None):
+        """Create an Attachment resource associated with another resource.
+        If no resource_id is provided, the attachment is created standalone.
+
+        @param attachment    Attachment
+        @param resource_id    str
+        @retval attachment_id    str
+        @throws NotFound    resource object does not exist if resource_id given
+        @throws BadRequest    bad attachment type or content
+        """
+        return self.request(IonObject('resource_registry_create_attachment_in', **{'attachment': attachment or None, 'resource_id': resource_id}), op='create_attachment', headers=headers, timeout=timeout)
+
+    def find_associations(self, predicate='', id_only=False, skip=0, object='', limit=0, assoc_type=None, descending=False, anyside='', subject='', headers=None, timeout=None):
+        """Find associations by subject, predicate, object and assoc_type.
+        If subject and object are provided (with optional predicate and assoc_type),
+        the directed association is returned.
+        If subject only is provided (with optional predicate and assoc_type), any associations
+        as subject or object are returned.
+        Or provide predicate only. Returns either a list
+        of Association objects or a list of association ids.
+
+        @param predicate    str
+        @param id_only    bool
+        @param skip    int
+        @param object    str
+        @param limit    int
+        @param assoc_type    NoneType
+        @param descending    bool
+        @param anyside    str
+        @param subject    str
+        @retval list    list
+        @throws BadRequest    missing parameters, or object id field missing in subject or object
+        """
+        return self.request(IonObject('resource_registry_find_associations_in', **{'predicate': predicate, 'id_only': id_only, 'skip': skip, 'object': object, 'limit': limit, 'assoc_type': assoc_type or None, 'descending': descending, 'anyside': anyside, 'subject': subject}), op='find_associations', headers=headers, timeout=timeout)
+
+    def create_association_mult(self, assoc_list=None, headers=None, timeout=None):
+        """Create multiple associations between subject and object resources (IonObjects).
+        Subject and object values can be passed as actual object instances or just
+        object ids.  Valid predicates can be found in res/config/associations.yml.
+        Subject and object must be of the proper types for the predicate or
+        an exception will be thrown.
+
+        @param assoc_list    list
+        @retval tuple    list
+        @throws NotFound    subject or object does not exist
+        @throws BadRequest    subject, predicate or object parameter missing, predicate is unknown, subject or object are invalid types for predicate, or subject or object do not have _id field
+        """
+        return self.request(IonObject('resource_registry_create_association_mult_in', **{'assoc_list': assoc_list or None}), op='create_association_mult', headers=headers, timeout=timeout)
+
+    def delete(self, object_id='', headers=None, timeout=None):
+        """Permanently delete object in datastores.
+        Throws exception if object does not exist.
+
+        @param object_id    str
+        @throws NotFound    object does not exist
+        """
+        return self.request(IonObject('resource_registry_delete_in', **{'object_id': object_id}), op='delete', headers=headers, timeout=timeout)
+
+
+
+class ResourceRegistryServiceClient(RPCClient, ResourceRegistryServiceClientMixin):
+    def __init__(self, to_name=None, node=None, **kwargs):
+        to_name = to_name or 'resource_registry'
+        RPCClient.__init__(self, to_name=to_name, node=node, **kwargs)
+        ResourceRegistryServiceClientMixin.__init__(self)
+
+
+class ResourceRegistryServiceProcessClient(ProcessRPCClient, ResourceRegistryServiceClientMixin):
+    def __init__(self, process=None, to_name=None, node=None, **kwargs):
+        to_name = to_name or 'resource_registry'
+        ProcessRPCClient.__init__(self, process=process, to_name=to_name, node=node, **kwargs)
+        ResourceRegistryServiceClientMixin.__init__(self)
+
+
+
+
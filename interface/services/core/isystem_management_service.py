@@ -0,0 +1,432 @@
+#!/usr/bin/env python
+#
+# File generated on 2026-10-16 20:36:13.253562
+#
+
+from zope.interface import Interface, implements
+
+from collections import OrderedDict, defaultdict
+
+import interface.objects
+from pyon.core.bootstrap import IonObject
+from pyon.ion.resregistry import ResourceRegistryServiceWrapper
+from pyon.ion.service import BaseService, BaseClients
+from pyon.net.endpoint import RPCClient
+from pyon.ion.endpoint import ProcessRPCClient
+from pyon.util.log import log
+
+
+SCHEMA_JSON = """{
+    "dependencies": [], 
+    "description": "Allow operators to perform administrative actions throughout the system.", 
+    "name": "system_management", 
+    "op_list": [
+        "reset_policy_cache", 
+        "trigger_container_snapshot", 
+        "trigger_garbage_collection", 
+        "perform_action", 
+        "set_log_level", 
+        "prepare_system_shutdown"
+    ], 
+    "operations": {
+        "perform_action": {
+            "description": "perform arbitrary string-encoded action (allow addition of new actions without adding service methods)", 
+            "in": {
+                "action": {
+                    "decorators": {}, 
+                    "default": "!ContainerManagementAction", 
+                    "description": "", 
+                    "name": "action", 
+                    "type": "ContainerManagementAction"
+                }, 
+                "predicate": {
+                    "decorators": {}, 
+                    "default": "!ContainerManagementPredicate", 
+                    "description": "", 
+                    "name": "predicate", 
+                    "type": "ContainerManagementPredicate"
+                }
+            }, 
+            "in_list": [
+                "action", 
+                "predicate"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": null
+            }
+        }, 
+        "prepare_system_shutdown": {
+            "description": "Prepares all containers in the system for a controlled shutdown", 
+            "in": {
+                "mode": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "mode", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "mode"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": null
+            }
+        }, 
+        "reset_policy_cache": {
+            "description": "Clears and reloads the policy caches in all of the containers.", 
+            "in": {}, 
+            "in_list": [], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": null
+            }
+        }, 
+        "set_log_level": {
+            "description": "Sets a log level.", 
+            "in": {
+                "level": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "level", 
+                    "type": "str"
+                }, 
+                "logger": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "logger", 
+                    "type": "str"
+                }, 
+                "recursive": {
+                    "decorators": {}, 
+                    "default": true, 
+                    "description": "", 
+                    "name": "recursive", 
+                    "type": "bool"
+                }
+            }, 
+            "in_list": [
+                "logger", 
+                "recursive", 
+                "level"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": null
+            }
+        }, 
+        "trigger_container_snapshot": {
+            "description": "Triggers a snapshot of container status for later analysis", 
+            "in": {
+                "clear_all": {
+                    "decorators": {}, 
+                    "default": false, 
+                    "description": "If True, clear snapshots", 
+                    "name": "clear_all", 
+                    "type": "bool"
+                }, 
+                "exclude_snapshots": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "List of special snapshots to exclude", 
+                    "name": "exclude_snapshots", 
+                    "type": "list"
+                }, 
+                "include_snapshots": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "List of special snapshots to include", 
+                    "name": "include_snapshots", 
+                    "type": "list"
+                }, 
+                "persist_snapshot": {
+                    "decorators": {}, 
+                    "default": true, 
+                    "description": "If True, persist snapshot, otherwise log only", 
+                    "name": "persist_snapshot", 
+                    "type": "bool"
+                }, 
+                "snapshot_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "Unique identifier for a snapshot", 
+                    "name": "snapshot_id", 
+                    "type": "str"
+                }, 
+                "snapshot_kwargs": {
+                    "decorators": {}, 
+                    "default": {}, 
+                    "description": "Arbitrary args for snapshot", 
+                    "name": "snapshot_kwargs", 
+                    "type": "dict"
+                }, 
+                "take_at_time": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "System timestamp for time when to take the snapshot", 
+                    "name": "take_at_time", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "include_snapshots", 
+                "exclude_snapshots", 
+                "snapshot_kwargs", 
+                "persist_snapshot", 
+                "snapshot_id", 
+                "clear_all", 
+                "take_at_time"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": null
+            }
+        }, 
+        "trigger_garbage_collection": {
+            "description": "Triggers a garbage collection in all containers", 
+            "in": {}, 
+            "in_list": [], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": null
+            }
+        }
+    }, 
+    "spec": ""
+}"""
+
+
+class SystemManagementServiceDependentClients(BaseClients):
+    def __init__(self, process=None):
+        self._process = process
+        BaseClients.__init__(self)
+
+
+
+
+class ISystemManagementService(Interface):
+    """None
+    """
+
+    def reset_policy_cache():
+        """Clears and reloads the policy caches in all of the containers.
+
+        @throws BadRequest    None
+        """
+        pass
+
+    def trigger_container_snapshot(include_snapshots=None, exclude_snapshots=None, snapshot_kwargs=None, persist_snapshot=True, snapshot_id='', clear_all=False, take_at_time=''):
+        """Triggers a snapshot of container status for later analysis
+
+        @param include_snapshots    list
+        @param exclude_snapshots    list
+        @param snapshot_kwargs    dict
+        @param persist_snapshot    bool
+        @param snapshot_id    str
+        @param clear_all    bool
+        @param take_at_time    str
+        @throws BadRequest    None
+        """
+        pass
+
+    def trigger_garbage_collection():
+        """Triggers a garbage collection in all containers
+
+        @throws BadRequest    None
+        """
+        pass
+
+    def perform_action(action=None, predicate=None):
+        """perform arbitrary string-encoded action (allow addition of new actions without adding service methods)
+
+        @param action    ContainerManagementAction
+        @param predicate    ContainerManagementPredicate
+        @throws BadRequest    None
+        """
+        pass
+
+    def set_log_level(logger='', recursive=True, level=''):
+        """Sets a log level.
+
+        @param logger    str
+        @param recursive    bool
+        @param level    str
+        @throws BadRequest    None
+        """
+        pass
+
+    def prepare_system_shutdown(mode=''):
+        """Prepares all containers in the system for a controlled shutdown
+
+        @param mode    str
+        @throws BadRequest    None
+        """
+        pass
+
+class BaseSystemManagementService(BaseService):
+    implements(ISystemManagementService)
+    """None
+    """
+    SCHEMA_JSON=SCHEMA_JSON
+    name = 'system_management'
+    dependencies = []
+
+    def __init__(self, *args, **kwargs):
+        BaseService.__init__(self, *args, **kwargs)
+        self.clients = SystemManagementServiceDependentClients(process=self)
+
+
+    def reset_policy_cache(self):
+        """Clears and reloads the policy caches in all of the containers.
+
+        @throws BadRequest    None
+        """
+        pass
+
+    def trigger_container_snapshot(self, include_snapshots=None, exclude_snapshots=None, snapshot_kwargs=None, persist_snapshot=True, snapshot_id='', clear_all=False, take_at_time=''):
+        """Triggers a snapshot of container status for later analysis
+
+        @param include_snapshots    list
+        @param exclude_snapshots    list
+        @param snapshot_kwargs    dict
+        @param persist_snapshot    bool
+        @param snapshot_id    str
+        @param clear_all    bool
+        @param take_at_time    str
+        @throws BadRequest    None
+        """
+        pass
+
+    def trigger_garbage_collection(self):
+        """Triggers a garbage collection in all containers
+
+        @throws BadRequest    None
+        """
+        pass
+
+    def perform_action(self, action=None, predicate=None):
+        """perform arbitrary string-encoded action (allow addition of new actions without adding service methods)
+
+        @param action    ContainerManagementAction
+        @param predicate    ContainerManagementPredicate
+        @throws BadRequest    None
+        """
+        pass
+
+    def set_log_level(self, logger='', recursive=True, level=''):
+        """Sets a log level.
+
+        @param logger    str
+        @param recursive    bool
+        @param level    str
+        @throws BadRequest    None
+        """
+        pass
+
+    def prepare_system_shutdown(self, mode=''):
+        """Prepares all containers in the system for a controlled shutdown
+
+        @param mode    str
+        @throws BadRequest    None
+        """
+        pass
+
+
+
+
+class SystemManagementServiceClientMixin(object):
+    """
+    # @todo Fill in client documentation.
+    """
+    #implements(ISystemManagementService)
+
+
+    def reset_policy_cache(self, headers=None, timeout=None):
+        """Clears and reloads the policy caches in all of the containers.
+
+        @throws BadRequest    None
+        """
+        return self.request(IonObject('system_management_reset_policy_cache_in', **{}), op='reset_policy_cache', headers=headers, timeout=timeout)
+
+    def trigger_container_snapshot(self, include_snapshots=None, exclude_snapshots=None, snapshot_kwargs=None, persist_snapshot=True, snapshot_id='', clear_all=False, take_at_time='', headers=None, timeout=None):
+        """Triggers a snapshot of container status for later analysis
+
+        @param include_snapshots    list
+        @param exclude_snapshots    list
+        @param snapshot_kwargs    dict
+        @param persist_snapshot    bool
+        @param snapshot_id    str
+        @param clear_all    bool
+        @param take_at_time    str
+        @throws BadRequest    None
+        """
+        return self.request(IonObject('system_management_trigger_container_snapshot_in', **{'include_snapshots': include_snapshots or None, 'exclude_snapshots': exclude_snapshots or None, 'snapshot_kwargs': snapshot_kwargs or None, 'persist_snapshot': persist_snapshot, 'snapshot_id': snapshot_id, 'clear_all': clear_all, 'take_at_time': take_at_time}), op='trigger_container_snapshot', headers=headers, timeout=timeout)
+
+    def trigger_garbage_collection(self, headers=None, timeout=None):
+        """Triggers a garbage collection in all containers
+
+        @throws BadRequest    None
+        """
+        return self.request(IonObject('system_management_trigger_garbage_collection_in', **{}), op='trigger_garbage_collection', headers=headers, timeout=timeout)
+
+    def perform_action(self, action=None, predicate=None, headers=None, timeout=None):
+        """perform arbitrary string-encoded action (allow addition of new actions without adding service methods)
+
+        @param action    ContainerManagementAction
+        @param predicate    ContainerManagementPredicate
+        @throws BadRequest    None
+        """
+        return self.request(IonObject('system_management_perform_action_in', **{'action': action or None, 'predicate': predicate or None}), op='perform_action', headers=headers, timeout=timeout)
+
+    def set_log_level(self, logger='', recursive=True, level='', headers=None, timeout=None):
+        """Sets a log level.
+
+        @param logger    str
+        @param recursive    bool
+        @param level    str
+        @throws BadRequest    None
+        """
+        return self.request(IonObject('system_management_set_log_level_in', **{'logger': logger, 'recursive': recursive, 'level': level}), op='set_log_level', headers=headers, timeout=timeout)
+
+    def prepare_system_shutdown(self, mode='', headers=None, timeout=None):
+        """Prepares all containers in the system for a controlled shutdown
+
+        @param mode    str
+        @throws BadRequest    None
+        """
+        return self.request(IonObject('system_management_prepare_system_shutdown_in', **{'mode': mode}), op='prepare_system_shutdown', headers=headers, timeout=timeout)
+
+
+
+class SystemManagementServiceClient(RPCClient, SystemManagementServiceClientMixin):
+    def __init__(self, to_name=None, node=None, **kwargs):
+        to_name = to_name or 'system_management'
+        RPCClient.__init__(self, to_name=to_name, node=node, **kwargs)
+        SystemManagementServiceClientMixin.__init__(self)
+
+
+class SystemManagementServiceProcessClient(ProcessRPCClient, SystemManagementServiceClientMixin):
+    def __init__(self, process=None, to_name=None, node=None, **kwargs):
+        to_name = to_name or 'system_management'
+        ProcessRPCClient.__init__(self, process=process, to_name=to_name, node=node, **kwargs)
+        SystemManagementServiceClientMixin.__init__(self)
+
+
+
+
@@ -19,6 +19,9 @@ class EventPersister(SimpleProcess):
         # Time in between event persists
         self.persist_interval = float(self.CFG.get_safe("process.event_persister.persist_interval", 1.0))
 
+        # Events are received as LazyIonMessage, decoded only as needed
+        self.lazy_decode = self.CFG.get_safe("process.event_persister.lazy_decode", False) is True
+
         self.persist_blacklist = self.CFG.get_safe("process.event_persister.persist_blacklist", {})
 
         self._event_type_blacklist = [entry['event_type'] for entry in self.persist_blacklist if entry.get('event_type', None) and len(entry) == 1]
@@ -65,7 +68,8 @@ class EventPersister(SimpleProcess):
         self.event_sub = EventSubscriber(pattern=EventSubscriber.ALL_EVENTS,
                                          callback=self._on_event,
                                          queue_name="event_persister",
-                                         auto_delete=False)
+                                         auto_delete=False,
+                                         lazy_decode=self.lazy_decode)
 
         self.event_sub.start()
 
@@ -57,3 +57,5 @@ except Exception as ex:
 # CHANGE HERE BEFORE IMPORTING ANY FURTHER PYON CODE TO OVERRIDE
 DEFAULT_CONFIG_PATHS = ['res/config/pyon.yml']
 DEFAULT_LOCAL_CONFIG_PATHS = ['res/config/pyon.local.yml']
+# Directory for compiled config snapshots. None: per user temp directory, empty: no snapshots
+CONFIG_CACHE_DIR = None
@@ -40,7 +40,7 @@ class AppManager(object):
         self.pd_client = None
         log.debug("AppManager stopped, OK.")
 
-    def start_rel_from_url(self, rel_url="", config=None):
+    def start_rel_from_url(self, rel_url="", config=None, shard=None):
         """
         @brief Read the rel file and call start_rel
         """
@@ -48,7 +48,7 @@ class AppManager(object):
 
         try:
             rel = Config([rel_url]).data
-            self.start_rel(rel, config)
+            self.start_rel(rel, config, shard=shard)
             log.debug("AppManager.start_rel_from_url(rel_url=%s) done,  OK.", rel_url)
             return True
         except ConfigNotFound as cnf:
@@ -59,7 +59,7 @@ class AppManager(object):
 
         return False
 
-    def start_rel(self, rel=None, config=None):
+    def start_rel(self, rel=None, config=None, shard=None):
         """
         @brief Recurse over the rel and start apps defined there.
         Note: apps in a rel file can come in one of 2 forms:
@@ -67,6 +67,8 @@ class AppManager(object):
         2 app file: Reference to an app definition in an app file
         If the rel file provides an app config block, it is provided to spawn the process.
         Any given function config dict is merged on top of this.
+        If shard is given as tuple (shard_num, num_shards), only every num_shards-th app
+        starting at index shard_num is started (e.g. by pycc --workers container workers).
         """
         log.debug("AppManager.start_rel(rel=%s) ...", rel)
 
@@ -74,13 +76,17 @@ class AppManager(object):
             return
 
         if self.use_pd:
+            if shard and shard[0] != 0:
+                return
             log.info("Sending rel file to PD")
             import json
             rel_def = json.loads(json.dumps(rel))     # HACK to get rid of OrderedDict (not serializable)
             cmd_res = self.pd_client.start_rel_blocking(rel_def, timeout=None)
             return cmd_res
 
-        for rel_app_cfg in rel.apps:
+        for app_num, rel_app_cfg in enumerate(rel.apps):
+            if shard and app_num % shard[1] != shard[0]:
+                continue
             name = rel_app_cfg.name
             log.debug("app definition in rel: %s" % str(rel_app_cfg))
 
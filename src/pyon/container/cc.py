@@ -340,9 +340,9 @@ class Container(BaseContainerAgent):
         with self._push_status("START_REL"):
             return self.app_manager.start_rel(rel=rel)
 
-    def start_rel_from_url(self, rel_url='', config=None):
+    def start_rel_from_url(self, rel_url='', config=None, shard=None):
         with self._push_status("START_REL_FROM_URL"):
-            return self.app_manager.start_rel_from_url(rel_url=rel_url, config=config)
+            return self.app_manager.start_rel_from_url(rel_url=rel_url, config=config, shard=shard)
 
 
     def fail_fast(self, err_msg="", skip_stop=False):
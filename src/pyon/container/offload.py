@@ -0,0 +1,255 @@
+#!/usr/bin/env python
+
+"""Container capability executing CPU-bound service operations in a pool of worker subprocesses.
+
+All processes of a container share one gevent hub, so a CPU-heavy operation stalls every other
+process in the container. Service operations declared with pyon.ion.service.offloadable are
+shipped (msgpack encoded, like messages) to a worker subprocess instead; the calling control
+greenlet waits cooperatively for the result.
+"""
+
+import multiprocessing
+import os
+import struct
+import sys
+import time
+import traceback
+
+import gevent
+import msgpack
+from gevent import subprocess
+from gevent.lock import Semaphore
+
+from pyon.container import ContainerCapability
+from pyon.core.bootstrap import CFG
+from pyon.core.exception import IonException, ServerError, Timeout, ContainerError, ExceptionFactory
+from pyon.core.interceptor.encode import encode_ion, decode_ion, decode_ion_ext_copy
+from pyon.util.containers import DotDict, named_any
+from pyon.util.log import log
+
+FRAME_HEADER = struct.Struct("<I")
+
+WORKER_START_TIMEOUT = 60
+
+# Worker subprocess entry: frames go to the original stdout, which is redirected to stderr
+# before any import can print
+WORKER_COMMAND = "import os; frame_fd = os.dup(1); os.dup2(2, 1); " \
+                 "from pyon.container.offload import worker_main; worker_main(frame_fd)"
+
+
+def write_frame(fobj, obj):
+    data = msgpack.packb(obj, default=encode_ion)
+    fobj.write(FRAME_HEADER.pack(len(data)) + data)
+    fobj.flush()
+
+
+def read_frame(fobj):
+    """ Reads one length prefixed msgpack frame. Raises EOFError if the pipe was closed. """
+    data = _read_exact(fobj, FRAME_HEADER.size)
+    data = _read_exact(fobj, FRAME_HEADER.unpack(data)[0])
+    return msgpack.unpackb(data, object_hook=decode_ion, ext_hook=decode_ion_ext_copy, use_list=1)
+
+
+def _read_exact(fobj, size):
+    chunks = []
+    while size > 0:
+        chunk = fobj.read(size)
+        if not chunk:
+            raise EOFError("Offload pipe closed")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return "".join(chunks)
+
+
+def get_task_ref(func):
+    """
+    Returns an importable reference (module, class name, function name) for a function or a
+    method bound to a service instance. The worker calls methods on an uninitialized instance
+    of the class, so offloadable operations must not depend on process state.
+    """
+    if getattr(func, "im_self", None) is not None:
+        clzz = type(func.im_self)
+        return clzz.__module__, clzz.__name__, func.__name__
+    return func.__module__, None, func.__name__
+
+
+class OffloadWorker(object):
+    """
+    One worker subprocess of the offload pool. Executes one task at a time.
+    """
+    def __init__(self, worker_id, pyon_cfg):
+        self.worker_id = worker_id
+        self.task_count = 0
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(path for path in sys.path if path)
+        self.proc = subprocess.Popen([sys.executable, "-c", WORKER_COMMAND],
+                                     stdin=subprocess.PIPE, stdout=subprocess.PIPE, env=env, close_fds=True)
+        write_frame(self.proc.stdin, pyon_cfg)
+        # Wait until the worker is bootstrapped, so that startup does not count against task timeouts
+        start_error = ContainerError("Offload worker did not start within %s sec" % WORKER_START_TIMEOUT)
+        with gevent.Timeout(WORKER_START_TIMEOUT, start_error):
+            read_frame(self.proc.stdout)
+
+    def execute(self, task, timeout=None):
+        """ Sends a task to the worker and waits cooperatively for its (ok, result) response. """
+        write_frame(self.proc.stdin, task)
+        with gevent.Timeout(timeout, Timeout("Offloaded operation did not complete within %s sec" % timeout)):
+            ok, result = read_frame(self.proc.stdout)
+        self.task_count += 1
+        return ok, result
+
+    def terminate(self, timeout=5):
+        """ Asks the worker to exit by closing its input; kills it if it does not comply. """
+        try:
+            self.proc.stdin.close()
+        except Exception:
+            pass
+        if self.proc.poll() is None:
+            with gevent.Timeout(timeout, False):
+                self.proc.wait()
+        if self.proc.poll() is None:
+            log.warn("Offload worker %s did not exit - killing", self.worker_id)
+            self.proc.kill()
+            self.proc.wait()
+
+
+class OffloadExecutor(ContainerCapability):
+    """
+    Executes offloadable operations in a pool of worker subprocesses, started on demand up to
+    pool_size. Workers are recycled after max_tasks_per_worker tasks and discarded on task
+    timeout or interruption (which also stops the work in progress).
+    """
+    def __init__(self, container=None):
+        ContainerCapability.__init__(self, container)
+        self.pool_size = 0
+        self.max_tasks_per_worker = 0
+        self.task_timeout = None
+        self._running = False
+        self._idle_workers = []
+        self._workers = set()
+        self._worker_sem = None
+        self._next_worker_id = 0
+        self._stats = {}
+        self._exc_factory = ExceptionFactory()
+
+    def start(self):
+        offload_cfg = CFG.get_safe("container.offload") or {}
+        self.pool_size = int(offload_cfg.get("pool_size", 0) or multiprocessing.cpu_count())
+        self.max_tasks_per_worker = int(offload_cfg.get("max_tasks_per_worker", 0) or 0)
+        self.task_timeout = offload_cfg.get("task_timeout", 0) or None
+        self._worker_sem = Semaphore(self.pool_size)
+        self._running = True
+        log.debug("Offload executor started, pool_size=%s", self.pool_size)
+
+    def stop(self):
+        self._running = False
+        for worker in list(self._workers):
+            self._discard_worker(worker)
+
+    def is_running(self):
+        return self._running
+
+    def execute(self, func, *args, **kwargs):
+        """
+        Executes the given function or service operation in a worker subprocess and returns its
+        result. Blocks the calling greenlet only. Exceptions raised by the operation are re-raised
+        as IonException of the same status code (ServerError for non-ION exceptions).
+        """
+        if not self._running:
+            raise ContainerError("Offload executor not running")
+        task_ref = get_task_ref(func)
+        op_name = ".".join(part for part in task_ref if part)
+
+        start_time = time.time()
+        with self._worker_sem:
+            worker = self._get_worker()
+            exec_start_time = time.time()
+            try:
+                ok, result = worker.execute((task_ref, args, kwargs), timeout=self.task_timeout)
+            except BaseException:
+                # Worker state is unknown (timeout, interrupt, broken pipe)
+                self._discard_worker(worker, kill=True)
+                self._record_stats(op_name, start_time, exec_start_time, error=True)
+                raise
+            self._release_worker(worker)
+
+        self._record_stats(op_name, start_time, exec_start_time, error=not ok)
+        if not ok:
+            status_code, message, stack = result
+            log.debug("Offloaded operation %s failed in worker:\n%s", op_name, stack)
+            raise self._exc_factory.create_exception(status_code, message, None)
+        return result
+
+    def get_stats(self):
+        """ Returns per operation stats: count, errors, queue_time and exec_time (total and max, in sec) """
+        return {op_name: dict(op_stats) for op_name, op_stats in self._stats.iteritems()}
+
+    def _get_worker(self):
+        if self._idle_workers:
+            return self._idle_workers.pop()
+        self._next_worker_id += 1
+        worker = OffloadWorker(self._next_worker_id, CFG.as_dict())
+        self._workers.add(worker)
+        return worker
+
+    def _release_worker(self, worker):
+        if not self._running or (self.max_tasks_per_worker and worker.task_count >= self.max_tasks_per_worker):
+            self._discard_worker(worker)
+        else:
+            self._idle_workers.append(worker)
+
+    def _discard_worker(self, worker, kill=False):
+        self._workers.discard(worker)
+        if worker in self._idle_workers:
+            self._idle_workers.remove(worker)
+        if kill and worker.proc.poll() is None:
+            worker.proc.kill()
+        worker.terminate()
+
+    def _record_stats(self, op_name, start_time, exec_start_time, error=False):
+        cur_time = time.time()
+        op_stats = self._stats.setdefault(op_name, dict(count=0, errors=0, queue_time=0.0, exec_time=0.0, max_exec_time=0.0))
+        op_stats["count"] += 1
+        if error:
+            op_stats["errors"] += 1
+        op_stats["queue_time"] += exec_start_time - start_time
+        exec_time = cur_time - exec_start_time
+        op_stats["exec_time"] += exec_time
+        op_stats["max_exec_time"] = max(op_stats["max_exec_time"], exec_time)
+
+
+def _resolve_task(task_ref):
+    module_name, class_name, func_name = task_ref
+    if class_name:
+        clzz = named_any("%s.%s" % (module_name, class_name))
+        return getattr(clzz.__new__(clzz), func_name)
+    return named_any("%s.%s" % (module_name, func_name))
+
+
+def worker_main(frame_fd):
+    """ Worker subprocess main loop: executes tasks read from stdin until it is closed. """
+    frame_in = os.fdopen(os.dup(0), "rb")
+    frame_out = os.fdopen(frame_fd, "wb")
+
+    pyon_cfg = msgpack.unpackb(_read_exact(frame_in, FRAME_HEADER.unpack(_read_exact(frame_in, FRAME_HEADER.size))[0]))
+    from pyon.core import bootstrap
+    bootstrap.bootstrap_pyon(pyon_cfg=DotDict(pyon_cfg))
+    write_frame(frame_out, True)
+
+    while True:
+        try:
+            task_ref, args, kwargs = read_frame(frame_in)
+        except EOFError:
+            break
+        try:
+            func = _resolve_task(task_ref)
+            response = (True, func(*args, **kwargs))
+        except IonException as ex:
+            response = (False, (ex.get_status_code(), ex.get_error_message(), traceback.format_exc()))
+        except Exception as ex:
+            response = (False, (ServerError.status_code, "%s: %s" % (type(ex).__name__, ex), traceback.format_exc()))
+        try:
+            write_frame(frame_out, response)
+        except Exception as ex:
+            write_frame(frame_out, (False, (ServerError.status_code, "Cannot encode result: %s" % ex, traceback.format_exc())))
+
@@ -27,6 +27,7 @@ import re
 import time
 import socket
 import sys
+import gevent
 from gevent.lock import RLock
 
 from pyon.core import (PROCTYPE_SERVICE, PROCTYPE_AGENT, PROCTYPE_IMMEDIATE, PROCTYPE_SIMPLE, PROCTYPE_STANDALONE,
@@ -491,7 +492,8 @@ class ProcManager(object):
         proc = self.proc_sup.spawn(name=process_instance.id,
                                    service=process_instance,
                                    listeners=[rsvc1],
-                                   proc_name=process_instance._proc_name)
+                                   proc_name=process_instance._proc_name,
+                                   max_concurrency=self._get_max_concurrency(process_instance))
         proc.proc._glname = "ION Proc %s" % process_instance._proc_name
         self.proc_sup.ensure_ready(proc, "_spawn_service_process for %s" % ",".join((str(listen_name), process_instance.id)))
 
@@ -553,6 +555,7 @@ class ProcManager(object):
                                    service=process_instance,
                                    listeners=listeners,
                                    proc_name=process_instance._proc_name,
+                                   max_concurrency=self._get_max_concurrency(process_instance),
                                    cleanup_method=cleanup)
         proc.proc._glname = "ION Proc %s" % process_instance._proc_name
         self.proc_sup.ensure_ready(proc, "_spawn_stream_process for %s" % process_instance._proc_name)
@@ -616,7 +619,8 @@ class ProcManager(object):
         proc = self.proc_sup.spawn(name=process_instance.id,
                                    service=process_instance,
                                    listeners=listeners,
-                                   proc_name=process_instance._proc_name)
+                                   proc_name=process_instance._proc_name,
+                                   max_concurrency=self._get_max_concurrency(process_instance))
         proc.proc._glname = "ION Proc %s" % process_instance._proc_name
         self.proc_sup.ensure_ready(proc, "_spawn_agent_process for %s" % process_instance.id)
 
@@ -669,6 +673,7 @@ class ProcManager(object):
                                    service=process_instance,
                                    listeners=[rsvc],
                                    proc_name=process_instance._proc_name,
+                                   max_concurrency=self._get_max_concurrency(process_instance),
                                    cleanup_method=cleanup)
         proc.proc._glname = "ION Proc %s" % process_instance._proc_name
         self.proc_sup.ensure_ready(proc, "_spawn_standalone_process for %s" % process_instance.id)
@@ -713,6 +718,7 @@ class ProcManager(object):
                                    service=process_instance,
                                    listeners=[],
                                    proc_name=process_instance._proc_name,
+                                   max_concurrency=self._get_max_concurrency(process_instance),
                                    cleanup_method=cleanup)
         proc.proc._glname = "ION Proc %s" % process_instance._proc_name
         self.proc_sup.ensure_ready(proc, "_spawn_simple_process for %s" % process_instance.id)
@@ -817,6 +823,15 @@ class ProcManager(object):
             log.debug("Loading persisted state for process %s", process_instance.id)
             process_instance._load_state()
 
+    def _get_max_concurrency(self, process_instance):
+        """ Returns the number of calls the process may handle concurrently: process config
+        process.max_concurrency overrides the process class max_concurrency attribute.
+        """
+        max_concurrency = getattr(process_instance, "max_concurrency", 1)
+        if process_instance.CFG:
+            max_concurrency = process_instance.CFG.get_safe("process.max_concurrency", max_concurrency)
+        return int(max_concurrency or 1)
+
     def _check_process_dependencies(self, app_instance):
         app_instance.errcause = "setting service dependencies"
         log.debug("spawn_process dependencies: %s", app_instance.dependencies)
@@ -859,6 +874,15 @@ class ProcManager(object):
             process_instance._process.notify_stop()
             process_instance._process.stop()
 
+        # Kill outstanding async calls of RPC clients, if any
+        if getattr(process_instance, '_rpc_async_calls', None):
+            gevent.killall(list(process_instance._rpc_async_calls))
+
+        # Close the shared reply queue of multiplexed RPC clients, if any
+        if getattr(process_instance, '_rpc_reply_dispatcher', None) is not None:
+            process_instance._rpc_reply_dispatcher.close()
+            process_instance._rpc_reply_dispatcher = None
+
     def _set_publisher_endpoints(self, process_instance, publisher_streams=None):
         """ Creates and attaches named stream publishers
         """
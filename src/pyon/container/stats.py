@@ -62,6 +62,15 @@ class ContainerStatsManager(object):
         cbs = self._stats_callbacks[group]
         cbs.pop(cb_func, None)
 
+    def get_stats(self):
+        """ Returns current counters of container components, by component """
+        stats = {}
+        from pyon.datastore.object_cache import get_object_cache
+        object_cache = get_object_cache()
+        if object_cache:
+            stats["object_cache"] = object_cache.get_stats()
+        return stats
+
     # -------------------------------------------------------------------------
 
     def _clear_stats_groups(self):
@@ -127,6 +136,11 @@ class ContainerStatsManager(object):
     def _msg_out_callback(self, msg, headers, env):
         log_entry = dict(status="SENT %s bytes" % len(msg), headers=headers, env=env,
                          content_length=len(msg), content=str(msg)[:self.SAVE_MSG_MAX])
+        if "compression" in env:
+            comp_info = env["compression"]
+            log_entry["status"] += " (%s from %s bytes, ratio=%.2f, time=%.4f)" % (
+                comp_info["codec"], comp_info["raw_size"], comp_info["ratio"], comp_info["time"])
+            log_entry["compression"] = comp_info
         CallTracer.log_scope_call("MSG.out", log_entry, include_stack=False)
         self._call_callbacks("MSG", "out", log_entry)
 
@@ -6,6 +6,7 @@ from unittest import SkipTest
 
 from pyon.container.apps import AppManager
 from pyon.core.path import resolve
+from pyon.util.containers import DotDict
 from pyon.ion.service import BaseService
 from pyon.util.int_test import IonIntegrationTestCase
 from nose.plugins.attrib import attr
@@ -29,6 +30,22 @@ class TestAppManager(IonIntegrationTestCase):
         am.start()
         am.stop()
 
+    def test_appmanager_shard(self):
+        fakecc = FakeContainer()
+        spawned = []
+        fakecc.spawn_process = lambda name, module, cls, config=None: spawned.append(name)
+        am = AppManager(fakecc)
+        am.use_pd = False
+        am.start()
+        rel = DotDict(apps=[DotDict(name="app%s" % i, processapp=["app%s" % i, "mod", "Cls"]) for i in range(5)])
+
+        am.start_rel(rel, shard=(1, 2))
+        self.assertEquals(spawned, ["app1", "app3"])
+
+        del spawned[:]
+        am.start_rel(rel, shard=(0, 2))
+        self.assertEquals(spawned, ["app0", "app2", "app4"])
+
     def test_appmanager(self):
         self._start_container()
 
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+
+import os
+import time
+from mock import Mock
+from nose.plugins.attrib import attr
+
+from pyon.container.offload import OffloadExecutor
+from pyon.core.exception import NotFound, ServerError, Timeout
+from pyon.ion.service import BaseService, offloadable
+from pyon.util.unit_test import PyonTestCase
+
+
+def worker_pid():
+    return os.getpid()
+
+
+def sleep_for(secs):
+    time.sleep(secs)
+
+
+class OffloadService(BaseService):
+    name = 'offload_service'
+    dependencies = []
+
+    @offloadable
+    def sum_values(self, values=None, scale=1):
+        return sum(values) * scale
+
+    @offloadable
+    def find_value(self, key=None):
+        raise NotFound("No value for %s" % key)
+
+    @offloadable
+    def divide(self, value=0):
+        return 1 / value
+
+
+@attr('UNIT')
+class TestOffloadExecutor(PyonTestCase):
+
+    def _start_executor(self, **offload_cfg):
+        self.patch_cfg('pyon.container.offload.CFG', {'container': {'offload': offload_cfg}})
+        executor = OffloadExecutor(container=Mock())
+        executor.start()
+        self.addCleanup(executor.stop)
+        return executor
+
+    def test_execute(self):
+        executor = self._start_executor(pool_size=2)
+        svc = OffloadService()
+
+        self.assertEquals(executor.execute(svc.sum_values, values=[1, 2, 3], scale=2), 12)
+        self.assertNotEquals(executor.execute(worker_pid), os.getpid())
+
+        with self.assertRaises(NotFound):
+            executor.execute(svc.find_value, key="foo")
+        with self.assertRaises(ServerError) as cm:
+            executor.execute(svc.divide, value=0)
+        self.assertIn("ZeroDivisionError", cm.exception.message)
+
+        stats = executor.get_stats()
+        op_stats = stats["pyon.container.test.test_offload.OffloadService.sum_values"]
+        self.assertEquals(op_stats["count"], 1)
+        self.assertEquals(op_stats["errors"], 0)
+        self.assertEquals(stats["pyon.container.test.test_offload.OffloadService.find_value"]["errors"], 1)
+
+        # Workers are reused
+        self.assertEquals(len(executor._workers), 1)
+
+    def test_worker_recycle(self):
+        executor = self._start_executor(pool_size=1, max_tasks_per_worker=2)
+
+        pids = [executor.execute(worker_pid) for i in xrange(4)]
+        self.assertEquals(pids[0], pids[1])
+        self.assertEquals(pids[2], pids[3])
+        self.assertNotEquals(pids[1], pids[2])
+
+    def test_task_timeout(self):
+        executor = self._start_executor(pool_size=1, task_timeout=0.5)
+
+        pid = executor.execute(worker_pid)
+        with self.assertRaises(Timeout):
+            executor.execute(sleep_for, 10)
+
+        # Timed out worker is discarded
+        self.assertEquals(len(executor._workers), 0)
+        self.assertNotEquals(executor.execute(worker_pid), pid)
@@ -16,6 +16,8 @@ MSG_HEADER_TOKENS = "ion-actor-tokens"
 MSG_HEADER_RESOURCE_ID = "resource-id"
 MSG_HEADER_USER_CONTEXT_ID = "user-context-id"
 
+MSG_HEADER_PRIORITY = "op-priority"
+
 
 # Process related constants
 
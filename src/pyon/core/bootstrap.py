@@ -81,6 +81,9 @@ def set_config(pyon_cfg=None):
         std_cfg = config.read_standard_configuration()
         config.apply_configuration(CFG, std_cfg)
 
+    # Flat index of dotted keys for fast CFG.get_safe on hot paths
+    CFG.enable_path_index()
+
     assert_configuration(CFG)
 
 
@@ -12,7 +12,7 @@ from pyon.core.exception import NotFound, Unauthorized
 from pyon.core.governance import get_system_actor_header, get_system_actor
 from pyon.core.governance.governance_dispatcher import GovernanceDispatcher
 from pyon.core.governance.policy.policy_decision import PolicyDecisionPointManager
-from pyon.core.interceptor.interceptor import Invocation
+from pyon.core.interceptor.interceptor import Invocation, InterceptorPipeline, run_timed_chain
 from pyon.ion.event import EventSubscriber
 from pyon.ion.resource import RT, OT
 from pyon.util.containers import get_ion_ts, named_any
@@ -35,6 +35,7 @@ class GovernanceController(object):
         self.enabled = False
         self.interceptor_by_name_dict = {}
         self.interceptor_order = []
+        self._interceptor_chains = {Invocation.PATH_IN: [], Invocation.PATH_OUT: []}
         self.policy_decision_point_manager = None
         self.governance_dispatcher = None
 
@@ -96,6 +97,17 @@ class GovernanceController(object):
             classinst = classobj()
             self.interceptor_by_name_dict[name] = classinst
 
+        self.compile_interceptor_chains()
+
+    def compile_interceptor_chains(self):
+        """Builds the ordered (name, bound method) chain for each path once, instead of per message"""
+        self._interceptor_chains = {}
+        for path, int_order in ((Invocation.PATH_IN, list(self.interceptor_order)),
+                                (Invocation.PATH_OUT, list(reversed(list(self.interceptor_order))))):
+            self._interceptor_chains[path] = [("%s.%s" % (type(self.interceptor_by_name_dict[name]).__name__, path),
+                                               getattr(self.interceptor_by_name_dict[name], path))
+                                              for name in int_order if not self.interceptor_by_name_dict[name].is_noop(path)]
+
     def _ensure_system_actor(self):
         """Make sure we have a handle for the system actor"""
         if self.system_actor_id is None:
@@ -159,33 +171,44 @@ class GovernanceController(object):
     def process_incoming_message(self, invocation):
         """The GovernanceController hook into the incoming message interceptor stack
         """
-        self.process_message(invocation, self.interceptor_order, Invocation.PATH_IN)
+        self.process_message(invocation, None, Invocation.PATH_IN)
         return self.governance_dispatcher.handle_incoming_message(invocation)
 
     def process_outgoing_message(self, invocation):
         """The GovernanceController hook into the outgoing message interceptor stack
         """
-        self.process_message(invocation, reversed(self.interceptor_order), Invocation.PATH_OUT)
+        self.process_message(invocation, None, Invocation.PATH_OUT)
         return self.governance_dispatcher.handle_outgoing_message(invocation)
 
     def process_message(self, invocation, interceptor_list, method):
         """
         The GovernanceController hook to iterate over the interceptors to call each one and
         evaluate the annotations to see what actions should be done.
+        If interceptor_list is None, the precompiled chain for the method (path) is used.
         """
-        for int_name in interceptor_list:
-            interceptor_obj = self.interceptor_by_name_dict[int_name]
-            interceptor_func = getattr(interceptor_obj, method)
+        if interceptor_list is None:
+            chain = self._interceptor_chains[method]
+        else:
+            chain = [(int_name, getattr(self.interceptor_by_name_dict[int_name], method)) for int_name in interceptor_list]
+
+        if InterceptorPipeline.timing_enabled:
+            return run_timed_chain(chain, invocation, stop_func=self._is_rejected)
+
+        for _, interceptor_func in chain:
             # Invoke interceptor function for designated path
             interceptor_func(invocation)
 
             # Stop processing message if an issue with the message was found by an interceptor
-            if invocation.message_annotations.get(GovernanceDispatcher.CONVERSATION__STATUS_ANNOTATION, None) == GovernanceDispatcher.STATUS_REJECT or \
-               invocation.message_annotations.get(GovernanceDispatcher.POLICY__STATUS_ANNOTATION, None) == GovernanceDispatcher.STATUS_REJECT:
+            if self._is_rejected(invocation):
                 break
 
         return invocation
 
+    def _is_rejected(self, invocation):
+        annotations = invocation.message_annotations
+        return annotations.get(GovernanceDispatcher.CONVERSATION__STATUS_ANNOTATION, None) == GovernanceDispatcher.STATUS_REJECT or \
+               annotations.get(GovernanceDispatcher.POLICY__STATUS_ANNOTATION, None) == GovernanceDispatcher.STATUS_REJECT
+
     # --- Container policy management
 
     def policy_event_callback(self, policy_event, *args, **kwargs):
@@ -3,13 +3,16 @@
 """Messaging object encoder/decoder for IonObjects and numpy data"""
 
 import msgpack
+import struct
 import sys
+import time
+import zlib
 from ast import literal_eval
 
 from pyon.core.bootstrap import get_obj_registry
 from pyon.core.exception import BadRequest
 from pyon.core.interceptor.interceptor import Interceptor
-from pyon.core.object import IonObjectBase, IonMessageObjectBase
+from pyon.core.object import IonObjectBase, IonMessageObjectBase, LazyIonMessage, BUILT_IN_ATTRS
 from pyon.util.containers import get_safe, DotDict
 from pyon.util.log import log
 
@@ -24,6 +27,15 @@ try:
 except ImportError:
     has_numpy = False
 
+try:
+    import lz4.block as lz4block
+    has_lz4 = True
+except ImportError:
+    has_lz4 = False
+
+# Message header indicating a compressed message body and the compression codec
+MSG_HEADER_COMPRESSION = "compression"
+
 
 class EncodeTypes(object):
     SET = 's'
@@ -35,6 +47,11 @@ class EncodeTypes(object):
     NPVAL = 'n'
 
 
+class ExtTypes(object):
+    """msgpack ext type codes"""
+    NPARRAY = 1
+
+
 # Global lazy load reference to the Pyon object registry (we be set on first use, not on load).
 # Note: We need this here so that the decode_ion/encode_ion functions can be imported (i.e. be static).
 obj_registry = None
@@ -55,15 +72,12 @@ def decode_ion(obj):
         if obj_registry is None:
             obj_registry = get_obj_registry()
 
-        ion_obj = obj_registry.new(obj["type_"])
         for k, v in obj.iteritems():
             # unicode translate to utf8
             # Note: This is not recursive within dicts/list or any other types
             if isinstance(v, unicode):
-                v = v.encode('utf8')
-            if k != "type_":
-                setattr(ion_obj, k, v)
-        return ion_obj
+                obj[k] = v.encode('utf8')
+        return obj_registry.new_from_dict(obj["type_"], obj)
 
     if 't' not in obj:
         return obj
@@ -147,18 +161,264 @@ def encode_ion(obj):
     raise TypeError('Unknown type "%s" in user specified encoder: "%s"' % (type(obj), obj))
 
 
+def encode_ndarray_ext(obj):
+    """
+    Encodes a numpy array as msgpack ext type: the raw array buffer (written once, not via
+    tostring()), followed by a msgpack trailer with dtype and shape and the trailer length.
+    Object arrays have no raw buffer representation and are encoded via encode_ion.
+    """
+    if obj.dtype.hasobject:
+        return encode_ion(obj)
+    if not obj.flags.c_contiguous:
+        obj = np.ascontiguousarray(obj)
+    dtype_def = obj.dtype.descr if obj.dtype.fields else obj.dtype.str
+    trailer = msgpack.packb((dtype_def, obj.shape))
+    trailer += struct.pack("<I", len(trailer))
+    # Note: One concatenation with the buffer results in a str with a single copy of the array data
+    # (ExtType data must be a str, so the array cannot be written into a pre-sized bytearray)
+    return msgpack.ExtType(ExtTypes.NPARRAY, buffer(obj) + trailer)
+
+
+def _restore_dtype_descr(descr):
+    """Returns a structured dtype descr as tuples again, after msgpack turned all tuples into lists"""
+    fields = []
+    for field in descr:
+        name, field_type = field[0], field[1]
+        if isinstance(name, list):
+            name = tuple(name)      # (title, name)
+        if isinstance(field_type, list):
+            field_type = _restore_dtype_descr(field_type)     # Nested structured dtype
+        fields.append((name, field_type) + tuple(tuple(shape) for shape in field[2:]))
+    return fields
+
+
+def decode_ion_ext(code, data, copy=False):
+    """
+    msgpack ext hook to decode numpy arrays. Without copy, the returned array is a read-only
+    view over the received message body.
+    """
+    if code == ExtTypes.NPARRAY:
+        if not has_numpy:
+            raise BadRequest("Missing numpy")
+        trailer_len, = struct.unpack_from("<I", data, len(data) - 4)
+        data_len = len(data) - 4 - trailer_len
+        dtype_def, shape = msgpack.unpackb(data[data_len:-4])
+        if isinstance(dtype_def, list):
+            dtype_def = _restore_dtype_descr(dtype_def)
+        dtype = np.dtype(dtype_def)
+        array = np.frombuffer(data, dtype=dtype, count=data_len // dtype.itemsize if dtype.itemsize else 0).reshape(shape)
+        return array.copy() if copy else array
+
+    return msgpack.ExtType(code, data)
+
+
+def decode_ion_ext_copy(code, data):
+    """msgpack ext hook to decode numpy arrays into writable copies"""
+    return decode_ion_ext(code, data, copy=True)
+
+
+class IonSchemaCodec(object):
+    """
+    msgpack object hooks with a per class plan for IonObjects, compiled on first use of a class
+    from its _schema and default template, and dispatch on exact type (encode) or type code
+    (decode) instead of a chain of isinstance checks.
+    IonObjects encode as their __dict__, which is the wire dict. A received object dict becomes
+    the __dict__ of the decoded object as is: only missing fields get defaults from the template,
+    and unicode is only converted for str typed fields. Other types fall back to encode_ion/decode_ion.
+    Produces the same bytes and objects as encode_ion/decode_ion.
+    """
+
+    def __init__(self):
+        self._encoders = {
+            list: lambda obj: {'t': EncodeTypes.LIST, 'o': tuple(obj)},
+            set: lambda obj: {'t': EncodeTypes.SET, 'o': tuple(obj)},
+            complex: lambda obj: {'t': EncodeTypes.COMPLEX, 'o': (obj.real, obj.imag)},
+            slice: lambda obj: {'t': EncodeTypes.SLICE, 'o': (obj.start, obj.stop, obj.step)},
+        }
+        self._value_decoders = {
+            EncodeTypes.LIST: lambda obj: list(obj['o']),
+            EncodeTypes.SET: lambda obj: set(obj['o']),
+            EncodeTypes.COMPLEX: lambda obj: complex(obj['o'][0], obj['o'][1]),
+            EncodeTypes.SLICE: lambda obj: slice(obj['o'][0], obj['o'][1], obj['o'][2]),
+        }
+        self._decoders = {}
+
+    def encode(self, obj):
+        """msgpack default hook, equivalent to encode_ion"""
+        encoder = self._encoders.get(type(obj), None)
+        if encoder is None:
+            if not isinstance(obj, IonObjectBase):
+                return encode_ion(obj)
+            encoder = self._get_obj_encoder(type(obj))
+        return encoder(obj)
+
+    def decode(self, obj):
+        """msgpack object_hook, equivalent to decode_ion"""
+        if "type_" in obj:
+            if "__noion__" in obj:
+                obj.pop("__noion__")
+                return obj
+            decoder = self._decoders.get(obj["type_"], None)
+            if decoder is None:
+                decoder = self._get_obj_decoder(obj["type_"])
+            return decoder(obj)
+
+        objt = obj.get('t', None)
+        if objt is None:
+            return obj
+        decoder = self._value_decoders.get(objt, None) if type(objt) is str else None
+        if decoder is None:
+            return decode_ion(obj)
+        return decoder(obj)
+
+    def _get_obj_encoder(self, clzz):
+        if issubclass(clzz, IonMessageObjectBase):
+            def encode_obj(obj):
+                return obj.__dict__
+        else:
+            def encode_obj(obj):
+                if "type_" not in obj.__dict__:
+                    log.error("IonObject with no type_: %s", obj)
+                return obj.__dict__
+
+        self._encoders[clzz] = encode_obj
+        return encode_obj
+
+    def _get_obj_decoder(self, type_name):
+        """Compiles the decode plan for a type, equivalent to decode_ion and new_from_dict"""
+        global obj_registry
+        if obj_registry is None:
+            obj_registry = get_obj_registry()
+
+        clzz = obj_registry.get_class(type_name)
+        immutables, mutables = obj_registry.get_template(type_name)
+        str_fields = tuple(key for key, val in clzz._schema.iteritems() if val['type'] == 'str')
+        defaults = dict(mutables)
+        defaults.update((key, lambda value=value: value) for key, value in immutables.iteritems())
+        fields = frozenset(defaults)
+        valid_fields = fields | clzz._schema.viewkeys() | BUILT_IN_ATTRS
+        validate_setattr = obj_registry.validate_setattr
+        has_type = "type_" in immutables
+        type_value = immutables.get("type_", None)
+        new_obj = clzz.__new__
+        set_attr = object.__setattr__
+
+        def decode_obj(obj):
+            # unicode translate to utf8, only for str typed fields
+            for key in str_fields:
+                val = obj.get(key, None)
+                if type(val) is unicode:
+                    obj[key] = val.encode('utf8')
+            if validate_setattr:
+                extra_attributes = obj.viewkeys() - valid_fields
+                if extra_attributes:
+                    raise AttributeError("'%s' object has no attribute '%s'" % (clzz.__name__, extra_attributes.pop()))
+            for key in fields.difference(obj):
+                obj[key] = defaults[key]()
+            if has_type:
+                obj["type_"] = type_value
+            else:
+                obj.pop("type_", None)
+            # The received dict is not shared, so it becomes the object's __dict__
+            ion_obj = new_obj(clzz)
+            set_attr(ion_obj, "__dict__", obj)
+            return ion_obj
+
+        self._decoders[type_name] = decode_obj
+        return decode_obj
+
+
+# Shared instance so that cached encode and decode functions are reused by all interceptors
+ion_schema_codec = IonSchemaCodec()
+
+
+def compress_body(codec, body, level=1):
+    if codec == "zlib":
+        return zlib.compress(body, level)
+    elif codec == "lz4":
+        if not has_lz4:
+            raise BadRequest("Missing lz4")
+        return lz4block.compress(body)
+    raise BadRequest("Unknown compression codec: %s" % codec)
+
+
+def decompress_body(codec, body, max_size=sys.maxint):
+    """Decompresses a message body, raising BadRequest if the result would be larger than max_size"""
+    if codec == "zlib":
+        # Output stops at the limit; a full buffer means more output was pending.
+        # zlib takes a C int max_length, hence the cap
+        limit = min(max_size, 0x7ffffffe) + 1
+        result = zlib.decompressobj().decompress(body, limit)
+        if len(result) >= limit:
+            raise BadRequest("The decompressed message size is larger than the max_message_size value of %s" % max_size)
+        return result
+    elif codec == "lz4":
+        if not has_lz4:
+            raise BadRequest("Missing lz4")
+        # lz4 block format as written by compress_body: uncompressed size prefix (uint32 LE)
+        raw_size, = struct.unpack_from("<I", body)
+        if raw_size > max_size:
+            raise BadRequest("The decompressed message size %s is larger than the max_message_size value of %s" % (
+                raw_size, max_size))
+        return lz4block.decompress(body)
+    raise BadRequest("Unknown compression codec: %s" % codec)
+
+
 class EncodeInterceptor(Interceptor):
 
     def __init__(self):
         self.max_message_size = sys.maxint  # Will be set appropriately from interceptor config
+        self.compress_codec = None
+        self.compress_threshold = sys.maxint
+        self.compress_level = 1
+        self.encoder = encode_ion
+        self.decoder = decode_ion
+        self.ext_decoder = decode_ion_ext
 
     def configure(self, config):
         self.max_message_size = get_safe(config, 'max_message_size', 20000000)
-        log.debug("EncodeInterceptor enabled")
+        codec = get_safe(config, 'codec', 'hooks')
+        if codec == 'schema':
+            self.encoder = ion_schema_codec.encode
+            self.decoder = ion_schema_codec.decode
+        elif codec == 'hooks':
+            self.encoder = encode_ion
+            self.decoder = decode_ion
+        else:
+            raise BadRequest("Unknown message codec: %s" % codec)
+
+        # Numpy arrays as ext type are always decoded but only sent if enabled (older containers can't decode)
+        if get_safe(config, 'numpy_ext', False) and has_numpy:
+            base_encoder = self.encoder
+
+            def ndarray_ext_encoder(obj):
+                if type(obj) is np.ndarray:
+                    return encode_ndarray_ext(obj)
+                return base_encoder(obj)
+            self.encoder = ndarray_ext_encoder
+        self.ext_decoder = decode_ion_ext_copy if get_safe(config, 'numpy_copy', False) else decode_ion_ext
+
+        # Compressed messages are always decompressed but only compressed if enabled (older containers can't decode)
+        self.compress_codec = get_safe(config, 'compress_codec', None)
+        if self.compress_codec == "lz4" and not has_lz4:
+            log.warn("lz4 not available - using zlib message compression")
+            self.compress_codec = "zlib"
+        elif self.compress_codec and self.compress_codec not in ("zlib", "lz4"):
+            raise BadRequest("Unknown compression codec: %s" % self.compress_codec)
+        self.compress_threshold = get_safe(config, 'compress_threshold', 100000)
+        self.compress_level = get_safe(config, 'compress_level', 1)
+        log.debug("EncodeInterceptor enabled, codec=%s, compression=%s", codec, self.compress_codec)
 
     def outgoing(self, invocation):
         payload = invocation.message
 
+        if isinstance(payload, LazyIonMessage):
+            if not payload.touched:
+                # Pass-through: the received bytes are still valid
+                invocation.message = payload.raw_body
+                return self._check_outgoing(invocation)
+            payload = payload.materialize()
+
         # Compliance: Make sure sent message objects support DotDict as arguments.
         # Although DotDict is subclass of dict, msgpack does not like it
         if isinstance(payload, IonMessageObjectBase):
@@ -168,28 +428,56 @@ class EncodeInterceptor(Interceptor):
 
         # Msgpack the content to binary str - does nested IonObject encoding
         try:
-            invocation.message = msgpack.packb(payload, default=encode_ion)
+            invocation.message = msgpack.packb(payload, default=self.encoder)
         except Exception:
             log.exception("Illegal type in IonObject attributes: %s", payload)
             raise BadRequest("Illegal type in IonObject attributes")
 
+        return self._check_outgoing(invocation)
+
+    def _check_outgoing(self, invocation):
         # Make sure no Nones exist in headers - this indicates a problem somewhere up the stack.
         # pika will choke hard on them as well, masking the actual problem, so we catch here.
         nonelist = [(k, v) for k, v in invocation.headers.iteritems() if v is None]
         if nonelist:
             raise BadRequest("Invalid headers containing None values: %s" % str(nonelist))
 
+        # Never pass on a compression header from elsewhere
+        invocation.headers.pop(MSG_HEADER_COMPRESSION, None)
+
+        # Check the uncompressed size, which receivers also limit
         msg_size = len(invocation.message)
         if msg_size > self.max_message_size:
             raise BadRequest('The message size %s is larger than the max_message_size value of %s' % (
                 msg_size, self.max_message_size))
 
+        if self.compress_codec and msg_size >= self.compress_threshold:
+            start_time = time.time()
+            compressed = compress_body(self.compress_codec, invocation.message, self.compress_level)
+            # Stats for the message out callback, see pyon.net.endpoint
+            invocation.message_annotations[MSG_HEADER_COMPRESSION] = dict(
+                codec=self.compress_codec, raw_size=msg_size, size=len(compressed),
+                ratio=float(msg_size) / len(compressed), time=time.time() - start_time,
+                applied=len(compressed) < msg_size)
+            if len(compressed) < msg_size:
+                invocation.message = compressed
+                invocation.headers[MSG_HEADER_COMPRESSION] = self.compress_codec
+
         return invocation
 
 
     def incoming(self, invocation):
+        compression = invocation.headers.pop(MSG_HEADER_COMPRESSION, None)
+        if compression:
+            invocation.message = decompress_body(compression, invocation.message, self.max_message_size)
+
+        if invocation.args.get("lazy_decode", False):
+            # Decoding deferred until message content is accessed
+            invocation.message = LazyIonMessage(invocation.message, self.decoder, self.ext_decoder)
+            return invocation
+
         # Un-Msgpack the content from binary string - does IonObject decoding
-        invocation.message = msgpack.unpackb(invocation.message, object_hook=decode_ion, use_list=1)
+        invocation.message = msgpack.unpackb(invocation.message, object_hook=self.decoder, ext_hook=self.ext_decoder, use_list=1)
 
         # At this point there could be a recursive unicode treatment, if necessary
 
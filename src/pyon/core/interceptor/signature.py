@@ -21,14 +21,35 @@ class DictSorter(IonObjectSerializationBase):
 
 
 class SignatureInterceptor(Interceptor):
+    """
+    Signs outgoing and verifies incoming messages with the container certificate, if authentication is enabled.
+    By default the signature is computed over a key sorted string form of the message object.
+    With sign_encoded, the signature is computed over the encoded message bytes instead. This requires the
+    interceptor to come after encode in the outgoing stack and before encode in the incoming stack,
+    on all containers. Signatures of the two modes do not verify against each other, so the option and the
+    stack order must be switched on all containers together, after all run a version supporting it.
+    """
+    sign_encoded = False
+
     def __init__(self, *args, **kwargs):
         Interceptor.__init__(self)
         self._dict_sorter = DictSorter()
         self.auth = authentication.Authentication()
 
+    def configure(self, config):
+        config = config or {}
+        self.sign_encoded = config.get("sign_encoded", False) is True
+
+    def _get_signed_content(self, invocation):
+        if not self.sign_encoded:
+            return str(self._dict_sorter.serialize(invocation.message))
+        if type(invocation.message) is not str:
+            raise BadRequest("SignatureInterceptor with sign_encoded requires encoded message (check stack order)")
+        return invocation.message
+
     def outgoing(self, invocation):
-        msg = str(self._dict_sorter.serialize(invocation.message))
         if self.auth.authentication_enabled():
+            msg = self._get_signed_content(invocation)
             signer = 'no-signer'
             if Container.instance is not None:
                 signer = Container.instance.id
@@ -39,11 +60,11 @@ class SignatureInterceptor(Interceptor):
         return invocation
 
     def incoming(self, invocation):
-        msg = str(self._dict_sorter.serialize(invocation.message))
         if self.auth.authentication_enabled():
             headers = invocation.headers
             if not 'signature' in headers or not 'signer' in headers or not 'certificate' in headers:
                 raise BadRequest("Digital signature missing from request")
+            msg = self._get_signed_content(invocation)
             status, cause = self.auth.verify_message(msg, headers['certificate'], headers['signature'])
             if status != 'Valid':
                 raise BadRequest("Digital signature invalid. Cause %s" % cause)
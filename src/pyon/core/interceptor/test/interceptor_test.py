@@ -7,8 +7,10 @@ from nose.plugins.attrib import attr
 
 from pyon.util.unit_test import PyonTestCase
 from pyon.core.interceptor.encode import EncodeInterceptor
+from pyon.core.object import IonObjectSerializer, LazyIonMessage
 from pyon.core.interceptor.validate import ValidateInterceptor
-from pyon.core.interceptor.interceptor import Invocation
+from pyon.core.interceptor.interceptor import Invocation, InterceptorPipeline, process_interceptors, \
+    enable_interceptor_timing, get_interceptor_stats, clear_interceptor_stats
 from pyon.public import IonObject, DotDict, BadRequest
 
 try:
@@ -62,6 +64,69 @@ class InterceptorTest(PyonTestCase):
         for d in c:
             self.assertTrue((a==d).all())
 
+    @unittest.skipIf(not _have_numpy, 'No numpy')
+    def test_numpy_ext(self):
+        encode = EncodeInterceptor()
+        encode.configure({"numpy_ext": True})
+        hooks_encode = EncodeInterceptor()
+        hooks_encode.configure({})
+
+        struct_array = np.zeros(5, dtype=[('time', 'i8'), ('temp', 'f4'), ('vec', 'f8', (3,))])
+        struct_array['time'] = range(5)
+        nested_array = np.zeros(3, dtype=[('id', 'i4'), ('pos', [('x', 'f8'), ('y', 'f8')]),
+                                          ('track', [('t', 'i8'), ('xy', 'f4', (2,))], (2,))])
+        nested_array['pos']['y'] = [1.5, 2.5, 3.5]
+        nested_array['track']['xy'][1] = [[1, 2], [3, 4]]
+        arrays = [np.arange(24, dtype='float32').reshape(2, 3, 4),
+                  np.arange(24, dtype='int16').reshape(4, 6)[:, ::2],
+                  np.array(5.5), struct_array, nested_array]
+        for a in arrays:
+            received = hooks_encode.incoming(encode.outgoing(Invocation(message={"a": a})))
+            b = received.message["a"]
+            self.assertEquals(a.dtype, b.dtype)
+            self.assertEquals(a.shape, b.shape)
+            self.assertTrue((a == b).all())
+            self.assertFalse(b.flags.writeable)
+
+        copy_encode = EncodeInterceptor()
+        copy_encode.configure({"numpy_ext": True, "numpy_copy": True})
+        b = copy_encode.incoming(encode.outgoing(Invocation(message=arrays[0]))).message
+        self.assertTrue((arrays[0] == b).all())
+        self.assertTrue(b.flags.writeable)
+
+    def test_compression(self):
+        encode = EncodeInterceptor()
+        encode.configure({"compress_codec": "zlib", "compress_threshold": 1000, "max_message_size": 20000})
+        plain_encode = EncodeInterceptor()
+        plain_encode.configure({"max_message_size": 20000})
+
+        # Below threshold: not compressed
+        inv = encode.outgoing(Invocation(message={"data": "x" * 100}))
+        self.assertNotIn("compression", inv.headers)
+        self.assertNotIn("compression", inv.message_annotations)
+
+        # Above threshold
+        msg = {"data": "x" * 10000}
+        inv = encode.outgoing(Invocation(message=msg, headers={"compression": "lz4"}))
+        self.assertEquals(inv.headers["compression"], "zlib")
+        self.assertTrue(inv.message_annotations["compression"]["applied"])
+        self.assertGreater(inv.message_annotations["compression"]["ratio"], 1)
+        self.assertLess(len(inv.message), 5000)
+
+        # Receivers decompress regardless of own config
+        compressed = inv.message
+        received = plain_encode.incoming(inv)
+        self.assertEquals(received.message, msg)
+        self.assertNotIn("compression", received.headers)
+
+        # max_message_size limits the uncompressed size, for senders and receivers
+        small_encode = EncodeInterceptor()
+        small_encode.configure({"compress_codec": "zlib", "compress_threshold": 1000, "max_message_size": 5000})
+        with self.assertRaises(BadRequest):
+            small_encode.outgoing(Invocation(message=msg))
+        with self.assertRaises(BadRequest):
+            small_encode.incoming(Invocation(message=compressed, headers={"compression": "zlib"}))
+
     def test_set(self):
         a = {1,2}
         invoke = Invocation()
@@ -121,7 +186,162 @@ class InterceptorTest(PyonTestCase):
 
         self.assertEquals(a,b)
 
+    def test_schema_codec(self):
+        obj = IonObject('Resource', name="res", alt_ids=["a:1"], addl={"key": {1, 2}, "sl": slice(1, 5, None)})
+        obj.description = u"unicode"
+        partial_obj = IonObject('Resource', name="partial")
+        del partial_obj.__dict__["addl"]
+        msg = {"objs": [obj, partial_obj], "num": 1, "cplx": complex(1, 2)}
+
+        hooks_encode = EncodeInterceptor()
+        hooks_encode.configure({})
+        schema_encode = EncodeInterceptor()
+        schema_encode.configure({"codec": "schema"})
+        with self.assertRaises(BadRequest):
+            EncodeInterceptor().configure({"codec": "unknown"})
+
+        # Both codecs produce the same bytes
+        hooks_bytes = hooks_encode.outgoing(Invocation(message=msg)).message
+        schema_bytes = schema_encode.outgoing(Invocation(message=msg)).message
+        self.assertEquals(hooks_bytes, schema_bytes)
+
+        received = schema_encode.incoming(Invocation(message=schema_bytes)).message
+        self.assertEquals(received, hooks_encode.incoming(Invocation(message=hooks_bytes)).message)
+        res_obj, res_partial = received["objs"]
+        self.assertEquals(type(res_obj), type(obj))
+        self.assertEquals(res_obj.addl, {"key": {1, 2}, "sl": slice(1, 5, None)})
+        self.assertEquals(res_obj.description, "unicode")
+        self.assertEquals(type(res_obj.description), str)
+        self.assertEquals(res_obj.type_, "Resource")
+        # Missing fields get their defaults, mutable defaults are not shared
+        self.assertEquals(res_partial.name, "partial")
+        self.assertEquals(res_partial.addl, {})
+        res_partial2 = schema_encode.incoming(Invocation(message=schema_bytes)).message["objs"][1]
+        self.assertIsNot(res_partial2.addl, res_partial.addl)
+        self.assertEquals(received["cplx"], complex(1, 2))
+
+        # Decoded message objects have no type_ attribute; unknown keys are handled as by the hooks codec
+        decoded = []
+        for obj_dict in ({"type_": "container_agent_spawn_process_out", "process_id": "p1"},
+                         {"type_": "Resource", "name": "extra", "unknown_attr": 1}):
+            hooks_obj = hooks_encode.incoming(Invocation(message=hooks_encode.outgoing(Invocation(message=dict(obj_dict))).message)).message
+            schema_obj = schema_encode.incoming(Invocation(message=schema_encode.outgoing(Invocation(message=dict(obj_dict))).message)).message
+            self.assertEquals(type(schema_obj), type(hooks_obj))
+            self.assertEquals(schema_obj.__dict__, hooks_obj.__dict__)
+            decoded.append(schema_obj)
+        self.assertEquals(decoded[0].__dict__, {"process_id": "p1"})
+
+    def test_lazy_decode(self):
+        encode = EncodeInterceptor()
+        encode.configure({})
+        obj = IonObject('ResourceEvent', origin="res1", base_types=["Event"], sub_type="SUB")
+        raw = encode.outgoing(Invocation(message=obj)).message
+
+        # Untouched: resent with the same bytes
+        lazy_msg = encode.incoming(Invocation(message=raw, lazy_decode=True)).message
+        self.assertIsInstance(lazy_msg, LazyIonMessage)
+        self.assertEquals(lazy_msg.origin, "res1")
+        self.assertEquals(lazy_msg.type_, "ResourceEvent")
+        self.assertFalse(lazy_msg.touched)
+        self.assertIn("origin", lazy_msg)
+        self.assertEquals(encode.outgoing(Invocation(message=lazy_msg)).message, raw)
+
+        self.assertEquals(lazy_msg.__dict__, {"origin": "res1", "type_": "ResourceEvent"})
+
+        # Persistence dict without materializing, same as serializer result
+        serializer = IonObjectSerializer()
+        self.assertEquals(serializer.serialize(lazy_msg, update_version=True), serializer.serialize(obj))
+        self.assertIsNone(lazy_msg._lazy_obj)
+
+        # Modifiable values accessed: re-encoded
+        self.assertEquals(lazy_msg.base_types, ["Event"])
+        self.assertTrue(lazy_msg.touched)
+        lazy_msg.sub_type = "NEW"
+        full_obj = lazy_msg.materialize()
+        self.assertEquals(type(full_obj), type(obj))
+        self.assertEquals(full_obj.sub_type, "NEW")
+        self.assertEquals(serializer.serialize(lazy_msg, update_version=True)["sub_type"], "NEW")
+        resent = encode.incoming(encode.outgoing(Invocation(message=lazy_msg))).message
+        self.assertEquals(resent.sub_type, "NEW")
+        self.assertEquals(resent.origin, "res1")
+
+        with self.assertRaises(AttributeError):
+            lazy_msg.unknown_field
+
+        # Fields not in the schema are not persisted, as for IonObjects
+        raw_extra = encode.outgoing(Invocation(message=dict(obj.__dict__, extra_field=1))).message
+        lazy_extra = encode.incoming(Invocation(message=raw_extra, lazy_decode=True)).message
+        self.assertEquals(serializer.serialize(lazy_extra, update_version=True), serializer.serialize(obj))
+
+    def test_pipeline(self):
+        encode = EncodeInterceptor()
+        encode.configure({})
+        validate = ValidateInterceptor()
+        validate.configure({"enabled": True})
+        out_pipeline = InterceptorPipeline([validate, encode], name="message_outgoing")
+        in_pipeline = InterceptorPipeline([encode, validate], name="message_incoming")
+
+        # Validate is a no-op on the outgoing path
+        self.assertEquals(len(out_pipeline), 2)
+        self.assertEquals([name for name, _ in out_pipeline.get_chain(Invocation.PATH_OUT)], ["EncodeInterceptor.outgoing"])
+        self.assertEquals(len(in_pipeline.get_chain(Invocation.PATH_IN)), 2)
+        validate.enabled = False
+        in_pipeline.compile()
+        self.assertEquals(len(in_pipeline.get_chain(Invocation.PATH_IN)), 1)
+
+        msg = {"data": [1, 2, 3]}
+        inv = process_interceptors(out_pipeline, Invocation(path=Invocation.PATH_OUT, message=msg))
+        inv = process_interceptors(in_pipeline, Invocation(path=Invocation.PATH_IN, message=inv.message))
+        self.assertEquals(inv.message, msg)
+
+        clear_interceptor_stats()
+        enable_interceptor_timing()
+        try:
+            inv = out_pipeline.process(Invocation(path=Invocation.PATH_OUT, message=msg))
+            in_pipeline.process(Invocation(path=Invocation.PATH_IN, message=inv.message))
+        finally:
+            enable_interceptor_timing(False)
+        stats = get_interceptor_stats()
+        self.assertEquals(set(stats), {"EncodeInterceptor.outgoing", "EncodeInterceptor.incoming"})
+        self.assertEquals(stats["EncodeInterceptor.incoming"]["count"], 1)
+        clear_interceptor_stats()
+
+    def test_signature_encoded(self):
+        import hashlib
+        from mock import Mock, patch
+        from pyon.core.interceptor.signature import SignatureInterceptor
+        auth = Mock()
+        auth.authentication_enabled.return_value = True
+        auth.sign_message.side_effect = lambda msg: hashlib.sha1(msg).hexdigest()
+        auth.verify_message.side_effect = lambda msg, cert, sig: ('Valid', 'OK') if hashlib.sha1(msg).hexdigest() == sig else ('Invalid', 'Mismatch')
+        auth.get_container_cert.return_value = "cert"
+        with patch('pyon.core.interceptor.signature.authentication.Authentication', Mock(return_value=auth)):
+            signature = SignatureInterceptor()
+            signature.configure({"sign_encoded": True})
+        encode = EncodeInterceptor()
+        encode.configure({})
 
+        msg = {"b": [1, 2], "a": {"y": 1, "x": 2}}
+        inv = signature.outgoing(encode.outgoing(Invocation(message=msg)))
+        self.assertEquals(inv.headers["signature"], hashlib.sha1(inv.message).hexdigest())
+        received = encode.incoming(signature.incoming(inv))
+        self.assertEquals(received.message, msg)
+
+        inv = signature.outgoing(encode.outgoing(Invocation(message=msg)))
+        inv.message = inv.message[:-1] + "X"
+        with self.assertRaises(BadRequest):
+            signature.incoming(inv)
+
+        # Authentication state is checked per message, not when compiling the pipeline
+        auth.authentication_enabled.return_value = False
+        out_pipeline = InterceptorPipeline([encode, signature], name="message_outgoing")
+        self.assertNotIn("signature", out_pipeline.process(Invocation(path=Invocation.PATH_OUT, message=msg)).headers)
+        auth.authentication_enabled.return_value = True
+        self.assertIn("signature", out_pipeline.process(Invocation(path=Invocation.PATH_OUT, message=msg)).headers)
+
+        # Must be placed after encode
+        with self.assertRaises(BadRequest):
+            signature.outgoing(Invocation(message=msg))
 
     def test_decorator_validation(self):
         #
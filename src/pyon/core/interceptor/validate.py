@@ -2,7 +2,7 @@
 
 """Messaging interceptor to validate IonObjects"""
 
-from pyon.core.interceptor.interceptor import Interceptor
+from pyon.core.interceptor.interceptor import Interceptor, Invocation
 from pyon.core.bootstrap import IonObject, CFG
 from pyon.core.exception import BadRequest
 from pyon.core.object import IonObjectBase, walk
@@ -24,6 +24,9 @@ class ValidateInterceptor(Interceptor):
         self.raise_exception = CFG.get_safe("container.objects.validate.interceptor_error", False) is True
         log.debug("ValidateInterceptor enabled: %s" % self.enabled)
 
+    def is_noop(self, path):
+        return path == Invocation.PATH_OUT or not self.enabled
+
     def outgoing(self, invocation):
         # Set validate flag in header if IonObject(s) found in message
 
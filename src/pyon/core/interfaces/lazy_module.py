@@ -0,0 +1,195 @@
+#!/usr/bin/env python
+
+"""Lazy generated interface modules (objects, messages). Classes are materialized on first access."""
+
+__author__ = 'Michael Meisinger'
+
+from collections import MutableMapping, OrderedDict
+import sys
+import types
+
+
+LAZY_MODULE_TEMPLATE = '''#!/usr/bin/env python
+
+#
+# This file is auto generated. Don't edit.
+# Classes are defined on first attribute access (see pyon.core.interfaces.lazy_module)
+#
+
+from pyon.core.interfaces.lazy_module import LazyClassModule
+
+_header = %(header)r
+
+_class_defs = [
+%(class_defs)s
+]
+
+LazyClassModule.install(__name__, _header, _class_defs)
+'''
+
+
+class LazyClassModule(types.ModuleType):
+    """
+    Module that replaces a generated interface module in sys.modules. Holds the source of each
+    generated class and defines a class (and the classes it depends on) on first attribute access.
+    """
+
+    @classmethod
+    def install(cls, module_name, header, class_defs):
+        """
+        Replaces the module with given name in sys.modules by a lazy module.
+        @param header      Source code executed immediately (imports)
+        @param class_defs  List of tuples (class name, base class names, referenced class names, class source)
+        """
+        orig_module = sys.modules[module_name]
+        module = cls(module_name, orig_module.__doc__)
+        module.__file__ = getattr(orig_module, "__file__", None)
+        module.__package__ = getattr(orig_module, "__package__", None)
+        module._orig_module = orig_module     # Python 2 clears the globals of garbage collected modules
+        module._init_classes(header, class_defs)
+        sys.modules[module_name] = module
+        return module
+
+    def _init_classes(self, header, class_defs):
+        self._class_defs = OrderedDict((name, (tuple(bases), tuple(deps), source)) for name, bases, deps, source in class_defs)
+        self.__all__ = list(self._class_defs.keys())
+        exec compile(header, self.__file__ or self.__name__, "exec") in self.__dict__
+
+    def __getattr__(self, name):
+        # Only called if name is not yet defined in the module
+        class_defs = self.__dict__.get("_class_defs", None)
+        if class_defs is None or name not in class_defs:
+            raise AttributeError("'module' object has no attribute '%s'" % name)
+        return self._define_class(name)
+
+    def __dir__(self):
+        return sorted(set(self.__dict__.keys()) | set(self._class_defs.keys()))
+
+    def _define_class(self, name):
+        if name in self.__dict__:
+            return self.__dict__[name]
+        bases, deps, source = self._class_defs[name]
+        for dep_name in deps:
+            if dep_name not in self.__dict__:
+                self._define_class(dep_name)
+        exec compile(source, "%s:%s" % (self.__file__ or self.__name__, name), "exec") in self.__dict__
+        return self.__dict__[name]
+
+    def get_class_names(self):
+        """ Returns the names of all generated classes in definition order, defined or not. """
+        return self._class_defs.keys()
+
+    def get_class_bases(self, name):
+        """ Returns the tuple of base class names of a generated class, without defining it. """
+        return self._class_defs[name][0]
+
+    def is_defined(self, name):
+        return name in self.__dict__
+
+    def define_all(self):
+        """ Defines all classes. Use before forking or to get eager behavior. """
+        for name in self._class_defs:
+            self._define_class(name)
+
+
+class LazyClassMap(MutableMapping):
+    """
+    Mapping of class name to class. Classes of lazy modules are added by name and
+    only defined when the entry is accessed.
+    """
+    def __init__(self):
+        self._classes = {}
+        self._lazy_modules = {}
+
+    def add_lazy(self, name, module):
+        self._lazy_modules[name] = module
+
+    def __getitem__(self, name):
+        try:
+            return self._classes[name]
+        except KeyError:
+            module = self._lazy_modules[name]
+            clzz = self._classes[name] = getattr(module, name)
+            return clzz
+
+    def __setitem__(self, name, clzz):
+        self._classes[name] = clzz
+
+    def __delitem__(self, name):
+        if name not in self:
+            raise KeyError(name)
+        self._classes.pop(name, None)
+        self._lazy_modules.pop(name, None)
+
+    def __contains__(self, name):
+        return name in self._classes or name in self._lazy_modules
+
+    def __iter__(self):
+        for name in self._classes:
+            yield name
+        for name in self._lazy_modules:
+            if name not in self._classes:
+                yield name
+
+    def __len__(self):
+        return len(self._classes) + sum(1 for name in self._lazy_modules if name not in self._classes)
+
+    def clear(self):
+        self._classes.clear()
+        self._lazy_modules.clear()
+
+
+# -----------------------------------------------------------------------------
+# Generator support
+
+def _get_code_names(code):
+    """ Returns the set of global names referenced in a code object and its nested code objects """
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names.update(_get_code_names(const))
+    return names
+
+
+def split_module_source(source):
+    """
+    Splits the source code of a generated module into the header (imports etc) and
+    a list of tuples (class name, class source) for each top level class definition.
+    """
+    header_lines = []
+    classes = []
+    cur_name, cur_lines = None, None
+    for line in source.split("\n"):
+        if line.startswith("class "):
+            if cur_name:
+                classes.append((cur_name, "\n".join(cur_lines) + "\n"))
+            cur_name = line[len("class "):].split("(", 1)[0].split(":", 1)[0].strip()
+            cur_lines = [line]
+        elif cur_name:
+            cur_lines.append(line)
+        else:
+            header_lines.append(line)
+    if cur_name:
+        classes.append((cur_name, "\n".join(cur_lines) + "\n"))
+    return "\n".join(header_lines) + "\n", classes
+
+
+def generate_lazy_module(source):
+    """
+    Converts the source code of a generated interface module into the source of a
+    lazy module that defines each class on first access.
+    """
+    header, classes = split_module_source(source)
+    class_names = set(name for name, _ in classes)
+
+    class_defs = []
+    for name, class_source in classes:
+        # Classes referenced anywhere in the class statement (bases, defaults, schema) must be defined first
+        code = compile(class_source, name, "exec")
+        deps = sorted((_get_code_names(code) & class_names) - {name})
+        class_line = class_source.split("\n", 1)[0]
+        bases = class_line.split("(", 1)[1].rsplit(")", 1)[0] if "(" in class_line else ""
+        bases = [base.strip().rsplit(".", 1)[-1] for base in bases.split(",") if base.strip()]
+        class_defs.append("    (%r, %r, %r,\n     %r)," % (name, bases, deps, class_source))
+
+    return LAZY_MODULE_TEMPLATE % dict(header=header, class_defs="\n".join(class_defs))
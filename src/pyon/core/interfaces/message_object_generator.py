@@ -11,6 +11,7 @@ import os
 import re
 
 from pyon.core.path import list_files_recursive
+from pyon.core.interfaces.lazy_module import generate_lazy_module
 from pyon.core.interfaces.interface_util import get_service_definition_from_datastore
 
 enums_by_name = {}
@@ -377,6 +378,8 @@ class MessageObjectGenerator:
                 os.unlink(messagemodelfile)
             except:
                 pass
+            if not getattr(opts, "eager_classes", False):
+                messageobject_output_text = generate_lazy_module(messageobject_output_text)
             print " Writing message interfaces to '" + messagemodelfile + "'"
             with open(messagemodelfile, 'w') as f:
                 f.write(messageobject_output_text)
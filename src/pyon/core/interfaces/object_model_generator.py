@@ -14,6 +14,7 @@ import yaml
 import cgi
 
 from pyon.core.path import list_files_recursive
+from pyon.core.interfaces.lazy_module import generate_lazy_module
 from pyon.core.interfaces.interface_util import get_object_definition_from_datastore, get_service_definition_from_datastore
 
 
@@ -734,7 +735,10 @@ class ObjectModelGenerator:
             os.unlink(datamodelfile)
         except:
             pass
+        output_text = self.dataobject_output_text
+        if not getattr(opts, "eager_classes", False):
+            output_text = generate_lazy_module(output_text)
         print " Writing object interfaces to '" + datamodelfile + "'"
         with open(datamodelfile, 'w') as f:
-            f.write(self.dataobject_output_text)
+            f.write(output_text)
 
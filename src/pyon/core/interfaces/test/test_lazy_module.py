@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+
+__author__ = 'Michael Meisinger'
+
+import sys
+import types
+from nose.plugins.attrib import attr
+
+from pyon.core.interfaces.lazy_module import LazyClassModule, LazyClassMap, generate_lazy_module
+from pyon.util.unit_test import PyonTestCase
+
+MODULE_SOURCE = """#!/usr/bin/env python
+
+from pyon.core.object import IonObjectBase
+
+class IonEnum(object):
+    pass
+
+class ColorEnum(IonEnum):
+    RED = 1
+    BLUE = 2
+
+class Shape(IonObjectBase):
+    def __init__(self, color=ColorEnum.RED):
+        self.color = color
+
+class Circle(Shape):
+    def __init__(self, color=ColorEnum.RED, radius=1.0):
+        Shape.__init__(self, color)
+        self.radius = radius
+"""
+
+
+@attr('UNIT', group='coi')
+class TestLazyModule(PyonTestCase):
+
+    def _load_module(self, source, module_name="test_lazy_interface_module"):
+        module = types.ModuleType(module_name)
+        sys.modules[module_name] = module
+        self.addCleanup(sys.modules.pop, module_name, None)
+        exec compile(source, module_name, "exec") in module.__dict__
+        return sys.modules[module_name]
+
+    def test_lazy_module(self):
+        lazy_source = generate_lazy_module(MODULE_SOURCE)
+        module = self._load_module(lazy_source)
+
+        self.assertIsInstance(module, LazyClassModule)
+        self.assertEquals(module.get_class_names(), ["IonEnum", "ColorEnum", "Shape", "Circle"])
+        self.assertEquals(module.get_class_bases("Circle"), ("Shape",))
+        self.assertFalse(module.is_defined("Circle"))
+        self.assertFalse(module.is_defined("ColorEnum"))
+
+        # Defines the class and all classes it depends on
+        circle = module.Circle(radius=2.0)
+        self.assertEquals(circle.color, 1)
+        self.assertEquals(circle.radius, 2.0)
+        self.assertTrue(module.is_defined("Shape"))
+        self.assertTrue(module.is_defined("ColorEnum"))
+        self.assertIsInstance(circle, module.Shape)
+        self.assertEquals(type(circle).__module__, "test_lazy_interface_module")
+
+        self.assertIn("IonEnum", dir(module))
+        with self.assertRaises(AttributeError):
+            module.Square
+
+        module.define_all()
+        self.assertTrue(module.is_defined("IonEnum"))
+
+    def test_lazy_class_map(self):
+        module = self._load_module(generate_lazy_module(MODULE_SOURCE))
+
+        class_map = LazyClassMap()
+        class_map["Other"] = object
+        class_map.add_lazy("Shape", module)
+        class_map.add_lazy("Circle", module)
+
+        self.assertIn("Circle", class_map)
+        self.assertEquals(len(class_map), 3)
+        self.assertEquals(set(class_map), {"Other", "Shape", "Circle"})
+        self.assertFalse(module.is_defined("Shape"))
+
+        self.assertIs(class_map["Shape"], module.Shape)
+        self.assertIs(class_map.get("Circle"), module.Circle)
+        self.assertIsNone(class_map.get("Square"))
+        self.assertEquals(len(class_map), 3)
+
+        del class_map["Circle"]
+        self.assertNotIn("Circle", class_map)
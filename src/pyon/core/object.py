@@ -6,6 +6,7 @@ import ast
 import os
 import re
 import inspect
+import msgpack
 from collections import OrderedDict, Mapping, Iterable
 
 from pyon.util.log import log
@@ -61,6 +62,16 @@ class IonObjectBase(object):
         """
         Compare fields to the schema and raise AttributeError if mismatched.
         Named _validate instead of validate because the data may have a field named "validate".
+        Uses a validator compiled for the object's class on first call (see compile_validator),
+        or the schema interpreting _validate_schema if compiled validation is turned off.
+        """
+        if _compiled_validation:
+            return compile_validator(type(self))(self, validate_objects)
+        return self._validate_schema(validate_objects)
+
+    def _validate_schema(self, validate_objects=True):
+        """
+        Validation by interpreting the class _schema. Semantics define what compiled validators must do.
         """
         fields, schema = self.__dict__, self._schema
 
@@ -136,7 +147,7 @@ class IonObjectBase(object):
                     if field_val in enum_classes[schema_val_type]._str_map:
                         continue
                     raise AttributeError("Invalid enum value '%d' for field '%s.%s', should be between 1 and %d" %
-                            (fields[key], type(self).__name__, key, len(enum_classes(schema_val_type)._str_map)))
+                            (fields[key], type(self).__name__, key, len(enum_classes[schema_val_type]._str_map)))
 
                 # Tuple allowed for list type (Msgpack decodes list to tuples)
                 if type(field_val) == tuple and schema_val_type == 'list':
@@ -270,9 +281,10 @@ class IonObjectBase(object):
     def _check_inheritance_chain(self, typ, expected_type):
         return any(baseclz.__name__ == expected_type for baseclz in typ.__mro__)
 
-    def _check_collection_content(self, key, list_values, content_types):
+    def _check_collection_content(self, key, list_values, content_types, split_content_types=None):
         from pyon.core.registry import issubtype
-        split_content_types = {t.strip() for t in content_types.split(',')}
+        if split_content_types is None:
+            split_content_types = {t.strip() for t in content_types.split(',')}
 
         for value in list_values:
             for content_type in split_content_types:
@@ -291,8 +303,9 @@ class IonObjectBase(object):
                 raise AttributeError("Invalid value type '%s' in collection field '%s.%s', should be one of '%s'" %
                         (value, type(self).__name__, key, content_types))
 
-    def _check_content(self, key, value, content_types):
-        split_content_types = {t.strip() for t in content_types.split(',')}
+    def _check_content(self, key, value, content_types, split_content_types=None):
+        if split_content_types is None:
+            split_content_types = {t.strip() for t in content_types.split(',')}
 
         for content_type in split_content_types:
             if type(value).__name__ == content_type:
@@ -315,6 +328,202 @@ class IonObjectBase(object):
                     (type(self).__name__, key, min_val, max_val))
 
 
+# -----------------------------------------------------------------------------
+# Compiled validators
+
+# Switch between compiled per-class validators and interpreted _schema validation
+_compiled_validation = True
+
+# Classes with a compiled _validate set in their class dict
+_compiled_classes = set()
+
+# Type names that can never contain IonObjects
+_SCALAR_TYPES = {'str', 'bool', 'int', 'float', 'long', 'NoneType'}
+
+# Type names that cannot be enums
+_BUILTIN_TYPES = _SCALAR_TYPES | {'list', 'dict', 'OrderedDict', 'tuple', 'set'}
+
+
+def set_compiled_validation(enabled=True):
+    """Turns use of compiled per-class validators on or off. Off falls back to the interpreted path."""
+    global _compiled_validation
+    _compiled_validation = bool(enabled)
+    if not _compiled_validation:
+        for clzz in _compiled_classes:
+            if "_validate" in clzz.__dict__:
+                del clzz._validate
+        _compiled_classes.clear()
+
+
+def _get_enum_classes():
+    from pyon.core.registry import enum_classes
+    return enum_classes
+
+
+def _check_inheritance(typ, expected_type):
+    return any(baseclz.__name__ == expected_type for baseclz in typ.__mro__)
+
+
+def _parse_min_max(value_range):
+    range_parts = value_range.split(',', 1)
+    return ast.literal_eval(range_parts[0].strip()), ast.literal_eval(range_parts[-1].strip())
+
+
+def _validate_children(field_val):
+    """Validates IonObjects in a field value and its first-level collection entries"""
+    if isinstance(field_val, IonObjectBase):
+        field_val._validate()
+    elif isinstance(field_val, Mapping):
+        for subkey in field_val:
+            subval = field_val[subkey]
+            if isinstance(subval, IonObjectBase):
+                subval._validate()
+    elif isinstance(field_val, Iterable):
+        for subval in field_val:
+            if isinstance(subval, IonObjectBase):
+                subval._validate()
+
+
+def compile_validator(clzz):
+    """
+    Returns the _validate function specialized for the given IonObject class, generating it on first use.
+    Type checks and decorator constraints of the _schema are unrolled per field, with value ranges and
+    regular expressions precompiled. Semantics are identical to IonObjectBase._validate_schema, except that
+    fields are checked in schema order, which affects which error is reported for multiple invalid fields.
+    """
+    validate_func = clzz.__dict__.get("_validate", None)
+    if validate_func is not None and clzz in _compiled_classes:
+        return validate_func
+    if clzz is IonObjectBase or clzz is IonMessageObjectBase:
+        return IonObjectBase._validate_schema.im_func
+
+    schema = clzz._schema
+    consts = dict(_cls=clzz, _schema=schema, _allowed=frozenset(schema) | BUILT_IN_ATTRS,
+                  _dispatch=IonObjectBase.__dict__['_validate'], BUILT_IN_ATTRS=BUILT_IN_ATTRS,
+                  OrderedDict=OrderedDict, IonObjectBase=IonObjectBase, _get_enum_classes=_get_enum_classes,
+                  _check_inheritance=_check_inheritance, _validate_children=_validate_children)
+    lines = ["def _validate(self, validate_objects=True):",
+             "    if type(self) is not _cls:",
+             "        return _dispatch(self, validate_objects)",
+             "    fields = self.__dict__",
+             "    if not fields.viewkeys() <= _allowed:",
+             "        raise AttributeError('Invalid field(s): %r' % (list(fields.viewkeys() - _schema.viewkeys() - BUILT_IN_ATTRS)))"]
+
+    for key, schema_val in schema.iteritems():
+        if DECO_VALIDATE_REQUIRED in schema_val.get('decorators', {}):
+            lines.append("    if fields.get(%r, None) is None:" % key)
+            lines.append("        raise AttributeError(%r)" % ("Value required for '%s'" % key))
+
+    for idx, (key, schema_val) in enumerate(schema.iteritems()):
+        if key in BUILT_IN_ATTRS:
+            continue
+        val_type = schema_val['type']
+        decos = schema_val.get('decorators', {})
+        content_types = decos.get(DECO_VALIDATE_CONTENT_TYPE, None)
+        if content_types is not None:
+            consts["_ct%s" % idx] = {t.strip() for t in content_types.split(',')}
+
+        lines.append("    if %r in fields:" % key)
+        lines.append("        v = fields[%r]" % key)
+
+        # Side effects: correct downgraded float/long and dict for OrderedDict
+        if val_type in ('float', 'long'):
+            lines.append("        if isinstance(v, int):")
+            lines.append("            v = fields[%r] = %s(v)" % (key, val_type))
+        elif val_type == 'OrderedDict':
+            lines.append("        if type(v) == dict:")
+            lines.append("            v = fields[%r] = OrderedDict(v)" % key)
+
+        matched = []
+        pattern = decos.get(DECO_VALIDATE_VALUE_PATTERN, None)
+        if val_type == 'str' and pattern is not None:
+            consts["_re%s" % idx] = re.compile(pattern)
+            matched.append("if not _re%s.match(v):" % idx)
+            matched.append("    raise AttributeError(\"Invalid value pattern %%s for field '%%s.%%s', should match regular expression %%s\" %% "
+                           "(v, type(self).__name__, %r, %r))" % (key, pattern))
+
+        value_range = decos.get(DECO_VALIDATE_VALUE_RANGE, None)
+        if val_type in ('int', 'float', 'long') and value_range is not None:
+            try:
+                consts["_min%s" % idx], consts["_max%s" % idx] = _parse_min_max(value_range)
+                matched.append("if v < _min%s or v > _max%s:" % (idx, idx))
+                matched.append("    raise AttributeError(\"Invalid value %%s for field '%%s.%%s', should be between %%d and %%d\" %% "
+                               "(str(v), type(self).__name__, %r, _min%s, _max%s))" % (key, idx, idx))
+            except Exception:
+                # Leave invalid ranges to fail at validation time, as in the interpreted path
+                matched.append("self._check_numeric_value_range(%r, v, %r)" % (key, value_range))
+
+        if content_types is not None:
+            if val_type == 'list':
+                matched.append("self._check_collection_content(%r, v, %r, _ct%s)" % (key, content_types, idx))
+            elif val_type in ('dict', 'OrderedDict'):
+                matched.append("self._check_collection_content(%r, v.values(), %r, _ct%s)" % (key, content_types, idx))
+            else:
+                matched.append("self._check_content(%r, v, %r, _ct%s)" % (key, content_types, idx))
+
+        content_count = decos.get(DECO_VALIDATE_CONTENT_COUNT, None)
+        if content_count is not None and val_type in ('list', 'dict', 'OrderedDict'):
+            try:
+                consts["_cmin%s" % idx], consts["_cmax%s" % idx] = _parse_min_max(content_count)
+                matched.append("if len(v) < _cmin%s or len(v) > _cmax%s:" % (idx, idx))
+                matched.append("    raise AttributeError(\"Invalid value length for collection field '%%s.%%s', should be between %%d and %%d\" %% "
+                               "(type(self).__name__, %r, _cmin%s, _cmax%s))" % (key, idx, idx))
+            except Exception:
+                matched.append("self._check_collection_length(%r, len(v), %r)" % (key, content_count))
+
+        if val_type not in _SCALAR_TYPES:
+            matched.append("if validate_objects:")
+            matched.append("    _validate_children(v)")
+
+        type_cond = "t is not %s and t.__name__ != %r" % (val_type, val_type) if val_type in _BUILTIN_TYPES and val_type != 'OrderedDict' \
+            else "t.__name__ != %r" % val_type
+        if val_type == 'int':
+            type_cond += " and t is not long and t.__name__ != 'long'"
+        if val_type == 'NoneType':
+            # All types are allowed - checks only apply to None values
+            if matched:
+                lines.append("        if v is None:")
+                lines.extend("            " + line for line in matched)
+            else:
+                del lines[-2:]
+            continue
+
+        lines.append("        t = type(v)")
+        lines.append("        if %s:" % type_cond)
+        skip_conds = ["v is None"]
+        if val_type == 'str':
+            skip_conds.append("t.__name__ == 'unicode'")
+        if val_type in ('dict', 'OrderedDict'):
+            skip_conds.append("isinstance(v, IonObjectBase)")
+        if val_type == 'list':
+            skip_conds.append("t == tuple")
+        skip_conds.append("_check_inheritance(t, %r)" % val_type)
+        lines.append("            if %s:" % " or ".join(skip_conds))
+        lines.append("                pass")
+        if val_type not in _BUILTIN_TYPES:
+            lines.append("            elif isinstance(v, int) and %r in _get_enum_classes():" % val_type)
+            lines.append("                if v not in _get_enum_classes()[%r]._str_map:" % val_type)
+            lines.append("                    raise AttributeError(\"Invalid enum value '%%d' for field '%%s.%%s', should be between 1 and %%d\" %% "
+                         "(v, type(self).__name__, %r, len(_get_enum_classes()[%r]._str_map)))" % (key, val_type))
+        if content_types is not None and val_type in ('dict', 'str'):
+            lines.append("            elif isinstance(v, IonObjectBase):")
+            lines.append("                self._check_content(%r, v, %r, _ct%s)" % (key, content_types, idx))
+        lines.append("            else:")
+        lines.append("                raise AttributeError(\"Invalid type '%%s' for field '%%s.%%s', should be '%%s'\" %% "
+                     "(t.__name__, type(self).__name__, %r, %r))" % (key, val_type))
+        if matched:
+            lines.append("        else:")
+            lines.extend("            " + line for line in matched)
+
+    source = "\n".join(lines) + "\n"
+    exec compile(source, "<validator %s>" % clzz.__name__, "exec") in consts
+    validate_func = consts["_validate"]
+    validate_func.source = source
+    clzz._validate = validate_func
+    _compiled_classes.add(clzz)
+    return validate_func
+
+
 class IonMessageObjectBase(IonObjectBase):
     """
     Common base class for message object types.
@@ -322,6 +531,144 @@ class IonMessageObjectBase(IonObjectBase):
     pass
 
 
+IMMUTABLE_TYPES = (basestring, int, long, float, bool, type(None))
+
+
+class LazyIonMessage(object):
+    """
+    Received message body that keeps the raw msgpack bytes and decodes on first access.
+    The top level is unpacked into plain values without object hooks; a field is decoded
+    (including any nested IonObjects) when its attribute is first accessed.
+    A message without modifiable values accessed can be sent again without re-encoding.
+    Only decoded fields are kept in __dict__.
+    """
+    __slots__ = ("_lazy_raw", "_lazy_decoder", "_lazy_ext_decoder", "_lazy_fields", "_lazy_obj", "touched", "__dict__")
+
+    def __init__(self, raw_body, decoder, ext_decoder):
+        """
+        @param  decoder         msgpack object hook, e.g. pyon.core.interceptor.encode.decode_ion
+        @param  ext_decoder     msgpack ext hook, e.g. pyon.core.interceptor.encode.decode_ion_ext
+        """
+        object.__setattr__(self, "_lazy_raw", raw_body)
+        object.__setattr__(self, "_lazy_decoder", decoder)
+        object.__setattr__(self, "_lazy_ext_decoder", ext_decoder)
+        object.__setattr__(self, "_lazy_fields", None)
+        object.__setattr__(self, "_lazy_obj", None)
+        object.__setattr__(self, "touched", False)
+
+    @property
+    def raw_body(self):
+        return self._lazy_raw
+
+    def _get_fields(self):
+        if self._lazy_fields is None:
+            object.__setattr__(self, "_lazy_fields", msgpack.unpackb(self._lazy_raw, ext_hook=self._lazy_ext_decoder, use_list=1))
+        return self._lazy_fields
+
+    def _decode_value(self, value):
+        # Decodes bottom-up like msgpack object_hook would
+        if isinstance(value, dict):
+            return self._lazy_decoder({k: self._decode_value(v) for k, v in value.iteritems()})
+        elif isinstance(value, list):
+            return [self._decode_value(v) for v in value]
+        return value
+
+    def materialize(self):
+        """Returns the fully decoded message, reusing any fields decoded already"""
+        if self._lazy_obj is None:
+            fields = self._get_fields()
+            object.__setattr__(self, "touched", True)
+            if isinstance(fields, dict):
+                values = {k: self._decode_value(v) for k, v in fields.iteritems() if k not in self.__dict__}
+                values.update(self.__dict__)
+                obj = self._lazy_decoder(values)
+            else:
+                obj = self._decode_value(fields)
+            object.__setattr__(self, "_lazy_obj", obj)
+        return self._lazy_obj
+
+    def get_persistence_value(self):
+        """
+        Returns the message for IonObjectSerializer: the decoded object if materialized, otherwise
+        a dict with IonObject dicts limited to their schema fields. Fields not accessed so far are
+        converted without building any IonObjects.
+        """
+        if self._lazy_obj is not None:
+            return self._lazy_obj
+
+        fields = self._get_fields()
+        if not isinstance(fields, dict):
+            return self.materialize()
+
+        from pyon.core.bootstrap import get_obj_registry
+        obj_registry = get_obj_registry()
+
+        def schema_dict(value):
+            # Same fields as IonObjectSerializer keeps from an IonObject
+            schema = obj_registry.get_class(value["type_"])._schema
+            return {k: v for k, v in value.iteritems() if k in schema or k in BUILT_IN_ATTRS}
+
+        def plain_value(value):
+            if isinstance(value, dict):
+                value = {k: plain_value(v) for k, v in value.iteritems()}
+                if "type_" in value:
+                    if "__noion__" not in value:
+                        value = schema_dict(value)
+                elif "t" in value:
+                    value = self._lazy_decoder(value)
+                    if isinstance(value, (set, tuple)):
+                        value = list(value)
+                return value
+            elif isinstance(value, list):
+                return [plain_value(v) for v in value]
+            return value
+
+        obj_dict = {k: plain_value(v) for k, v in fields.iteritems() if k not in self.__dict__}
+        obj_dict.update(self.__dict__)
+        return schema_dict(obj_dict) if "type_" in obj_dict else obj_dict
+
+    def __getattr__(self, name):
+        # Only called if regular attribute lookup fails, i.e. for fields not yet decoded
+        if name.startswith("__"):
+            raise AttributeError(name)
+        if self._lazy_obj is not None:
+            return getattr(self._lazy_obj, name)
+        fields = self._get_fields()
+        if not isinstance(fields, dict):
+            return getattr(self.materialize(), name)
+        if name not in fields:
+            raise AttributeError("'%s' message has no attribute '%s'" % (fields.get("type_", "?"), name))
+        value = self._decode_value(fields[name])
+        self.__dict__[name] = value
+        if not isinstance(value, IMMUTABLE_TYPES):
+            # Value may get modified, so the raw body may not be valid anymore
+            object.__setattr__(self, "touched", True)
+        return value
+
+    def __setattr__(self, name, value):
+        if self._lazy_obj is not None:
+            setattr(self._lazy_obj, name, value)
+        self.__dict__[name] = value
+        object.__setattr__(self, "touched", True)
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+    def __contains__(self, item):
+        if self._lazy_obj is not None:
+            return item in self._lazy_obj
+        fields = self._get_fields()
+        return item in fields if isinstance(fields, dict) else item in self.materialize()
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self else default
+
+    def __str__(self):
+        return "LazyIonMessage(%s)" % self.materialize()
+
+    __repr__ = __str__
+
+
 def walk(o, cb, modify_key_value='value'):
     """
     Utility method to do recursive walking of a possible iterable (incl dicts) and return a
@@ -388,6 +735,9 @@ class IonObjectSerializer(IonObjectSerializationBase):
 
         def _transform(obj):
 
+            if isinstance(obj, LazyIonMessage):
+                obj = obj.get_persistence_value()
+
             if isinstance(obj, IonObjectBase):
                 res = {k:v for k, v in obj.__dict__.iteritems() if k in obj._schema or k in BUILT_IN_ATTRS}
                 if not 'type_' in res:
@@ -441,12 +791,8 @@ class IonObjectDeserializer(IonObjectSerializationBase):
             objc  = obj
             otype = objc['type_'].encode('ascii')   # Correct?
 
-            # don't supply a dict - we want the object to initialize with all its defaults intact,
-            # which preserves things like IonEnumObject and invokes the setattr behavior we want there.
-            ion_obj = self._obj_registry.new(otype)
-
             # get outdated attributes in data that are not defined in the current schema
-            extra_attributes = objc.viewkeys() - ion_obj._schema.viewkeys() - BUILT_IN_ATTRS
+            extra_attributes = objc.viewkeys() - self._obj_registry.get_class(otype)._schema.viewkeys() - BUILT_IN_ATTRS
             for extra in extra_attributes:
                 objc.pop(extra)
                 log.info('discard %s not in current schema' % extra)
@@ -454,11 +800,10 @@ class IonObjectDeserializer(IonObjectSerializationBase):
             for k, v in objc.iteritems():
                 # unicode translate to utf8
                 if isinstance(v, unicode):
-                    v = str(v.encode('utf8'))
-                if k != "type_":
-                    setattr(ion_obj, k, v)
+                    objc[k] = str(v.encode('utf8'))
 
-            return ion_obj
+            # Defaults are only created for attributes not in the dict
+            return self._obj_registry.new_from_dict(otype, objc)
 
         return obj
 
@@ -471,14 +816,7 @@ class IonObjectBlameDeserializer(IonObjectDeserializer):
             objc    = in_obj.copy()
             type    = objc['type_'].encode('ascii')
 
-            # don't supply a dict - we want the object to initialize with all its defaults intact,
-            # which preserves things like IonEnumObject and invokes the setattr behavior we want there.
-            ion_obj = self._obj_registry.new(type)
-            for k, v in objc.iteritems():
-                if k != "type_":
-                    setattr(ion_obj, k, v)
-
-            return ion_obj
+            return self._obj_registry.new_from_dict(type, objc)
 
         # Note: This check to detect an IonObject is a bit risky (only type_)
         if isinstance(obj, dict):
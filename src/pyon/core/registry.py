@@ -6,15 +6,22 @@ import inspect
 from copy import deepcopy
 
 from pyon.core.exception import NotFound
-from pyon.core.object import walk
+from pyon.core.interfaces.lazy_module import LazyClassModule, LazyClassMap
+from pyon.core.object import walk, set_compiled_validation, IonObjectBase, BUILT_IN_ATTRS
 
 import interface.objects
 import interface.messages
 
 
-enum_classes = {}
-model_classes = {}
-message_classes = {}
+enum_classes = LazyClassMap()
+model_classes = LazyClassMap()
+message_classes = LazyClassMap()
+
+class_bases = {}        # Class name -> tuple of base class names, for all registered classes
+_class_ancestors = {}   # Class name -> set of names of the class and all its base classes (cache)
+
+# Default values of these types are shared by all objects created from a template
+TEMPLATE_IMMUTABLE_TYPES = (basestring, int, long, float, bool, type(None))
 
 
 def getextends(type):
@@ -23,26 +30,29 @@ def getextends(type):
     @param type (str) Object type
     @retval List of object types that are extended by given type
     """
-    ret = []
-    base_clzz = model_classes[type]
-    for name in model_classes:
-        clzz = model_classes[name]
-        bases = inspect.getmro(clzz)
-        if base_clzz in bases:
-            ret.append(name)
-    return ret
+    if type not in model_classes:
+        raise KeyError(type)
+    return [name for name in model_classes if type in _get_ancestors(name)]
 
 
 def issubtype(obj_type, base_type):
-    obj_cls = model_classes.get(obj_type, None)
-    base_cls = model_classes.get(base_type, None)
-
-    if obj_cls and base_cls:
-        return base_cls in obj_cls.__mro__
+    if obj_type in model_classes and base_type in model_classes:
+        return base_type in _get_ancestors(obj_type)
 
     return False
 
 
+def _get_ancestors(type):
+    """ Returns the set of names of the given class and its base classes, without defining lazy classes """
+    ancestors = _class_ancestors.get(type, None)
+    if ancestors is None:
+        ancestors = {type}
+        for base in class_bases.get(type, ()):
+            ancestors.update(_get_ancestors(base))
+        _class_ancestors[type] = ancestors
+    return ancestors
+
+
 def isenum(clzz_name):
     return clzz_name in enum_classes
 
@@ -126,18 +136,49 @@ class IonObjectRegistry(object):
     validate_setattr = False
 
     def __init__(self):
-        classes = inspect.getmembers(interface.objects, inspect.isclass)
-        for name, clzz in classes:
-            if clzz.__bases__[0].__name__ == "IonEnum":
-                enum_classes[name] = clzz
-            else:
-                model_classes[name] = clzz
-        classes = inspect.getmembers(interface.messages, inspect.isclass)
-        for name, clzz in classes:
-            message_classes[name] = clzz
+        _class_ancestors.clear()
+        self._templates = {}
+        self._register_classes(interface.objects, is_message=False)
+        self._register_classes(interface.messages, is_message=True)
 
         from pyon.core.bootstrap import CFG
         self.validate_setattr = CFG.get_safe('container.objects.validate.setattr', False)
+        set_compiled_validation(CFG.get_safe('container.objects.validate.compiled', True))
+
+    def _register_classes(self, module, is_message=False):
+        """ Registers the classes of a generated interface module. Classes of lazy modules
+        are registered by name and defined on first access. """
+        if isinstance(module, LazyClassModule):
+            lazy_names = set(module.get_class_names())
+            classes = [(name, module.get_class_bases(name), True) for name in module.get_class_names()]
+            classes += [(name, tuple(b.__name__ for b in clzz.__bases__), False) for name, clzz in module.__dict__.items()
+                        if inspect.isclass(clzz) and name not in lazy_names]
+        else:
+            classes = [(name, tuple(b.__name__ for b in clzz.__bases__), False)
+                       for name, clzz in inspect.getmembers(module, inspect.isclass)]
+
+        for name, bases, is_lazy in classes:
+            if is_message:
+                class_map = message_classes
+            elif bases and bases[0] == "IonEnum":
+                class_map = enum_classes
+            else:
+                class_map = model_classes
+            if is_lazy:
+                class_map.add_lazy(name, module)
+            else:
+                class_map[name] = getattr(module, name)
+            class_bases[name] = bases
+
+    def get_class(self, _def):
+        """Returns the object, message or enum class for given type name"""
+        if _def in model_classes:
+            return model_classes[_def]
+        elif _def in message_classes:
+            return message_classes[_def]
+        elif _def in enum_classes:
+            return enum_classes[_def]
+        raise NotFound("No matching class found for name %s" % _def)
 
     def new(self, _def, _dict=None, **kwargs):
         """Instantiates an IonObject based on given object type name and initial values.
@@ -146,14 +187,7 @@ class IonObjectRegistry(object):
         @param _dict   A dict/DotDict/derivative with initial values
         @param kwargs  Additional initial values
         """
-        if _def in model_classes:
-            clzz = model_classes[_def]
-        elif _def in message_classes:
-            clzz = message_classes[_def]
-        elif _def in enum_classes:
-            clzz = enum_classes[_def]
-        else:
-            raise NotFound("No matching class found for name %s" % _def)
+        clzz = self.get_class(_def)
 
         # Conditionally override the __setattr__ method to include additional client side validation
         if self.validate_setattr:
@@ -183,7 +217,79 @@ class IonObjectRegistry(object):
             keywordargs = tmpdict
             keywordargs.update(kwargs)
             obj = clzz(**keywordargs)
-        else:
+        elif kwargs:
             obj = clzz(**kwargs)
+        else:
+            obj = self._new_from_template(_def, clzz)
+
+        return obj
+
+    def new_from_dict(self, _def, obj_dict):
+        """Instantiates an IonObject with the attribute values of a given dict, such as a decoded
+        message or a persisted document, as if created via new(_def) followed by setattr for each
+        entry. Default values are only created for attributes not present in the dict.
+        The dict is not modified; values are not copied or converted.
+        @param _def      Name of object type
+        @param obj_dict  A dict with attribute values (type_ is ignored)
+        """
+        clzz = self.get_class(_def)
+        immutables, mutables = self._templates.get(_def, None) or self._get_template(_def, clzz)
+
+        if self.validate_setattr:
+            extra_attributes = obj_dict.viewkeys() - clzz._schema.viewkeys() - BUILT_IN_ATTRS
+            if extra_attributes:
+                raise AttributeError("'%s' object has no attribute '%s'" % (clzz.__name__, extra_attributes.pop()))
+
+        obj_fields = dict(obj_dict)
+        for key, value in immutables.iteritems():
+            if key not in obj_fields:
+                obj_fields[key] = value
+        for key, factory in mutables:
+            if key not in obj_fields:
+                obj_fields[key] = factory()
+        if "type_" in immutables:
+            obj_fields["type_"] = immutables["type_"]
+        else:
+            obj_fields.pop("type_", None)
+
+        obj = clzz.__new__(clzz)
+        object.__setattr__(obj, "__dict__", obj_fields)
+        return obj
 
+    def get_template(self, _def):
+        """Returns the default template of a class: a dict of immutable default values and
+        a list of (attribute, factory) for mutable defaults. See new_from_dict"""
+        return self._templates.get(_def, None) or self._get_template(_def, self.get_class(_def))
+
+    def _new_from_template(self, _def, clzz):
+        """Instantiates an IonObject with default values from the class template, equivalent to clzz()"""
+        immutables, mutables = self._templates.get(_def, None) or self._get_template(_def, clzz)
+        obj_fields = immutables.copy()
+        for key, factory in mutables:
+            obj_fields[key] = factory()
+        obj = clzz.__new__(clzz)
+        object.__setattr__(obj, "__dict__", obj_fields)
         return obj
+
+    def _get_template(self, _def, clzz):
+        """
+        Returns the default template of a class, computed once from a default instance:
+        a dict of immutable default values and a list of (attribute, factory) for mutable defaults.
+        """
+        immutables, mutables = {}, []
+        for key, value in clzz().__dict__.iteritems():
+            if isinstance(value, TEMPLATE_IMMUTABLE_TYPES):
+                immutables[key] = value
+            elif type(value) is list and not value:
+                mutables.append((key, list))
+            elif type(value) is dict and not value:
+                mutables.append((key, dict))
+            elif isinstance(value, IonObjectBase) and type(value).__name__ in model_classes:
+                mutables.append((key, self._get_template_factory(type(value).__name__, type(value))))
+            else:
+                mutables.append((key, lambda value=value: deepcopy(value)))
+        template = self._templates[_def] = (immutables, mutables)
+        return template
+
+    def _get_template_factory(self, _def, clzz):
+        return lambda: self._new_from_template(_def, clzz)
@@ -34,6 +34,9 @@ CONTAINER_CERT_NAME = 'container.crt'
 CONTAINER_KEY_NAME = 'container.key'
 ORG_CERT_NAME = 'root.crt'
 
+# Maximum number of parsed certificates kept for signature verification
+CERT_CACHE_SIZE = 1000
+
 
 class Authentication(object):
     """
@@ -44,6 +47,7 @@ class Authentication(object):
         self.cont_key = None
         self.root_cert = None
         self.white_list = []
+        self._cert_cache = {}   # Certificate string -> parsed certificate info
 
         # Look for certificates and keys in "the usual places"
         certstore_path = self.certstore = CFG.get_safe('authentication.certstore', CERTSTORE_PATH)
@@ -76,6 +80,7 @@ class Authentication(object):
     def add_to_white_list(self, root_cert_string):
         log.debug("Adding certificate <%s> to white list" % root_cert_string)
         self.white_list.append(root_cert_string)
+        self._cert_cache.clear()
 
     def get_container_cert(self):
         return self.cont_cert
@@ -128,8 +133,7 @@ class Authentication(object):
         hash = hashlib.sha1(message).hexdigest()
 
         # Check validity of signature
-        x509 = X509.load_cert_string(cert_string)
-        pubkey = x509.get_pubkey()
+        pubkey = self._get_cert_info(cert_string)["pubkey"]
         pubkey.verify_init()
         pubkey.verify_update(hash)
         outcome = pubkey.verify_final(signed_message)
@@ -180,6 +184,25 @@ class Authentication(object):
 
         return attributes
 
+    def _get_cert_info(self, cert_string):
+        """
+        Returns parsed certificate, public key, validity dates and white list status for a certificate string.
+        Results are cached, so that signers' certificates are parsed and checked once, not per message.
+        """
+        cert_info = self._cert_cache.get(cert_string, None)
+        if cert_info is None:
+            x509 = X509.load_cert_string(cert_string)
+            cert_info = dict(
+                x509=x509,
+                pubkey=x509.get_pubkey(),
+                not_before=datetime.datetime.strptime(str(x509.get_not_before()), "%b %d %H:%M:%S %Y %Z"),
+                not_after=datetime.datetime.strptime(str(x509.get_not_after()), "%b %d %H:%M:%S %Y %Z"),
+                in_white_list=any(self.is_certificate_descended_from(cert_string, root_cert) for root_cert in self.white_list))
+            if len(self._cert_cache) >= CERT_CACHE_SIZE:
+                self._cert_cache.clear()
+            self._cert_cache[cert_string] = cert_info
+        return cert_info
+
     def is_certificate_valid(self, cert_string):
         """
         This returns if the certificate is valid.
@@ -192,10 +215,7 @@ class Authentication(object):
             return 'Invalid', ' Certificate does not derive from any known root certificates'
 
     def is_certificate_in_white_list(self, cert_string):
-        for root_cert in self.white_list:
-            if self.is_certificate_descended_from(cert_string, root_cert):
-                return True
-        return False
+        return self._get_cert_info(cert_string)["in_white_list"]
 
     def is_certificate_descended_from(self, cert_string, root_cert):
         """
@@ -219,9 +239,8 @@ class Authentication(object):
         """
         Test if the current date is covered by the certificates valid within date range.
         """
-        cert = X509.load_cert_string(cert_string)
-        nvb = datetime.datetime.strptime(str(cert.get_not_before()), "%b %d %H:%M:%S %Y %Z")
-        nva = datetime.datetime.strptime(str(cert.get_not_after()), "%b %d %H:%M:%S %Y %Z")
+        cert_info = self._get_cert_info(cert_string)
+        nvb, nva = cert_info["not_before"], cert_info["not_after"]
         now = datetime.datetime.utcnow()
 
         if now < nvb:
@@ -24,6 +24,39 @@ class ObjectTest(IonIntegrationTestCase):
         self.assertEqual(obj.name, '')
         self.assertEqual(obj.time, "1341269890404")
 
+    def test_new_from_template(self):
+        obj1 = self.registry.new('SampleObject')
+        obj2 = self.registry.new('SampleObject')
+        self.assertEqual(obj1.__dict__, self.registry.get_class('SampleObject')().__dict__)
+        self.assertEqual(obj1, obj2)
+
+        # Mutable defaults are not shared
+        obj1.a_dict["key"] = "value"
+        obj1.a_list.append(1)
+        self.assertEqual(obj2.a_dict, {})
+        self.assertEqual(obj2.a_list, [])
+
+        res1 = self.registry.new('UserIdentityDetails')
+        res2 = self.registry.new('UserIdentityDetails')
+        self.assertEqual(res1.__dict__, self.registry.get_class('UserIdentityDetails')().__dict__)
+        self.assertIsNot(res1.location, res2.location)
+
+    def test_new_from_dict(self):
+        obj_dict = {"type_": u"SampleObject", "name": "foo", "a_list": [1, 2]}
+        obj = self.registry.new_from_dict('SampleObject', obj_dict)
+        self.assertEqual(obj.type_, "SampleObject")
+        self.assertEqual(obj.name, "foo")
+        self.assertIs(obj.a_list, obj_dict["a_list"])
+        self.assertEqual(obj.a_dict, {})
+        self.assertEqual(obj.time, "1341269890404")
+        self.assertEqual(obj_dict["type_"], u"SampleObject")
+
+        obj2 = self.registry.new('SampleObject', name="foo", a_list=[1, 2])
+        self.assertEqual(obj, obj2)
+
+        with self.assertRaises(AttributeError):
+            self.registry.new_from_dict('SampleObject', {"name": "foo", "extra_field": 5})
+
     def test_validate(self):
         obj = self.registry.new('SampleObject')
         self.name = 'monkey'
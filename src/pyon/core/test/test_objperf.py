@@ -185,6 +185,45 @@ class ObjectPerfTest(IonUnitTestCase):
         with time_it("recursive_utf8encode1"):
             recursive_encode1(o2)
 
+    def test_validate(self):
+        from pyon.core.object import set_compiled_validation
+        deco_args = {"list1": [1, 2], "list2": ["One element"], "dict1": {"key1": 1}, "dict2": {"key1": 1},
+                     "an_important_value": "good value", "us_phone_number": "555-555-5555"}
+        res_objs = [IonObject("Resource", name="TestObject %s" % i, alt_ids=["ID:%s" % i], addl={"a": i}) for i in xrange(1000)]
+        deco_objs = [IonObject("Deco_Example", deco_args) for i in xrange(1000)]
+
+        def validate_all(objs):
+            for obj in objs:
+                obj._validate()
+
+        try:
+            for mode in (False, True):
+                set_compiled_validation(mode)
+                validate_all(res_objs[:1] + deco_objs[:1])
+                with time_it("validate Resource x1000, compiled=%s" % mode):
+                    validate_all(res_objs)
+                with time_it("validate Deco_Example x1000, compiled=%s" % mode):
+                    validate_all(deco_objs)
+
+            # Both paths must accept and reject the same values
+            invalid_args = [dict(list1=["not numeric"]), dict(list2=[]), dict(dict1={"key1": "x"}), dict(dict2={}),
+                            dict(unsigned_short_int=-1), dict(a_float=10.11), dict(us_phone_number="5555555555"),
+                            dict(an_important_value=None), dict(list1=[{"type_": "Bad_Phone"}])]
+            for args in invalid_args:
+                for mode in (False, True):
+                    set_compiled_validation(mode)
+                    obj = IonObject("Deco_Example", dict(deco_args, **args))
+                    with self.assertRaises(AttributeError):
+                        obj._validate()
+            obj = IonObject("Deco_Example", dict(deco_args, a_float=2, list1=({"type_": "ExtendedPhone"}, 5)))
+            obj._validate()
+            self.assertEquals(type(obj.a_float), float)
+            obj.extra_field = 1
+            self.assertRaises(AttributeError, obj._validate)
+        finally:
+            set_compiled_validation(True)
+
+
 def count_objs(obj):
     counters = {}
     def _count(obj):
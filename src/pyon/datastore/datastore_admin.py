@@ -69,12 +69,16 @@ class DatastoreAdmin(object):
             if clear_dir:
                 [os.remove(os.path.join(outpath, f)) for f in os.listdir(outpath)]
 
-            objs = ds.find_docs_by_view("_all_docs", None, id_only=False)
-            compact_obj = [obj for obj_id, obj_key, obj in objs]
-            compact_obj= ["COMPACTDUMP", compact_obj]
+            # Stream documents into the file in the format of json.dump(["COMPACTDUMP", [obj, ...]])
+            numwrites = 0
             with open("%s/%s_compact.json" % (outpath, ds_name), 'w') as f:
-                json.dump(compact_obj, f)
-            numwrites = len(objs)
+                f.write('["COMPACTDUMP", [')
+                for obj_id, obj_key, obj in ds.find_docs_by_view_iter("_all_docs", None, id_only=False):
+                    if numwrites:
+                        f.write(', ')
+                    json.dump(obj, f)
+                    numwrites += 1
+                f.write(']]')
 
             log.info("Wrote %s files to %s" % (numwrites, outpath))
         finally:
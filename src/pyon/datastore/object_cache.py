@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+
+"""Container wide read-through cache for objects read by id from the resources datastore.
+
+Entries are the persisted documents, keyed by (datastore, id) and kept as marshal blobs, so that
+every read returns new IonObjects. Entries are invalidated by local writes through the datastore
+and by resource events from other containers; a TTL bounds the staleness of anything missed.
+In strict mode, each hit is verified against the current revision in the database.
+"""
+
+__author__ = 'Michael Meisinger'
+
+from collections import OrderedDict
+import marshal
+import time
+
+from pyon.container import ContainerCapability
+from pyon.core.bootstrap import CFG
+from pyon.util.log import log
+
+# Resource events invalidating cached objects (origin is the resource id)
+INVALIDATING_EVENT_TYPES = ("ResourceModifiedEvent", "ResourceLifecycleEvent")
+
+# The container's object cache, if enabled
+object_cache = None
+
+
+def get_object_cache():
+    return object_cache
+
+
+class ObjectCache(object):
+    """
+    LRU bounded, TTL limited cache of persisted documents. Not greenlet switching.
+    """
+
+    def __init__(self, max_size=10000, ttl=60, strict=False):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.strict = strict
+        self._entries = OrderedDict()     # (datastore, id) -> (rev, doc blob, insert time)
+        self._ids = {}                    # id -> set of datastore names with an entry for the id
+        self._inval_seq = 0
+        self._stats = dict(hits=0, misses=0, evictions=0, expirations=0, invalidations=0, stale=0)
+
+    @property
+    def invalidation_seq(self):
+        """ Current invalidation sequence number. Get before reading from the database, for put(). """
+        return self._inval_seq
+
+    def get(self, datastore, obj_id):
+        """ Returns tuple (rev, doc) with a new copy of the cached doc, or None """
+        key = (datastore, obj_id)
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            self._stats["misses"] += 1
+            return None
+        rev, blob, insert_time = entry
+        if self.ttl and time.time() - insert_time > self.ttl:
+            self._remove_id(datastore, obj_id)
+            self._stats["expirations"] += 1
+            self._stats["misses"] += 1
+            return None
+        self._entries[key] = entry     # Most recently used
+        self._stats["hits"] += 1
+        return rev, marshal.loads(blob)
+
+    def put(self, datastore, obj_id, doc, inval_seq):
+        """
+        Adds a doc read from the database. Ignored if there was any invalidation since inval_seq
+        was taken before the read, because the doc may be stale already.
+        """
+        if inval_seq != self._inval_seq or not doc or "_rev" not in doc:
+            return
+        try:
+            blob = marshal.dumps(doc)
+        except ValueError:
+            return
+        key = (datastore, obj_id)
+        self._entries.pop(key, None)
+        self._entries[key] = (doc["_rev"], blob, time.time())
+        self._ids.setdefault(obj_id, set()).add(datastore)
+        while len(self._entries) > self.max_size:
+            (ev_datastore, ev_obj_id), _ = self._entries.popitem(last=False)
+            self._remove_id(ev_datastore, ev_obj_id)
+            self._stats["evictions"] += 1
+
+    def invalidate(self, obj_id, datastore=None):
+        """ Removes entries for the given id, from the given datastore or all datastores """
+        self._inval_seq += 1
+        datastores = self._ids.get(obj_id, None)
+        if not datastores:
+            return
+        for ds_name in list(datastores):
+            if datastore is None or ds_name == datastore:
+                self._entries.pop((ds_name, obj_id), None)
+                self._remove_id(ds_name, obj_id)
+                self._stats["invalidations"] += 1
+
+    def invalidate_stale(self, datastore, obj_id):
+        """ Removes an entry found to be outdated by a revision check """
+        self.invalidate(obj_id, datastore)
+        self._stats["stale"] += 1
+
+    def clear(self):
+        self._inval_seq += 1
+        self._entries.clear()
+        self._ids.clear()
+
+    def get_stats(self):
+        """ Returns counters hits, misses, evictions (LRU), expirations (TTL), invalidations, stale (strict
+        revision check) and the current size """
+        stats = dict(self._stats)
+        stats["size"] = len(self._entries)
+        return stats
+
+    def _remove_id(self, datastore, obj_id):
+        datastores = self._ids.get(obj_id, None)
+        if datastores is not None:
+            datastores.discard(datastore)
+            if not datastores:
+                del self._ids[obj_id]
+
+
+class ObjectCacheCapability(ContainerCapability):
+    """
+    Container capability maintaining the object cache and its invalidation by resource events.
+    """
+
+    def __init__(self, container=None):
+        ContainerCapability.__init__(self, container)
+        self._subscribers = []
+
+    def start(self):
+        from pyon.ion.event import EventSubscriber
+        global object_cache
+        cache_cfg = CFG.get_safe("container.datastore.object_cache") or {}
+        object_cache = ObjectCache(max_size=int(cache_cfg.get("max_size", 10000)),
+                                   ttl=float(cache_cfg.get("ttl", 60)),
+                                   strict=bool(cache_cfg.get("strict", False)))
+        for event_type in INVALIDATING_EVENT_TYPES:
+            subscriber = EventSubscriber(event_type=event_type, callback=self._receive_event, auto_delete=True)
+            subscriber.start()
+            self._subscribers.append(subscriber)
+        log.debug("Object cache started (max_size=%s, ttl=%s, strict=%s)",
+                  object_cache.max_size, object_cache.ttl, object_cache.strict)
+
+    def stop(self):
+        global object_cache
+        for subscriber in self._subscribers:
+            try:
+                subscriber.stop()
+            except Exception:
+                log.exception("Error stopping object cache event subscriber")
+        self._subscribers = []
+        if object_cache is not None:
+            log.debug("Object cache stopped, stats: %s", object_cache.get_stats())
+            object_cache.clear()
+        object_cache = None
+
+    def _receive_event(self, event, headers):
+        if object_cache is not None and event.origin:
+            object_cache.invalidate(event.origin)
@@ -4,6 +4,7 @@
 
 __author__ = 'Michael Meisinger'
 
+from collections import OrderedDict
 import contextlib
 import getpass
 import os.path
@@ -25,7 +26,8 @@ from pyon.core.exception import BadRequest, Conflict, NotFound, Inconsistent
 from pyon.datastore.datastore_common import DataStore, get_obj_geospatial_bounds, get_obj_geospatial_point, \
     get_obj_temporal_bounds, get_obj_vertical_bounds, get_obj_geometry
 from pyon.datastore.datastore_query import DQ
-from pyon.datastore.postgresql.pg_util import PostgresConnectionPool, StatementBuilder, psycopg2_connect, TracingCursor
+from pyon.datastore.postgresql.pg_util import PostgresConnectionPool, StatementBuilder, psycopg2_connect, TracingCursor, \
+    chunk_list, map_parallel, is_in_transaction
 from pyon.util.containers import create_basic_identifier
 from pyon.util.tracer import CallTracer
 
@@ -78,6 +80,8 @@ class PostgresDataStore(DataStore):
         self.database = self.config.get('database', None) or DEFAULT_DBNAME
         self.default_database = self.config.get('default_database', None) or 'postgres'
         self.pool_maxsize = int(self.config.get('connection_pool_max', 4))
+        self.id_chunk_size = int(self.config.get('id_chunk_size', 1000))
+        self.stream_itersize = int(self.config.get('stream_itersize', 1000))
         self.db_init = self.config.get('db_init', None) or "res/datastore/postgresql/db_init.sql"
 
         # Database (Postgres database) and datastore (database table) name handling.
@@ -439,15 +443,18 @@ class PostgresDataStore(DataStore):
             log.warn("Could not compute value for numrange column %s: %s", col, ex)
         return res
 
+    def _get_column_value(self, col, doc):
+        """Returns the value for an extra column given a document"""
+        if col in GEOSPATIAL_COLS:
+            return self._get_geom_value(col, doc)
+        elif col in NUMRANGE_COLS:
+            return self._get_range_value(col, doc)
+        return doc.get(col, None)
+
     def _create_value_expression(self, col, doc, valuename, value_dict, allow_null_values=False, assign=False):
         """Returns part of an SQL statement to insert or update a value for a column.
         Places the value into a dict for the DB client to convert properly"""
-        if col in GEOSPATIAL_COLS:
-            value = self._get_geom_value(col, doc)
-        elif col in NUMRANGE_COLS:
-            value = self._get_range_value(col, doc)
-        else:
-            value = doc.get(col, None)
+        value = self._get_column_value(col, doc)
 
         if allow_null_values or value or type(value) is bool:
             insert_expr = ", "
@@ -531,17 +538,11 @@ class PostgresDataStore(DataStore):
         with self.pool.cursor(**self.cursor_args) as cur:
             # Need to make sure to first insert resources then associations for referential integrity
             for obj_type in sorted(all_obj_types, key=lambda x: OBJ_TYPE_PRECED.get(x, 10)):
-                sb = StatementBuilder()
                 docs_ot = [doc for (doc, doc_ot) in zip(docs, doc_obj_type) if doc_ot == obj_type]
 
                 # Take the first document to determine the type of objects (resource, association, dir entry)
                 extra_cols, table = self._get_extra_cols(docs_ot[0], qual_ds_name, self.profile)
-                xcol = ""
-                for col in extra_cols:
-                    xcol += ", %s" % col
-                sb.append("INSERT INTO "+table+" (id, rev, doc" + xcol + ") VALUES ")
 
-                # Build a large statement
                 for i, doc in enumerate(docs_ot):
                     object_id = object_ids[i] if object_ids else None
                     if "_id" not in doc:
@@ -549,23 +550,9 @@ class PostgresDataStore(DataStore):
                         doc["_id"] = object_id
 
                     doc["_rev"] = "1"
-                    doc_json = json.dumps(doc)
-
-                    if i>0:
-                        sb.append(",")
-
-                    sb.statement_args["id"+str(i)] = doc["_id"]
-                    sb.statement_args["doc"+str(i)] = doc_json
-                    xval = ""
-                    for col in extra_cols:
-                        valuename = col + str(i)
-                        insert_expr = self._create_value_expression(col, doc, valuename, sb.statement_args, allow_null_values=True)
-                        xval += insert_expr
-
-                    sb.append("(%(id", str(i), ")s, 1, %(doc", str(i), ")s", xval, ")")
 
                 try:
-                    cur.execute(*sb.build())
+                    self._insert_docs(cur, table, extra_cols, docs_ot)
                     if cur.rowcount != len(docs_ot):
                         log.warn("Number of objects created (%s) != objects given (%s) in %s", cur.rowcount, len(docs_ot), table)
                 except IntegrityError as ie:
@@ -575,6 +562,31 @@ class PostgresDataStore(DataStore):
 
         return result_list
 
+    def _insert_docs(self, cur, table, extra_cols, docs):
+        """Inserts documents with one INSERT statement with a value list"""
+        sb = StatementBuilder()
+        xcol = ""
+        for col in extra_cols:
+            xcol += ", %s" % col
+        sb.append("INSERT INTO "+table+" (id, rev, doc" + xcol + ") VALUES ")
+
+        # Build a large statement
+        for i, doc in enumerate(docs):
+            if i>0:
+                sb.append(",")
+
+            sb.statement_args["id"+str(i)] = doc["_id"]
+            sb.statement_args["doc"+str(i)] = json.dumps(doc)
+            xval = ""
+            for col in extra_cols:
+                valuename = col + str(i)
+                insert_expr = self._create_value_expression(col, doc, valuename, sb.statement_args, allow_null_values=True)
+                xval += insert_expr
+
+            sb.append("(%(id", str(i), ")s, 1, %(doc", str(i), ")s", xval, ")")
+
+        cur.execute(*sb.build())
+
     def create_attachment(self, doc, attachment_name, data, content_type=None, datastore_name=""):
         if not isinstance(attachment_name, str):
             raise BadRequest("attachment name is not string")
@@ -628,19 +640,85 @@ class PostgresDataStore(DataStore):
         log.debug('update_doc_mult(): update %s documents', len(docs))
 
         qual_ds_name = self._get_datastore_name(datastore_name)
-        # Could use cur.executemany() here but does not allow for case-by-case reaction to failure
+        if len({doc["_id"] for doc in docs}) < len(docs):
+            # Repeated ids must be updated one after the other, each with its own revision check
+            with self.pool.cursor(**self.cursor_args) as cur:
+                result_list = []
+                for doc in docs:
+                    if "_deleted" in doc:
+                        self._delete_doc(cur, qual_ds_name, doc["_id"])
+                        oid, version = doc["_id"], doc["_rev"]
+                    else:
+                        oid, version = self._update_doc(cur, qual_ds_name, doc)
+                    result_list.append((True, oid, version))
+            return result_list
+
+        # Update with one statement per table and set of extra columns (usually one), instead of one per doc
+        result_list = []
+        deleted_ids = []
+        update_groups = OrderedDict()  # (table, extra columns) -> list of (id, VALUES row, statement args)
+        for i, doc in enumerate(docs):
+            if "_deleted" in doc:
+                deleted_ids.append(doc["_id"])
+            else:
+                update_key, update_row = self._get_update_row(doc, qual_ds_name, str(i))
+                update_groups.setdefault(update_key, []).append(update_row)
+            result_list.append((True, doc["_id"], doc["_rev"]))
+
         with self.pool.cursor(**self.cursor_args) as cur:
-            result_list = []
-            for doc in docs:
-                if "_deleted" in doc:
-                    self._delete_doc(cur, qual_ds_name, doc["_id"])
-                    oid, version = doc["_id"], doc["_rev"]
-                else:
-                    oid, version = self._update_doc(cur, qual_ds_name, doc)
-                result_list.append((True, oid, version))
+            if deleted_ids:
+                self._delete_docs(cur, qual_ds_name, deleted_ids)
+            for (table, extra_cols), update_rows in update_groups.iteritems():
+                for row_chunk in chunk_list(update_rows, self.id_chunk_size):
+                    self._update_docs(cur, table, extra_cols, row_chunk)
 
         return result_list
 
+    def _get_update_row(self, doc, table, suffix):
+        """
+        Sets the next revision in the doc and returns a tuple (table, extra column names) and
+        a tuple (id, VALUES row expression, statement args) for _update_docs.
+        Extra columns without value are not updated, as in _update_doc.
+        """
+        old_rev = int(doc["_rev"])
+        doc["_rev"] = str(old_rev+1)
+        doc_json = json.dumps(doc)
+
+        extra_cols, table = self._get_extra_cols(doc, table, self.profile)
+
+        statement_args = {"id"+suffix: doc["_id"], "rev"+suffix: old_rev, "revn"+suffix: old_rev+1, "doc"+suffix: doc_json}
+        row_expr = "(%(id"+suffix+")s, %(rev"+suffix+")s, %(revn"+suffix+")s, %(doc"+suffix+")s::json"
+        update_cols = []
+        for col in extra_cols:
+            insert_expr = self._create_value_expression(col, doc, col+suffix, statement_args)
+            if insert_expr:
+                update_cols.append(col)
+                row_expr += insert_expr
+        row_expr += ")"
+
+        return (table, tuple(update_cols)), (doc["_id"], row_expr, statement_args)
+
+    def _update_docs(self, cur, table, extra_cols, update_rows):
+        """
+        Updates docs with a single UPDATE ... FROM (VALUES ...) statement. Revision conflicts
+        are determined from the ids returned by the update.
+        """
+        statement_args = {}
+        for doc_id, row_expr, row_args in update_rows:
+            statement_args.update(row_args)
+        xset = "".join(", %s=v.%s" % (col, col) for col in extra_cols)
+        xcol = "".join(", %s" % col for col in extra_cols)
+        statement = "UPDATE " + table + " AS t SET doc=v.doc, rev=v.revn" + xset + \
+                    " FROM (VALUES " + ", ".join(row_expr for doc_id, row_expr, row_args in update_rows) + \
+                    ") AS v(id, rev, revn, doc" + xcol + ") WHERE t.id=v.id AND t.rev=v.rev RETURNING t.id"
+        cur.execute(statement, statement_args)
+
+        updated_ids = {row[0] for row in cur.fetchall()}
+        conflict_list = ["Object with id %s revision conflict" % doc_id
+                         for doc_id, row_expr, row_args in update_rows if doc_id not in updated_ids]
+        if conflict_list:
+            raise Conflict("\n".join(conflict_list))
+
     def _update_doc(self, cur, table, doc):
         old_rev = int(doc["_rev"])
         doc["_rev"] = str(old_rev+1)
@@ -750,11 +828,34 @@ class PostgresDataStore(DataStore):
 
         return str(rev)
 
+    def _read_doc_rev_mult(self, doc_ids, datastore_name=None):
+        """ Returns a dict of id to current revision (as str) for the given ids that exist """
+        if not doc_ids:
+            return {}
+        qual_ds_name = self._get_datastore_name(datastore_name)
+
+        def read_chunk(id_chunk):
+            with self.pool.cursor(**self.cursor_args) as cur:
+                cur.execute("SELECT id, rev FROM "+qual_ds_name+" WHERE id = ANY(%s)", (id_chunk,))
+                return cur.fetchall()
+
+        return {row[0]: str(row[1]) for rows in self._map_id_chunks(read_chunk, doc_ids) for row in rows}
+
     def _assert_doc_rev(self, doc, datastore_name=None):
         rev = self._read_doc_rev(doc["_id"], datastore_name=datastore_name)
         if rev != doc["_rev"]:
             raise Conflict("Object with id %s revision conflict is=%s, need=%s" % (doc["_id"], rev, doc["_rev"]))
 
+    def _map_id_chunks(self, func, object_ids):
+        """
+        Calls func with lists of at most id_chunk_size ids each and returns the list of results.
+        Outside of a transaction, multiple chunks are processed in parallel with connections from the pool.
+        """
+        id_chunks = chunk_list(object_ids, self.id_chunk_size)
+        if len(id_chunks) > 1 and self.pool_maxsize > 1 and not is_in_transaction():
+            return map_parallel(func, id_chunks, self.pool_maxsize)
+        return [func(id_chunk) for id_chunk in id_chunks]
+
     def read_doc_mult(self, object_ids, datastore_name=None, object_type=None, strict=True):
         """"
         Fetch a number of raw doc instances, HEAD rev.
@@ -769,21 +870,14 @@ class PostgresDataStore(DataStore):
         elif object_type == "DirEntry":
             table = qual_ds_name + "_dir"
 
-        query = "SELECT id, doc FROM "+table+" WHERE id IN ("
-        query_args = dict()
-        for i, oid in enumerate(object_ids):
-            arg_name = "id" + str(i)
-            if i>0:
-                query += ","
-            query += "%(" + arg_name + ")s"
-            query_args[arg_name] = oid
-        query += ")"
-
-        with self.pool.cursor(**self.cursor_args) as cur:
-            cur.execute(query, query_args)
-            rows = cur.fetchall()
+        def read_chunk(id_chunk):
+            with self.pool.cursor(**self.cursor_args) as cur:
+                cur.execute("SELECT id, doc FROM "+table+" WHERE id = ANY(%s)", (id_chunk,))
+                return cur.fetchall()
 
-        doc_by_id = {row[0]: row[1] for row in rows}
+        doc_by_id = {}
+        for rows in self._map_id_chunks(read_chunk, object_ids):
+            doc_by_id.update(rows)
         doc_list = [doc_by_id.get(oid, None) for oid in object_ids]
         if strict:
             notfound_list = ['Object with id %s does not exist.' % object_ids[i]
@@ -850,8 +944,17 @@ class PostgresDataStore(DataStore):
             table = qual_ds_name + "_dir"
 
         with self.pool.cursor(**self.cursor_args) as cur:
-            for doc_id in object_ids:
-                self._delete_doc(cur, table, doc_id)
+            self._delete_docs(cur, table, object_ids)
+
+    def _delete_docs(self, cur, table, doc_ids):
+        """ Deletes docs with one statement per id chunk. All chunks use the same cursor (atomic) """
+        for id_chunk in chunk_list(doc_ids, self.id_chunk_size):
+            cur.execute("DELETE FROM "+table+" WHERE id = ANY(%s) RETURNING id", (id_chunk,))
+            deleted_ids = {row[0] for row in cur.fetchall()}
+            notfound_list = ['Object with id %s does not exist.' % doc_id
+                             for doc_id in id_chunk if doc_id not in deleted_ids]
+            if notfound_list:
+                raise NotFound("\n".join(notfound_list))
 
     def _delete_doc(self, cur, table, doc_id):
         sql = "DELETE FROM "+table+" WHERE id=%s"
@@ -914,8 +1017,49 @@ class PostgresDataStore(DataStore):
         log.debug("find_docs_by_view() found %s results", len(res_list))
         return res_list
 
+    def find_docs_by_view_iter(self, design_name, view_name, key=None, keys=None, start_key=None, end_key=None,
+                               id_only=True, **kwargs):
+        """
+        Like find_docs_by_view, but returns a generator of result rows, read from the database lazily
+        using a server side cursor. Supported for all docs and event views.
+        """
+        log.debug("find_docs_by_view_iter() %s/%s, %s, %s, %s, %s, %s, %s", design_name, view_name, key, keys, start_key, end_key, id_only, kwargs)
+
+        funcname = "_query_%s" % (design_name) if view_name else "_query_all_docs"
+        if not hasattr(self, funcname):
+            raise NotImplementedError()
+
+        filter = self._get_view_args(kwargs)
+
+        query, query_args, row_func = getattr(self, funcname)(key=key, view_name=view_name, keys=keys, start_key=start_key, end_key=end_key, id_only=id_only, filter=filter)
+        return self._iter_rows(query, query_args, row_func)
+
+    def _iter_rows(self, query, query_args, row_func=None):
+        """
+        Generator executing a query with a named (server side) cursor, yielding the result rows
+        (converted by row_func) while fetching them in batches of stream_itersize rows.
+        Holds a pool connection until the generator is exhausted or closed.
+        """
+        with self.pool.cursor(name="iter_" + uuid4().hex, **self.cursor_args) as cur:
+            cur.itersize = self.stream_itersize
+            cur.execute(query, query_args)
+            for row in cur:
+                yield row_func(row) if row_func else row
+
     def _find_all_docs(self, view_name, key=None, keys=None, start_key=None, end_key=None,
                        id_only=True, filter=None):
+        query, query_args, row_func = self._query_all_docs(view_name, key=key, keys=keys, start_key=start_key,
+                                                           end_key=end_key, id_only=id_only, filter=filter)
+        with self.pool.cursor(**self.cursor_args) as cur:
+            #print query, query_args
+            cur.execute(query, query_args)
+            rows = cur.fetchall()
+
+        return [row_func(row) for row in rows]
+
+    def _query_all_docs(self, view_name, key=None, keys=None, start_key=None, end_key=None,
+                        id_only=True, filter=None):
+        """ Returns query, query args and a result row conversion function for _find_all_docs """
         if view_name and view_name != "_all_docs":
             log.warn("Using _all_docs view instead of requested %s", view_name)
 
@@ -955,17 +1099,13 @@ class PostgresDataStore(DataStore):
             raise NotImplementedError()
 
         extra_clause = filter.get("extra_clause", "")
-        with self.pool.cursor(**self.cursor_args) as cur:
-            #print query + query_clause + extra_clause, query_args
-            cur.execute(query + query_clause + extra_clause, query_args)
-            rows = cur.fetchall()
 
         if id_only:
-            res_rows = [(self._prep_id(row[0]), [], None) for row in rows]
+            row_func = lambda row: (self._prep_id(row[0]), [], None)
         else:
-            res_rows = [(self._prep_id(row[0]), [], self._prep_doc(row[-1])) for row in rows]
+            row_func = lambda row: (self._prep_id(row[0]), [], self._prep_doc(row[-1]))
 
-        return res_rows
+        return query + query_clause + extra_clause, query_args, row_func
 
     def _find_directory(self, view_name, key=None, keys=None, start_key=None, end_key=None,
                         id_only=True, filter=None):
@@ -1103,6 +1243,18 @@ class PostgresDataStore(DataStore):
 
     def _find_event(self, view_name, key=None, keys=None, start_key=None, end_key=None,
                     id_only=True, filter=None):
+        query, query_args, row_func = self._query_event(view_name, key=key, keys=keys, start_key=start_key,
+                                                        end_key=end_key, id_only=id_only, filter=filter)
+        with self.pool.cursor(**self.cursor_args) as cur:
+            #print "QUERY:", query, query_args
+            cur.execute(query, query_args)
+            rows = cur.fetchall()
+
+        return [row_func(row) for row in rows]
+
+    def _query_event(self, view_name, key=None, keys=None, start_key=None, end_key=None,
+                     id_only=True, filter=None):
+        """ Returns query, query args and a result row conversion function for _find_event """
         qual_ds_name = self._get_datastore_name()
         if id_only:
             query = "SELECT id, ts_created FROM " + qual_ds_name
@@ -1168,19 +1320,13 @@ class PostgresDataStore(DataStore):
         if query_clause == " WHERE ":
             query_clause = " "
         extra_clause = filter.get("extra_clause", "")
-        with self.pool.cursor(**self.cursor_args) as cur:
-            sql = query + query_clause + order_clause + extra_clause
-            #print "QUERY:", sql, query_args
-            #print "filter:", filter
-            cur.execute(sql, query_args)
-            rows = cur.fetchall()
 
         if id_only:
-            res_rows = [(self._prep_id(row[0]), [], row[1]) for row in rows]
+            row_func = lambda row: (self._prep_id(row[0]), [], row[1])
         else:
-            res_rows = [(self._prep_id(row[0]), [], self._prep_doc(row[-1])) for row in rows]
+            row_func = lambda row: (self._prep_id(row[0]), [], self._prep_doc(row[-1]))
 
-        return res_rows
+        return query + query_clause + order_clause + extra_clause, query_args, row_func
 
     def get_unique_id(self):
         return uuid4().hex
@@ -4,12 +4,16 @@
 
 __author__ = 'Michael Meisinger'
 
+from collections import OrderedDict
+
 from pyon.core.bootstrap import get_obj_registry, CFG
 from pyon.core.exception import BadRequest, Conflict, NotFound, Inconsistent
-from pyon.core.object import IonObjectBase, IonObjectSerializer, IonObjectDeserializer
+from pyon.core.object import IonObjectBase, IonObjectSerializer, IonObjectDeserializer, LazyIonMessage
 from pyon.datastore.postgresql.base_store import PostgresDataStore
 from pyon.datastore.postgresql.pg_query import PostgresQueryBuilder
+from pyon.datastore.postgresql.pg_util import is_in_transaction, add_transaction_end_callback
 from pyon.datastore.datastore import DataStore
+from pyon.datastore import object_cache
 from pyon.util.log import log
 from pyon.ion.resource import AvailabilityStates, OT, RT
 
@@ -35,6 +39,9 @@ class PostgresPyonDataStore(PostgresDataStore):
         self._io_serializer = IonObjectSerializer()
         self._io_deserializer = IonObjectDeserializer(obj_registry=get_obj_registry())
 
+        # Only resources are cached, because only their changes are announced by events
+        self._use_object_cache = self.profile == DataStore.DS_PROFILE.RESOURCES
+
     # -------------------------------------------------------------------------
     # Couch document operations
 
@@ -52,7 +59,7 @@ class PostgresPyonDataStore(PostgresDataStore):
                                    attachments=attachments)
 
     def create_mult(self, objects, object_ids=None, allow_ids=None):
-        if any([not isinstance(obj, IonObjectBase) for obj in objects]):
+        if any([not isinstance(obj, (IonObjectBase, LazyIonMessage)) for obj in objects]):
             raise BadRequest("Obj param is not instance of IonObjectBase")
 
         return self.create_doc_mult([self._ion_object_to_persistence_dict(obj) for obj in objects], object_ids)
@@ -75,7 +82,11 @@ class PostgresPyonDataStore(PostgresDataStore):
         if not isinstance(object_id, str):
             raise BadRequest("Object id param is not string")
 
-        doc = self.read_doc(object_id, rev_id, datastore_name=datastore_name, object_type=object_type)
+        cache = self._get_object_cache() if not rev_id and not object_type else None
+        if cache:
+            doc = self._read_doc_cached(cache, object_id, datastore_name)
+        else:
+            doc = self.read_doc(object_id, rev_id, datastore_name=datastore_name, object_type=object_type)
         obj = self._persistence_dict_to_ion_object(doc)
 
         return obj
@@ -84,7 +95,11 @@ class PostgresPyonDataStore(PostgresDataStore):
         if any([not isinstance(object_id, str) for object_id in object_ids]):
             raise BadRequest("Object ids are not string: %s" % str(object_ids))
 
-        docs = self.read_doc_mult(object_ids, datastore_name, strict=strict)
+        cache = self._get_object_cache()
+        if cache:
+            docs = self._read_doc_mult_cached(cache, object_ids, datastore_name, strict=strict)
+        else:
+            docs = self.read_doc_mult(object_ids, datastore_name, strict=strict)
         obj_list = [self._persistence_dict_to_ion_object(doc) if doc is not None else None for doc in docs]
 
         return obj_list
@@ -105,6 +120,120 @@ class PostgresPyonDataStore(PostgresDataStore):
     def delete_mult(self, object_ids, datastore_name=None):
         return self.delete_doc_mult(object_ids, datastore_name)
 
+    # -------------------------------------------------------------------------
+    # Object cache support
+
+    def _get_object_cache(self, for_read=True):
+        # Reads within a transaction may see uncommitted state, so they bypass the cache
+        if not self._use_object_cache or (for_read and is_in_transaction()):
+            return None
+        return object_cache.object_cache
+
+    def _read_doc_cached(self, cache, object_id, datastore_name=""):
+        qual_ds_name = self._get_datastore_name(datastore_name)
+        cached = cache.get(qual_ds_name, object_id)
+        if cached:
+            rev, doc = cached
+            if not cache.strict:
+                return doc
+            try:
+                cur_rev = self._read_doc_rev(object_id, datastore_name=datastore_name)
+            except NotFound:
+                cache.invalidate_stale(qual_ds_name, object_id)
+                raise
+            if cur_rev == rev:
+                return doc
+            cache.invalidate_stale(qual_ds_name, object_id)
+
+        inval_seq = cache.invalidation_seq
+        doc = self.read_doc(object_id, datastore_name=datastore_name)
+        cache.put(qual_ds_name, object_id, doc, inval_seq)
+        return doc
+
+    def _read_doc_mult_cached(self, cache, object_ids, datastore_name="", strict=True):
+        qual_ds_name = self._get_datastore_name(datastore_name)
+        doc_by_id = {}
+        for object_id in object_ids:
+            cached = cache.get(qual_ds_name, object_id)
+            if cached:
+                doc_by_id[object_id] = cached
+
+        if doc_by_id and cache.strict:
+            cur_revs = self._read_doc_rev_mult(doc_by_id.keys(), datastore_name=datastore_name)
+            for object_id, (rev, doc) in doc_by_id.items():
+                if cur_revs.get(object_id, None) != rev:
+                    cache.invalidate_stale(qual_ds_name, object_id)
+                    del doc_by_id[object_id]
+        doc_by_id = {object_id: doc for object_id, (rev, doc) in doc_by_id.iteritems()}
+
+        read_ids = list(set(object_id for object_id in object_ids if object_id not in doc_by_id))
+        if read_ids:
+            inval_seq = cache.invalidation_seq
+            read_docs = self.read_doc_mult(read_ids, datastore_name, strict=False)
+            for object_id, doc in zip(read_ids, read_docs):
+                if doc is not None:
+                    cache.put(qual_ds_name, object_id, doc, inval_seq)
+                    doc_by_id[object_id] = doc
+
+        doc_list = [doc_by_id.get(object_id, None) for object_id in object_ids]
+        if strict:
+            notfound_list = ['Object with id %s does not exist.' % object_ids[i]
+                             for i, doc in enumerate(doc_list) if doc is None]
+            if notfound_list:
+                raise NotFound("\n".join(notfound_list))
+        return doc_list
+
+    def _invalidate_cached(self, object_ids):
+        cache = self._get_object_cache(for_read=False)
+        if cache:
+            def invalidate():
+                for object_id in object_ids:
+                    cache.invalidate(object_id)
+            invalidate()
+            # Other greenlets may cache the old version until the transaction is committed
+            if is_in_transaction():
+                add_transaction_end_callback(invalidate)
+
+    def update_doc(self, doc, datastore_name=None):
+        try:
+            return PostgresDataStore.update_doc(self, doc, datastore_name=datastore_name)
+        finally:
+            self._invalidate_cached([doc["_id"]] if "_id" in doc else [])
+
+    def update_doc_mult(self, docs, datastore_name=None):
+        try:
+            return PostgresDataStore.update_doc_mult(self, docs, datastore_name=datastore_name)
+        finally:
+            self._invalidate_cached([doc["_id"] for doc in docs if "_id" in doc] if type(docs) is list else [])
+
+    def delete_doc(self, doc, datastore_name=None, object_type=None, **kwargs):
+        try:
+            return PostgresDataStore.delete_doc(self, doc, datastore_name=datastore_name, object_type=object_type, **kwargs)
+        finally:
+            self._invalidate_cached([doc] if isinstance(doc, str) else [doc.get("_id", None)])
+
+    def delete_doc_mult(self, object_ids, datastore_name=None, object_type=None):
+        try:
+            return PostgresDataStore.delete_doc_mult(self, object_ids, datastore_name=datastore_name, object_type=object_type)
+        finally:
+            self._invalidate_cached(object_ids or [])
+
+    def clear_datastore(self, datastore_name=None):
+        try:
+            return PostgresDataStore.clear_datastore(self, datastore_name=datastore_name)
+        finally:
+            cache = self._get_object_cache(for_read=False)
+            if cache:
+                cache.clear()
+
+    def delete_datastore(self, datastore_name=None):
+        try:
+            return PostgresDataStore.delete_datastore(self, datastore_name=datastore_name)
+        finally:
+            cache = self._get_object_cache(for_read=False)
+            if cache:
+                cache.clear()
+
     # -------------------------------------------------------------------------
     # View operations
 
@@ -112,28 +241,67 @@ class PostgresPyonDataStore(PostgresDataStore):
         """
         Returns a list of associations for a given list of subjects
         """
-        # TODO: Port this implementation to Postgres single query
-        res_list = [[], []]
-        if not subjects:
-            return res_list
-        for sub in subjects:
-            res_ids, res_assocs = self.find_objects(subject=sub, id_only=id_only, predicate=predicate, access_args=access_args)
-            res_list[0].extend(res_ids)
-            res_list[1].extend(res_assocs)
-        return res_list
+        return self._find_assoc_mult(subjects, "s", id_only=id_only, predicate=predicate, access_args=access_args)
 
     def find_subjects_mult(self, objects, id_only=False, predicate=None, access_args=None):
         """
         Returns a list of associations for a given list of objects
         """
-        # TODO: Port this implementation to Postgres single query
+        return self._find_assoc_mult(objects, "o", id_only=id_only, predicate=predicate, access_args=access_args)
+
+    def _find_assoc_mult(self, targets, direction, id_only=False, predicate=None, access_args=None):
+        """
+        Returns [objects or ids, associations] for the associations of the given subjects (direction "s")
+        or objects (direction "o"), in the order of the given targets. Uses one query per chunk of target ids.
+        """
+        if type(id_only) is not bool:
+            raise BadRequest('id_only must be type bool, not %s' % type(id_only))
         res_list = [[], []]
-        if not objects:
+        if not targets:
             return res_list
-        for obj in objects:
-            res_ids, res_assocs = self.find_subjects(obj=obj, id_only=id_only, predicate=predicate, access_args=access_args)
-            res_list[0].extend(res_ids)
-            res_list[1].extend(res_assocs)
+
+        target_name = "subject" if direction == "s" else "object"
+        target_ids = []
+        for target in targets:
+            if not target:
+                raise BadRequest("Must provide %s" % target_name)
+            if type(target) is str:
+                target_ids.append(target)
+            elif "_id" not in target:
+                raise BadRequest("Object id not available in %s" % target_name)
+            else:
+                target_ids.append(target._id)
+
+        qual_ds_name = self._get_datastore_name()
+        assoc_table_name = qual_ds_name+"_assoc"
+        table_names = dict(ds=qual_ds_name, dsa=assoc_table_name, tc=direction, rc="o" if direction == "s" else "s")
+
+        if id_only:
+            query = "SELECT %(dsa)s.%(tc)s, %(dsa)s.%(rc)s, %(dsa)s.doc FROM %(dsa)s, %(ds)s WHERE retired<>true AND %(dsa)s.%(rc)s=%(ds)s.id " % table_names
+        else:
+            query = "SELECT %(dsa)s.%(tc)s, %(ds)s.doc, %(dsa)s.doc FROM %(dsa)s, %(ds)s WHERE retired<>true AND %(dsa)s.%(rc)s=%(ds)s.id " % table_names
+        query_args = dict(p=predicate)
+
+        query_clause = "AND " + direction + " = ANY(%(target_ids)s)"
+        if predicate:
+            query_clause += " AND p=%(p)s"
+        query_clause = self._add_access_filter(access_args, qual_ds_name, query_clause, query_args)
+
+        def find_chunk(id_chunk):
+            chunk_args = dict(query_args, target_ids=id_chunk)
+            with self.pool.cursor(**self.cursor_args) as cur:
+                cur.execute(query + query_clause, chunk_args)
+                return cur.fetchall()
+
+        rows_by_target = {}
+        for rows in self._map_id_chunks(find_chunk, list(OrderedDict.fromkeys(target_ids))):
+            for row in rows:
+                rows_by_target.setdefault(row[0], []).append(row)
+
+        for target_id in target_ids:
+            for row in rows_by_target.get(target_id, ()):
+                res_list[0].append(self._prep_id(row[1]) if id_only else self._persistence_dict_to_ion_object(row[1]))
+                res_list[1].append(self._persistence_dict_to_ion_object(row[2]))
         return res_list
 
     def find_objects(self, subject, predicate=None, object_type=None, id_only=False, access_args=None, **kwargs):
@@ -429,13 +597,7 @@ class PostgresPyonDataStore(PostgresDataStore):
                            limit=None, skip=None, descending=None, id_only=True, query=None, access_args=None):
         filter_kwargs = self._get_view_args(dict(limit=limit, skip=skip, descending=descending), access_args)
         if query:
-            qargs = query["query_args"]
-            if id_only is not None:
-                qargs["id_only"] = id_only
-            if limit is not None and limit != 0:
-                qargs["limit"] = limit
-            if skip is not None and skip != 0:
-                qargs["skip"] = skip
+            self._set_query_args(query, limit=limit, skip=skip, id_only=id_only)
             return self.find_by_query(query, access_args=access_args)
         elif name:
             if lcstate:
@@ -458,6 +620,24 @@ class PostgresPyonDataStore(PostgresDataStore):
         elif not restype and not lcstate and not name:
             return self.find_res_by_type(None, None, id_only, filter=filter_kwargs)
 
+    def find_resources_ext_iter(self, query, limit=None, skip=None, id_only=True, access_args=None):
+        """
+        Like find_resources_ext with a datastore query, but returns a generator (see find_by_query_iter)
+        """
+        if not query:
+            raise BadRequest("Must provide query")
+        self._set_query_args(query, limit=limit, skip=skip, id_only=id_only)
+        return self.find_by_query_iter(query, access_args=access_args)
+
+    def _set_query_args(self, query, limit=None, skip=None, id_only=None):
+        qargs = query["query_args"]
+        if id_only is not None:
+            qargs["id_only"] = id_only
+        if limit is not None and limit != 0:
+            qargs["limit"] = limit
+        if skip is not None and skip != 0:
+            qargs["skip"] = skip
+
     def find_res_by_type(self, restype, lcstate=None, id_only=False, filter=None):
         log.debug("find_res_by_type(restype=%s, lcstate=%s)", restype, lcstate)
         if type(id_only) is not bool:
@@ -720,12 +900,56 @@ class PostgresPyonDataStore(PostgresDataStore):
         log.debug("find_by_view() found %s objects" % (len(res_rows)))
         return res_rows
 
+    def find_by_view_iter(self, design_name, view_name, key=None, keys=None, start_key=None, end_key=None,
+                          id_only=True, convert_doc=True, **kwargs):
+        """
+        Like find_by_view, but returns a generator of 3-tuples that are read from the database
+        with a server side cursor and converted lazily. Supported for all docs and event views.
+        """
+        res_rows = self.find_docs_by_view_iter(design_name=design_name, view_name=view_name, key=key, keys=keys,
+                                               start_key=start_key, end_key=end_key, id_only=id_only, **kwargs)
+
+        return ((rid, key, self._persistence_dict_to_ion_object(doc) if convert_doc and isinstance(doc, dict) else doc)
+                for rid, key, doc in res_rows)
+
     def find_by_query(self, query, access_args=None):
         """
         Find resources given a datastore query expression dict.
         @param query  a dict representation of a datastore query
         @retval  list of resource ids or resource objects matching query (dependent on id_only value)
         """
+        pqb = self._get_query_builder(query, access_args)
+
+        with self.pool.cursor(**self.cursor_args) as cur:
+            exec_query = pqb.get_query()
+            cur.execute(exec_query, pqb.get_values())
+            rows = cur.fetchall()
+            query_str = cur.query if len(cur.query) < 2000 else cur.query[:1000] + "...[" + str(len(cur.query) - 1200) + "]..." + cur.query[-200:]
+            log.info("find_by_query() QUERY: %s (%s rows)", query_str, cur.rowcount)
+            query_res = {}
+            query["_result"] = query_res
+            query_res["statement_gen"] = exec_query
+            query_res["statement_sql"] = cur.query
+            query_res["rowcount"] = cur.rowcount
+
+        row_func = self._get_query_row_func(query, pqb)
+        return [row_func(row) for row in rows]
+
+    def find_by_query_iter(self, query, access_args=None):
+        """
+        Like find_by_query, but returns a generator of resource ids or resource objects that are read
+        from the database with a server side cursor (in batches of stream_itersize rows) and converted lazily.
+        The query result info contains the generated statement only.
+        """
+        pqb = self._get_query_builder(query, access_args)
+        exec_query = pqb.get_query()
+        log.info("find_by_query_iter() QUERY: %s", exec_query)
+        query["_result"] = dict(statement_gen=exec_query)
+
+        return self._iter_rows(exec_query, pqb.get_values(), self._get_query_row_func(query, pqb))
+
+    def _get_query_builder(self, query, access_args=None):
+        """ Returns a query builder for a datastore query with access and deleted filters applied """
         qual_ds_name = self._get_datastore_name()
         query_ds_sub = query["query_args"].get("ds_sub", None)
         query_format = query["query_args"].get("format", "")
@@ -740,37 +964,27 @@ class PostgresPyonDataStore(PostgresDataStore):
             pqb.where = self._add_deleted_filter(pqb.table_aliases[0], query_ds_sub,
                                                  pqb.where, pqb.values,
                                                  with_deleted=query["query_args"].get("with_deleted", False) is True)
+        return pqb
 
-        with self.pool.cursor(**self.cursor_args) as cur:
-            exec_query = pqb.get_query()
-            cur.execute(exec_query, pqb.get_values())
-            rows = cur.fetchall()
-            query_str = cur.query if len(cur.query) < 2000 else cur.query[:1000] + "...[" + str(len(cur.query) - 1200) + "]..." + cur.query[-200:]
-            log.info("find_by_query() QUERY: %s (%s rows)", query_str, cur.rowcount)
-            query_res = {}
-            query["_result"] = query_res
-            query_res["statement_gen"] = exec_query
-            query_res["statement_sql"] = cur.query
-            query_res["rowcount"] = cur.rowcount
-
+    def _get_query_row_func(self, query, pqb):
+        """ Returns the function converting a result row of a datastore query into a result value """
+        query_format = query["query_args"].get("format", "")
         id_only = query["query_args"].get("id_only", True)
         if query_format == "complex" and pqb.has_basic_cols:
             # Return format is list of lists
             if id_only:
-                res_vals = [[self._prep_id(row[0])] + list(row[1:]) for row in rows]
+                return lambda row: [self._prep_id(row[0])] + list(row[1:])
             else:
-                res_vals = [[self._persistence_dict_to_ion_object(row[1])] + list(rows[2:]) for row in rows]
+                return lambda row: [self._persistence_dict_to_ion_object(row[1])] + list(row[2:])
 
         elif query_format == "complex":
-            res_vals = [list(row) for row in rows]
+            return list
 
         else:
             if id_only:
-                res_vals = [self._prep_id(row[0]) for row in rows]
+                return lambda row: self._prep_id(row[0])
             else:
-                res_vals = [self._persistence_dict_to_ion_object(row[-1]) for row in rows]
-
-        return res_vals
+                return lambda row: self._persistence_dict_to_ion_object(row[-1])
 
     # -------------------------------------------------------------------------
     # Internal operations
@@ -6,6 +6,7 @@ __author__ = 'Michael Meisinger'
 
 import contextlib
 import gevent
+from gevent.pool import Pool as GreenletPool
 from gevent.queue import Queue
 from gevent.socket import wait_read, wait_write
 import sys
@@ -23,6 +24,8 @@ try:
 except ImportError:
     print "PostgreSQL imports not available!"
 
+from putil.logging import log
+
 
 # Gevent Monkey patching
 def gevent_wait_callback(conn, timeout=None):
@@ -92,6 +95,7 @@ class DatabaseConnectionPool(object):
             raise OperationalError("Already in a transaction context")
         conn = self.get()
         db_context.cur_transaction = conn
+        db_context.transaction_end_callbacks = []
         try:
             if isolation_level is not None:
                 if conn.isolation_level == isolation_level:
@@ -116,6 +120,12 @@ class DatabaseConnectionPool(object):
                     conn.set_isolation_level(isolation_level)
                 self.put(conn)
             db_context.cur_transaction = None
+            end_callbacks, db_context.transaction_end_callbacks = db_context.transaction_end_callbacks, None
+            for end_callback in end_callbacks:
+                try:
+                    end_callback()
+                except Exception:
+                    log.exception("Error in transaction end callback")
 
     @contextlib.contextmanager
     def connection(self, isolation_level=None):
@@ -365,6 +375,54 @@ class StatementBuilder(object):
         return self.statement, self.statement_args
 
 
+def is_in_transaction():
+    """ Returns True if the current thread/gevent is within a transaction context """
+    return getattr(db_context, "cur_transaction", None) is not None
+
+
+def add_transaction_end_callback(func):
+    """ Calls func after the transaction of the current thread/gevent ended (commit or rollback),
+    or immediately if not within a transaction context """
+    end_callbacks = getattr(db_context, "transaction_end_callbacks", None)
+    if is_in_transaction() and end_callbacks is not None:
+        end_callbacks.append(func)
+    else:
+        func()
+
+
+def chunk_list(items, chunk_size):
+    """ Returns a list of consecutive lists of at most chunk_size items (all items in one list if chunk_size<=0) """
+    items = list(items)
+    if chunk_size <= 0 or len(items) <= chunk_size:
+        return [items]
+    return [items[i:i + chunk_size] for i in xrange(0, len(items), chunk_size)]
+
+
+def map_parallel(func, args_list, maxsize):
+    """ Calls func for each entry of args_list in separate gevents (at most maxsize at a time) and
+    returns the results in order. Raises the first error after all calls completed.
+    The DB stats of the current request are shared with the spawned gevents """
+    db_stats = get_db_stats()
+
+    def run_func(arg):
+        db_context.db_stats = db_stats
+        try:
+            return True, func(arg)
+        except Exception:
+            return False, sys.exc_info()
+
+    gpool = GreenletPool(size=max(1, maxsize))
+    greenlets = [gpool.spawn(run_func, arg) for arg in args_list]
+    gevent.joinall(greenlets)
+    results = []
+    for gl in greenlets:
+        success, res = gl.value
+        if not success:
+            raise res[0], res[1], res[2]
+        results.append(res)
+    return results
+
+
 def init_db_stats():
     """ Clears DB stats object for current thread/gevent local request stack """
     db_context.db_stats = {}
@@ -19,6 +19,7 @@ from pyon.ion.resource import RT, PRED, LCS, AS, lcstate, create_access_args
 from pyon.util.tracer import CallTracer
 
 from pyon.datastore.postgresql.datastore import PostgresPyonDataStore
+from pyon.datastore.postgresql.base_store import PostgresDataStore
 from pyon.datastore.postgresql.pg_util import init_db_stats, get_db_stats, clear_db_stats
 from pyon.datastore.datastore_query import DatastoreQueryBuilder
 
@@ -938,9 +939,215 @@ class TestDataStores(IonIntegrationTestCase):
         res = data_store.find_by_query(qb.get_query(), access_args=access_args)
         self.assertEquals(len(res), 3)
 
+        # Streaming queries with server side cursor
+        data_store.stream_itersize = 2
+        query = qb.get_query()
+        query["query_args"]["id_only"] = False
+        res_iter = data_store.find_by_query_iter(query, access_args=access_args)
+        self.assertIn("statement_gen", query["_result"])
+        res = list(res_iter)
+        self.assertEquals(sorted(obj.name for obj in res), ["Buoy1", "Buoy2", "Buoy3"])
+        self.assertEquals(set(data_store.find_resources_ext_iter(query, id_only=True, access_args=access_args)),
+                          {plat1_obj_id, plat2_obj_id, plat3_obj_id})
+
+        all_docs = data_store.find_by_view("_all_docs", None, id_only=False)
+        all_docs_iter = data_store.find_by_view_iter("_all_docs", None, id_only=False)
+        self.assertEquals(sorted(rid for rid, _, _ in all_docs_iter), sorted(rid for rid, _, _ in all_docs))
+        # Abandoned iteration releases the connection
+        all_docs_iter = data_store.find_docs_by_view_iter("_all_docs", None, id_only=True)
+        next(all_docs_iter)
+        all_docs_iter.close()
+        with self.assertRaises(NotImplementedError):
+            data_store.find_docs_by_view_iter("directory", "by_key", key="x")
+
         # Clean up
         self.data_store.delete_mult([plat1_obj_id, plat2_obj_id, plat3_obj_id, aid1_obj_id, dp1_obj_id])
 
+    def test_datastore_object_cache(self):
+        from pyon.datastore.object_cache import ObjectCache
+        data_store = self.ds_class(datastore_name='ion_test_ds', profile=DataStore.DS_PROFILE.RESOURCES, scope=get_sys_name())
+        try:
+            data_store.delete_datastore()
+        except NotFound:
+            pass
+        data_store.create_datastore()
+        self.data_store = data_store
+
+        cache = ObjectCache(max_size=100, ttl=0)
+        with patch("pyon.datastore.object_cache.object_cache", cache):
+            obj_id1, _ = data_store.create(IonObject(RT.ActorIdentity, name="actor1"))
+            obj_id2, _ = data_store.create(IonObject(RT.ActorIdentity, name="actor2"))
+
+            obj1 = data_store.read(obj_id1)
+            self.assertEqual(obj1.name, "actor1")
+            obj1a = data_store.read(obj_id1)
+            self.assertEqual(obj1a, obj1)
+            self.assertIsNot(obj1a, obj1)
+            self.assertEqual(cache.get_stats()["hits"], 1)
+
+            objs = data_store.read_mult([obj_id1, obj_id2])
+            self.assertEqual([o.name for o in objs], ["actor1", "actor2"])
+            self.assertEqual(cache.get_stats()["hits"], 2)
+
+            # Local writes invalidate
+            obj1.name = "actor1 updated"
+            data_store.update(obj1)
+            self.assertEqual(data_store.read(obj_id1).name, "actor1 updated")
+
+            # Changes not seen by the cache are detected in strict mode only
+            doc2 = data_store.read_doc(obj_id2)
+            doc2["name"] = "actor2 updated"
+            PostgresDataStore.update_doc(data_store, doc2)
+            self.assertEqual(data_store.read(obj_id2).name, "actor2")
+            cache.strict = True
+            self.assertEqual(data_store.read(obj_id2).name, "actor2 updated")
+            self.assertEqual(data_store.read_mult([obj_id1, obj_id2])[1].name, "actor2 updated")
+            self.assertEqual(cache.get_stats()["stale"], 1)
+
+            data_store.delete(obj_id2)
+            with self.assertRaises(NotFound):
+                data_store.read(obj_id2)
+            self.assertEqual(data_store.read_mult([obj_id1, obj_id2], strict=False)[1], None)
+
+    def test_datastore_create_mult(self):
+        data_store = self.ds_class(datastore_name='ion_test_ds', profile=DataStore.DS_PROFILE.RESOURCES, scope=get_sys_name())
+        try:
+            data_store.delete_datastore()
+        except NotFound:
+            pass
+        data_store.create_datastore()
+        self.data_store = data_store
+
+        res_objs = [IonObject(RT.ActorIdentity, name="actor%s" % i) for i in xrange(5)]
+        res_objs[0].description = "Tab\there, newline\nthere, backslash \\ and unicode \xc3\xa9"
+        res_objs[1].visibility = 2
+        res_objs[2].alt_ids = ["PRE:1"]
+        res_ids = [rid for rid, _ in data_store.create_mult(res_objs)]
+
+        read_objs = data_store.read_mult(res_ids)
+        self.assertEqual([o.name for o in read_objs], ["actor%s" % i for i in xrange(5)])
+        self.assertEqual(read_objs[0].description, res_objs[0].description)
+        self.assertEqual(read_objs[2].alt_ids, ["PRE:1"])
+        with data_store.pool.cursor() as cur:
+            cur.execute("SELECT name, visibility, lcstate FROM " + data_store._get_datastore_name() + " WHERE id=%s", (res_ids[1],))
+            self.assertEqual(cur.fetchall(), [("actor1", 2, "DRAFT")])
+
+        assoc_objs = [IonObject("Association", s=res_ids[0], st=RT.ActorIdentity, p=HAS_A, o=rid, ot=RT.ActorIdentity,
+                                retired=False) for rid in res_ids[1:]]
+        data_store.create_mult(assoc_objs)
+        self.assertEqual(len(data_store.find_objects(res_ids[0], HAS_A, id_only=True)[0]), 4)
+
+        # Duplicates are rejected
+        with self.assertRaises(BadRequest):
+            data_store.create_doc_mult([data_store.read_doc(rid) for rid in res_ids[:3]])
+
+    def test_datastore_update_mult(self):
+        data_store = self.ds_class(datastore_name='ion_test_ds', profile=DataStore.DS_PROFILE.RESOURCES, scope=get_sys_name())
+        try:
+            data_store.delete_datastore()
+        except NotFound:
+            pass
+        data_store.create_datastore()
+        self.data_store = data_store
+
+        res_objs = [IonObject(RT.ActorIdentity, name="actor%s" % i) for i in xrange(4)]
+        res_ids = [rid for rid, _ in data_store.create_mult(res_objs)]
+        assoc_objs = [IonObject("Association", s=res_ids[0], st=RT.ActorIdentity, p=HAS_A, o=res_ids[i],
+                                ot=RT.ActorIdentity, retired=False) for i in xrange(1, 3)]
+        assoc_ids = [aid for aid, _ in data_store.create_mult(assoc_objs)]
+
+        # One statement per table and set of columns with values (resources with and without name, associations)
+        res_objs = data_store.read_mult(res_ids)
+        res_objs[0].name = "actor0 updated"
+        res_objs[1].visibility = 2
+        res_objs[2].name = ""
+        assoc_objs = data_store.read_mult(assoc_ids)
+        assoc_objs[0].retired = True
+        init_db_stats()
+        with patch.object(data_store, "_update_doc") as update_doc:
+            res = data_store.update_mult(res_objs + assoc_objs)
+            self.assertFalse(update_doc.called)
+        db_stats = get_db_stats()
+        clear_db_stats()
+        self.assertEqual(db_stats["count.nonsel"], 3)
+        self.assertEqual([(oid, rev) for _, oid, rev in res], [(oid, "2") for oid in res_ids + assoc_ids])
+
+        res_objs = data_store.read_mult(res_ids)
+        self.assertEqual([o.name for o in res_objs], ["actor0 updated", "actor1", "", "actor3"])
+        self.assertEqual([o._rev for o in res_objs], ["2", "2", "2", "1"])
+        with data_store.pool.cursor() as cur:
+            cur.execute("SELECT name, visibility FROM " + data_store._get_datastore_name() + " WHERE id = ANY(%s) ORDER BY name", (res_ids[:3],))
+            # Columns without value are left unchanged
+            self.assertEqual(cur.fetchall(), [("actor0 updated", 1), ("actor1", 2), ("actor2", 1)])
+        self.assertEqual(len(data_store.find_objects(res_ids[0], HAS_A, id_only=True)[0]), 1)
+
+        # Revision conflicts are reported per id and nothing is updated
+        stale_obj = data_store.read(res_ids[3])
+        data_store.update(data_store.read(res_ids[3]))
+        res_objs = data_store.read_mult(res_ids[:2])
+        res_objs[0].name = "not updated"
+        with self.assertRaises(Conflict) as cm:
+            data_store.update_mult(res_objs + [stale_obj])
+        self.assertIn(res_ids[3], str(cm.exception))
+        self.assertNotIn(res_ids[0], str(cm.exception))
+        self.assertEqual(data_store.read(res_ids[0]).name, "actor0 updated")
+
+        # Deleted docs and repeated ids
+        res_docs = data_store.read_doc_mult(res_ids[:2])
+        res_docs[1]["_deleted"] = True
+        data_store.update_doc_mult(res_docs)
+        self.assertEqual(data_store.read_mult(res_ids[:2], strict=False)[1], None)
+        res_doc = data_store.read_doc(res_ids[0])
+        with self.assertRaises(Conflict):
+            data_store.update_doc_mult([res_doc, dict(res_doc)])
+
+    def test_datastore_id_chunks(self):
+        data_store = self.ds_class(datastore_name='ion_test_ds', profile=DataStore.DS_PROFILE.RESOURCES, scope=get_sys_name())
+        try:
+            data_store.delete_datastore()
+        except NotFound:
+            pass
+        data_store.create_datastore()
+        self.data_store = data_store
+        data_store.id_chunk_size = 2
+
+        res_objs = [IonObject(RT.ActorIdentity, name="actor%s" % i) for i in xrange(5)]
+        res_ids = [rid for rid, _ in data_store.create_mult(res_objs)]
+        assoc_objs = [IonObject("Association", s=res_ids[i], st=RT.ActorIdentity, p=HAS_A, o=res_ids[i + 1],
+                                ot=RT.ActorIdentity, retired=False) for i in xrange(4)]
+        data_store.create_mult(assoc_objs)
+
+        # Reads in chunks, in parallel outside of a transaction
+        read_objs = data_store.read_mult(list(reversed(res_ids)))
+        self.assertEqual([o.name for o in read_objs], ["actor%s" % i for i in reversed(xrange(5))])
+        with self.assertRaises(NotFound):
+            data_store.read_mult(res_ids + ["NONEXISTENT"])
+        read_objs = data_store.read_mult([res_ids[0], "NONEXISTENT", res_ids[4]], strict=False)
+        self.assertEqual([o.name if o else None for o in read_objs], ["actor0", None, "actor4"])
+        with data_store.in_transaction():
+            with patch("pyon.datastore.postgresql.base_store.map_parallel") as map_parallel:
+                self.assertEqual(len(data_store.read_mult(res_ids)), 5)
+                self.assertFalse(map_parallel.called)
+
+        # Association finds return results grouped in the order of the given ids
+        obj_ids, assocs = data_store.find_objects_mult(list(reversed(res_ids)), id_only=True)
+        self.assertEqual(obj_ids, list(reversed(res_ids[1:])))
+        self.assertEqual([a.s for a in assocs], list(reversed(res_ids[:4])))
+        objs, assocs = data_store.find_objects_mult(res_ids[:3], id_only=False, predicate=HAS_A)
+        self.assertEqual([o.name for o in objs], ["actor1", "actor2", "actor3"])
+        self.assertEqual(data_store.find_objects_mult(res_ids[:3], predicate=OWNER_OF), [[], []])
+        subj_ids, assocs = data_store.find_subjects_mult([res_ids[4], res_ids[1], res_ids[0]], id_only=True)
+        self.assertEqual(subj_ids, [res_ids[3], res_ids[0]])
+        with self.assertRaises(BadRequest):
+            data_store.find_subjects_mult([res_ids[0], None])
+
+        # Deletes are atomic across chunks
+        with self.assertRaises(NotFound):
+            data_store.delete_mult(res_ids[:4] + ["NONEXISTENT"])
+        self.assertEqual(len(data_store.read_mult(res_ids)), 5)
+        data_store.delete_mult(res_ids)
+        self.assertEqual(data_store.read_mult(res_ids, strict=False), [None] * 5)
+
     def test_datastore_transactions(self):
         data_store = self.ds_class(datastore_name='ion_test_ds', profile=DataStore.DS_PROFILE.RESOURCES, scope=get_sys_name())
         # Just in case previous run failed without cleaning up, delete data store
@@ -978,8 +1185,8 @@ class TestDataStores(IonIntegrationTestCase):
         db_stats = get_db_stats()
         print "STATS", db_stats
         self.assertEqual(db_stats["count.select"], 3)
-        self.assertEqual(db_stats["count.nonsel"], 7)    # Note: delete_mult issues individual statements
-        self.assertEqual(db_stats["count.all"], 10)
+        self.assertEqual(db_stats["count.nonsel"], 6)    # Note: delete_mult issues one statement per id chunk
+        self.assertEqual(db_stats["count.all"], 9)
 
         clear_db_stats()
 
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+
+__author__ = 'Michael Meisinger'
+
+from mock import patch
+from nose.plugins.attrib import attr
+
+from pyon.datastore.object_cache import ObjectCache
+from pyon.util.unit_test import IonUnitTestCase
+
+
+@attr('UNIT', group='datastore')
+class TestObjectCache(IonUnitTestCase):
+
+    def test_object_cache(self):
+        cache = ObjectCache(max_size=2, ttl=0)
+        doc1 = dict(_id="id1", _rev="1", type_="Resource", name="res1", alt_ids=["a"])
+
+        self.assertIsNone(cache.get("ds", "id1"))
+        cache.put("ds", "id1", doc1, cache.invalidation_seq)
+        rev, doc = cache.get("ds", "id1")
+        self.assertEqual(rev, "1")
+        self.assertEqual(doc, doc1)
+
+        # Each hit returns a new copy
+        doc["alt_ids"].append("b")
+        self.assertEqual(cache.get("ds", "id1")[1]["alt_ids"], ["a"])
+        self.assertIsNone(cache.get("other_ds", "id1"))
+
+        # Docs read before an invalidation are not added
+        inval_seq = cache.invalidation_seq
+        cache.invalidate("id2")
+        cache.put("ds", "id2", dict(_id="id2", _rev="1"), inval_seq)
+        self.assertIsNone(cache.get("ds", "id2"))
+
+        # LRU eviction
+        cache.put("ds", "id2", dict(_id="id2", _rev="1"), cache.invalidation_seq)
+        cache.get("ds", "id1")
+        cache.put("ds", "id3", dict(_id="id3", _rev="1"), cache.invalidation_seq)
+        self.assertIsNone(cache.get("ds", "id2"))
+        self.assertIsNotNone(cache.get("ds", "id1"))
+
+        cache.invalidate("id1")
+        self.assertIsNone(cache.get("ds", "id1"))
+
+        stats = cache.get_stats()
+        self.assertEqual(stats["hits"], 4)
+        self.assertEqual(stats["misses"], 5)
+        self.assertEqual(stats["evictions"], 1)
+        self.assertEqual(stats["invalidations"], 1)
+        self.assertEqual(stats["size"], 1)
+
+        cache.clear()
+        self.assertIsNone(cache.get("ds", "id3"))
+
+    def test_object_cache_ttl(self):
+        cache = ObjectCache(ttl=10)
+        with patch("pyon.datastore.object_cache.time.time", return_value=1000.0):
+            cache.put("ds", "id1", dict(_id="id1", _rev="1"), cache.invalidation_seq)
+        with patch("pyon.datastore.object_cache.time.time", return_value=1005.0):
+            self.assertIsNotNone(cache.get("ds", "id1"))
+        with patch("pyon.datastore.object_cache.time.time", return_value=1011.0):
+            self.assertIsNone(cache.get("ds", "id1"))
+        self.assertEqual(cache.get_stats()["expirations"], 1)
@@ -10,7 +10,8 @@ from pyon.core import MSG_HEADER_ACTOR, MSG_HEADER_VALID, MSG_HEADER_ROLES, MSG_
 from pyon.core.exception import Timeout as IonTimeout
 from pyon.net.transport import BaseTransport
 from pyon.net.endpoint import (Publisher, Subscriber, EndpointUnit, process_interceptors, RPCRequestEndpointUnit,
-        BaseEndpoint, RPCClient, RPCResponseEndpointUnit, RPCServer, PublisherEndpointUnit, SubscriberEndpointUnit)
+        BaseEndpoint, RPCClient, RPCResponseEndpointUnit, RPCServer, PublisherEndpointUnit, SubscriberEndpointUnit,
+        RPCReplyDispatcher)
 from pyon.ion.event import BaseEventSubscriberMixin
 from pyon.util.log import log
 
@@ -210,6 +211,46 @@ class ProcessRPCClient(RPCClient):
         newkwargs['process'] = self._process
         return RPCClient.create_endpoint(self, to_name, existing_channel, **newkwargs)
 
+    def _spawn_call(self, func, *args, **kwargs):
+        """
+        Process context is greenlet-local. Carry the caller's context into the greenlet making
+        the call, so that security and conversation headers are forwarded as for a blocking call.
+        """
+        if hasattr(self._process, 'get_context') and hasattr(self._process, 'push_context'):
+            context = self._process.get_context()
+
+            def _call_in_context(*args, **kwargs):
+                with self._process.push_context(context):
+                    return func(*args, **kwargs)
+
+            return RPCClient._spawn_call(self, _call_in_context, *args, **kwargs)
+
+        return RPCClient._spawn_call(self, func, *args, **kwargs)
+
+    def _track_async_call(self, gl):
+        """
+        Async calls of all clients of a process are also tracked per process.
+        Outstanding calls are killed when the process quits.
+        """
+        RPCClient._track_async_call(self, gl)
+        if self._process is not None:
+            async_calls = getattr(self._process, '_rpc_async_calls', None)
+            if async_calls is None:
+                async_calls = self._process._rpc_async_calls = set()
+            async_calls.add(gl)
+            gl.link(async_calls.discard)
+
+    def _get_reply_dispatcher(self):
+        """
+        Multiplexed requests of all clients of a process share one reply queue.
+        The dispatcher is closed when the process quits.
+        """
+        dispatcher = getattr(self._process, '_rpc_reply_dispatcher', None)
+        if dispatcher is None:
+            dispatcher = RPCReplyDispatcher(node=self.node)
+            self._process._rpc_reply_dispatcher = dispatcher
+        return dispatcher
+
 
 class ProcessRPCResponseEndpointUnit(ProcessEndpointUnitMixin, RPCResponseEndpointUnit):
     def __init__(self, process=None, routing_call=None, **kwargs):
@@ -291,7 +332,7 @@ class ProcessRPCResponseEndpointUnit(ProcessEndpointUnitMixin, RPCResponseEndpoi
         """
         Gets the process' saturation, as an integer percentage (process time / total time).
         """
-        total, _, proc, interval, interval_run = self._process._process.time_stats  # we want the ION proc's stats
+        total, _, proc, interval, interval_run = self._process._process.time_stats[:5]  # we want the ION proc's stats
         return str(int(interval_run / float(interval) * 100))  # Percentage in current (partial) and prior interval
 
 
@@ -13,6 +13,7 @@ from gevent import event as gevent_event
 from pyon.core import bootstrap, MSG_HEADER_ACTOR
 from pyon.core.bootstrap import CFG
 from pyon.core.exception import BadRequest, IonException, StreamException
+from pyon.core.object import LazyIonMessage
 from pyon.datastore.datastore import DataStore
 from pyon.datastore.datastore_query import QUERY_EXP_KEY, DatastoreQueryBuilder, DQ
 from pyon.ion.identifier import create_unique_event_id, create_simple_unique_id
@@ -403,6 +404,8 @@ class EventRepository(object):
         Returns event_id of new event.
         """
         log.trace("Store event persistently %s", event)
+        if isinstance(event, LazyIonMessage):
+            event = event.materialize()
         if not isinstance(event, Event):
             raise BadRequest("event must be type Event, not %s" % type(event))
         event_id = event.__dict__.pop("_id", None)
@@ -418,7 +421,8 @@ class EventRepository(object):
         log.debug("Store %s events persistently", len(events))
         if type(events) is not list:
             raise BadRequest("events must be type list, not %s" % type(events))
-        if not all([isinstance(event, Event) for event in events]):
+        if not all([isinstance(event, Event) or (isinstance(event, LazyIonMessage) and self._is_event_msg(event))
+                    for event in events]):
             raise BadRequest("events must all be type Event")
 
         if events:
@@ -427,6 +431,9 @@ class EventRepository(object):
         else:
             return None
 
+    def _is_event_msg(self, event_msg):
+        return event_msg.type_ == "Event" or "Event" in (event_msg.base_types or [])
+
     def get_event(self, event_id):
         """
         Returns the event object for given event_id or raises NotFound
@@ -442,9 +449,22 @@ class EventRepository(object):
         """
         log.trace("Retrieving persistent event for event_type=%s, origin=%s, start_ts=%s, end_ts=%s, descending=%s, limit=%s",
                   event_type, origin, start_ts, end_ts, kwargs.get("descending", None), kwargs.get("limit", None))
-        events = None
+        view_name, start_key, end_key = self._get_event_view(event_type, origin, start_ts, end_ts, kwargs)
+        events = self.event_store.find_by_view("event", view_name, start_key=start_key, end_key=end_key,
+                                               id_only=id_only, **kwargs)
+        return events
 
-        design_name = "event"
+    def find_events_iter(self, event_type=None, origin=None, start_ts=None, end_ts=None, id_only=False, **kwargs):
+        """
+        Like find_events, but returns a generator of (event_id, event_key, event object) tuples.
+        Events are read from the database in batches and converted lazily, e.g. for event exports.
+        """
+        view_name, start_key, end_key = self._get_event_view(event_type, origin, start_ts, end_ts, kwargs)
+        return self.event_store.find_by_view_iter("event", view_name, start_key=start_key, end_key=end_key,
+                                                  id_only=id_only, **kwargs)
+
+    def _get_event_view(self, event_type, origin, start_ts, end_ts, kwargs):
+        """ Returns the event view name, start key and end key for given query arguments """
         view_name = None
         start_key = []
         end_key = []
@@ -475,9 +495,7 @@ class EventRepository(object):
         if end_ts:
             end_key.append(end_ts)
 
-        events = self.event_store.find_by_view(design_name, view_name, start_key=start_key, end_key=end_key,
-                                               id_only=id_only, **kwargs)
-        return events
+        return view_name, start_key, end_key
 
     def find_events_query(self, query, id_only=False):
         """
@@ -494,6 +512,19 @@ class EventRepository(object):
         log.debug("find_events_query() found %s events", len(events))
         return events
 
+    def find_events_query_iter(self, query, id_only=False):
+        """
+        Like find_events_query, but returns a generator of events or event ids that are read from
+        the database in batches and converted lazily.
+        """
+        if not query or not isinstance(query, dict) or not QUERY_EXP_KEY in query:
+            raise BadRequest("Illegal events query")
+        qargs = query["query_args"]
+        qargs["datastore"] = DataStore.DS_EVENTS
+        qargs["profile"] = DataStore.DS_PROFILE.EVENTS
+        qargs["id_only"] = id_only
+        return self.event_store.find_by_query_iter(query)
+
 
 class EventGate(EventSubscriber):
     def __init__(self, *args, **kwargs):
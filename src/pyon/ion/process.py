@@ -2,16 +2,18 @@
 
 __author__ = 'Adam R. Smith, Michael Meisinger, Dave Foster <dfoster@asascience.com>'
 
+import heapq
+import itertools
 import threading
 import traceback
 import gevent
 from gevent import greenlet, Timeout
 from gevent.event import Event, AsyncResult
-from gevent.queue import Queue
+from gevent.queue import PriorityQueue
 
-from pyon.core import MSG_HEADER_ACTOR
+from pyon.core import MSG_HEADER_ACTOR, MSG_HEADER_PRIORITY
 from pyon.core.bootstrap import CFG
-from pyon.core.exception import IonException, ContainerError
+from pyon.core.exception import IonException, ContainerError, ServiceUnavailable
 from pyon.core.exception import Timeout as IonTimeout
 from pyon.core.thread import PyonThreadManager, PyonThread, ThreadManager, PyonThreadTraceback, PyonHeartbeatError
 from pyon.datastore.postgresql.pg_util import init_db_stats, get_db_stats, clear_db_stats
@@ -23,6 +25,13 @@ STAT_INTERVAL_LENGTH = 60000  # Interval time for process saturation stats colle
 
 stats_callback = None
 
+# Priority classes of calls in the process control queue. Lower values are processed first.
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+PRIORITY_STOP = 3     # Stop sentinels come after all queued calls
+CALL_PRIORITIES = {"high": PRIORITY_HIGH, "normal": PRIORITY_NORMAL, "low": PRIORITY_LOW}
+
 
 class OperationInterruptedException(BaseException):
     """
@@ -39,13 +48,69 @@ class IonProcessError(StandardError):
     pass
 
 
+class ControlQueue(PriorityQueue):
+    """
+    Queue of calls for the control greenlet(s) of an ION process. Calls are ordered by priority
+    class, FIFO within a class. Keeps statistics of the time calls waited in the queue.
+    """
+    def __init__(self):
+        PriorityQueue.__init__(self)
+        self._seq = itertools.count()
+        self.wait_count = 0     # number of calls taken from the queue
+        self.wait_time = 0      # total time calls waited in the queue (ms)
+        self.wait_max = 0       # longest time a call waited in the queue (ms)
+        self._call_count = 0    # number of calls in the queue, excluding stop sentinels
+
+    def put_call(self, calltuple, priority=PRIORITY_NORMAL):
+        self.put((priority, next(self._seq), get_ion_ts_millis(), calltuple))
+
+    def put_stop(self):
+        self.put((PRIORITY_STOP, next(self._seq), None, StopIteration))
+
+    def _put(self, item, heappush=heapq.heappush):
+        heappush(self.queue, item)
+        if item[2] is not None:
+            self._call_count += 1
+
+    def _get(self, heappop=heapq.heappop):
+        _, _, enqueue_time, item = heappop(self.queue)
+        if enqueue_time is not None:
+            self._call_count -= 1
+            wait_time = get_ion_ts_millis() - enqueue_time
+            self.wait_count += 1
+            self.wait_time += wait_time
+            self.wait_max = max(self.wait_max, wait_time)
+        return item
+
+    def iter_calls(self):
+        """ Iterates over the queued call tuples in no particular order, without removing them. """
+        for _, _, _, item in self.queue:
+            if item is not StopIteration:
+                yield item
+
+    def call_count(self):
+        return self._call_count
+
+
+class CtrlHeartbeatState(object):
+    """
+    Heartbeat stuck-detection state of one control greenlet of an ION process.
+    """
+    def __init__(self):
+        self.op     = None      # last operation (by AR)
+        self.sig    = None      # progress signature of last heartbeat
+        self.stack  = None      # stacktrace, only captured once the operation is considered stuck
+        self.time   = None      # timestamp of heart beat last matching the current op
+        self.count  = 0         # number of times this operation has been seen consecutively
+
+
 class IonProcessThread(PyonThread):
     """
     The control part of an ION process.
     """
 
     def __init__(self, target=None, listeners=None, name=None, service=None, cleanup_method=None,
-                 heartbeat_secs=10, **kwargs):
+                 heartbeat_secs=10, max_concurrency=1, **kwargs):
         """
         Constructs the control part of an ION process.
         Used by the container's IonProcessThreadManager, as part of spawn_process.
@@ -59,6 +124,8 @@ class IonProcessThread(PyonThread):
         @param  cleanup_method  An optional callable to run when the process is stopping. Runs after all other
                                 notify_stop calls have run. Should take one param, this instance.
         @param  heartbeat_secs  Number of seconds to wait in between heartbeats.
+        @param  max_concurrency Number of control greenlets processing calls from the control queue concurrently.
+                                Only use > 1 for processes that do not depend on calls being serialized.
         """
         self._startup_listeners = listeners or []
         self.listeners          = []
@@ -69,11 +136,14 @@ class IonProcessThread(PyonThread):
 
         self.thread_manager     = ThreadManager(failure_notify_callback=self._child_failed)  # bubbles up to main thread manager
         self._dead_children     = []        # save any dead children for forensics
-        self._ctrl_thread       = None
-        self._ctrl_queue        = Queue()
+        self._ctrl_thread       = None      # the first control thread
+        self._ctrl_threads      = []        # all control threads
+        self._max_concurrency   = max(1, int(max_concurrency or 1))
+        self._ctrl_queue        = ControlQueue()
+        self._max_queue_size    = int(CFG.get_safe("container.process.max_queue_size", 0) or 0)
         self._ready_control     = Event()
         self._errors            = []
-        self._ctrl_current      = None      # set to the AR generated by _routing_call when in the context of a call
+        self._ctrl_currents     = {}        # control greenlet -> AR generated by _routing_call of the call it processes
 
         # processing vs idle time (ms)
         self._start_time        = None
@@ -81,13 +151,12 @@ class IonProcessThread(PyonThread):
         self._proc_time_prior   = 0   # busy time at the beginning of the prior interval
         self._proc_time_prior2  = 0   # busy time at the beginning of 2 interval's ago
         self._proc_interval_num = 0   # interval num of last record
+        self._proc_busy_count   = 0   # number of calls currently processing
+        self._proc_busy_start   = None  # time since when at least one call is processing
 
         # for heartbeats, used to detect stuck processes
         self._heartbeat_secs    = heartbeat_secs    # amount of time to wait between heartbeats
-        self._heartbeat_stack   = None              # stacktrace of last heartbeat
-        self._heartbeat_time    = None              # timestamp of heart beat last matching the current op
-        self._heartbeat_op      = None              # last operation (by AR)
-        self._heartbeat_count   = 0                 # number of times this operation has been seen consecutively
+        self._heartbeat_states  = {}                # control greenlet -> CtrlHeartbeatState
 
         self._log_call_exception = CFG.get_safe("container.process.log_exceptions", False)
         self._log_call_dbstats = CFG.get_safe("container.process.log_dbstats", False)
@@ -112,45 +181,85 @@ class IonProcessThread(PyonThread):
             if not (l in self._listener_map and not self._listener_map[l].proc.dead and l.get_ready_event().is_set()):
                 listeners_ok = False
 
-        ctrl_thread_ok = self._ctrl_thread.running
+        ctrl_thread_ok = all(ct.running for ct in self._ctrl_threads)
 
         # are we currently processing something?
         heartbeat_ok = True
-        if self._ctrl_current is not None:
-            st = traceback.extract_stack(self._ctrl_thread.proc.gr_frame)
+        for ctrl_thread in self._ctrl_threads:
+            if not self._heartbeat_ctrl_thread(ctrl_thread):
+                heartbeat_ok = False
+
+        #log.debug("%s %s %s", listeners_ok, ctrl_thread_ok, heartbeat_ok)
+        return (listeners_ok, ctrl_thread_ok, heartbeat_ok)
 
-            if self._ctrl_current == self._heartbeat_op:
+    def _heartbeat_ctrl_thread(self, ctrl_thread):
+        """
+        Checks whether the call processed by the given control thread made progress since the last heartbeat.
+        @return False if the call is considered stuck.
+        """
+        hb = self._get_heartbeat_state(ctrl_thread)
+        ctrl_current = self._ctrl_currents.get(ctrl_thread.proc, None)
+        if ctrl_current is None:
+            hb.op       = None
+            hb.count    = 0
+            return True
 
-                if st == self._heartbeat_stack:
-                    self._heartbeat_count += 1  # we've seen this before! increment count
+        frame = ctrl_thread.proc.gr_frame
+        sig = get_progress_signature(frame)
 
-                    # we've been in this for the last X ticks, or it's been X seconds, fail this part of the heartbeat
-                    if self._heartbeat_count > CFG.get_safe('container.timeout.heartbeat_proc_count_threshold', 30) or \
-                       get_ion_ts_millis() - int(self._heartbeat_time) >= CFG.get_safe('container.timeout.heartbeat_proc_time_threshold', 30) * 1000:
-                        heartbeat_ok = False
-                else:
-                    # it's made some progress
-                    self._heartbeat_count = 1
-                    self._heartbeat_stack = st
-                    self._heartbeat_time  = get_ion_ts()
-            else:
-                self._heartbeat_op      = self._ctrl_current
-                self._heartbeat_count   = 1
-                self._heartbeat_time    = get_ion_ts()
-                self._heartbeat_stack   = st
+        if ctrl_current == hb.op:
+
+            if sig == hb.sig:
+                hb.count += 1  # we've seen this before! increment count
 
+                # we've been in this for the last X ticks, or it's been X seconds, fail this part of the heartbeat
+                if hb.count > CFG.get_safe('container.timeout.heartbeat_proc_count_threshold', 30) or \
+                   get_ion_ts_millis() - int(hb.time) >= CFG.get_safe('container.timeout.heartbeat_proc_time_threshold', 30) * 1000:
+                    if hb.stack is None and frame is not None:
+                        hb.stack = traceback.extract_stack(frame)
+                    return False
+            else:
+                # it's made some progress
+                hb.count    = 1
+                hb.sig      = sig
+                hb.stack    = None
+                hb.time     = get_ion_ts()
         else:
-            self._heartbeat_op      = None
-            self._heartbeat_count   = 0
+            hb.op       = ctrl_current
+            hb.count    = 1
+            hb.time     = get_ion_ts()
+            hb.sig      = sig
+            hb.stack    = None
+
+        return True
+
+    def _get_heartbeat_state(self, ctrl_thread=None):
+        """ Returns the heartbeat state of the given (default: first) control thread. """
+        ctrl_thread = ctrl_thread or self._ctrl_thread
+        if ctrl_thread not in self._heartbeat_states:
+            self._heartbeat_states[ctrl_thread] = CtrlHeartbeatState()
+        return self._heartbeat_states[ctrl_thread]
+
+    # Heartbeat state of the first control thread
+    _heartbeat_op = property(lambda self: self._get_heartbeat_state().op)
+    _heartbeat_sig = property(lambda self: self._get_heartbeat_state().sig)
+    _heartbeat_stack = property(lambda self: self._get_heartbeat_state().stack)
+    _heartbeat_time = property(lambda self: self._get_heartbeat_state().time)
+    _heartbeat_count = property(lambda self: self._get_heartbeat_state().count)
 
-        #log.debug("%s %s %s", listeners_ok, ctrl_thread_ok, heartbeat_ok)
-        return (listeners_ok, ctrl_thread_ok, heartbeat_ok)
+    @property
+    def _ctrl_current(self):
+        """ The AR of the call processed by the first control thread, if any """
+        if self._ctrl_thread is None:
+            return None
+        return self._ctrl_currents.get(self._ctrl_thread.proc, None)
 
     @property
     def time_stats(self):
         """
-        Returns a 5-tuple of (total time, idle time, processing time, time since prior interval start,
-        busy since prior interval start), all in ms (int).
+        Returns a 8-tuple of (total time, idle time, processing time, time since prior interval start,
+        busy since prior interval start, control queue depth, average queue wait time, max queue wait time),
+        all times in ms (int).
         """
         now = get_ion_ts_millis()
         running_time = now - self._start_time
@@ -166,7 +275,11 @@ class IonProcessThread(PyonThread):
         else:
             proc_time_since_prior = 0
 
-        return (running_time, idle_time, self._proc_time, now_since_prior, proc_time_since_prior)
+        ctrl_queue = self._ctrl_queue
+        avg_wait_time = ctrl_queue.wait_time / ctrl_queue.wait_count if ctrl_queue.wait_count else 0
+
+        return (running_time, idle_time, self._proc_time, now_since_prior, proc_time_since_prior,
+                ctrl_queue.call_count(), avg_wait_time, ctrl_queue.wait_max)
 
     def _child_failed(self, child):
         """
@@ -242,9 +355,12 @@ class IonProcessThread(PyonThread):
         self._start_time = get_ion_ts_millis()
         self._proc_interval_num = self._start_time / STAT_INTERVAL_LENGTH
 
-        # spawn control flow loop
-        self._ctrl_thread = self.thread_manager.spawn(self._control_flow)
-        self._ctrl_thread.proc._glname = "ION Proc CL %s" % self.name
+        # spawn control flow loop(s)
+        for i in xrange(self._max_concurrency):
+            ctrl_thread = self.thread_manager.spawn(self._control_flow)
+            ctrl_thread.proc._glname = "ION Proc CL %s" % self.name if i == 0 else "ION Proc CL %s-%s" % (self.name, i)
+            self._ctrl_threads.append(ctrl_thread)
+        self._ctrl_thread = self._ctrl_threads[0]
 
         # wait on control flow loop, heartbeating as appropriate
         while not self._ctrl_thread.ev_exit.wait(timeout=self._heartbeat_secs):
@@ -252,8 +368,9 @@ class IonProcessThread(PyonThread):
 
             if not all(hbst):
                 log.warn("Heartbeat status for process %s returned %s", self, hbst)
-                if self._heartbeat_stack is not None:
-                    stack_out = "".join(traceback.format_list(self._heartbeat_stack))
+                stacks = [hb.stack for hb in self._heartbeat_states.values() if hb.op is not None and hb.stack is not None]
+                if stacks:
+                    stack_out = "\n".join("".join(traceback.format_list(st)) for st in stacks)
                 else:
                     stack_out = "N/A"
 
@@ -262,7 +379,8 @@ class IonProcessThread(PyonThread):
 
         # this is almost a no-op as we don't fall out of the above loop without
         # exiting the ctrl_thread, but having this line here makes testing much easier.
-        self._ctrl_thread.join()
+        for ctrl_thread in self._ctrl_threads:
+            ctrl_thread.join()
 
     def _routing_call(self, call, context, *callargs, **callkwargs):
         """
@@ -277,20 +395,43 @@ class IonProcessThread(PyonThread):
         @param  context     Optional process-context (usually the headers of the incoming call) to be
                             set. Process-context is greenlet-local, and since we're crossing greenlet
                             boundaries, we must set it again in the ION process' calling greenlet.
+
+        Raises Timeout if the call's reply-by time has already passed and ServiceUnavailable if the
+        control queue is full (does not apply to high priority calls).
         """
         ar = AsyncResult()
 
         if len(callargs) == 0 and len(callkwargs) == 0:
             log.trace("_routing_call got no arguments for the call %s, check your call's parameters", call)
 
-        self._ctrl_queue.put((greenlet.getcurrent(), ar, call, callargs, callkwargs, context))
+        # check context for expiration before waiting in the queue
+        if context is not None and 'reply-by' in context:
+            now = get_ion_ts_millis()
+            if now >= int(context['reply-by']):
+                raise IonTimeout("Reply-by time has already occurred (reply-by: %s, enqueue time: %s)" % (context['reply-by'], now))
+
+        priority = self._get_call_priority(call, context)
+        if self._max_queue_size > 0 and priority != PRIORITY_HIGH and \
+                self._ctrl_queue.call_count() >= self._max_queue_size:
+            raise ServiceUnavailable("Process %s control queue is full (%s calls)" % (self.name, self._ctrl_queue.call_count()))
+
+        self._ctrl_queue.put_call((greenlet.getcurrent(), ar, call, callargs, callkwargs, context), priority)
         return ar
 
+    def _get_call_priority(self, call, context):
+        """ Returns the priority of a call, from the op-priority header or the call_priority decorator """
+        priority = None
+        if context is not None and MSG_HEADER_PRIORITY in context:
+            priority = CALL_PRIORITIES.get(context[MSG_HEADER_PRIORITY], None)
+        if priority is None:
+            priority = CALL_PRIORITIES.get(getattr(call, "_priority", None), PRIORITY_NORMAL)
+        return priority
+
     def has_pending_call(self, ar):
         """
         Returns true if the call (keyed by the AsyncResult returned by _routing_call) is still pending.
         """
-        for _, qar, _, _, _, _ in self._ctrl_queue.queue:
+        for _, qar, _, _, _, _ in self._ctrl_queue.iter_calls():
             if qar == ar:
                 return True
 
@@ -308,11 +449,24 @@ class IonProcessThread(PyonThread):
 
         return False
 
-    def _interrupt_control_thread(self):
+    def _interrupt_control_thread(self, ar=None):
         """
         Signal the control flow thread that it needs to abort processing, likely due to a timeout.
+
+        @param  ar  If given, interrupts the control thread processing the call keyed by this AR (if any).
+                    Otherwise interrupts the first control thread.
         """
-        self._ctrl_thread.proc.kill(exception=OperationInterruptedException, block=False)
+        ctrl_thread = self._ctrl_thread
+        if ar is not None:
+            ctrl_thread = None
+            for ct in self._ctrl_threads:
+                if self._ctrl_currents.get(ct.proc, None) is ar:
+                    ctrl_thread = ct
+                    break
+            if ctrl_thread is None:
+                return
+
+        ctrl_thread.proc.kill(exception=OperationInterruptedException, block=False)
 
     def cancel_or_abort_call(self, ar):
         """
@@ -321,13 +475,13 @@ class IonProcessThread(PyonThread):
         The pending call is keyed by the AsyncResult returned by _routing_call.
         """
         if not self._cancel_pending_call(ar) and not ar.ready():
-            self._interrupt_control_thread()
+            self._interrupt_control_thread(ar)
 
     def _control_flow(self):
         """
         Entry point for process control thread of execution.
 
-        This method is run by the control greenlet for each ION process. Listeners attached
+        This method is run by the control greenlet(s) for each ION process. Listeners attached
         to the process, either RPC Servers or Subscribers, synchronize calls to the process
         by placing call requests into the queue by calling _routing_call.
 
@@ -341,6 +495,7 @@ class IonProcessThread(PyonThread):
         if self.name:
             threading.current_thread().name = "%s-%s" % (svc_name, self.name)
         thread_base_name = threading.current_thread().name
+        ctrl_gl = gevent.getcurrent()
 
         self._ready_control.set()
 
@@ -371,6 +526,7 @@ class IonProcessThread(PyonThread):
                 log.info("control_flow: attempting to process message that has been cancelled, ignore")
                 continue
 
+            self._mark_proc_busy(start_proc_time)
             init_db_stats()
             try:
                 # ******************************************************************
@@ -378,8 +534,12 @@ class IonProcessThread(PyonThread):
 
                 with self.service.push_context(context), \
                      self.service.container.context.push_context(context):
-                    self._ctrl_current = ar
-                    res = call(*callargs, **callkwargs)
+                    self._ctrl_currents[ctrl_gl] = ar
+                    offload_executor = self._get_offload_executor(call)
+                    if offload_executor:
+                        res = offload_executor.execute(call, *callargs, **callkwargs)
+                    else:
+                        res = call(*callargs, **callkwargs)
 
                 # ****** END CALL, EXCEPTION HANDLING FOLLOWS                 ******
                 # ******************************************************************
@@ -424,7 +584,7 @@ class IonProcessThread(PyonThread):
             finally:
                 try:
                     # Compute statistics
-                    self._compute_proc_stats(start_proc_time)
+                    self._compute_proc_stats()
 
                     db_stats = get_db_stats()
                     if db_stats:
@@ -443,12 +603,21 @@ class IonProcessThread(PyonThread):
                 except Exception:
                     log.exception("Error computing process call stats")
 
-                self._ctrl_current = None
+                self._ctrl_currents.pop(ctrl_gl, None)
                 threading.current_thread().name = thread_base_name
 
             # Set response in AsyncEvent of caller (endpoint greenlet)
             ar.set(res)
 
+    def _get_offload_executor(self, call):
+        """ Returns the container's offload executor if the call is offloadable and the executor runs """
+        if getattr(call, "_offloadable", False) is not True:
+            return None
+        offload_executor = getattr(self.service.container, "offload_executor", None)
+        if offload_executor and offload_executor.is_running():
+            return offload_executor
+        return None
+
     def _record_proc_time(self, cur_time):
         """ Keep the _proc_time of the prior and prior-prior intervals for stats computation
         """
@@ -467,11 +636,19 @@ class IonProcessThread(PyonThread):
             self._proc_time_prior2 = self._proc_time
             self._proc_time_prior = self._proc_time
 
-    def _compute_proc_stats(self, start_proc_time):
+    def _mark_proc_busy(self, start_proc_time):
+        if self._proc_busy_count == 0:
+            self._proc_busy_start = start_proc_time
+        self._proc_busy_count += 1
+
+    def _compute_proc_stats(self):
+        """ Busy time is counted while at least one call is processing, not per concurrent call. """
         cur_time = get_ion_ts_millis()
         self._record_proc_time(cur_time)
-        proc_time = cur_time - start_proc_time
-        self._proc_time += proc_time
+        self._proc_busy_count -= 1
+        if self._proc_busy_count == 0:
+            proc_time = cur_time - self._proc_busy_start
+            self._proc_time += proc_time
 
     def start_listeners(self):
         """
@@ -518,7 +695,8 @@ class IonProcessThread(PyonThread):
                 tb = traceback.format_exc()
                 log.warn("Could not close listener, attempting to ignore: %s\nTraceback:\n%s", ex, tb)
 
-        self._ctrl_queue.put(StopIteration)
+        for _ in xrange(max(1, len(self._ctrl_threads))):
+            self._ctrl_queue.put_stop()
 
         # wait_children will join them and then get() them, which may raise an exception if any of them
         # died with an exception.
@@ -608,6 +786,21 @@ def get_ion_actor_id(process):
     return ion_actor_id
 
 
+def get_progress_signature(frame):
+    """
+    Returns a cheap signature of the execution state of a (greenlet's) frame stack: identity and
+    instruction offset of the innermost frame plus the stack depth. Any progress changes the signature.
+    """
+    if frame is None:
+        return None
+    depth = 0
+    f = frame
+    while f is not None:
+        depth += 1
+        f = f.f_back
+    return id(frame), frame.f_lasti, depth
+
+
 def set_process_stats_callback(stats_cb):
     """ Sets a callback function (hook) to push stats after a process operation call. """
     global stats_callback
@@ -763,6 +763,14 @@ class ResourceRegistry(object):
             limit=limit, skip=skip, descending=descending,
             id_only=id_only, query=query, access_args=access_args)
 
+    def find_resources_ext_iter(self, query, limit=None, skip=None, id_only=False, access_args=None):
+        """Like find_resources_ext with a datastore query expression dict (ResourceQuery), but returns a
+        generator of resource objects or resource ids. Resources are read from the database in batches
+        and converted lazily, e.g. to process large result sets without holding them in memory.
+        """
+        return self.rr_store.find_resources_ext_iter(query, limit=limit, skip=skip, id_only=id_only,
+                                                     access_args=access_args)
+
 
     def get_superuser_actors(self, reset=False):
         """Returns a memoized list of system superusers, including the system actor and all actors with
@@ -14,6 +14,30 @@ from pyon.util.containers import named_any, itersubclasses
 from pyon.util.context import LocalContextMixin
 
 
+def offloadable(func):
+    """
+    Decorator declaring a service operation as CPU-bound. If the container's offload executor is
+    enabled, the operation is executed in a worker subprocess, with arguments and result passed
+    msgpack encoded. The operation is called on an uninitialized instance of the service class,
+    so it must only depend on its arguments, not on process state or container capabilities.
+    """
+    func._offloadable = True
+    return func
+
+
+def call_priority(priority):
+    """
+    Decorator setting the priority class of a service operation in the ION process control queue:
+    "high", "normal" (default) or "low". Queued calls of higher priority are processed first.
+    High priority calls are admitted even if the control queue is full.
+    A caller can override the priority class with the op-priority message header.
+    """
+    def decorator(func):
+        func._priority = priority
+        return func
+    return decorator
+
+
 class BaseClients(object):
     """
     Basic object to hold clients for a service. Derived in implementations.
@@ -33,6 +57,7 @@ class BaseService(LocalContextMixin):
     running = False
     dependencies = []
     process_type = "service"
+    max_concurrency = 1     # number of calls processed concurrently; override only if calls need not be serialized
 
     def __init__(self, *args, **kwargs):
         self.id               = None
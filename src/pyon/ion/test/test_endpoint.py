@@ -7,6 +7,7 @@ from pyon.ion.endpoint import ProcessEndpointUnitMixin, ProcessRPCRequestEndpoin
 from mock import Mock, sentinel, patch, ANY, call, MagicMock
 from pyon.net.channel import SendChannel
 from pyon.util.unit_test import PyonTestCase
+from pyon.util.context import LocalContextMixin
 from pyon.core.exception import Unauthorized
 from nose.plugins.attrib import attr
 
@@ -157,6 +158,22 @@ class TestProcessRPCClient(PyonTestCase):
 
         mockce.assert_called_once_with(prpc, sentinel.to_name, None, process=sentinel.process)
 
+    def test_request_async_keeps_context(self):
+        proc = LocalContextMixin()
+        prpc = ProcessRPCClient(process=proc)
+
+        seen = []
+        def _request(msg, headers=None, op=None, timeout=None):
+            seen.append(proc.get_context())
+            return sentinel.result
+        prpc.request = _request
+
+        with proc.push_context({'ion-actor-id': 'actor'}):
+            ar = prpc.request_async(sentinel.msg, op="op")
+        self.assertEquals(ar.get(timeout=2), sentinel.result)
+        self.assertEquals(seen, [{'ion-actor-id': 'actor'}])
+        self.assertEquals(proc.get_context(), None)
+
 
 @attr('UNIT')
 class TestProcessRPCResponseEndpointUnit(PyonTestCase):
@@ -405,6 +405,16 @@ class TestEventRepository(IonUnitTestCase):
         events_r = event_repo.find_events(event_type="ResourceLifecycleEvent")
         self.assertEquals(len(events_r), 1)
 
+        # Streaming variants
+        event_repo.event_store.stream_itersize = 2
+        events_iter = event_repo.find_events_iter(origin='resource2', descending=True)
+        self.assertNotIsInstance(events_iter, list)
+        events_r = list(events_iter)
+        self.assertEquals([ev.ts_created for _, _, ev in events_r], [str(ts + i) for i in reversed(xrange(5))])
+        events_r = list(event_repo.find_events_iter(origin='resource2', start_ts=str(ts+3), id_only=True))
+        self.assertEquals(len(events_r), 2)
+        self.assertEquals({ev_id for ev_id, _, _ in events_r}, {ev_id for ev, ev_id in events2[3:]})
+
 
     def test_event_persist(self):
         events = [{'_id': '778dcc0811bd4b518ffd1ef873f3f457',
@@ -10,12 +10,14 @@ from gevent.timeout import Timeout
 from pyon.util.unit_test import PyonTestCase
 from pyon.util.int_test import IonIntegrationTestCase
 from pyon.util.context import LocalContextMixin
-from pyon.core.exception import IonException, NotFound, ContainerError, Timeout as IonTimeout
+from pyon.core import MSG_HEADER_PRIORITY
+from pyon.core.exception import IonException, NotFound, ContainerError, ServiceUnavailable, Timeout as IonTimeout
 from pyon.util.async import spawn
 from mock import sentinel, Mock, MagicMock, ANY, patch
 from nose.plugins.attrib import attr
 from pyon.net.endpoint import RPCClient
-from pyon.ion.service import BaseService
+from pyon.ion.service import BaseService, offloadable, call_priority
+from pyon.util.containers import get_ion_ts_millis
 from interface.objects import ProcessStateEnum
 import time
 import os
@@ -155,6 +157,58 @@ class ProcessTest(PyonTestCase):
         p._notify_stop()
         p.stop()
 
+    def test_concurrent__routing_call(self):
+        svc = self._make_service()
+        p = IonProcessThread(name=sentinel.name, listeners=[], service=svc, max_concurrency=3)
+        p.start()
+        p.get_ready_event().wait(timeout=5)
+        self.addCleanup(p.stop)
+
+        self.assertEquals(len(p._ctrl_threads), 3)
+
+        # each call blocks until all calls are processing at the same time
+        started = []
+        allev = Event()
+        def thecall(ar=None):
+            started.append(ar)
+            if len(started) == 3:
+                allev.set()
+            allev.wait(timeout=5)
+            ar.set(allev.is_set())
+
+        ars = [AsyncResult() for x in xrange(3)]
+        for ar in ars:
+            p._routing_call(thecall, None, ar=ar)
+
+        for ar in ars:
+            self.assertTrue(ar.get(timeout=5))
+
+        p._notify_stop()
+        for ctrl_thread in p._ctrl_threads:
+            ctrl_thread.join(timeout=5)
+            self.assertTrue(ctrl_thread.proc.dead)
+
+    def test_offloadable_call(self):
+        svc = self._make_service()
+        svc.container.offload_executor.execute.return_value = sentinel.result
+        p = IonProcessThread(name=sentinel.name, listeners=[], service=svc)
+        p.start()
+        p.get_ready_event().wait(timeout=5)
+        self.addCleanup(p.stop)
+
+        @offloadable
+        def offload_op(value=None):
+            return value
+
+        ar = p._routing_call(offload_op, None, value=sentinel.value)
+        self.assertEquals(ar.get(timeout=5), sentinel.result)
+        svc.container.offload_executor.execute.assert_called_once_with(offload_op, value=sentinel.value)
+
+        # Executed in process if the executor is not running
+        svc.container.offload_executor.is_running.return_value = False
+        ar = p._routing_call(offload_op, None, value=sentinel.value)
+        self.assertEquals(ar.get(timeout=5), sentinel.value)
+
     def test_known_error(self):
 
         # IonExceptions and TypeErrors get forwarded back intact
@@ -280,6 +334,33 @@ class ProcessTest(PyonTestCase):
         self.assertTrue(callar.ready())
         self.assertEquals(callar.get(), sentinel.val)
 
+    def test__interrupt_control_thread_concurrent(self):
+        svc = self._make_service()
+        p = IonProcessThread(name=sentinel.name, listeners=[], service=svc, max_concurrency=2)
+        p.start()
+        p.get_ready_event().wait(timeout=5)
+        self.addCleanup(p.stop)
+
+        def spin(inar, outar):
+            outar.set(True)
+            inar.wait()
+
+        callar1, waitar1 = AsyncResult(), AsyncResult()
+        callar2, waitar2 = AsyncResult(), AsyncResult()
+        ar1 = p._routing_call(spin, MagicMock(), callar1, waitar1)
+        ar2 = p._routing_call(spin, MagicMock(), callar2, waitar2)
+        waitar1.get(timeout=2)
+        waitar2.get(timeout=2)
+
+        # only the control thread processing the second call gets interrupted
+        p.cancel_or_abort_call(ar2)
+        ar2.get(timeout=2)
+        self.assertFalse(ar1.ready())
+
+        callar1.set(sentinel.val)
+        ar1.get(timeout=2)
+        self.assertTrue(all(ct.running for ct in p._ctrl_threads))
+
     def test__control_flow_cancelled_call(self):
         svc = self._make_service()
         p = IonProcessThread(name=sentinel.name, listeners=[], service=svc)
@@ -314,6 +395,15 @@ class ProcessTest(PyonTestCase):
         self.assertRaises(Timeout, futurear.get, timeout=2)
         self.assertTrue(ar2.ready())
 
+    def test__routing_call_expired_call(self):
+        svc = self._make_service()
+        p = IonProcessThread(name=sentinel.name, listeners=[], service=svc)
+
+        ctx = { 'reply-by' : 0 }        # no need for real time, as it compares by CURRENT >= this value
+        futurear = AsyncResult()
+        self.assertRaises(IonTimeout, p._routing_call, futurear.set, ctx, sentinel.val)
+        self.assertEquals(p._ctrl_queue.qsize(), 0)
+
     def test__control_flow_expired_call(self):
         svc = self._make_service()
         p = IonProcessThread(name=sentinel.name, listeners=[], service=svc)
@@ -321,17 +411,19 @@ class ProcessTest(PyonTestCase):
         p.get_ready_event().wait(timeout=5)
         self.addCleanup(p.stop)
 
-        def make_call(call, ctx, val):
-            ar = p._routing_call(call, ctx, val)
-            return ar.get(timeout=10)
+        # keep the control thread busy until the next call expired while waiting in the queue
+        blockar = AsyncResult()
+        p._routing_call(blockar.wait, MagicMock(), 5)
 
-        ctx = { 'reply-by' : 0 }        # no need for real time, as it compares by CURRENT >= this value
+        ctx = { 'reply-by' : get_ion_ts_millis() + 50 }
         futurear = AsyncResult()
         with patch('pyon.ion.process.greenlet') as gcm:
             waitar = AsyncResult()
             gcm.getcurrent().kill.side_effect = lambda *a, **k: waitar.set()
 
             ar = p._routing_call(futurear.set, ctx, sentinel.val)
+            time.sleep(0.1)
+            blockar.set(True)
 
             waitar.get(timeout=10)
 
@@ -350,6 +442,68 @@ class ProcessTest(PyonTestCase):
         ar2 = p._routing_call(futurear2.set, MagicMock(), sentinel.val2)
         ar2.get(timeout=2)
 
+    def test__routing_call_priority(self):
+        svc = self._make_service()
+        p = IonProcessThread(name=sentinel.name, listeners=[], service=svc)
+
+        @call_priority("low")
+        def low_op():
+            pass
+
+        @call_priority("high")
+        def high_op():
+            pass
+
+        def normal_op():
+            pass
+
+        p._routing_call(low_op, None)
+        p._routing_call(normal_op, None)
+        p._routing_call(high_op, None)
+        p._routing_call(normal_op, {MSG_HEADER_PRIORITY: "high"})
+        p._routing_call(high_op, {MSG_HEADER_PRIORITY: "low"})
+        self.assertEquals(p._ctrl_queue.call_count(), 5)
+
+        calls = [p._ctrl_queue.get() for i in xrange(5)]
+        self.assertEquals([c[2] for c in calls], [high_op, normal_op, normal_op, low_op, high_op])
+        self.assertEquals(calls[1][5], {MSG_HEADER_PRIORITY: "high"})
+        self.assertEquals(p._ctrl_queue.wait_count, 5)
+        self.assertEquals(p._ctrl_queue.call_count(), 0)
+
+        # stop sentinels are not counted as calls
+        p._ctrl_queue.put_stop()
+        self.assertEquals(p._ctrl_queue.qsize(), 1)
+        self.assertEquals(p._ctrl_queue.call_count(), 0)
+
+    def test__routing_call_queue_full(self):
+        self.patch_cfg('pyon.ion.process.CFG', {'container':{'process':{'max_queue_size':2}}})
+        svc = self._make_service()
+        p = IonProcessThread(name=sentinel.name, listeners=[], service=svc)
+
+        p._routing_call(sentinel.call, None)
+        p._routing_call(sentinel.call, None)
+        self.assertRaises(ServiceUnavailable, p._routing_call, sentinel.call, None)
+
+        # high priority calls are admitted anyway
+        p._routing_call(sentinel.call, {MSG_HEADER_PRIORITY: "high"})
+        self.assertEquals(p._ctrl_queue.qsize(), 3)
+        self.assertEquals(p._ctrl_queue.call_count(), 3)
+
+    def test__routing_call_queue_full_stop_queued(self):
+        self.patch_cfg('pyon.ion.process.CFG', {'container':{'process':{'max_queue_size':2}}})
+        svc = self._make_service()
+        p = IonProcessThread(name=sentinel.name, listeners=[], service=svc)
+
+        # stop sentinels do not count against the limit
+        p._ctrl_queue.put_stop()
+        p._routing_call(sentinel.call, None)
+        p._routing_call(sentinel.call, None)
+        self.assertEquals(p._ctrl_queue.qsize(), 3)
+        self.assertEquals(p._ctrl_queue.call_count(), 2)
+        with self.assertRaises(ServiceUnavailable) as cm:
+            p._routing_call(sentinel.call, None)
+        self.assertIn("(2 calls)", str(cm.exception))
+
     def test_heartbeat_no_listeners(self):
         svc = self._make_service()
         p = IonProcessThread(name=sentinel.name, listeners=[], service=svc)
@@ -471,9 +625,8 @@ class ProcessTest(PyonTestCase):
         self.assertEquals(1, p._heartbeat_count)
         self.assertEquals(ar, p._heartbeat_op)
         self.assertIsNotNone(p._heartbeat_time)
-        self.assertIsNotNone(p._heartbeat_stack)
-
-        self.assertIn("evin.wait", str(p._heartbeat_stack))
+        self.assertIsNotNone(p._heartbeat_sig)
+        self.assertIsNone(p._heartbeat_stack)     # only captured when stuck
 
     def test_heartbeat_with_current_op_multiple_times(self):
         svc = self._make_service()
@@ -531,6 +684,7 @@ class ProcessTest(PyonTestCase):
             hb = p.heartbeat()
 
         self.assertEquals((True, True, False), hb)
+        self.assertIn("evin.wait", str(p._heartbeat_stack))
 
 class FakeService(BaseService):
     """
@@ -801,6 +801,38 @@ class PublisherChannel(SendChannel):
         self._declare_exchange(self._send_name.exchange)
         SendChannel.send(self, data, headers=headers)
 
+    def send_batch(self, messages, confirm=False, confirm_timeout=None):
+        """
+        Publishes several messages holding the transport once.
+
+        Each distinct exchange is declared once per batch rather than once per message.
+        If confirm is set, waits for the broker to confirm the whole batch.
+
+        @param  messages    List of (name, data, headers) 3-tuples
+        """
+        for exchange in set(name.exchange for name, _, _ in messages):
+            self._declare_exchange(exchange)
+
+        durable_msg = False
+        if hasattr(self._send_name, 'queue_durable'):
+            durable_msg = self._send_name.queue_durable
+
+        with self._ensure_transport():
+            if confirm:
+                self._transport.confirm_select_impl()
+
+            for name, data, headers in messages:
+                self._transport.publish_impl(exchange=name.exchange,
+                                             routing_key=name.binding,
+                                             body=data,
+                                             properties=headers or {},
+                                             immediate=False,
+                                             mandatory=False,
+                                             durable_msg=durable_msg)
+
+            if confirm:
+                self._transport.wait_for_confirms_impl(timeout=confirm_timeout)
+
 
 class BidirClientChannel(SendChannel, RecvChannel):
     """
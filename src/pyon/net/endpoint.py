@@ -2,6 +2,7 @@
 
 """Provides the communication layer above channels."""
 
+import gevent
 from gevent import event
 from gevent.lock import RLock
 from gevent.timeout import Timeout
@@ -106,9 +107,15 @@ class EndpointUnit(object):
 
         @returns    A 2-tuple of message, headers after going through the interceptors.
         """
-        inv = self._build_invocation(path=Invocation.PATH_IN,
-                                     message=msg,
-                                     headers=headers)
+        if self._endpoint is not None and self._endpoint.lazy_decode:
+            inv = self._build_invocation(path=Invocation.PATH_IN,
+                                         message=msg,
+                                         headers=headers,
+                                         lazy_decode=True)
+        else:
+            inv = self._build_invocation(path=Invocation.PATH_IN,
+                                         message=msg,
+                                         headers=headers)
         inv_prime = self._intercept_msg_in(inv)
         new_msg = inv_prime.message
         new_headers = inv_prime.headers
@@ -178,6 +185,7 @@ class EndpointUnit(object):
         inv_prime = self._intercept_msg_out(inv)
         new_msg = inv_prime.message
         new_headers = inv_prime.headers
+        self._msg_out_annotations = inv_prime.message_annotations
 
         return new_msg, new_headers
 
@@ -244,6 +252,7 @@ class BaseEndpoint(object):
     node = None     # connection to the broker, basically
 
     _interceptors = None
+    lazy_decode = False     # If True, received message bodies are decoded on first access
 
     def __init__(self, node=None, transport=None):
         self.node = node
@@ -465,8 +474,13 @@ class ListeningBaseEndpoint(BaseEndpoint):
     """
     channel_type = ListenChannel
 
-    def __init__(self, node=None, from_name=None, binding=None, transport=None, auto_delete=None):
+    def __init__(self, node=None, from_name=None, binding=None, transport=None, auto_delete=None, lazy_decode=False):
+        """
+        @param  lazy_decode     If True, received messages are LazyIonMessage instances that are only decoded
+                                on first attribute access and can be sent on without re-encoding if untouched
+        """
         BaseEndpoint.__init__(self, node=node, transport=transport)
+        self.lazy_decode = lazy_decode
 
         # Set origin as NameTrio - can also be an XO
         self._recv_name = self._ensure_name_trio(from_name)
@@ -686,7 +700,22 @@ class ListeningBaseEndpoint(BaseEndpoint):
 #
 
 class PublisherEndpointUnit(EndpointUnit):
-    pass
+
+    def send_batch(self, messages, confirm=False, confirm_timeout=None):
+        """
+        Sends several messages with one channel interaction.
+        Outgoing interceptors are processed per message as in send.
+
+        @param  messages    List of (msg, to_name, headers) 3-tuples as produced by _build_msg at publish
+                            time, so that headers reflect the sender's context; to_name must be a NameTrio
+        """
+        out_msgs = []
+        for msg, to_name, headers in messages:
+            new_msg, new_headers = self.intercept_out(msg, headers)
+            trigger_msg_out_callback(new_msg, new_headers, self)
+            out_msgs.append((to_name, new_msg, new_headers))
+
+        self.channel.send_batch(out_msgs, confirm=confirm, confirm_timeout=confirm_timeout)
 
 
 class Publisher(SendingBaseEndpoint):
@@ -697,27 +726,50 @@ class Publisher(SendingBaseEndpoint):
     endpoint_unit_type = PublisherEndpointUnit
     channel_type = PublisherChannel
 
-    def __init__(self, **kwargs):
+    def __init__(self, batch_size=None, batch_latency=None, confirms=None, **kwargs):
+        """
+        @param  batch_size      If > 0, messages are buffered and sent in batches of up to this size.
+                                Defaults to container.messaging.publisher.batch_size (0: no batching)
+        @param  batch_latency   Max seconds a buffered message waits before the batch is flushed
+        @param  confirms        If True, each batch flush waits for broker publisher confirms
+        """
         self._pub_ep = None   # A cached EndpointUnit for publishing to the default to_name
+        self._batch_ep = None   # A cached EndpointUnit for building and sending batches to any name
         SendingBaseEndpoint.__init__(self, **kwargs)
 
+        pub_cfg = CFG.get_safe('container.messaging.publisher') or {}
+        self._batch_size = batch_size if batch_size is not None else pub_cfg.get('batch_size', 0)
+        self._batch_latency = batch_latency if batch_latency is not None else pub_cfg.get('batch_latency', 0.05)
+        self._confirms = confirms if confirms is not None else pub_cfg.get('confirms', False)
+        self._confirm_timeout = pub_cfg.get('confirm_timeout', 10)
+        self._batch = []
+        self._batch_lock = RLock()
+        self._flush_gl = None
+
+    def _get_pub_ep(self):
+        """ Returns the default publish EndpointUnit, creating it if needed. """
+        if self._pub_ep is None:
+            # Check that we got a to_name (_send_name) in the constructor
+            if self._send_name is None:
+                raise EndpointError("Publisher has no address to send to")
+
+            self._pub_ep = self.create_endpoint(self._send_name)
+            self._pub_ep.channel.connect(self._send_name)
+
+        return self._pub_ep
+
     def publish(self, msg, to_name=None, headers=None):
         if to_name is not None:
             to_name = self._ensure_name_trio(to_name)
 
+        if self._batch_size:
+            self._publish_batched(msg, to_name, headers)
+            return
+
         ep_unit = None
         if to_name is None:
             # We can use the default publish EndpointUnit
-
-            if self._pub_ep is None:         # Create the default publish EndpointUnit
-                # Check that we got a to_name (_send_name) in the constructor
-                if self._send_name is None:
-                    raise EndpointError("Publisher has no address to send to")
-
-                self._pub_ep = self.create_endpoint(self._send_name)
-                self._pub_ep.channel.connect(self._send_name)
-
-            ep_unit = self._pub_ep
+            ep_unit = self._get_pub_ep()
         else:
             ep_unit = self.create_endpoint(to_name)
             ep_unit.channel.connect(to_name)
@@ -726,8 +778,65 @@ class Publisher(SendingBaseEndpoint):
         if ep_unit != self._pub_ep:
             ep_unit.close()
 
+    def _get_batch_ep(self, to_name):
+        """ Returns the EndpointUnit for batches, creating it if needed. Its channel can publish to any name. """
+        if self._batch_ep is None:
+            self._batch_ep = self._get_pub_ep() if self._send_name is not None else self.create_endpoint(to_name)
+
+        return self._batch_ep
+
+    def _publish_batched(self, msg, to_name, headers):
+        if to_name is None and self._send_name is None:
+            raise EndpointError("Publisher has no address to send to")
+
+        to_name = to_name or self._send_name
+        with self._batch_lock:
+            # Build headers now, in the publishing greenlet (context, ts); interceptors run on flush
+            ep_unit = self._get_batch_ep(to_name)
+            _msg, _header = ep_unit._build_msg(msg, headers)
+            if headers:
+                _header.update(headers)
+
+            self._batch.append((_msg, to_name, _header))
+            batch_full = len(self._batch) >= self._batch_size
+            if not batch_full and self._flush_gl is None and self._batch_latency:
+                self._flush_gl = gevent.spawn_later(self._batch_latency, self._timed_flush)
+
+        if batch_full:
+            self.flush()
+
+    def _timed_flush(self):
+        try:
+            self.flush()
+        except Exception:
+            log.exception("Error flushing publisher batch")
+
+    def flush(self):
+        """
+        Sends all buffered messages in one batch.
+        @returns    The number of messages sent
+        """
+        with self._batch_lock:
+            batch, self._batch = self._batch, []
+            flush_gl, self._flush_gl = self._flush_gl, None
+            if flush_gl is not None and flush_gl is not gevent.getcurrent():
+                flush_gl.kill(block=False)
+
+            if not batch:
+                return 0
+
+            # Publish all messages over the batch channel, which can send to any name
+            ep_unit = self._get_batch_ep(batch[0][1])
+            ep_unit.send_batch(batch, confirm=self._confirms, confirm_timeout=self._confirm_timeout)
+
+        return len(batch)
+
     def close(self):
-        """ Closes the opened publishing channel, if we've opened it previously. """
+        """ Flushes buffered messages and closes the opened publishing channel, if we've opened it previously. """
+        if self._batch:
+            self.flush()
+        if self._batch_ep and self._batch_ep != self._pub_ep:
+            self._batch_ep.close()
         if self._pub_ep:
             self._pub_ep.close()
 
@@ -803,6 +912,195 @@ class BidirectionalListeningEndpointUnit(EndpointUnit):
     pass
 
 
+# -----------------------------------------------------------------------------
+#  RPC REPLY MULTIPLEXING
+#
+
+class RPCReplyChannel(BidirClientChannel):
+    """
+    Long-lived reply channel shared by multiplexed RPC requests.
+    Auto-delete so that the node does not put it into the BidirClientChannel pool.
+    """
+    _queue_auto_delete = True
+
+
+class RPCReplyDispatcher(object):
+    """
+    Owns one persistent reply queue and a receive greenlet that demultiplexes replies
+    to waiting requesters by conv-id. Replaces the per-request reply queue declare/bind/consume
+    of the classic RPC request path, and allows many concurrent requests over one channel.
+    """
+    def __init__(self, node=None):
+        self.node = node
+        self._pending = {}          # conv-id -> AsyncResult
+        self._lock = RLock()
+        self._channel = None
+        self._recv_gl = None
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._channel is not None:
+                if not self._recv_gl.dead:
+                    return
+                # The receive greenlet ended on a channel error: replace the reply channel
+                log.warn("RPC reply dispatcher receive loop ended, recreating reply channel")
+                self._close_channel(self._channel)
+                self._channel = None
+
+            if not self.node:
+                container_instance = BaseEndpoint._get_container_instance()
+                if not container_instance:
+                    raise EndpointError("Cannot pull node from Container.instance and no node specified")
+                self.node = container_instance.node
+
+            ch = self.node.channel(RPCReplyChannel)
+            sys_ex = "%s.%s" % (bootstrap.get_sys_name(), CFG.get_safe('exchange.core.system_xs', 'system'))
+            ch.setup_listener(NameTrio(sys_ex, "rpc_mux_%s" % uuid.uuid4().hex))
+
+            prefetch = CFG.get_safe('container.messaging.rpc.reply_prefetch', None)
+            if prefetch:
+                with ch._ensure_transport():
+                    ch._transport.qos_impl(prefetch_count=prefetch)
+
+            ch.start_consume()
+            self._channel = ch
+            self._recv_gl = gevent.spawn(self._recv_loop, ch)
+
+    def _recv_loop(self, channel):
+        while True:
+            try:
+                rmsg, rheaders, rdtag = channel.recv()
+            except ChannelClosedError:
+                break
+            except Exception as ex:
+                # The channel is unusable; the next request recreates it (see _ensure_started)
+                log.exception("RPC reply dispatcher failed to receive")
+                self._fail_pending(ex)
+                break
+
+            try:
+                self._dispatch(channel, rmsg, rheaders, rdtag)
+            except Exception:
+                log.exception("Failed to dispatch RPC reply")
+
+    def _dispatch(self, channel, rmsg, rheaders, rdtag):
+        try:
+            channel.ack(rdtag)
+        except Exception:
+            log.exception("Failed to ack RPC reply")
+
+        conv_id = rheaders.get('conv-id', None)
+        ar = self._pending.get(conv_id, None)
+        if ar is not None:
+            ar.set((rmsg, rheaders, rdtag))
+        else:
+            log.warn("Discarding unknown message, likely from a previous timed out request (conv-id: %s, seq: %s, perf: %s)",
+                     rheaders.get('conv-id', "unset"), rheaders.get('conv-seq', 'unset'), rheaders.get('performative', 'unset'))
+
+    def _fail_pending(self, ex):
+        """ Fails all waiting requests, whose replies can no longer arrive. """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+
+        for conv_id, ar in pending.iteritems():
+            ar.set_exception(ex)
+
+    def _close_channel(self, ch):
+        try:
+            ev = ch.close()
+            if not ev.wait(timeout=3):
+                log.warn("Channel (%s) close did not respond in time, giving up", ch.get_channel_id())
+        except Exception:
+            log.exception("Error closing RPC reply channel")
+
+    @property
+    def recv_name(self):
+        self._ensure_started()
+        return self._channel._recv_name
+
+    def register(self, conv_id):
+        """
+        Registers interest in the reply to conv_id. Must be called before the request is sent.
+        @returns    An AsyncResult that is set to a 3-tuple (body, headers, delivery tag) on reply.
+        """
+        self._ensure_started()
+        ar = event.AsyncResult()
+        with self._lock:
+            self._pending[conv_id] = ar
+        return ar
+
+    def unregister(self, conv_id):
+        with self._lock:
+            self._pending.pop(conv_id, None)
+
+    def send(self, name, msg, headers):
+        """
+        Publishes a request to name with reply-to set to the shared reply queue.
+        Publishes directly on the transport, as the shared channel has no single send name.
+        """
+        self._ensure_started()
+        ch = self._channel
+        headers = headers.copy() if headers else {}
+        if 'reply-to' not in headers:
+            headers['reply-to'] = "%s,%s" % (ch._recv_name.exchange, ch._recv_name.queue)
+
+        with ch._ensure_transport():
+            ch._transport.publish_impl(exchange=name.exchange,
+                                       routing_key=name.binding,
+                                       body=msg,
+                                       properties=headers,
+                                       immediate=False,
+                                       mandatory=False,
+                                       durable_msg=getattr(name, 'queue_durable', False))
+
+    def create_send_channel(self):
+        """ Returns a lightweight send channel for one endpoint unit that sends via this dispatcher. """
+        return MultiplexedSendChannel(self)
+
+    def close(self):
+        with self._lock:
+            ch, self._channel = self._channel, None
+            pending, self._pending = self._pending, {}
+
+        for conv_id, ar in pending.iteritems():
+            ar.set_exception(ChannelClosedError("RPC reply dispatcher closed while waiting for conv %s" % conv_id))
+
+        if ch is not None:
+            self._close_channel(ch)
+
+        if self._recv_gl is not None:
+            self._recv_gl.kill(block=False)
+            self._recv_gl = None
+
+
+class MultiplexedSendChannel(object):
+    """
+    Stand-in for a BidirClientChannel for a single request endpoint unit.
+    Sending goes through the shared dispatcher channel; replies arrive on the dispatcher queue.
+    """
+    def __init__(self, dispatcher):
+        self.dispatcher = dispatcher
+        self._send_name = None
+
+    @property
+    def _recv_name(self):
+        return self.dispatcher.recv_name
+
+    def connect(self, name):
+        self._send_name = name
+
+    def send(self, data, headers=None):
+        self.dispatcher.send(self._send_name, data, headers or {})
+
+    def get_channel_id(self):
+        return None
+
+    def close(self):
+        ev = event.Event()
+        ev.set()
+        return ev
+
+
 # -----------------------------------------------------------------------------
 #  REQUEST-RESPONSE and RPC
 #
@@ -855,6 +1153,10 @@ class RequestEndpointUnit(BidirectionalEndpointUnit):
 
         # we have a timeout, update reply-by header
         headers['reply-by'] = str(int(headers['ts']) + int(timeout * 1000))
+
+        if isinstance(self.channel, MultiplexedSendChannel):
+            return self._send_multiplexed(msg, headers, timeout)
+
         if self.channel._recv_name is None:
             # Only set name when channel is new.
             # Create a name for the sender/queue for the response to arrive back
@@ -875,6 +1177,32 @@ class RequestEndpointUnit(BidirectionalEndpointUnit):
 
         return result_data, result_headers
 
+    def _send_multiplexed(self, msg, headers, timeout):
+        """
+        Sends the request via a shared RPCReplyDispatcher and waits for the reply to be
+        routed back by conv-id. No per-request reply queue is declared.
+        """
+        new_msg, new_headers = self.intercept_out(msg, headers)
+        trigger_msg_out_callback(new_msg, new_headers, self)
+
+        conv_id = new_headers['conv-id']
+        dispatcher = self.channel.dispatcher
+        ar = dispatcher.register(conv_id)
+        try:
+            self.channel.send(new_msg, new_headers)
+            try:
+                rmsg, rheaders, rdtag = ar.get(timeout=timeout)
+            except Timeout:
+                raise exception.Timeout('Request timed out (%d sec) waiting for response from %s, conv %s' % (
+                        timeout, str(self.channel._send_name), conv_id))
+        finally:
+            dispatcher.unregister(conv_id)
+
+        # Provide a hook for any message received
+        trigger_msg_in_callback(rmsg, rheaders, rdtag, self)
+
+        return self.intercept_in(rmsg, rheaders)
+
     def _build_header(self, raw_msg, raw_headers):
         """
         Sets headers common to Request-Response patterns.
@@ -1025,15 +1353,48 @@ class RPCClient(RequestResponseClient):
     """
     endpoint_unit_type = RPCRequestEndpointUnit
 
-    def __init__(self, iface=None, **kwargs):
+    def __init__(self, iface=None, multiplex=None, **kwargs):
+        """
+        @param  multiplex   If True, requests share a persistent reply queue (RPCReplyDispatcher) instead
+                            of declaring one per request. Defaults to container.messaging.rpc.multiplex
+        """
         # Add dynamic operations from interface or schema (optional)
         if isinstance(iface, interface.interface.InterfaceClass):
             self._define_interface(iface)
         elif isinstance(iface, dict) and "op_list" in dict and "operations" in dict:
             self._define_from_schema(iface)
 
+        if multiplex is None:
+            multiplex = CFG.get_safe('container.messaging.rpc.multiplex', False)
+        self.multiplex = multiplex
+        self._reply_dispatcher = None
+        self._async_calls = set()   # greenlets of outstanding request_async/call_async calls
+
         RequestResponseClient.__init__(self, **kwargs)
 
+    def _create_channel(self, transport=None):
+        # A given transport (e.g. an XO as send name) is used as in SendingBaseEndpoint, without multiplexing
+        if self.multiplex and transport is None and self._transport is None and not isinstance(self._send_name, BaseTransport):
+            return self._get_reply_dispatcher().create_send_channel()
+
+        return RequestResponseClient._create_channel(self, transport=transport)
+
+    def _get_reply_dispatcher(self):
+        """
+        Returns the RPCReplyDispatcher used for multiplexed requests of this client.
+        Override to share a dispatcher more widely (e.g. per process).
+        """
+        if self._reply_dispatcher is None:
+            self._reply_dispatcher = RPCReplyDispatcher(node=self.node)
+        return self._reply_dispatcher
+
+    def close(self):
+        if self._async_calls:
+            gevent.killall(list(self._async_calls))
+        if self._reply_dispatcher is not None:
+            self._reply_dispatcher.close()
+            self._reply_dispatcher = None
+
     def _define_interface(self, iface):
         """ Sets callable operations on this client instance from a zope interface definition. """
         methods = iface.namesAndDescriptions()
@@ -1089,6 +1450,83 @@ class RPCClient(RequestResponseClient):
 
         return RequestResponseClient.request(self, msg, headers=headers, timeout=timeout)
 
+    def request_async(self, msg, headers=None, op=None, timeout=None):
+        """
+        Non-blocking version of request.
+
+        @returns    A gevent AsyncResult. get() returns the response or raises the exception
+                    (built by the ExceptionFactory) for an error response.
+        """
+        return self._spawn_call(self.request, msg, headers=headers, op=op, timeout=timeout)
+
+    def call_async(self, op, **kwargs):
+        """
+        Calls the named operation of this client (e.g. a generated service client method)
+        without blocking. Returns a gevent AsyncResult.
+        """
+        return self._spawn_call(getattr(self, op), **kwargs)
+
+    def gather(self, calls, timeout=None, raise_error=True):
+        """
+        Issues several operation calls concurrently and collects the results in call order.
+
+        @param  calls       List of (op, kwargs) tuples naming operations of this client, e.g.
+                            [("read", {"object_id": id1}), ("read", {"object_id": id2})]
+        @param  timeout     RPC timeout applied to each call that does not set its own
+        @param  raise_error If True, raises the exception of the first failed call (in call order)
+                            once all calls completed. Otherwise the exception is put in the result list.
+        """
+        ars = []
+        for op, kwargs in calls:
+            kwargs = dict(kwargs or {})
+            if timeout is not None:
+                kwargs.setdefault('timeout', timeout)
+            ars.append(self.call_async(op, **kwargs))
+
+        results = []
+        for ar in ars:
+            ar.wait()
+            if ar.successful():
+                results.append(ar.value)
+            elif raise_error:
+                # Let the remaining calls complete before raising
+                for other in ars:
+                    other.wait()
+                ar.get()
+            else:
+                results.append(ar.exception)
+
+        return results
+
+    def _spawn_call(self, func, *args, **kwargs):
+        """ Runs func in a new greenlet and returns an AsyncResult for its outcome. """
+        ar = event.AsyncResult()
+
+        def _call():
+            try:
+                ar.set(func(*args, **kwargs))
+            except Exception as ex:
+                ar.set_exception(ex)
+
+        def _call_done(gl):
+            # Killed (possibly before it started) or exited with another BaseException.
+            # gevent reports a GreenletExit as the value of the greenlet, not as its exception
+            if not ar.ready():
+                ar.set_exception(gl.exception if gl.exception is not None else gl.value)
+
+        gl = gevent.spawn(_call)
+        gl.link(_call_done)
+        self._track_async_call(gl)
+        return ar
+
+    def _track_async_call(self, gl):
+        """
+        Keeps the greenlet of an async call until it completes, so that close() can kill it.
+        Override to track calls more widely (e.g. per process).
+        """
+        self._async_calls.add(gl)
+        gl.link(self._async_calls.discard)
+
 
 class RPCResponseEndpointUnit(ResponseEndpointUnit):
     def __init__(self, routing_obj=None, **kwargs):
@@ -1339,6 +1777,9 @@ def trigger_msg_out_callback(body, headers, ep_unit):
             if hasattr(ep_unit, "_process"):
                 env["process"] = ep_unit._process
             env["ep_type"] = type(ep_unit)
+            annotations = getattr(ep_unit, "_msg_out_annotations", None)
+            if annotations and "compression" in annotations:
+                env["compression"] = annotations["compression"]
             callback_msg_out(body, dict(headers), env)  # Must copy headers because they get muted during processing
         except Exception as ex:
             log.warn("Message out callback error: %s", str(ex))
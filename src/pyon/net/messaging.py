@@ -14,6 +14,7 @@ from pika import channel as pikachannel
 from pika.exceptions import NoFreeChannels
 
 from pyon.core.bootstrap import CFG, get_sys_name
+from pyon.core.interceptor.interceptor import InterceptorPipeline
 from pyon.net import channel
 from pyon.net.transport import LocalTransport, LocalRouter, AMQPTransport, ComposableTransport
 from pyon.util.async import blocking_cb
@@ -128,7 +129,9 @@ class BaseNode(object):
 
                 interceptors[type_and_direction].append(classinst)
 
-        self.interceptors = dict(interceptors)
+        # Precompile the call chain for each stack once
+        self.interceptors = {type_and_direction: InterceptorPipeline(stack_ints, name=type_and_direction)
+                             for type_and_direction, stack_ints in interceptors.iteritems()}
 
 
 class NodeB(BaseNode):
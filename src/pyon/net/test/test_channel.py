@@ -3,9 +3,10 @@
 __author__ = 'Dave Foster <dfoster@asascience.com>'
 
 
-from mock import Mock, sentinel, patch, MagicMock
+from mock import Mock, sentinel, patch, MagicMock, call
 from gevent.event import Event
 from gevent import spawn
+from gevent.lock import RLock
 from gevent.queue import Queue
 import Queue as PQueue
 import time
@@ -599,6 +600,26 @@ class TestPublisherChannel(PyonTestCase):
         depmock.assert_called_once_with(sentinel.xp)
         mocksendchannel.send.assert_called_once_with(pubchan, sentinel.data, headers=None)
 
+    def test_send_batch(self, mocksendchannel):
+        depmock = Mock()
+        pubchan = PublisherChannel()
+        pubchan._declare_exchange = depmock
+        pubchan._transport = Mock()
+        pubchan._lock = RLock()
+
+        msgs = [(NameTrio(sentinel.xp, "one"), sentinel.data1, {'h': 1}),
+                (NameTrio(sentinel.xp, "two"), sentinel.data2, None)]
+        pubchan.send_batch(msgs, confirm=True, confirm_timeout=5)
+
+        depmock.assert_called_once_with(sentinel.xp)
+        pubchan._transport.confirm_select_impl.assert_called_once_with()
+        self.assertEquals(pubchan._transport.publish_impl.call_args_list,
+                          [call(exchange=sentinel.xp, routing_key="one", body=sentinel.data1, properties={'h': 1},
+                                immediate=False, mandatory=False, durable_msg=False),
+                           call(exchange=sentinel.xp, routing_key="two", body=sentinel.data2, properties={},
+                                immediate=False, mandatory=False, durable_msg=False)])
+        pubchan._transport.wait_for_confirms_impl.assert_called_once_with(timeout=5)
+
 @attr('UNIT')
 @patch('pyon.net.channel.SendChannel')
 class TestBidirClientChannel(PyonTestCase):
@@ -9,7 +9,9 @@ from gevent import event, spawn
 import unittest
 from zope.interface.declarations import implements
 from zope.interface.interface import Interface
-from gevent import sleep
+from gevent import sleep, GreenletExit
+from gevent.timeout import Timeout
+from gevent.queue import Queue
 
 from pyon.util.int_test import IonIntegrationTestCase
 from pyon.util.unit_test import PyonTestCase
@@ -18,11 +20,12 @@ from pyon.core.exception import BadRequest
 from pyon.core.bootstrap import get_sys_name, CFG
 from pyon.container.cc import Container
 from pyon.core.interceptor.interceptor import Invocation
-from pyon.net.channel import BaseChannel, SendChannel, BidirClientChannel, SubscriberChannel, ChannelClosedError, ServerChannel, RecvChannel, ListenChannel
-from pyon.net.endpoint import EndpointUnit, BaseEndpoint, RPCServer, Subscriber, Publisher, RequestResponseClient, RequestEndpointUnit, RPCRequestEndpointUnit, RPCClient, RPCResponseEndpointUnit, EndpointError, SendingBaseEndpoint, ListeningBaseEndpoint
+from pyon.net.channel import BaseChannel, SendChannel, PublisherChannel, BidirClientChannel, SubscriberChannel, ChannelClosedError, ServerChannel, RecvChannel, ListenChannel
+from pyon.net.endpoint import EndpointUnit, BaseEndpoint, RPCServer, Subscriber, Publisher, RequestResponseClient, RequestEndpointUnit, RPCRequestEndpointUnit, RPCClient, RPCResponseEndpointUnit, EndpointError, SendingBaseEndpoint, ListeningBaseEndpoint, RPCReplyDispatcher, RPCReplyChannel, MultiplexedSendChannel
 from pyon.net.messaging import NodeB
 from pyon.ion.service import BaseService
 from pyon.net.transport import NameTrio, BaseTransport
+from pyon.ion.exchange import ServiceExchangeName
 
 # NO INTERCEPTORS - we use these mock-like objects up top here which deliver received messages that don't go through the interceptor stack.
 no_interceptors = {'message_incoming': [],
@@ -418,6 +421,52 @@ class TestPublisher(PyonTestCase):
         self._pub.close()
         self._pub._pub_ep.close.assert_called_once_with()
 
+    def test_publish_batched(self):
+        self._ch = Mock(spec=PublisherChannel)
+        self._node.channel.return_value = self._ch
+        pub = Publisher(node=self._node, to_name="testpub", batch_size=3, batch_latency=0)
+
+        pub.publish("one")
+        pub.publish("two", to_name="other")
+        self.assertEquals(self._ch.send_batch.call_count, 0)
+
+        pub.publish("three")
+        self.assertEquals(self._ch.send_batch.call_count, 1)
+        msgs = self._ch.send_batch.call_args[0][0]
+        self.assertEquals([m[1] for m in msgs], ["one", "two", "three"])
+        self.assertEquals([m[0].queue for m in msgs], ["testpub", "other", "testpub"])
+        self.assertEquals(self._ch.send.call_count, 0)
+
+        # explicit flush and flush on close
+        pub.publish("four")
+        self.assertEquals(pub.flush(), 1)
+        self.assertEquals(pub.flush(), 0)
+        pub.publish("five")
+        pub.close()
+        self.assertEquals(self._ch.send_batch.call_count, 3)
+        self.assertEquals(self._ch.send_batch.call_args[0][0][0][1], "five")
+
+        # one channel for all batches
+        self.assertEquals(self._node.channel.call_count, 1)
+
+    def test_publish_batched_latency(self):
+        self._ch = Mock(spec=PublisherChannel)
+        self._node.channel.return_value = self._ch
+        pub = Publisher(node=self._node, to_name="testpub", batch_size=100, batch_latency=0.01, confirms=True)
+
+        # headers are built when publishing, not when the timed flush sends the batch
+        with patch('pyon.net.endpoint.get_ion_ts', return_value="100"):
+            pub.publish("one")
+            pub.publish("two", headers={'custom': 1})
+        self.assertEquals(self._ch.send_batch.call_count, 0)
+        sleep(0.05)
+        self.assertEquals(self._ch.send_batch.call_count, 1)
+        msgs = self._ch.send_batch.call_args[0][0]
+        self.assertEquals(len(msgs), 2)
+        self.assertEquals([m[2]['ts'] for m in msgs], ["100", "100"])
+        self.assertEquals(msgs[1][2]['custom'], 1)
+        self.assertTrue(self._ch.send_batch.call_args[1]['confirm'])
+
 
 class RecvMockMixin(object):
     """
@@ -592,6 +641,222 @@ class TestRPCClient(PyonTestCase, RecvMockMixin):
         rpcc = RPCClient(to_name="simply", iface=ISimpleInterface)
         self.assertRaises(BadRequest, rpcc.simple, "zap", "zip")
 
+    @patch('pyon.net.endpoint.RPCRequestEndpointUnit._build_conv_id', Mock(return_value=sentinel.conv_id))
+    def test_request_async(self):
+        node = Mock(spec=NodeB)
+        node.interceptors = {}
+        node.channel.return_value = self._setup_mock_channel()
+
+        rpcc = RPCClient(node=node, to_name="simply")
+        ar = rpcc.request_async("request", op="simple")
+        self.assertEquals(ar.get(timeout=2), "bidirmsg")
+
+    @patch('pyon.net.endpoint.IonObject')
+    @patch('pyon.net.endpoint.RPCRequestEndpointUnit._build_conv_id', Mock(return_value=sentinel.conv_id))
+    def test_gather(self, iomock):
+        node = Mock(spec=NodeB)
+        node.interceptors = {}
+
+        rpcc = RPCClient(node=node, to_name="simply", iface=ISimpleInterface)
+        calls = [("simple", {'one': "zap"}), ("simple", {'one': "zip"}), ("simple", {'one': "zop"})]
+
+        node.channel.side_effect = [self._setup_mock_channel(value=v) for v in ("a", "b", "c")]
+        self.assertEquals(rpcc.gather(calls, timeout=2), ["a", "b", "c"])
+
+        # per-call exceptions are raised via the ExceptionFactory
+        node.channel.side_effect = [self._setup_mock_channel(value="a"),
+                                    self._setup_mock_channel(status_code=exception.NotFound.status_code),
+                                    self._setup_mock_channel(value="c")]
+        self.assertRaises(exception.NotFound, rpcc.gather, calls)
+
+        node.channel.side_effect = [self._setup_mock_channel(value="a"),
+                                    self._setup_mock_channel(status_code=exception.NotFound.status_code),
+                                    self._setup_mock_channel(value="c")]
+        res = rpcc.gather(calls, raise_error=False)
+        self.assertEquals(res[0], "a")
+        self.assertIsInstance(res[1], exception.NotFound)
+        self.assertEquals(res[2], "c")
+
+        # Calls failing before a response is received complete the gather as well
+        node.channel.side_effect = [self._setup_mock_channel(value="a"),
+                                    exception.ServerError("no channel"),
+                                    self._setup_mock_channel(value="c")]
+        with Timeout(5):
+            self.assertRaises(exception.ServerError, rpcc.gather, calls)
+
+        node.channel.side_effect = [self._setup_mock_channel(value="a"),
+                                    exception.ServerError("no channel"),
+                                    self._setup_mock_channel(value="c")]
+        with Timeout(5):
+            res = rpcc.gather(calls, raise_error=False)
+        self.assertEquals(res[0], "a")
+        self.assertIsInstance(res[1], exception.ServerError)
+        self.assertEquals(res[2], "c")
+
+    def test_gather_close(self):
+        rpcc = RPCClient(to_name="simply", iface=ISimpleInterface)
+        calls = [("simple", {'one': "zap"}), ("simple", {'one': "zip"})]
+        never = event.Event()
+
+        with patch.object(rpcc, 'simple', Mock(side_effect=lambda **kwargs: never.wait())):
+            # close kills outstanding calls and gather completes
+            gl = spawn(rpcc.gather, calls, raise_error=False)
+            sleep(0.1)
+            self.assertEquals(rpcc.simple.call_count, 2)
+            self.assertEquals(len(rpcc._async_calls), 2)
+            rpcc.close()
+            with Timeout(5):
+                res = gl.get()
+            self.assertEquals([type(r) for r in res], [GreenletExit, GreenletExit])
+            self.assertEquals(rpcc._async_calls, set())
+
+            # calls killed before they started complete as well
+            ar = rpcc.call_async("simple", one="zap")
+            call_gl, = rpcc._async_calls
+            call_gl.kill()
+            self.assertRaises(GreenletExit, ar.get, timeout=5)
+            self.assertEquals(rpcc.simple.call_count, 2)
+
+@attr('UNIT')
+class TestRPCReplyDispatcher(PyonTestCase):
+
+    def _setup_reply_channel(self, reply_status=200):
+        """
+        Mocked reply channel: every publish is answered with a reply carrying the request's conv-id.
+        """
+        replies = Queue()
+        ch = MagicMock(spec=RPCReplyChannel())
+        ch._recv_name = NameTrio('ex', 'rpc_mux_q')
+        ch._transport = Mock()
+
+        def _publish(exchange=None, routing_key=None, body=None, properties=None, **kwargs):
+            replies.put(("reply to %s" % body, {'conv-id': properties['conv-id'], 'status_code': reply_status,
+                                                'error_message': 'err'}, sentinel.delivery_tag))
+        ch._transport.publish_impl.side_effect = _publish
+
+        def _recv(*args, **kwargs):
+            msg = replies.get()
+            if msg is None:
+                raise ChannelClosedError()
+            if isinstance(msg, Exception):
+                raise msg
+            return msg
+        ch.recv.side_effect = _recv
+        ch._replies = replies
+
+        return ch
+
+    def test_dispatch_by_conv_id(self):
+        node = Mock(spec=NodeB)
+        node.channel.return_value = ch = self._setup_reply_channel()
+        disp = RPCReplyDispatcher(node=node)
+
+        ar1 = disp.register("c1")
+        ar2 = disp.register("c2")
+        node.channel.assert_called_once_with(RPCReplyChannel)
+        ch.start_consume.assert_called_once_with()
+
+        disp.send(NameTrio('ex', 'svc'), "two", {'conv-id': "c2"})
+        disp.send(NameTrio('ex', 'svc'), "one", {'conv-id': "c1"})
+        disp.send(NameTrio('ex', 'svc'), "stale", {'conv-id': "unknown"})
+
+        self.assertEquals(ar1.get(timeout=1)[0], "reply to one")
+        self.assertEquals(ar2.get(timeout=1)[0], "reply to two")
+        sleep(0)
+        self.assertEquals(ch.ack.call_count, 3)
+
+        # reply-to points at the shared reply queue
+        props = ch._transport.publish_impl.call_args[1]['properties']
+        self.assertEquals(props['reply-to'], "ex,rpc_mux_q")
+
+        disp.unregister("c1")
+        ar3 = disp.register("c3")
+        disp.close()
+        self.assertRaises(ChannelClosedError, ar3.get, timeout=1)
+        ch.close.assert_called_once_with()
+
+    def test_recv_errors(self):
+        node = Mock(spec=NodeB)
+        ch1 = self._setup_reply_channel()
+        ch2 = self._setup_reply_channel()
+        node.channel.side_effect = [ch1, ch2]
+        disp = RPCReplyDispatcher(node=node)
+
+        # A malformed reply does not end the receive loop
+        ar1 = disp.register("c1")
+        ch1._replies.put(("bad", None, sentinel.delivery_tag))
+        disp.send(NameTrio('ex', 'svc'), "one", {'conv-id': "c1"})
+        self.assertEquals(ar1.get(timeout=1)[0], "reply to one")
+
+        # A receive error fails waiting requests; the reply channel is recreated on next use
+        ar2 = disp.register("c2")
+        ch1._replies.put(IOError("recv failed"))
+        self.assertRaises(IOError, ar2.get, timeout=1)
+        sleep(0)
+
+        ar3 = disp.register("c3")
+        self.assertEquals(node.channel.call_count, 2)
+        ch1.close.assert_called_once_with()
+        disp.send(NameTrio('ex', 'svc'), "three", {'conv-id': "c3"})
+        self.assertEquals(ar3.get(timeout=1)[0], "reply to three")
+        self.assertEquals(ch2._transport.publish_impl.call_count, 1)
+
+        disp.close()
+
+    @patch('pyon.net.endpoint.IonObject')
+    def test_multiplexed_rpc_client(self, iomock):
+        node = Mock(spec=NodeB)
+        node.interceptors = {}
+        node.channel.return_value = ch = self._setup_reply_channel()
+
+        rpcc = RPCClient(node=node, to_name="simply", iface=ISimpleInterface, multiplex=True)
+        ep_unit = rpcc.create_endpoint()
+        self.assertIsInstance(ep_unit.channel, MultiplexedSendChannel)
+        ep_unit.close()
+
+        results = [spawn(rpcc.request, "call %d" % i, op="simple") for i in xrange(5)]
+        for i, gl in enumerate(results):
+            self.assertEquals(gl.get(timeout=2), "reply to call %d" % i)
+
+        # one reply queue for all requests
+        node.channel.assert_called_once_with(RPCReplyChannel)
+        ch.setup_listener.assert_called_once_with(ANY)
+
+        rpcc.close()
+        ch.close.assert_called_once_with()
+
+    def test_multiplexed_rpc_client_error(self):
+        node = Mock(spec=NodeB)
+        node.interceptors = {}
+        node.channel.return_value = self._setup_reply_channel(reply_status=exception.NotFound.status_code)
+
+        rpcc = RPCClient(node=node, to_name="simply", multiplex=True)
+        self.assertRaises(exception.NotFound, rpcc.request, "call", op="simple")
+        rpcc.close()
+
+    def test_multiplexed_xo_send_name(self):
+        xo = Mock(spec=ServiceExchangeName)
+        xo.node = Mock(spec=NodeB)
+        xo.node.interceptors = {}
+
+        # The XO transport is used as in SendingBaseEndpoint, not the shared reply queue
+        rpcc = RPCClient(to_name=xo, multiplex=True)
+        ep_unit = rpcc.create_endpoint()
+        self.assertNotIsInstance(ep_unit.channel, MultiplexedSendChannel)
+        xo.node.channel.assert_called_once_with(RPCClient.channel_type, transport=xo)
+        self.assertIsNone(rpcc._reply_dispatcher)
+
+    def test_multiplexed_timeout(self):
+        node = Mock(spec=NodeB)
+        node.interceptors = {}
+        node.channel.return_value = ch = self._setup_reply_channel()
+        ch._transport.publish_impl.side_effect = None      # never replies
+
+        rpcc = RPCClient(node=node, to_name="simply", multiplex=True)
+        self.assertRaises(exception.Timeout, rpcc.request, "call", op="simple", timeout=0.1)
+        self.assertEquals(rpcc._reply_dispatcher._pending, {})
+        rpcc.close()
+
 @attr('UNIT')
 class TestRPCResponseEndpoint(PyonTestCase, RecvMockMixin):
 
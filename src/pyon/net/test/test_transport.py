@@ -7,11 +7,13 @@ from pyon.util.unit_test import PyonTestCase
 from pyon.util.int_test import IonIntegrationTestCase
 from pyon.net.transport import NameTrio, BaseTransport, AMQPTransport, TransportError, TopicTrie, LocalRouter, ComposableTransport, LocalTransport
 from pyon.core.bootstrap import get_sys_name
+from pyon.util.log import log
 from pika import BasicProperties
 
 from nose.plugins.attrib import attr
 from mock import Mock, MagicMock, sentinel, patch, call, ANY
 from gevent.event import Event
+from gevent import sleep
 import time
 
 @attr('UNIT')
@@ -64,7 +66,9 @@ class TestComposableTransport(PyonTestCase):
                                         'stop_consume_impl'    : right.stop_consume_impl,
                                         'get_stats_impl'       : right.get_stats_impl,
                                         'qos_impl'             : right.qos_impl,
-                                        'publish_impl'         : right.publish_impl, })
+                                        'publish_impl'         : right.publish_impl,
+                                        'confirm_select_impl'  : right.confirm_select_impl,
+                                        'wait_for_confirms_impl': right.wait_for_confirms_impl, })
 
     def test_overlay(self):
         left = Mock()
@@ -498,6 +502,34 @@ class TestAMQPTransportCommonMethods(PyonTestCase):
                                                               immediate=False,
                                                               mandatory=False)
 
+    def test_publisher_confirms(self):
+        self.tp.confirm_select_impl()
+        self.tp.confirm_select_impl()
+        self.assertEquals(self.tp._sync_call.call_count, 1)
+        self.assertEquals(self.tp._sync_call.call_args[0][:2], (self.tp._client.transport.rpc, 'callback'))
+        self.assertEquals(self.tp._client.callbacks.add.call_count, 2)
+
+        for i in xrange(3):
+            self.tp.publish_impl(sentinel.exchange, sentinel.routing_key, sentinel.body, {})
+
+        self.assertRaises(TransportError, self.tp.wait_for_confirms_impl, timeout=0.01)
+
+        # broker acks up to 3 at once
+        self.tp._on_publish_confirm(Mock(method=Mock(delivery_tag=3, multiple=True)))
+        self.tp.wait_for_confirms_impl(timeout=0.01)
+
+        # broker nacks one message of the next batch
+        for i in xrange(2):
+            self.tp.publish_impl(sentinel.exchange, sentinel.routing_key, sentinel.body, {})
+        self.tp._on_publish_nack(Mock(method=Mock(delivery_tag=4, multiple=False)))
+        self.tp._on_publish_confirm(Mock(method=Mock(delivery_tag=5, multiple=False)))
+        self.assertRaises(TransportError, self.tp.wait_for_confirms_impl, timeout=0.01)
+
+        # the nack does not carry over to later batches
+        self.tp.publish_impl(sentinel.exchange, sentinel.routing_key, sentinel.body, {})
+        self.tp._on_publish_confirm(Mock(method=Mock(delivery_tag=6, multiple=False)))
+        self.tp.wait_for_confirms_impl(timeout=0.01)
+
 @attr('UNIT')
 class TestNameTrio(PyonTestCase):
     def test_init(self):
@@ -571,6 +603,37 @@ class TestTopicTrie(PyonTestCase):
         self.assertEquals({sentinel.wild},
                           set(self.tt.get_all_matches('a.b.b.b.b.b.b')))
 
+    def test_multiple_wildcards(self):
+        # event subscription style bindings with several '#'
+        self.tt.add_topic_tree('#.ResourceEvent.#.*.#.*.dev_1', sentinel.origin)
+        self.tt.add_topic_tree('#.ResourceEvent.#.*.#.*.*', sentinel.type)
+        self.tt.add_topic_tree('#.TimerEvent.#.*.#.*.*', sentinel.other)
+
+        self.assertEquals({sentinel.origin, sentinel.type},
+                          self.tt.get_all_matches('Event.ResourceEvent.ResourceLifecycleEvent._.InstrumentDevice.dev_1'))
+        self.assertEquals({sentinel.type},
+                          self.tt.get_all_matches('Event.ResourceEvent.a.b.c.d.e.ResourceLifecycleEvent._.InstrumentDevice.dev_2'))
+        self.assertEquals(set(), self.tt.get_all_matches('Event.ResourceEvent'))
+
+    def test_remove_prunes_nodes(self):
+        self.tt.add_topic_tree('a.b.c', sentinel.p1)
+        self.tt.add_topic_tree('a.b', sentinel.p2)
+        self.tt.add_topic_tree('a.x.y', sentinel.p3)
+
+        self.tt.remove_topic_tree('a.b.c', sentinel.p1)
+        self.assertNotIn('c', self.tt.root.children['a'].children['b'].children)
+        self.assertEquals({sentinel.p2}, self.tt.get_all_matches('a.b'))
+
+        self.tt.remove_topic_tree('a.x.y', sentinel.p3)
+        self.assertEquals(['b'], self.tt.root.children['a'].children.keys())
+
+        # removing unknown trees does not create nodes
+        self.tt.remove_topic_tree('q.r.s', sentinel.p1)
+        self.assertNotIn('q', self.tt.root.children)
+
+        self.tt.remove_topic_tree('a.b', sentinel.p2)
+        self.assertEquals({}, self.tt.root.children)
+
 @attr('UNIT')
 class TestLocalRouter(PyonTestCase):
 
@@ -909,6 +972,67 @@ class TestLocalRouter(PyonTestCase):
 
         self.assertEquals(self.lr._queues[sentinel.queue].qsize(), 0)
 
+    def test_route_cache(self):
+        self.lr.declare_exchange('known')
+        self.lr.declare_queue('q1')
+        self.lr.declare_queue('q2')
+        self.lr.bind('known', 'q1', 'a.*')
+
+        self.assertEquals(self.lr._get_routes('known', 'a.b'), ('q1',))
+        self.assertIn('a.b', self.lr._route_cache['known'])
+
+        # bind, unbind and queue delete invalidate the cached routes
+        self.lr.bind('known', 'q2', '#.b')
+        self.assertNotIn('known', self.lr._route_cache)
+        self.assertEquals(set(self.lr._get_routes('known', 'a.b')), {'q1', 'q2'})
+
+        self.lr.unbind('known', 'q1', 'a.*')
+        self.assertEquals(self.lr._get_routes('known', 'a.b'), ('q2',))
+
+        self.lr.delete_queue('q2')
+        self.assertEquals(self.lr._get_routes('known', 'a.b'), ())
+
+        self.lr.delete_exchange('known')
+        self.assertRaises(AssertionError, self.lr._get_routes, 'known', 'a.b')
+
+    def test_route_speed(self):
+        """ Microbenchmark: routed messages/sec for event-like routing keys, with and without route cache """
+        num_origins, num_msgs = 500, 5000
+        self.lr._route = self.lr._oldroute
+        self.lr.declare_exchange('events')
+
+        # Subscriptions as made by event subscribers: by type, by origin and catch-all
+        for i, binding in enumerate(['#.ResourceEvent.#.*.*', '#.TimerEvent.#.*.*', '#']):
+            self.lr.declare_queue('type_%s' % i)
+            self.lr.bind('events', 'type_%s' % i, binding)
+        for i in xrange(num_origins):
+            self.lr.declare_queue('origin_%s' % i)
+            self.lr.bind('events', 'origin_%s' % i, '#.ResourceEvent.#.*.*.dev_%s' % i)
+
+        rkeys = ['Event.ResourceEvent.ResourceLifecycleEvent._.InstrumentDevice.dev_%s' % (i % 50) for i in xrange(num_msgs)]
+
+        def route_all():
+            t1 = time.time()
+            for rkey in rkeys:
+                self.lr.publish('events', rkey, 'body', {})
+            while self.lr._queue_incoming.qsize():
+                sleep(0)
+            return num_msgs / (time.time() - t1)
+
+        cache_size = self.lr.ROUTE_CACHE_SIZE
+        try:
+            self.lr.ROUTE_CACHE_SIZE = 0
+            rate_nocache = route_all()
+        finally:
+            self.lr.ROUTE_CACHE_SIZE = cache_size
+        rate_cache = route_all()
+
+        log.info("LocalRouter routing: %d msg/s without route cache, %d msg/s with route cache", rate_nocache, rate_cache)
+        self.assertEquals(self.lr._queues['type_0'].qsize(), 2 * num_msgs)
+        self.assertEquals(self.lr._queues['type_1'].qsize(), 0)
+        self.assertEquals(self.lr._queues['origin_7'].qsize(), 2 * num_msgs / 50)
+        self.assertEquals(len(self.lr.errors), 0)
+
 @attr('UNIT')
 class TestLocalTransport(PyonTestCase):
     def setUp(self):
@@ -13,7 +13,7 @@ import os
 from contextlib import contextmanager
 from uuid import uuid4
 from collections import defaultdict
-from pika import BasicProperties
+from pika import BasicProperties, spec
 from gevent.event import AsyncResult, Event
 from gevent.queue import Queue
 from gevent import sleep
@@ -115,6 +115,12 @@ class BaseTransport(object):
     def publish_impl(self, exchange, routing_key, body, properties, immediate=False, mandatory=False, durable_msg=False):
         raise NotImplementedError()
 
+    def confirm_select_impl(self):
+        raise NotImplementedError()
+
+    def wait_for_confirms_impl(self, timeout=None):
+        raise NotImplementedError()
+
     def close(self):
         raise NotImplementedError()
 
@@ -143,6 +149,7 @@ class ComposableTransport(BaseTransport):
         - qos_impl
         - get_stats_impl
         - publish_impl      (solely for publish rates, not needed for identity in protocol)
+        - confirm_select_impl, wait_for_confirms_impl (must match the transport used for publish)
     """
     common_methods = ['ack_impl',
                       'reject_impl',
@@ -150,7 +157,9 @@ class ComposableTransport(BaseTransport):
                       'stop_consume_impl',
                       'qos_impl',
                       'get_stats_impl',
-                      'publish_impl']
+                      'publish_impl',
+                      'confirm_select_impl',
+                      'wait_for_confirms_impl']
 
     def __init__(self, left, right, *methods):
         self._transports = [left]
@@ -171,7 +180,9 @@ class ComposableTransport(BaseTransport):
                           'get_stats_impl'       : left.get_stats_impl,
                           'purge_impl'           : left.purge_impl,
                           'qos_impl'             : left.qos_impl,
-                          'publish_impl'         : left.publish_impl, }
+                          'publish_impl'         : left.publish_impl,
+                          'confirm_select_impl'  : left.confirm_select_impl,
+                          'wait_for_confirms_impl': left.wait_for_confirms_impl, }
 
         if right is not None:
             self.overlay(right, *methods)
@@ -245,6 +256,14 @@ class ComposableTransport(BaseTransport):
         m = self._methods['publish_impl']
         return m(exchange, routing_key, body, properties, immediate=immediate, mandatory=mandatory, durable_msg=durable_msg)
 
+    def confirm_select_impl(self):
+        m = self._methods['confirm_select_impl']
+        return m()
+
+    def wait_for_confirms_impl(self, timeout=None):
+        m = self._methods['wait_for_confirms_impl']
+        return m(timeout=timeout)
+
     def close(self):
         for t in self._transports:
             t.close()
@@ -280,6 +299,13 @@ class AMQPTransport(BaseTransport):
         self._close_callbacks = []
         self.lock = False
 
+        # Publisher confirms state (None until confirm mode is selected)
+        self._confirm_seq = None
+        self._confirmed_seq = 0
+        self._nacked_seq = 0
+        self._waited_seq = 0
+        self._confirm_event = Event()
+
     def _on_underlying_close(self, code, text):
         if not (code == 0 or code == 200):
             log.error("AMQPTransport.underlying closed:\n\tchannel number: %s\n\tcode: %d\n\ttext: %s", self.channel_number, code, text)
@@ -527,6 +553,63 @@ class AMQPTransport(BaseTransport):
                                    properties=props,
                                    immediate=immediate,     # todo
                                    mandatory=mandatory)     # todo
+        if self._confirm_seq is not None:
+            self._confirm_seq += 1
+
+    def confirm_select_impl(self):
+        """
+        Puts the channel into publisher confirm mode, if not already. The broker acks (or nacks)
+        every subsequent publish by sequence number.
+        """
+        if self._confirm_seq is None:
+            # PIKA BUG: v0.9.5 confirm_delivery only registers a Basic.Ack callback and gives no
+            # callback for Confirm.SelectOk, so we register both callbacks and send the RPC ourselves
+            self._client.callbacks.add(self._client.channel_number, spec.Basic.Ack, self._on_publish_confirm, False)
+            self._client.callbacks.add(self._client.channel_number, spec.Basic.Nack, self._on_publish_nack, False)
+            self._sync_call(self._client.transport.rpc, 'callback', spec.Confirm.Select(False),
+                            acceptable_replies=[spec.Confirm.SelectOk])
+            self._confirm_seq = 0
+            self._confirmed_seq = 0
+            self._nacked_seq = 0
+            self._waited_seq = 0
+
+    def _on_publish_confirm(self, frame):
+        # Acks arrive in order; an ack with multiple set covers all prior publishes
+        self._confirmed_seq = max(self._confirmed_seq, frame.method.delivery_tag)
+        self._confirm_event.set()
+
+    def _on_publish_nack(self, frame):
+        # A nacked message is settled, but the broker could not take responsibility for it
+        self._nacked_seq = max(self._nacked_seq, frame.method.delivery_tag)
+        self._on_publish_confirm(frame)
+
+    def wait_for_confirms_impl(self, timeout=None):
+        """
+        Blocks until the broker confirmed all messages published since the last wait in confirm mode.
+        @raises TransportError  if not all messages are confirmed within timeout, or the broker
+                                nacked any of them
+        """
+        if self._confirm_seq is None:
+            return
+
+        target = self._confirm_seq
+        timer = Timeout(timeout)
+        timer.start()
+        try:
+            while self._confirmed_seq < target:
+                self._confirm_event.clear()
+                self._confirm_event.wait()
+        except Timeout as t:
+            if t is not timer:
+                raise
+            raise TransportError("Publisher confirms not received in time (%s of %s)" % (self._confirmed_seq, target))
+        finally:
+            timer.cancel()
+
+        nacked = self._nacked_seq > self._waited_seq
+        self._waited_seq = target
+        if nacked:
+            raise TransportError("Broker nacked published messages (up to %s of %s)" % (self._nacked_seq, target))
 
 
 class TopicTrie(object):
@@ -571,40 +654,57 @@ class TopicTrie(object):
         def get_all_matches(self, topics):
             """
             Given a list of topic tokens, returns all patterns stored in child nodes/self that match the topic tokens.
-
-            This is a depth-first search pruned by token, with special handling for both wildcard types.
             """
-            results = []
+            return list(TopicTrie.match_patterns(self, topics))
 
-            if len(topics) == 0:
-                # terminal point, return any pattern we have here
-                return self.patterns
+    @staticmethod
+    def match_patterns(node, topics):
+        """
+        Returns the set of patterns below node that match the list of topic tokens.
 
-            cur_token = topics[0]
-            rem_tokens = topics[1:]     # will always be a list, even if empty or 1-len
-            #log.debug('get_all_matches(%s): cur_token %s, rem_tokens %s', self.token, cur_token, rem_tokens)
+        Iterative depth-first search over (node, token position) states, pruned by token. '*' consumes
+        exactly one token. '#' consumes any number of tokens: zero or more if more pattern tokens follow,
+        one or more if it ends the pattern. States reachable via several '#' expansions are only visited once.
+        """
+        results = set()
+        num_topics = len(topics)
+        stack = [(node, 0)]
+        visited = set()
 
-            # child node direct matching
-            if cur_token in self.children:
-                results.extend(self.children[cur_token].get_all_matches(rem_tokens))
+        while stack:
+            cur_node, pos = stack.pop()
 
-            # now '*' wildcard
-            if '*' in self.children:
-                results.extend(self.children['*'].get_all_matches(rem_tokens))
+            if pos == num_topics:
+                # terminal point, take any pattern we have here
+                results.update(cur_node.patterns)
+                continue
 
-            # '#' means any number of tokens - naive method of descent, we'll feed it nothing to start. Then chop the full
-            # topics all the way down, put the results in a set to remove duplicates, and also any patterns on self.
-            if '#' in self.children:
-                # keep popping off and descend, make a set out of results
-                all_wild_childs = set()
-                for i in xrange(len(topics)):
-                    res = self.children['#'].get_all_matches(topics[i:])
-                    map(all_wild_childs.add, res)
+            children = cur_node.children
+            if not children:
+                continue
 
-                results.extend(all_wild_childs)
-                results.extend(self.children['#'].patterns)     # any patterns defined in # are legal too
+            # child node direct matching
+            child = children.get(topics[pos], None)
+            if child is not None:
+                stack.append((child, pos + 1))
 
-            return results
+            # now '*' wildcard
+            child = children.get('*', None)
+            if child is not None:
+                stack.append((child, pos + 1))
+
+            # '#' wildcard: continue matching below '#' from every remaining position,
+            # and any patterns defined in # itself match the remaining tokens
+            child = children.get('#', None)
+            if child is not None:
+                for i in xrange(pos, num_topics):
+                    state = (child, i)
+                    if state not in visited:
+                        visited.add(state)
+                        stack.append(state)
+                results.update(child.patterns)
+
+        return results
 
     def __init__(self):
         """
@@ -630,26 +730,35 @@ class TopicTrie(object):
     def remove_topic_tree(self, topic_tree, pattern):
         """
         Splits a string topic_tree into tokens (by .) and removes the pattern from the terminal node.
-        @TODO should remove empty nodes
+        Removes nodes left without patterns and children.
         """
         topics = topic_tree.split(".")
 
         curnode = self.root
+        path = []
 
         for topic in topics:
-            curnode = curnode.get_or_create_child(topic)
+            if topic not in curnode.children:
+                return
+            path.append((curnode, topic))
+            curnode = curnode.children[topic]
 
         if pattern in curnode.patterns:
             curnode.patterns.remove(pattern)
 
+        # prune empty nodes bottom up
+        for parent, topic in reversed(path):
+            node = parent.children[topic]
+            if node.patterns or node.children:
+                break
+            del parent.children[topic]
+
     def get_all_matches(self, topic_tree):
         """
-        Returns a list of all matches for a given topic tree string.
-        Creates a set out of the matching patterns, so multiple binds matching on the same pattern only
-        return once.
+        Returns a set of all matches for a given topic tree string.
+        Multiple binds matching on the same pattern only return once.
         """
-        topics = topic_tree.split(".")
-        return set(self.root.get_all_matches(topics))
+        return self.match_patterns(self.root, topic_tree.split("."))
 
 
 class LocalRouter(object):
@@ -657,7 +766,12 @@ class LocalRouter(object):
     A RabbitMQ-like routing device implemented with gevent mechanisms for an in-memory broker.
     Using LocalTransport, can handle topic-exchange-like communication in ION within the context
     of a single container.
+
+    Routing results are cached per exchange by routing key. Declarations modify the binding tables
+    under a lock and replace the exchange's route cache; routing itself takes no lock; it runs
+    without yielding, so it always sees a consistent set of bindings.
     """
+    ROUTE_CACHE_SIZE = 10000                            # max cached routing keys per exchange (0: no caching)
 
     class ConsumerClosedMessage(object):
         """
@@ -673,7 +787,8 @@ class LocalRouter(object):
         self._exchanges = {}                            # names -> { subscriber, topictrie(queue name) }
         self._queues = {}                               # names -> gevent queue
         self._bindings_by_queue = defaultdict(list)     # queue name -> [(ex, binding)]
-        self._lock_declarables = RLock()                # exchanges, queues, bindings, routing method
+        self._lock_declarables = RLock()                # exchanges, queues, bindings
+        self._route_cache = {}                          # exchange -> { routing key -> tuple(queue names) }
 
         # consumers
         self._consumers = defaultdict(list)             # queue name -> [ctag, channel._on_deliver]
@@ -716,8 +831,7 @@ class LocalRouter(object):
         while True:
             ex, rkey, body, props = self._queue_incoming.get()
             try:
-                with self._lock_declarables:
-                    self._route(ex, rkey, body, props)
+                self._route(ex, rkey, body, props)
             except Exception as e:
                 self.errors.append(e)
                 log.exception("Routing message")
@@ -725,18 +839,44 @@ class LocalRouter(object):
     def _route(self, exchange, routing_key, body, props):
         """
         Delivers incoming messages into queues based on known routes.
-        This entire method runs in a lock (likely pretty slow).
+        Does not lock and must not yield (see class docstring).
         """
-        assert exchange in self._exchanges, "Unknown exchange %s" % exchange
-
-        queues = self._exchanges[exchange].get_all_matches(routing_key)
-        log.debug("route: ex %s, rkey %s,  matched %s routes", exchange, routing_key, len(queues))
+        queues = self._get_routes(exchange, routing_key)
 
         # deliver to each queue
+        msg = (exchange, routing_key, body, props)
+        all_queues = self._queues
         for q in queues:
-            assert q in self._queues
-            log.debug("deliver -> %s", q)
-            self._queues[q].put((exchange, routing_key, body, props))
+            gqueue = all_queues.get(q, None)
+            if gqueue is not None:
+                gqueue.put(msg)
+
+    def _get_routes(self, exchange, routing_key):
+        """
+        Returns the names of all queues bound to exchange that match routing_key, from the
+        route cache if possible.
+        """
+        cache = self._route_cache.get(exchange, None)
+        if cache is None:
+            assert exchange in self._exchanges, "Unknown exchange %s" % exchange
+            cache = self._route_cache[exchange] = {}
+
+        queues = cache.get(routing_key, None)
+        if queues is None:
+            queues = tuple(self._exchanges[exchange].get_all_matches(routing_key))
+            if self.ROUTE_CACHE_SIZE:
+                if len(cache) >= self.ROUTE_CACHE_SIZE:
+                    cache.clear()
+                cache[routing_key] = queues
+
+        return queues
+
+    def _invalidate_routes(self, exchange):
+        """
+        Drops the route cache of an exchange after its bindings changed.
+        Replaces rather than clears the cache, so a route computed from the old bindings is never stored.
+        """
+        self._route_cache.pop(exchange, None)
 
     def _child_failed(self, gproc):
         """
@@ -757,7 +897,7 @@ class LocalRouter(object):
 
     def publish(self, exchange, routing_key, body, properties, immediate=False, mandatory=False):
         self._queue_incoming.put((exchange, routing_key, body, properties))
-        sleep(0.0001)      # really wish switch would work instead of a sleep, seems wrong
+        sleep(0)        # yield so the routing greenlet can run
 
     def declare_exchange(self, exchange, **kwargs):
         with self._lock_declarables:
@@ -768,6 +908,7 @@ class LocalRouter(object):
         with self._lock_declarables:
             if exchange in self._exchanges:
                 del self._exchanges[exchange]
+                self._invalidate_routes(exchange)
 
     def declare_queue(self, queue, **kwargs):
         with self._lock_declarables:
@@ -793,6 +934,7 @@ class LocalRouter(object):
                 for ex, binding in self._bindings_by_queue[queue]:
                     if ex in self._exchanges:
                         self._exchanges[ex].remove_topic_tree(binding, queue)
+                        self._invalidate_routes(ex)
 
                 self._bindings_by_queue.pop(queue)
 
@@ -806,6 +948,7 @@ class LocalRouter(object):
 
             tt.add_topic_tree(binding, queue)
             self._bindings_by_queue[queue].append((exchange, binding))
+            self._invalidate_routes(exchange)
 
     def unbind(self, exchange, queue, binding):
         with self._lock_declarables:
@@ -813,6 +956,7 @@ class LocalRouter(object):
             assert queue in self._queues
 
             self._exchanges[exchange].remove_topic_tree(binding, queue)
+            self._invalidate_routes(exchange)
             for i, val in enumerate(self._bindings_by_queue[queue]):
                 ex, b = val
                 if ex == exchange and b == binding:
@@ -982,6 +1126,13 @@ class LocalTransport(BaseTransport):
     def publish_impl(self, exchange, routing_key, body, properties, immediate=False, mandatory=False, durable_msg=False):
         self._broker.publish(exchange, routing_key, body, properties, immediate=immediate, mandatory=mandatory)
 
+    def confirm_select_impl(self):
+        pass
+
+    def wait_for_confirms_impl(self, timeout=None):
+        # Local routing delivers synchronously, nothing to wait for
+        pass
+
     def start_consume_impl(self, callback, queue, no_ack=False, exclusive=False):
         return self._broker.start_consume(callback, queue, no_ack=no_ack, exclusive=exclusive)
 
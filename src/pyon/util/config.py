@@ -2,9 +2,15 @@
 
 __author__ = 'Adam R. Smith'
 
+import hashlib
+import marshal
+import os
+import sys
+import tempfile
 import yaml
 
-from pyon.util.containers import DotDict, dict_merge
+import pyon
+from pyon.util.containers import DotDict, dict_merge, simple_deepcopy
 from pyon.core.exception import ConfigNotFound
 
 
@@ -12,13 +18,16 @@ class Config(object):
     """
     YAML-based config loader that supports multiple paths.
     Later paths get deep-merged over earlier ones.
+    The merged result is kept as a compiled snapshot (see ConfigSnapshotCache), keyed by the
+    content of all loaded files, so that an unchanged set of files is not parsed again.
     """
 
-    def __init__(self, paths=(), dict_class=DotDict, ignore_not_found=False):
+    def __init__(self, paths=(), dict_class=DotDict, ignore_not_found=False, use_cache=True):
         self.paths = [path for path in paths if path] if paths is not None else []
         self.paths_loaded = set()
         self.dict_class = dict_class
         self.data = self.dict_class()
+        self.use_cache = use_cache
 
         if paths:
             self.load(ignore_not_found)
@@ -30,23 +39,148 @@ class Config(object):
 
     def load(self, ignore_not_found=False):
         """ Load each path in order. Remember paths already loaded and only load new ones. """
-        data = self.dict_class()
-        
+        path_contents = []
         for path in self.paths:
             if path in self.paths_loaded: continue
-            
+
             try:
                 with open(path, 'r') as file:
-                    path_data = yaml.load(file.read())
-                    if path_data is not None:
-                        data = dict_merge(data, path_data)
-                self.paths_loaded.add(path)
+                    path_contents.append((path, file.read()))
             except IOError:
                 if not ignore_not_found:
                     raise ConfigNotFound("Config URL '%s' not found" % path)
+                path_contents.append((path, None))
+
+        snapshot_cache = get_snapshot_cache() if self.use_cache else None
+        snapshot = snapshot_cache.get(path_contents) if snapshot_cache else None
+        if snapshot is not None:
+            data = self.dict_class(snapshot)
+        else:
+            data = self.dict_class()
+            for path, content in path_contents:
+                if content is None: continue
+                path_data = yaml.load(content)
+                if path_data is not None:
+                    data = dict_merge(data, path_data)
+            if snapshot_cache:
+                snapshot_cache.put(path_contents, data)
 
+        self.paths_loaded.update(path for path, content in path_contents if content is not None)
         self.data = data
 
     def reload(self):
         self.paths_loaded.clear()
         self.load()
+
+
+class ConfigSnapshotCache(object):
+    """
+    Stores merged config file contents as marshal blobs in a directory private to the user.
+    A snapshot is keyed by the hash of the content of all source files (and the Python version),
+    so a changed source file automatically results in a new snapshot.
+    Configs that cannot be marshalled (e.g. with YAML timestamps) are not cached.
+    Only the max_files most recently used snapshots are kept; older ones are removed on put.
+    """
+    max_files = 20
+
+    def __init__(self, cache_dir, max_files=None):
+        self.cache_dir = cache_dir
+        if max_files is not None:
+            self.max_files = max_files
+        self._dir_ok = None
+
+    def get_key(self, path_contents):
+        hasher = hashlib.sha1(sys.version)
+        for path, content in path_contents:
+            hasher.update("\0%s\0" % path)
+            hasher.update(content if content is not None else "\0MISSING\0")
+        return hasher.hexdigest()
+
+    def get(self, path_contents):
+        """ Returns snapshot content as plain dict or None if not cached """
+        if not self._check_dir(create=False):
+            return None
+        snapshot_filename = os.path.join(self.cache_dir, self.get_key(path_contents) + ".cfg")
+        try:
+            with open(snapshot_filename, "rb") as f:
+                data = marshal.loads(f.read())
+        except Exception:
+            return None
+        try:
+            # Mark as recently used, so that it is kept when pruning
+            os.utime(snapshot_filename, None)
+        except OSError:
+            pass
+        return data
+
+    def put(self, path_contents, data):
+        if not self._check_dir(create=True):
+            return
+        try:
+            blob = marshal.dumps(simple_deepcopy(data))
+        except ValueError:
+            return
+        snapshot_filename = os.path.join(self.cache_dir, self.get_key(path_contents) + ".cfg")
+        try:
+            fd, tmp_filename = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(blob)
+            os.rename(tmp_filename, snapshot_filename)
+        except (IOError, OSError):
+            return
+        self._prune()
+
+    def _prune(self):
+        """ Removes all but the max_files most recently used snapshots """
+        snapshots = []
+        for filename in os.listdir(self.cache_dir):
+            if filename.endswith(".cfg"):
+                path = os.path.join(self.cache_dir, filename)
+                try:
+                    snapshots.append((os.stat(path).st_mtime, path))
+                except OSError:
+                    pass
+        snapshots.sort(reverse=True)
+        for _, path in snapshots[self.max_files:]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def clear(self):
+        if not self._check_dir(create=False):
+            return
+        for filename in os.listdir(self.cache_dir):
+            if filename.endswith(".cfg"):
+                try:
+                    os.remove(os.path.join(self.cache_dir, filename))
+                except OSError:
+                    pass
+
+    def _check_dir(self, create=False):
+        """ Returns True if the cache directory exists, belongs to the current user and is not writable by others """
+        if self._dir_ok:
+            return True
+        try:
+            if create and not os.path.exists(self.cache_dir):
+                os.makedirs(self.cache_dir, 0700)
+            dir_stat = os.stat(self.cache_dir)
+        except OSError:
+            return False
+        self._dir_ok = dir_stat.st_uid == os.getuid() and not dir_stat.st_mode & 0022
+        return self._dir_ok
+
+
+_snapshot_cache = None
+
+def get_snapshot_cache():
+    """ Returns the config snapshot cache or None if disabled via pyon.CONFIG_CACHE_DIR """
+    global _snapshot_cache
+    cache_dir = pyon.CONFIG_CACHE_DIR
+    if cache_dir is None:
+        cache_dir = os.path.join(tempfile.gettempdir(), "scion_config_%s" % os.getuid())
+    if not cache_dir:
+        return None
+    if _snapshot_cache is None or _snapshot_cache.cache_dir != cache_dir:
+        _snapshot_cache = ConfigSnapshotCache(cache_dir)
+    return _snapshot_cache
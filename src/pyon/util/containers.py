@@ -16,6 +16,7 @@ from types import NoneType
 from copy import deepcopy
 
 DICT_LOCKING_ATTR = "__locked__"
+DICT_INDEX_ATTR = "__path_index__"
 
 
 class DotNotationGetItem(object):
@@ -66,7 +67,14 @@ class DotDict(DotNotationGetItem, dict):
     """
 
     def __dir__(self):
-        return [k for k in self.__dict__.keys() + self.keys() if k != DICT_LOCKING_ATTR]
+        return [k for k in self.__dict__.keys() + self.keys() if k != DICT_LOCKING_ATTR and k != DICT_INDEX_ATTR]
+
+    def __getstate__(self):
+        # Path index is not copied or pickled
+        state = self.__dict__
+        if DICT_INDEX_ATTR in state:
+            state = {k: v for k, v in state.iteritems() if k != DICT_INDEX_ATTR}
+        return state
 
     def __getattr__(self, key):
         """ Make attempts to lookup by nonexistent attributes also attempt key lookups. """
@@ -93,6 +101,16 @@ class DotDict(DotNotationGetItem, dict):
         else:
             self[key] = value
 
+    def __setitem__(self, key, value):
+        path_index = self.__dict__.get(DICT_INDEX_ATTR, None)
+        if path_index is not None:
+            path_index.valid = False
+        super(DotDict, self).__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._invalidate_path_index()
+        super(DotDict, self).__delitem__(key)
+
     def copy(self):
         return deepcopy(self)
 
@@ -101,11 +119,29 @@ class DotDict(DotNotationGetItem, dict):
         @brief Returns value of qualified key, such as "system.name" or None if not exists.
                 If default is given, returns the default. No exception thrown.
         """
-        value = get_safe(self, qual_key)
+        path_index = self.__dict__.get(DICT_INDEX_ATTR, None)
+        if path_index is not None and path_index.root is self and isinstance(qual_key, basestring):
+            value = path_index.get(qual_key)
+        else:
+            value = get_safe(self, qual_key)
         if value is None:
             value = default
         return value
 
+    def enable_path_index(self):
+        """
+        Keeps a flat index of all dotted key paths in this dict for fast get_safe lookups.
+        Any change within the nested dicts invalidates the index, which is rebuilt on the next get_safe.
+        Use for large, rarely changed dicts that are read a lot, such as the global CFG.
+        """
+        if self.__dict__.get(DICT_INDEX_ATTR, None) is None or self.__dict__[DICT_INDEX_ATTR].root is not self:
+            self.__dict__[DICT_INDEX_ATTR] = DotDictPathIndex(self)
+
+    def _invalidate_path_index(self):
+        path_index = self.__dict__.get(DICT_INDEX_ATTR, None)
+        if path_index is not None:
+            path_index.valid = False
+
     def lock(self):
         self.__dict__[DICT_LOCKING_ATTR] = True
 
@@ -113,18 +149,29 @@ class DotDict(DotNotationGetItem, dict):
         if self.__dict__.has_key(DICT_LOCKING_ATTR):
             del self.__dict__[DICT_LOCKING_ATTR]
 
+        self._invalidate_path_index()
         super(DotDict, self).clear()
 
     def pop(self, *args, **kwargs):
         if self.__dict__.has_key(DICT_LOCKING_ATTR):
             raise AttributeError('Cannot pop on a locked DotDict')
+        self._invalidate_path_index()
         return super(DotDict, self).pop(*args, **kwargs)
 
     def popitem(self):
         if self.__dict__.has_key(DICT_LOCKING_ATTR):
             raise AttributeError('Cannot popitem on a locked DotDict')
+        self._invalidate_path_index()
         return super(DotDict, self).popitem()
 
+    def update(self, *args, **kwargs):
+        self._invalidate_path_index()
+        super(DotDict, self).update(*args, **kwargs)
+
+    def setdefault(self, key, default=None):
+        self._invalidate_path_index()
+        return super(DotDict, self).setdefault(key, default)
+
     def as_dict(self):
         return simple_deepcopy(self)
 
@@ -134,6 +181,52 @@ class DotDict(DotNotationGetItem, dict):
         return DotDict(dict.fromkeys(seq, value))
 
 
+class DotDictPathIndex(object):
+    """
+    Flat index of dotted key path to value for a tree of nested DotDicts, see DotDict.enable_path_index.
+    The index is referenced by all DotDicts of the tree, which invalidate it on change.
+    """
+    MAX_MISSES = 10000
+
+    __slots__ = ("root", "valid", "paths", "misses")
+
+    def __init__(self, root):
+        self.root = root
+        self.valid = False
+        self.paths = {}
+        self.misses = set()
+
+    def get(self, qual_key):
+        if not self.valid:
+            self.rebuild()
+        try:
+            return self.paths[qual_key]
+        except KeyError:
+            if qual_key in self.misses:
+                return None
+        value = get_safe(self.root, qual_key)
+        if value is None and self.valid and len(self.misses) < self.MAX_MISSES:
+            self.misses.add(qual_key)
+        return value
+
+    def rebuild(self):
+        paths = {}
+        stack = [(self.root, "")]
+        while stack:
+            dot_dict, prefix = stack.pop()
+            dot_dict.__dict__[DICT_INDEX_ATTR] = self
+            for key in dot_dict.keys():
+                if not isinstance(key, basestring) or "." in key:
+                    continue
+                value = dot_dict[key]    # Converts nested dicts to DotDict
+                paths[prefix + key] = value
+                if isinstance(value, DotDict):
+                    stack.append((value, prefix + key + "."))
+        self.paths = paths
+        self.misses = set()
+        self.valid = True
+
+
 class DictDiffer(object):
     """
     Calculate the difference between two dictionaries as:
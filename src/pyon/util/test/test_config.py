@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+
+__author__ = 'Michael Meisinger'
+
+import os
+import shutil
+import tempfile
+from mock import patch
+from nose.plugins.attrib import attr
+
+from pyon.util.config import Config, ConfigSnapshotCache, get_snapshot_cache
+from pyon.util.containers import DotDict
+from pyon.util.unit_test import PyonTestCase
+
+
+@attr('UNIT', group='util')
+class TestConfig(PyonTestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+        self.cache_dir = os.path.join(self.tmp_dir, "cache")
+        patcher = patch("pyon.CONFIG_CACHE_DIR", self.cache_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _write_file(self, filename, content):
+        path = os.path.join(self.tmp_dir, filename)
+        with open(path, "w") as f:
+            f.write(content)
+        return path
+
+    def test_config_snapshot(self):
+        base_path = self._write_file("base.yml", "system:\n  name: sys1\n  opts: [1, 2]\nother: 5\n")
+        override_path = self._write_file("override.yml", "system:\n  name: sys2\n")
+        missing_path = os.path.join(self.tmp_dir, "missing.yml")
+        paths = [base_path, override_path, missing_path]
+
+        cfg = Config(paths, ignore_not_found=True)
+        self.assertIsInstance(cfg.data, DotDict)
+        self.assertEqual(cfg.data.get_safe("system.name"), "sys2")
+        self.assertEqual(cfg.data.get_safe("system.opts"), [1, 2])
+        self.assertEqual(cfg.paths_loaded, {base_path, override_path})
+        self.assertEqual(len([fn for fn in os.listdir(self.cache_dir) if fn.endswith(".cfg")]), 1)
+
+        # Loaded from snapshot without parsing YAML
+        with patch("pyon.util.config.yaml.load") as yaml_load:
+            cfg = Config(paths, ignore_not_found=True)
+            self.assertFalse(yaml_load.called)
+        self.assertEqual(cfg.data.get_safe("system.name"), "sys2")
+        self.assertEqual(cfg.data.other, 5)
+
+        # A changed source file invalidates the snapshot
+        self._write_file("override.yml", "system:\n  name: sys3\n")
+        cfg = Config(paths, ignore_not_found=True)
+        self.assertEqual(cfg.data.get_safe("system.name"), "sys3")
+
+        # A source file that appears invalidates the snapshot
+        self._write_file("missing.yml", "other: 6\n")
+        cfg = Config(paths, ignore_not_found=True)
+        self.assertEqual(cfg.data.other, 6)
+
+        get_snapshot_cache().clear()
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_config_snapshot_prune(self):
+        cache = get_snapshot_cache()
+        cache.max_files = 2
+        self.addCleanup(setattr, cache, "max_files", ConfigSnapshotCache.max_files)
+
+        snapshot_names = []
+        for i in xrange(4):
+            content = "key: %s\n" % i
+            path = self._write_file("cfg%s.yml" % i, content)
+            Config([path])
+            snapshot_names.append(cache.get_key([(path, content)]) + ".cfg")
+            # Distinct modification times, newest last
+            os.utime(os.path.join(self.cache_dir, snapshot_names[-1]), (i, i))
+
+        # Only the most recent snapshots are kept
+        snapshots = [fn for fn in os.listdir(self.cache_dir) if fn.endswith(".cfg")]
+        self.assertEqual(set(snapshots), set(snapshot_names[2:]))
+
+    def test_config_no_snapshot(self):
+        # Values that cannot be marshalled are not cached
+        path = self._write_file("dates.yml", "created: 2015-01-01\n")
+        cfg = Config([path])
+        self.assertEqual(cfg.data.created.year, 2015)
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+        path = self._write_file("plain.yml", "key: value\n")
+        cfg = Config([path], use_cache=False)
+        self.assertEqual(cfg.data.key, "value")
+        self.assertEqual(os.listdir(self.cache_dir), [])
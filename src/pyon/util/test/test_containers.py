@@ -116,6 +116,36 @@ class Test_Containers(IonIntegrationTestCase):
         with self.assertRaises(AttributeError):
             base.another.chained.pop = 'again should not work'
 
+    def test_dotdict_path_index(self):
+        cfg = DotDict({"system": {"name": "sys1", "nested": {"x": 1}}, "dotted.key": {"y": 2}})
+        cfg.enable_path_index()
+        self.assertEqual(cfg.get_safe("system.name"), "sys1")
+        self.assertEqual(cfg.get_safe("system.nested.x"), 1)
+        self.assertIsInstance(cfg.get_safe("system.nested"), DotDict)
+        self.assertEqual(cfg.get_safe("system.missing", "default"), "default")
+        self.assertIsNone(cfg.get_safe("dotted.key.y"))
+        self.assertEqual(cfg.get_safe(["dotted.key", "y"]), 2)
+
+        # Changes at any level invalidate the index
+        cfg.system.nested.x = 2
+        self.assertEqual(cfg.get_safe("system.nested.x"), 2)
+        cfg.system.missing = "now set"
+        self.assertEqual(cfg.get_safe("system.missing"), "now set")
+        cfg.system.nested.update({"z": 3})
+        self.assertEqual(cfg.get_safe("system.nested.z"), 3)
+        del cfg.system.nested["z"]
+        self.assertIsNone(cfg.get_safe("system.nested.z"))
+        cfg["system"] = {"name": "sys2"}
+        self.assertEqual(cfg.get_safe("system.name"), "sys2")
+        self.assertIsNone(cfg.get_safe("system.nested.x"))
+        dict_merge(cfg, {"system": {"name": "sys3"}}, inplace=True)
+        self.assertEqual(cfg.get_safe("system.name"), "sys3")
+
+        cfg_copy = copy.deepcopy(cfg)
+        self.assertNotIn("__path_index__", cfg_copy.__dict__)
+        self.assertNotIn("__path_index__", dir(cfg))
+        self.assertEqual(cfg_copy.get_safe("system.name"), "sys3")
+
     def test_dict_merge(self):
         # dict_merge(base, upd, inplace=False):
         org_dict = {"a":"str_a", "d": {"d-x": 1, "d-y": None, "d-d": {"d-d-1": 1, "d-d-2": 2}}}
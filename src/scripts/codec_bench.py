@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+
+"""Benchmark for the msgpack codecs of the EncodeInterceptor: encodes and decodes a message with
+a list of resources and associations (as returned by a resource registry find) with the generic
+hooks codec and the schema codec. Reports the median time per message and checks that both codecs
+produce the same bytes and objects. Run from the repository root."""
+
+__author__ = 'Michael Meisinger'
+
+import argparse
+import json
+import time
+
+from pyon.core import bootstrap
+
+
+def time_call(func, repeat):
+    """ Returns the median time in ms of repeat calls to func """
+    run_times = []
+    for i in xrange(repeat):
+        start_time = time.time()
+        func()
+        run_times.append(time.time() - start_time)
+    return round(sorted(run_times)[len(run_times) / 2] * 1000, 2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--num_objects', type=int, default=1000, help='Number of resources in the message')
+    parser.add_argument('-r', '--repeat', type=int, default=20, help='Number of runs per case (median is reported)')
+    parser.add_argument('-j', '--json', action='store_true', help='Print results as JSON')
+    opts = parser.parse_args()
+
+    bootstrap.testing = False
+    bootstrap.bootstrap_pyon()
+    from pyon.core.bootstrap import IonObject
+    from pyon.core.interceptor.encode import EncodeInterceptor
+    from pyon.core.interceptor.interceptor import Invocation
+    from pyon.ion.resource import RT, PRED
+
+    res_objs = [IonObject(RT.ActorIdentity, name="actor%s" % i, description="Actor %s" % i, alt_ids=["PRE:%s" % i],
+                          addl={"index": i}, ts_created="1476662400000") for i in xrange(opts.num_objects)]
+    assoc_objs = [IonObject("Association", s="id0", st=RT.ActorIdentity, p=PRED.hasResource, o="id%s" % i,
+                            ot=RT.ActorIdentity, retired=False, ts="1476662400000") for i in xrange(opts.num_objects)]
+    for i, (res_obj, assoc_obj) in enumerate(zip(res_objs, assoc_objs)):
+        res_obj._id, res_obj._rev = "id%s" % i, "1"
+        assoc_obj._id, assoc_obj._rev = "aid%s" % i, "1"
+    msg = {"result": [res_objs, assoc_objs]}
+
+    codecs = []
+    for codec in ("hooks", "schema"):
+        encode = EncodeInterceptor()
+        encode.configure({"codec": codec})
+        codecs.append((codec, encode))
+
+    results = []
+    msg_bytes = {}
+    for codec, encode in codecs:
+        msg_bytes[codec] = encode.outgoing(Invocation(message=msg)).message
+        results.append(dict(case="encode %s" % codec, size=len(msg_bytes[codec]),
+                            time_ms=time_call(lambda: encode.outgoing(Invocation(message=msg)), opts.repeat)))
+    for codec, encode in codecs:
+        body = msg_bytes[codec]
+        results.append(dict(case="decode %s" % codec, size=len(body),
+                            time_ms=time_call(lambda: encode.incoming(Invocation(message=body)), opts.repeat)))
+
+    decoded = [encode.incoming(Invocation(message=msg_bytes[codec])).message for codec, encode in codecs]
+    same_bytes = msg_bytes["hooks"] == msg_bytes["schema"]
+    same_objects = decoded[0] == decoded[1] and all(
+        o1.__dict__ == o2.__dict__ and type(o1) is type(o2)
+        for objs1, objs2 in zip(decoded[0]["result"], decoded[1]["result"]) for o1, o2 in zip(objs1, objs2))
+
+    if opts.json:
+        print json.dumps(dict(results=results, same_bytes=same_bytes, same_objects=same_objects), indent=2)
+        return
+    print "%-16s %12s %12s" % ("case", "bytes", "time (ms)")
+    for res in results:
+        print "%-16s %12s %12s" % (res["case"], res["size"], res["time_ms"])
+    print "Same bytes: %s, same objects: %s" % (same_bytes, same_objects)
+
+
+if __name__ == '__main__':
+    main()
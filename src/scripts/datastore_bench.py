@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+
+"""Benchmark for bulk id lookups against a local Postgres: read_doc_mult with the former
+WHERE id IN (...) list of parameters compared to id = ANY(array) in chunks (single statement,
+sequential chunks within a transaction, parallel chunks), plus find_objects_mult and delete_doc_mult.
+Creates a scratch datastore with the given number of resources (default 100k) and removes it after.
+Run from the repository root."""
+
+__author__ = 'Michael Meisinger'
+
+import argparse
+import json
+import random
+import time
+
+from pyon.core import bootstrap
+
+
+def time_call(func, repeat):
+    """ Returns the median time in ms of repeat calls to func """
+    run_times = []
+    for i in xrange(repeat):
+        start_time = time.time()
+        func()
+        run_times.append(time.time() - start_time)
+    return round(sorted(run_times)[len(run_times) / 2] * 1000, 1)
+
+
+def read_doc_mult_in_list(data_store, object_ids):
+    """ Former implementation of read_doc_mult with one named parameter per id """
+    query = "SELECT id, doc FROM " + data_store._get_datastore_name() + " WHERE id IN ("
+    query_args = dict()
+    for i, oid in enumerate(object_ids):
+        arg_name = "id" + str(i)
+        if i > 0:
+            query += ","
+        query += "%(" + arg_name + ")s"
+        query_args[arg_name] = oid
+    query += ")"
+    with data_store.pool.cursor(**data_store.cursor_args) as cur:
+        cur.execute(query, query_args)
+        return cur.fetchall()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--num_resources', type=int, default=100000, help='Number of resources to create')
+    parser.add_argument('-r', '--repeat', type=int, default=5, help='Number of runs per case (median is reported)')
+    parser.add_argument('-c', '--chunk_size', type=int, default=1000, help='Id chunk size for the chunked cases')
+    parser.add_argument('-j', '--json', action='store_true', help='Print results as JSON')
+    opts = parser.parse_args()
+
+    bootstrap.testing = False
+    bootstrap.bootstrap_pyon()
+    from pyon.core.bootstrap import IonObject, get_sys_name
+    from pyon.datastore.datastore import DataStore
+    from pyon.datastore.postgresql.datastore import PostgresPyonDataStore
+    from pyon.ion.resource import RT
+
+    data_store = PostgresPyonDataStore(datastore_name="bench_ds", profile=DataStore.DS_PROFILE.RESOURCES, scope=get_sys_name())
+    data_store._use_object_cache = False
+    if data_store.datastore_exists():
+        data_store.delete_datastore()
+    data_store.create_datastore()
+
+    results = []
+    try:
+        res_objs = [IonObject(RT.ActorIdentity, name="actor%s" % i) for i in xrange(opts.num_resources)]
+        start_time = time.time()
+        res_ids = [rid for rid, _ in data_store.create_mult(res_objs)]
+        results.append(dict(case="create_mult", num_ids=len(res_ids), time_ms=round((time.time() - start_time) * 1000, 1)))
+        assoc_objs = [IonObject("Association", s=res_ids[i], st=RT.ActorIdentity, p="hasBench", o=res_ids[i + 1],
+                                ot=RT.ActorIdentity, retired=False) for i in xrange(len(res_ids) - 1)]
+        data_store.create_mult(assoc_objs)
+
+        def in_transaction(func):
+            def run_func():
+                with data_store.in_transaction():
+                    func()
+            return run_func
+
+        for num_ids in (100, 1000, 10000, opts.num_resources):
+            num_ids = min(num_ids, len(res_ids))
+            object_ids = random.sample(res_ids, num_ids)
+
+            def read_chunked(chunk_size):
+                def run_func():
+                    data_store.id_chunk_size = chunk_size
+                    data_store.read_doc_mult(object_ids)
+                return run_func
+
+            cases = [("read IN list", lambda: read_doc_mult_in_list(data_store, object_ids)),
+                     ("read ANY single", read_chunked(0)),
+                     ("read ANY chunks sequential", in_transaction(read_chunked(opts.chunk_size))),
+                     ("read ANY chunks parallel", read_chunked(opts.chunk_size)),
+                     ("find_objects_mult", lambda: data_store.find_objects_mult(object_ids, id_only=True)),
+                     ]
+            for case_name, case_func in cases:
+                results.append(dict(case=case_name, num_ids=num_ids, time_ms=time_call(case_func, opts.repeat)))
+
+        data_store.id_chunk_size = opts.chunk_size
+        start_time = time.time()
+        data_store.delete_doc_mult(res_ids)
+        results.append(dict(case="delete_doc_mult", num_ids=len(res_ids), time_ms=round((time.time() - start_time) * 1000, 1)))
+    finally:
+        data_store.delete_datastore()
+        data_store.close()
+
+    if opts.json:
+        print json.dumps(results, indent=2)
+        return
+    print "%-28s %10s %12s" % ("case", "num ids", "time (ms)")
+    for res in results:
+        print "%-28s %10s %12s" % (res["case"], res["num_ids"], res["time_ms"])
+
+
+if __name__ == '__main__':
+    main()
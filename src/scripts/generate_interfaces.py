@@ -32,6 +32,9 @@ def main():
                         help='Read configuration from datastore.')
     parser.add_argument('-c', '--no_check', action='store_true',
                         help='Do not check import all source modules')
+    parser.add_argument('-e', '--eager_classes', action='store_true',
+                        help='Generate plain object and message modules instead of lazy modules '
+                             'that define classes on first access')
     opts = parser.parse_args()
 
     print "generate_interfaces: SciON interface generator with options:" , str(opts)
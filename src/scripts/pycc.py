@@ -8,10 +8,12 @@ __author__ = 'Adam R. Smith, Michael Meisinger'
 import argparse
 import ast
 from copy import deepcopy
+import errno
 from multiprocessing import Process, Event, current_process
 import os
 import signal
 import sys
+import time
 import traceback
 from uuid import uuid4
 # WARNING - DO NOT IMPORT GEVENT OR PYON HERE. IMPORTS **MUST** BE DONE IN THE main()
@@ -30,6 +32,12 @@ SciON Capability Container v%s
 
 child_procs = []     # List of child processes to notify on terminate
 childproc_go = None  # Event that starts child processes (so that main process can complete initialization first)
+worker_pids = {}     # Map of pid to worker number of forked container workers (in prefork supervisor)
+worker_shard = None  # Tuple (worker_num, num_workers) if we are a forked container worker
+
+WORKER_RESTART_DELAY = 1.0      # Initial delay before restarting a failed worker (doubles on quick failures)
+WORKER_RESTART_MAX_DELAY = 60.0
+WORKER_MIN_UPTIME = 30.0        # Workers failing faster than this are restarted with increasing delay
 
 # See below __main__ for STEP 1
 
@@ -59,6 +67,7 @@ def entry():
     parser.add_argument('-ra', '--relall', action='store_true', help='Launch deploy file on all child processes')
     parser.add_argument('-s', '--sysname', type=str, help='System name')
     parser.add_argument('-sp', '--signalparent', action='store_true', help='Signal parent process after procs started')
+    parser.add_argument('-w', '--workers', type=int, help='Bootstrap once, then fork n supervised container workers sharing the deploy file')
     parser.add_argument('-v', '--version', action='version', version='ScionCC v%s' % version)
     parser.add_argument('-x', '--proc', type=str, help='Qualified name of process to start and then exit')
     parser.add_argument('-X', '--no_container', action='store_true', help='Perform pre-initialization steps and stop before starting a container')
@@ -71,6 +80,10 @@ def entry():
     if opts.nomanhole:
         opts.noshell = True
 
+    if opts.workers and opts.multiproc:
+        print "pycc: ERROR: Options --workers and --multiproc are mutually exclusive"
+        sys.exit(1)
+
     if opts.multiproc:
         num_proc = int(opts.multiproc)
         if num_proc > 1:
@@ -119,6 +132,88 @@ def stop_childprocs():
         if ch.is_alive():
             os.kill(ch.pid, signal.SIGTERM)
 
+def fork_worker(worker_num, num_workers, run_worker):
+    """ Forks a container worker process from the bootstrapped supervisor process.
+    The child shares all loaded modules and registries copy-on-write and never returns.
+    """
+    pid = os.fork()
+    if pid:
+        worker_pids[pid] = worker_num
+        log.info("Started container worker %s (pid %s)", worker_num, pid)
+        return pid
+
+    # We are the worker
+    global worker_shard
+    worker_shard = (worker_num, num_workers)
+    worker_pids.clear()
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)    # Supervisor relays INT as TERM
+    exit_code = 1
+    try:
+        exit_code = run_worker()
+    except SystemExit as se:
+        exit_code = se.code
+    except BaseException:
+        traceback.print_exc()
+    finally:
+        os._exit(exit_code or 0)
+
+def supervise_workers(num_workers, run_worker):
+    """ Forks num_workers container workers and restarts workers that fail,
+    until the supervisor receives a TERM/INT signal, which is relayed to all workers.
+    """
+    stopping = []
+
+    def stop_workers(signum, frame):
+        if not stopping:
+            log.info("Received signal %s, stopping %s container workers", signum, len(worker_pids))
+            stopping.append(signum)
+        for pid in worker_pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except OSError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop_workers)
+    signal.signal(signal.SIGINT, stop_workers)
+
+    start_times = {}
+    restart_delays = {}
+    for worker_num in range(num_workers):
+        fork_worker(worker_num, num_workers, run_worker)
+        start_times[worker_num] = time.time()
+
+    while worker_pids:
+        try:
+            pid, status = os.waitpid(-1, 0)
+        except OSError as ose:
+            if ose.errno == errno.EINTR:
+                continue
+            raise
+        worker_num = worker_pids.pop(pid, None)
+        if worker_num is None:
+            continue
+        if stopping or status == 0:
+            log.info("Container worker %s (pid %s) exited with status %s", worker_num, pid, status)
+            continue
+        log.warn("Container worker %s (pid %s) exited unexpectedly with status %s -- restarting", worker_num, pid, status)
+
+        # Back off when a worker fails repeatedly right after start
+        delay = restart_delays.get(worker_num, 0)
+        if time.time() - start_times[worker_num] < WORKER_MIN_UPTIME:
+            delay = min(max(delay * 2, WORKER_RESTART_DELAY), WORKER_RESTART_MAX_DELAY)
+        else:
+            delay = 0
+        restart_delays[worker_num] = delay
+        if delay:
+            time.sleep(delay)
+        if stopping:
+            continue
+        fork_worker(worker_num, num_workers, run_worker)
+        start_times[worker_num] = time.time()
+
+    log.info("All container workers stopped")
+
 # PYCC STEP 3
 def main(opts, *args, **kwargs):
     """
@@ -141,11 +236,12 @@ def main(opts, *args, **kwargs):
                 logutil.DEFAULT_LOGGING_PATHS.append(opts.logcfg)
         logutil.configure_logging(logutil.DEFAULT_LOGGING_PATHS, logging_config_override=logging_config_override)
 
-    def prepare_container():
+    def prepare_container(create=True):
         """
         Walks through pyon initialization in a deterministic way and initializes Container.
         In particular make sure configuration is loaded in correct order and
         pycc startup arguments are considered.
+        If create is False, stops after pyon is bootstrapped (used before forking workers).
         """
         # SIDE EFFECT: The import triggers static initializers: Gevent monkey patching, setting pyon defaults
         import pyon
@@ -289,10 +385,26 @@ def main(opts, *args, **kwargs):
             log.info("no_container=True. Stopping here.")
             return None
 
+        if not create:
+            # Import container code and define all interface classes now, so that forked workers share them copy-on-write
+            import gc
+            import pyon.container.cc
+            from pyon.core.interfaces.lazy_module import LazyClassModule
+            import interface.objects, interface.messages
+            for interface_module in (interface.objects, interface.messages):
+                if isinstance(interface_module, LazyClassModule):
+                    interface_module.define_all()
+            gc.collect()
+            return None
+
+        return create_container()
 
-        # Create the container instance
+    def create_container():
+        """
+        Creates the container instance. Requires pyon to be bootstrapped.
+        """
         from pyon.container.cc import Container
-        container = Container(*args, **command_line_config)
+        container = Container(*args, **kwargs)
         container.version = version
 
         return container
@@ -319,7 +431,7 @@ def main(opts, *args, **kwargs):
 
         if opts.rel:
             # Start a rel file
-            start_ok = container.start_rel_from_url(opts.rel)
+            start_ok = container.start_rel_from_url(opts.rel, shard=worker_shard)
             if not start_ok:
                 raise Exception("Cannot start deploy file '%s'" % opts.rel)
 
@@ -552,45 +664,70 @@ def main(opts, *args, **kwargs):
         res_args = dict(config=ipy_config, connection_file=conn_file)
         return res_args
 
-    # main() -----> ENTER
-    # ----------------------------------------------------------------------------------
-    # Container life cycle
+    def run_worker():
+        """
+        Entry point of a forked container worker. Pyon is already bootstrapped by the supervisor.
+        Each worker creates its own container (with id based on its pid) and connections.
+        """
+        opts.noshell = opts.nomanhole = True
+        opts.signalparent = False
+        if worker_shard[0] != 0:
+            opts.mx = False
+        run_container(create_container)
+
+    def run_container(container_factory):
+        # Container life cycle
+        container = None
+        try:
+            container = container_factory()
+            if container is None:
+                sys.exit(0)
 
-    prepare_logging()
-    container = None
-    try:
-        container = prepare_container()
-        if container is None:
-            sys.exit(0)
+            start_container(container)
 
-        start_container(container)
+            # Let child processes run if we are the parent
+            if child_procs and childproc_go:
+                childproc_go.set()
+        except Exception as ex:
+            log.error('CONTAINER START ERROR', exc_info=True)
+            stop_childprocs()
+            stop_container(container)
+            sys.exit(1)
 
-        # Let child processes run if we are the parent
-        if child_procs and childproc_go:
-            childproc_go.set()
-    except Exception as ex:
-        log.error('CONTAINER START ERROR', exc_info=True)
-        stop_childprocs()
-        stop_container(container)
-        sys.exit(1)
+        try:
+            do_work(container)
 
-    try:
-        do_work(container)
+        except Exception as ex:
+            stop_childprocs()
+            stop_container(container)
+            log.error('CONTAINER PROCESS INTERRUPTION', exc_info=True)
+            sys.exit(1)
 
-    except Exception as ex:
+        except (KeyboardInterrupt, SystemExit):
+            log.info("Received a kill signal, shutting down the container (%s)", os.getpid())
+
+        # Assumption: stop is so robust, it does not fail even if it was only partially started
         stop_childprocs()
-        stop_container(container)
-        log.error('CONTAINER PROCESS INTERRUPTION', exc_info=True)
-        sys.exit(1)
+        stop_ok = stop_container(container)
+        if not stop_ok:
+            sys.exit(1)
 
-    except (KeyboardInterrupt, SystemExit):
-        log.info("Received a kill signal, shutting down the container (%s)", os.getpid())
+    # main() -----> ENTER
+    # ----------------------------------------------------------------------------------
 
-    # Assumption: stop is so robust, it does not fail even if it was only partially started
-    stop_childprocs()
-    stop_ok = stop_container(container)
-    if not stop_ok:
-        sys.exit(1)
+    prepare_logging()
+    if opts.workers:
+        # Prefork mode: bootstrap config and registries once, then fork supervised workers
+        try:
+            prepare_container(create=False)
+        except Exception as ex:
+            log.error('CONTAINER START ERROR', exc_info=True)
+            sys.exit(1)
+        if opts.no_container:
+            sys.exit(0)
+        supervise_workers(opts.workers, run_worker)
+    else:
+        run_container(prepare_container)
 
 # START HERE:
 # PYCC STEP 1
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+
+"""Benchmark for container startup cost: time and max RSS of importing the interface modules,
+of bootstrap_pyon and of pycc (without starting a container). Each case runs in a fresh process,
+once with lazily defined interface classes and once with all classes defined upfront (as before
+lazy interface modules). Run from the repository root."""
+
+__author__ = 'Michael Meisinger'
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+CASE_PREFIX = """
+import resource, sys, time
+start_time = time.time()
+try:
+"""
+
+CASE_SUFFIX = """
+except SystemExit:
+    pass
+sys.stdout.write("\\nSTARTUP_BENCH %.6f %d\\n" % (time.time() - start_time, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss))
+"""
+
+DEFINE_ALL = """
+    import interface.objects, interface.messages
+    for interface_module in (interface.objects, interface.messages):
+        if hasattr(interface_module, "define_all"):
+            interface_module.define_all()
+"""
+
+CASES = [
+    ("import interfaces", """
+    import interface.objects, interface.messages
+"""),
+    ("bootstrap_pyon", """
+    from pyon.core import bootstrap
+    bootstrap.testing = False
+    bootstrap.bootstrap_pyon()
+"""),
+    ("pycc --no_container", """
+    import runpy
+    sys.argv = ["pycc", "--no_container", "--noshell"]
+    runpy.run_path("src/scripts/pycc.py", run_name="__main__")
+"""),
+]
+
+
+def run_case(case_code, eager=False):
+    code = CASE_PREFIX + (DEFINE_ALL if eager else "") + case_code + CASE_SUFFIX
+    output = subprocess.check_output([sys.executable, "-c", code], stderr=subprocess.STDOUT, env=dict(os.environ))
+    for line in output.splitlines():
+        if line.startswith("STARTUP_BENCH "):
+            run_time, max_rss = line.split()[1:]
+            return float(run_time), int(max_rss)
+    raise Exception("Benchmark case did not complete:\n%s" % output)
+
+
+def median(values):
+    values = sorted(values)
+    return values[len(values) / 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--repeat', type=int, default=5, help='Number of runs per case (median is reported)')
+    parser.add_argument('-p', '--no_pycc', action='store_true', help='Skip the pycc case (requires datastore access)')
+    parser.add_argument('-j', '--json', action='store_true', help='Print results as JSON')
+    opts = parser.parse_args()
+
+    results = []
+    for case_name, case_code in CASES:
+        if opts.no_pycc and case_name.startswith("pycc"):
+            continue
+        for mode in ("eager", "lazy"):
+            runs = [run_case(case_code, eager=(mode == "eager")) for i in xrange(opts.repeat)]
+            results.append(dict(case=case_name, mode=mode,
+                                time_ms=round(median([r[0] for r in runs]) * 1000, 1),
+                                max_rss_kb=median([r[1] for r in runs])))
+
+    if opts.json:
+        print json.dumps(results, indent=2)
+        return
+    print "%-22s %-6s %12s %12s" % ("case", "mode", "time (ms)", "max RSS (kB)")
+    for res in results:
+        print "%-22s %-6s %12s %12s" % (res["case"], res["mode"], res["time_ms"], res["max_rss_kb"])
+
+
+if __name__ == '__main__':
+    main()